@@ -0,0 +1,239 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Units sounds API.
+
+Sounds of the same file share their data through the audio manager
+cache, so the file is read and decoded only once. Sounds are attached
+to the 3D audio manager only while they're playing, so it doesn't
+update positions of the silent sounds.
+The number of the simultaneously playing sounds of the noisiest
+categories is limited, and sounds, which are too far from the
+listener, are not played at all.
+"""
+from panda3d.core import AudioSound
+
+# max number of the sounds of a category playing at once
+VOICE_LIMITS = {"engine": 4, "shot": 6}
+# sounds, which are more distant from the listener, are not played
+CULL_DISTANCE = 5
+
+
+class VoicesManager:
+    """Manager to load and play units sounds.
+
+    Every sound loaded with the manager must
+    also be played and stopped with it.
+
+    Args:
+        sound_mgr (direct.showbase.Audio3DManager.Audio3DManager):
+            The game 3D audio manager.
+    """
+
+    def __init__(self, sound_mgr):
+        self._sound_mgr = sound_mgr
+        # preloaded sounds, which keep their data in the audio manager cache
+        self._sources = {}
+        # sound -> (owner model, category)
+        self._sounds = {}
+        # loops, which should be played when there is a free voice
+        self._loops = set()
+        # sounds, attached to the 3D audio manager
+        self._playing = set()
+
+        taskMgr.doMethodLater(0.5, self._update, "update_voices")  # noqa: F821
+
+    def _attach(self, snd):
+        """Attach the given sound to its owner and play it.
+
+        Args:
+            snd (panda3d.core.AudioSound): Sound to play.
+        """
+        model = self._sounds[snd][0]
+        self._sound_mgr.attachSoundToObject(snd, model)
+
+        # set the position right away, without waiting for the next frame
+        pos = model.getPos(render)  # noqa: F821
+        snd.set3dAttributes(pos[0], pos[1], pos[2], 0, 0, 0)
+
+        self._playing.add(snd)
+        snd.play()
+
+    def _detach(self, snd):
+        """Stop the given sound and detach it from its owner.
+
+        Args:
+            snd (panda3d.core.AudioSound): Sound to stop.
+        """
+        snd.stop()
+        self._sound_mgr.detach_sound(snd)
+        self._playing.discard(snd)
+
+    def _distance(self, snd):
+        """Get the distance between the given sound and the listener.
+
+        Args:
+            snd (panda3d.core.AudioSound): Sound to check.
+
+        Returns:
+            float: The distance. Sounds of removed objects are infinitely far.
+        """
+        model = self._sounds[snd][0]
+        if model.isEmpty():
+            return float("inf")
+
+        return model.getDistance(base.cam)  # noqa: F821
+
+    def _forget(self, snd):
+        """Stop the given sound and drop all the data related to it.
+
+        Args:
+            snd (panda3d.core.AudioSound): Sound to forget.
+        """
+        if snd in self._playing:
+            self._detach(snd)
+
+        self._loops.discard(snd)
+        self._sounds.pop(snd)
+
+    def _free_voice(self, snd):
+        """Check if the given sound can be played now.
+
+        If the sound category has no free voices, but the sound
+        is closer to the listener than the most distant of the
+        playing sounds, that sound is stopped to free a voice.
+
+        Args:
+            snd (panda3d.core.AudioSound): Sound to be played.
+
+        Returns:
+            bool: True if the sound can be played.
+        """
+        distance = self._distance(snd)
+        if distance > CULL_DISTANCE:
+            return False
+
+        category = self._sounds[snd][1]
+        if category not in VOICE_LIMITS:
+            return True
+
+        playing = [
+            playing_snd
+            for playing_snd in self._playing
+            if self._sounds[playing_snd][1] == category
+        ]
+        if len(playing) < VOICE_LIMITS[category]:
+            return True
+
+        farthest = max(playing, key=self._distance)
+        if distance >= self._distance(farthest):
+            return False
+
+        self._detach(farthest)
+        return True
+
+    def _prune(self):
+        """Detach all the sounds, which finished playing."""
+        for snd in tuple(self._playing):
+            if snd.status() != AudioSound.PLAYING:
+                self._detach(snd)
+
+    def _update(self, task):
+        """Drop sounds of the removed objects and redistribute voices of loops."""
+        self._prune()
+
+        for snd, (model, _) in tuple(self._sounds.items()):
+            if model.isEmpty():
+                self._forget(snd)
+
+        for snd in self._loops & self._playing:
+            if self._distance(snd) > CULL_DISTANCE:
+                self._detach(snd)
+
+        for snd in sorted(self._loops - self._playing, key=self._distance):
+            if self._free_voice(snd):
+                self._attach(snd)
+
+        return task.again
+
+    def load(self, path, model, category=None):
+        """Load a sound of the given object.
+
+        Args:
+            path (str): Path to the sound file.
+            model (panda3d.core.NodePath): Object to attach the sound to.
+            category (str): Optional. Sound category from VOICE_LIMITS.
+
+        Returns:
+            panda3d.core.AudioSound: The loaded sound.
+        """
+        self.preload(path)
+
+        snd = self._sound_mgr.loadSfx(path)
+        self._sounds[snd] = (model, category)
+        return snd
+
+    def play(self, snd):
+        """Play the given sound once, if there is a free voice for it.
+
+        Args:
+            snd (panda3d.core.AudioSound): Sound loaded with this manager.
+        """
+        if snd not in self._sounds:
+            return
+
+        self._prune()
+
+        if snd in self._playing:
+            snd.play()
+        elif self._free_voice(snd):
+            self._attach(snd)
+
+    def play_loop(self, snd):
+        """Loop the given sound until it's stopped.
+
+        If there is no free voice for the sound, it'll
+        start playing as soon as a voice is freed.
+
+        Args:
+            snd (panda3d.core.AudioSound): Sound loaded with this manager.
+        """
+        snd.setLoop(True)
+        self._loops.add(snd)
+
+        self._prune()
+        if snd not in self._playing and self._free_voice(snd):
+            self._attach(snd)
+
+    def preload(self, path):
+        """Read and decode the sound file to share its data.
+
+        Args:
+            path (str): Path to the sound file.
+        """
+        if path not in self._sources:
+            self._sources[path] = self._sound_mgr.loadSfx(path)
+
+    def release(self, model):
+        """Stop and forget all the sounds of the given object.
+
+        Sounds of the object descendants are released as well.
+
+        Args:
+            model (panda3d.core.NodePath): Object to release sounds of.
+        """
+        for snd, (owner, _) in tuple(self._sounds.items()):
+            if owner == model or model.isAncestorOf(owner):
+                self._forget(snd)
+
+    def stop(self, snd):
+        """Stop the given sound.
+
+        Args:
+            snd (panda3d.core.AudioSound): Sound loaded with this manager.
+        """
+        self._loops.discard(snd)
+
+        if snd in self._playing:
+            self._detach(snd)
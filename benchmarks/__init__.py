@@ -0,0 +1,11 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+The game hot paths benchmarks.
+
+Run from the game directory:
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --compare results.json
+"""
@@ -0,0 +1,174 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Benchmarks runner.
+
+Runs every case on a headless game with the random generator seeded,
+so that all the runs measure the same workload. For every case wall
+time of several runs is recorded, then one more run is traced to get
+the peak and the retained delta of the Python memory, and the number
+of allocated blocks. Tasks added by a run are removed after it.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from panda3d.core import Filename, getModelPath
+
+from simulation import Simulation
+from .cases import CASES, clear_saves
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _clear_tasks(game, tasks):
+    """Remove the tasks added since the given snapshot.
+
+    Args:
+        game (simulation.Simulation): Headless game.
+        tasks (set): Tasks, which must stay.
+    """
+    for task in game.taskMgr.getAllTasks():
+        if task not in tasks:
+            game.taskMgr.remove(task)
+
+
+def _commit():
+    """Get the current git commit of the game.
+
+    Returns:
+        str: Commit hash, None if it can't be found.
+    """
+    try:
+        return subprocess.check_output(
+            ("git", "rev-parse", "HEAD"), stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def measure(game, case, seed, repeat):
+    """Measure the given benchmark case.
+
+    Args:
+        game (simulation.Simulation): Headless game.
+        case (function): Benchmark case.
+        seed (int): Random generator seed.
+        repeat (int): Number of the timed runs.
+
+    Returns:
+        dict: The case measurements.
+    """
+    tasks = set(game.taskMgr.getAllTasks())
+
+    times = []
+    for _ in range(repeat):
+        game.rng.seed(seed)
+        func = case(game)
+
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+        _clear_tasks(game, tasks)
+
+    game.rng.seed(seed)
+    func = case(game)
+
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    func()
+    traced_delta, traced_peak = tracemalloc.get_traced_memory()
+    blocks = sys.getallocatedblocks() - blocks
+    tracemalloc.stop()
+    _clear_tasks(game, tasks)
+
+    return {
+        "wall_min": min(times),
+        "wall_median": statistics.median(times),
+        "wall_mean": statistics.mean(times),
+        "traced_peak_bytes": traced_peak,
+        "traced_delta_bytes": traced_delta,
+        "allocated_blocks": blocks,
+    }
+
+
+def compare(old, new):
+    """Print the difference between two benchmark results.
+
+    Args:
+        old (dict): Previous results.
+        new (dict): Current results.
+    """
+    print("{:<20} {:>12} {:>12} {:>8}".format("case", "old, s", "new, s", "ratio"))
+    for name, result in new["results"].items():
+        if name not in old["results"]:
+            continue
+
+        old_time = old["results"][name]["wall_median"]
+        new_time = result["wall_median"]
+        print(
+            "{:<20} {:>12.4f} {:>12.4f} {:>8.2f}".format(
+                name, old_time, new_time, new_time / old_time
+            )
+        )
+
+
+def main():
+    """Run the benchmarks and report the results."""
+    parser = argparse.ArgumentParser(description="The game benchmarks.")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case")
+    parser.add_argument("--only", nargs="*", help="names of the cases to run")
+    parser.add_argument("--output", help="file to write the results into")
+    parser.add_argument("--compare", help="previous results file to compare with")
+    args = parser.parse_args()
+
+    # assets are looked for relative to the game
+    # directory, not to the benchmarks package
+    getModelPath().prependDirectory(Filename.fromOsSpecific(GAME_DIR))
+
+    game = Simulation(args.seed)
+    game.start_new_game("soldiers")
+
+    results = {}
+    try:
+        for case in CASES:
+            if args.only and case.__name__ not in args.only:
+                continue
+
+            results[case.__name__] = measure(game, case, args.seed, args.repeat)
+    finally:
+        clear_saves()
+
+    report = {
+        "meta": {
+            "commit": _commit(),
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as out_file:
+            json.dump(report, out_file, indent=4)
+    else:
+        print(json.dumps(report, indent=4))
+
+    if args.compare:
+        with open(args.compare) as old_file:
+            compare(json.load(old_file), report)
+
+
+if __name__ == "__main__":
+    main()
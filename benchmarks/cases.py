@@ -0,0 +1,145 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Benchmark cases.
+
+Every case is a function, which takes the headless game object,
+prepares everything the measured code needs and returns a callable
+to measure. Cases are run in the order of declaration: the ones,
+which step the game frames, go before the ones, which build new
+worlds and games.
+"""
+import glob
+import os
+
+import save_file
+from world import World
+from world.block import Block
+from world.railway_generator import RailwayGenerator
+
+LOCATION_SIZE = 500
+BLOCKS_NUM = 500
+CYCLES = 40
+# frames to simulate after every prepared block,
+# so that its delayed loading tasks are done
+CYCLE_FRAMES = 30
+# save slot, which doesn't collide with the player saves
+SAVE_SLOT = "_bench"
+
+CASES = []
+
+
+def case(func):
+    """Register the given function as a benchmark case."""
+    CASES.append(func)
+    return func
+
+
+def _game_desc(game):
+    """Build the least game description, which can be saved.
+
+    Args:
+        game (simulation.Simulation): Headless game.
+
+    Returns:
+        dict: The game description for the save slot info.
+    """
+    return {
+        "save_time": "",
+        "train": game.train.description,
+        "team": game.team.description,
+    }
+
+
+def clear_saves():
+    """Delete all the files saved by the benchmarks."""
+    for path in glob.glob("saves/*{}.*".format(SAVE_SLOT)):
+        os.remove(path)
+
+
+@case
+def railway_main_line(game):
+    """Generate the main railway line of a full size location."""
+    rails_gen = RailwayGenerator()
+    return lambda: rails_gen.generate_main_line(LOCATION_SIZE)
+
+
+@case
+def railway_branches(game):
+    """Generate branches for the main railway line of the game."""
+    rails_gen = RailwayGenerator()
+    main_line = game.world._map[:LOCATION_SIZE]
+    return lambda: rails_gen.generate_branches(main_line)
+
+
+@case
+def railway_topology(game):
+    """Build the topology index of the game world railway."""
+    return game.world.topology.build
+
+
+@case
+def block_construction(game):
+    """Construct world blocks and generate their layouts."""
+    records = game.world._map[:BLOCKS_NUM]
+
+    def construct():
+        for record in records:
+            Block(record, game.world._paths, game.world._surf_vertices).manifest()
+
+    return construct
+
+
+@case
+def block_cycles(game):
+    """Prepare the next and clear the previous world blocks."""
+
+    def cycle():
+        for _ in range(CYCLES):
+            game.world.prepare_next_block()
+            game.world.clear_prev_block()
+
+            for _ in range(CYCLE_FRAMES):
+                game.taskMgr.step()
+
+    return cycle
+
+
+@case
+def save_map(game):
+    """Save the world map."""
+    desc = _game_desc(game)
+    return lambda: save_file.write(SAVE_SLOT, desc, game.world.map_description)
+
+
+@case
+def load_location(game):
+    """Load the saved world map into a new world."""
+    save_file.write(SAVE_SLOT, _game_desc(game), game.world.map_description)
+    world = World()
+    return lambda: world.load_location(save_file.read(SAVE_SLOT)[1], 3, 25, 0, False)
+
+
+@case
+def generate_location(game):
+    """Generate a full size location for a new world."""
+    world = World()
+    return lambda: world.generate_location(LOCATION_SIZE, "soldiers")
+
+
+@case
+def save_game(game):
+    """Save the whole game and wait for the save to be written."""
+    return lambda: game.save_game(SAVE_SLOT).wait()
+
+
+@case
+def load_game(game):
+    """Load the whole saved game."""
+    # a just loaded game doesn't have its blocks
+    # around the Train yet, so it's saved only once
+    if not save_file.exists(SAVE_SLOT):
+        game.save_game(SAVE_SLOT).wait()
+
+    return lambda: game.load_game(SAVE_SLOT)
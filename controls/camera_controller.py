@@ -4,8 +4,6 @@ License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
 
 The main camera configuring and controls.
 """
-import random
-
 from direct.interval.IntervalGlobal import Parallel, Sequence
 from direct.interval.LerpInterval import LerpHprInterval, LerpPosInterval
 from panda3d.core import Vec3
@@ -331,9 +329,9 @@ class CameraController:
 
         self._move_int = Sequence()
 
-        self._target.setZ(base.cam.getZ() - random.uniform(-0.02, 0.02))  # noqa: F821
-        self._target.setX(base.cam.getX() + random.uniform(-0.03, 0.03))  # noqa: F821
-        self._target.setY(base.cam.getY() + random.uniform(-0.03, 0.03))  # noqa: F821
+        self._target.setZ(base.cam.getZ() - base.rng.uniform(-0.02, 0.02))  # noqa: F821
+        self._target.setX(base.cam.getX() + base.rng.uniform(-0.03, 0.03))  # noqa: F821
+        self._target.setY(base.cam.getY() + base.rng.uniform(-0.03, 0.03))  # noqa: F821
 
         self._move_int.append(
             Parallel(
@@ -347,9 +345,9 @@ class CameraController:
                     self._np,
                     0.15,
                     (
-                        self._np.getH() + random.uniform(-1, 1),
-                        self._np.getP() + random.uniform(-2, 2),
-                        self._np.getR() + random.uniform(-3, 3),
+                        self._np.getH() + base.rng.uniform(-1, 1),  # noqa: F821
+                        self._np.getP() + base.rng.uniform(-2, 2),  # noqa: F821
+                        self._np.getR() + base.rng.uniform(-3, 3),  # noqa: F821
                     ),
                 ),
             )
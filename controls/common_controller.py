@@ -10,6 +10,7 @@ from panda3d.core import (
     CollisionNode,
     CollisionRay,
     CollisionTraverser,
+    Point2,
     TextNode,
 )
 
@@ -37,8 +38,18 @@ class CommonController:
         self._keys_info = None  # on screen text object
         self._pointed_obj = ""
         self._chosen_char = None
+        self._mouse_pos = None
+        self._cam_mat = None
+        # something was added, removed or moved
+        # since the previous collisions traversal
+        self._is_dirty = True
         self.handler = None
 
+        # the only subgraph, which carries collision solids: the Train
+        # with its parts, characters, weapons and overtaking enemies
+        self.collision_root = render.attachNewNode("collision_root")  # noqa: F821
+        base.train.root_node.reparentTo(self.collision_root)  # noqa: F821
+
         self._move_char_snd = loader.loadSfx("sounds/move_char.ogg")  # noqa: F821
         self._char_pointer = loader.loadModel(  # noqa: F821
             address("character_pointer")
@@ -64,6 +75,7 @@ class CommonController:
             if self._pointed_obj.startswith("part_"):
                 if self._chosen_char.move_to(self._parts[self._pointed_obj]):
                     self._move_char_snd.play()
+                    self._is_dirty = True
                 return
 
             if self._pointed_obj.startswith("enemy_"):
@@ -75,6 +87,7 @@ class CommonController:
             if self._pointed_obj.startswith("character_"):
                 self.chosen_char.exchange_pos(self._chars[self._pointed_obj])
                 self._move_char_snd.play()
+                self._is_dirty = True
 
     def _choose_obj(self):
         """Event: left mouse button clicked.
@@ -116,8 +129,17 @@ class CommonController:
         if not base.mouseWatcherNode.hasMouse():  # noqa: F821
             return task.again
 
-        mpos = base.mouseWatcherNode.getMouse()  # noqa: F821
-        self._mouse_ray.setFromLens(base.camNode, mpos.x, mpos.y)  # noqa: F821
+        mpos = Point2(base.mouseWatcherNode.getMouse())  # noqa: F821
+        if mpos != self._mouse_pos:
+            self._mouse_pos = mpos
+            self._mouse_ray.setFromLens(base.camNode, mpos.x, mpos.y)  # noqa: F821
+            self._is_dirty = True
+
+        cam_mat = base.cam.getMat(base.train.model)  # noqa: F821
+        if cam_mat != self._cam_mat:
+            self._cam_mat = cam_mat
+            self._is_dirty = True
+
         return task.again
 
     def _point_obj(self, event):
@@ -187,8 +209,18 @@ class CommonController:
         self._is_keys_shown = not self._is_keys_shown
 
     def _traverse(self, task):
-        """Main traverser task."""
-        self.traverser.traverse(render)  # noqa: F821
+        """Main traverser task.
+
+        Only the collision root is traversed, and only if
+        something changed since the previous traversal,
+        any object is pointed by the mouse (to keep "again"
+        events going), or there are colliders besides the
+        mouse ray: they are moving enemies and projectiles.
+        """
+        if self._is_dirty or self._pointed_obj or self.traverser.getNumColliders() > 1:
+            self._is_dirty = False
+            self.traverser.traverse(self.collision_root)
+
         return task.again
 
     def _unpoint_obj(self, event):
@@ -197,6 +229,17 @@ class CommonController:
         base.char_gui.hide_tip()  # noqa: F821
         base.change_mouse_pointer("normal")  # noqa: F821
 
+    def add_collider(self, col_np, handler):
+        """Add the given collider into the common traverser.
+
+        Args:
+            col_np (panda3d.core.NodePath): Collision node to add.
+            handler (panda3d.core.CollisionHandler):
+                Handler of the collider collisions.
+        """
+        self.traverser.addCollider(col_np, handler)
+        self._is_dirty = True
+
     def choose_char(self, char_id):
         """Choose a character with the given id.
 
@@ -227,6 +270,23 @@ class CommonController:
             base.team.hide_relations()  # noqa: F821
             self._is_relations_shown = False
 
+    def refresh_collisions(self):
+        """Traverse collisions on the next check.
+
+        Must be called, when collision solids are
+        added, removed or moved not within a collider.
+        """
+        self._is_dirty = True
+
+    def remove_collider(self, col_np):
+        """Remove the given collider from the common traverser.
+
+        Args:
+            col_np (panda3d.core.NodePath): Collision node to remove.
+        """
+        self.traverser.removeCollider(col_np)
+        self._is_dirty = True
+
     def set_controls(self):
         """Configure common game controls.
 
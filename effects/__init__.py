@@ -16,6 +16,33 @@ from panda3d.core import (
 )
 
 from utils import drown_snd
+from .particles import ParticlesPool
+
+# explosion kinds: particle effect name, effect length
+# and the max number of the explosions playing at once
+EXPLOSIONS = {
+    "explosion": ("explode_fire", 1.5, 4),
+    "explosion_big": ("explode_fire2", 2.1, 3),
+}
+# max number of the burning smokes playing at once
+BURN_SMOKES_NUM = 3
+
+
+def _cam_distance(parent):
+    """Get the distance between the camera and the given object.
+
+    Removed objects are considered the most distant.
+
+    Args:
+        parent (object): Must include "model" property.
+
+    Returns:
+        float: The distance to the camera.
+    """
+    if parent.model.isEmpty():
+        return float("inf")
+
+    return parent.model.getDistance(base.cam)  # noqa: F821
 
 
 class EffectsManager:
@@ -25,7 +52,19 @@ class EffectsManager:
         base.enableParticles()  # noqa: F821
         render.setShaderAuto()  # noqa: F821
 
+        self.particles = ParticlesPool()
+
         self._explosion_lights = self._set_explosion_lights()
+        self._explosions = {
+            kind: [
+                Explosion(num, self.particles, self._explosion_lights, ptf, length)
+                for num in range(limit)
+            ]
+            for kind, (ptf, length, limit) in EXPLOSIONS.items()
+        }
+        self._burn_smokes = [
+            BurnSmoke(num, self.particles) for num in range(BURN_SMOKES_NUM)
+        ]
 
         self._transition = Transitions(loader)  # noqa: F821
         self._transition.setFadeColor(0, 0, 0)
@@ -33,8 +72,10 @@ class EffectsManager:
         self.stench_effect = Stench()
         self.love_fog = LoveFog()
 
-        filters = CommonFilters(base.win, base.cam)  # noqa: F821
-        filters.setBloom(size="large", mintrigger=0.8, intensity=2.1)
+        # there is no screen to filter in headless mode
+        if base.win is not None:  # noqa: F821
+            filters = CommonFilters(base.win, base.cam)  # noqa: F821
+            filters.setBloom(size="large", mintrigger=0.8, intensity=2.1)
 
     def _set_explosion_lights(self):
         """Prepare three explosion lights.
@@ -57,6 +98,29 @@ class EffectsManager:
 
         return lights
 
+    def _play(self, pool, parent):
+        """Play one of the effects of the given pool on the given object.
+
+        If all the effects of the pool are already playing,
+        the least visible of them (including the new one)
+        is dropped to keep the number of effects bounded.
+
+        Args:
+            pool (list): Effects of a single kind.
+            parent (object): Must include "model" property.
+        """
+        for effect in pool:
+            if not effect.is_playing:
+                effect.play(parent)
+                return
+
+        effect = max(pool, key=lambda effect: _cam_distance(effect.parent))
+        if _cam_distance(parent) >= _cam_distance(effect.parent):
+            return
+
+        effect.stop()
+        effect.play(parent)
+
     def bomb_explosion(self, parent):
         """Prepare a bomb explosion effect for the given object.
 
@@ -66,40 +130,31 @@ class EffectsManager:
         Returns:
             BombExplosion: Hand bomb explosion effect object.
         """
-        return BombExplosion(parent)
+        return BombExplosion(self.particles, parent)
 
-    def burn_smoke(self, parent):
-        """Prepare a burning object smoke effect.
+    def play_burn_smoke(self, parent):
+        """Play a burning object smoke effect.
 
         Args:
-            parent (object): Must include "id" and "model" properties.
-
-        Returns:
-            BurnSmoke: Burning object smoke effect.
+            parent (object): Must include "model" property.
         """
-        return BurnSmoke(parent)
+        self._play(self._burn_smokes, parent)
 
-    def explosion(self, parent):
-        """Prepare an explosion effect for the given object.
+    def play_explosion(self, parent):
+        """Play an explosion effect on the given object.
 
         Args:
-            parent (object): Must include "id" and "model" properties.
-
-        Returns:
-            Explosion: Explosion effect object.
+            parent (object): Must include "model" property.
         """
-        return Explosion(self._explosion_lights, parent, "explode_fire", 1.5)
+        self._play(self._explosions["explosion"], parent)
 
-    def explosion_big(self, parent):
-        """Prepare a big explosion effect for the given object.
+    def play_big_explosion(self, parent):
+        """Play a big explosion effect on the given object.
 
         Args:
-            parent (object): Must include "id" and "model" properties.
-
-        Returns:
-            Explosion: Explosion effect object.
+            parent (object): Must include "model" property.
         """
-        return Explosion(self._explosion_lights, parent, "explode_fire2", 2.1)
+        self._play(self._explosions["explosion_big"], parent)
 
     def fade_in_screen(self, task):
         """Smoothly fill the screen with natural colors."""
@@ -113,128 +168,179 @@ class EffectsManager:
 
 
 class Explosion:
-    """An explosion effect.
+    """An explosion reusable effect.
 
-    Includes sound, light and particle effects.
+    Includes sound, light and particle effects. Particle
+    effects are taken from the pool only to play them.
 
     Args:
+        num (int): The effect number within the effects of its kind.
+        particles (effects.particles.ParticlesPool): Particle effects pool.
         explode_lights (list): Explosion lights pool.
-        parent (object): Object to explode.
         ptf (str): Name of the particles file to use.
         length (float): The length of the effect.
     """
 
-    def __init__(self, explode_lights, parent, ptf, length):
+    def __init__(self, num, particles, explode_lights, ptf, length):
+        self.parent = None
+
+        self._name = "{ptf}_{num}".format(ptf=ptf, num=num)
         self._length = length
-        self._parent = parent
+        self._ptf = ptf
 
+        self._particles = particles
         self._lights = explode_lights
+        self._light = None
         self._light_coef = 1.5
 
-        self._sparks = ParticleEffect()
-        self._sparks.loadConfig("effects/explode_sparks.ptf")
-        self._sparks.setY(0.2)
-
-        self._fire = ParticleEffect()
-        self._fire.loadConfig("effects/{}.ptf".format(ptf))
-        self._fire.setY(0.1)
+        self._sparks = None
+        self._fire = None
 
         self._snd = base.sound_mgr.loadSfx("sounds/combat/explosion1.ogg")  # noqa: F821
-        base.sound_mgr.attachSoundToObject(self._snd, parent.model)  # noqa: F821
+
+    @property
+    def is_playing(self):
+        """Indicates if this explosion is playing now.
+
+        Returns:
+            bool: True if the explosion is playing.
+        """
+        return self.parent is not None
 
     def _clear(self, task):
         """Clear this explosion effect."""
-        self._sparks.cleanup()
-        self._fire.cleanup()
-        base.sound_mgr.detach_sound(self._snd)  # noqa: F821
+        self.stop()
         return task.done
 
-    def _light_change(self, light, task):
+    def _return_light(self):
+        """Return the explosion light into the lights pool."""
+        self._light.detachNode()
+        self._light.node().setAttenuation((0, 0, 1))
+        self._lights.append(self._light)
+        self._light = None
+
+    def _light_change(self, task):
         """Change the explosion light attenuation.
 
         Implements a gradual (but fast) fall off of the light power.
-
-        Args:
-            light (panda3d.core.NodePath): Explosion light object.
         """
         self._light_coef += 0.1
 
         if self._light_coef >= 10:
-            self._lights.append(light)
-            light.detachNode()
-            light.node().setAttenuation((0, 0, 1))
+            self._return_light()
             return task.done
 
-        light.node().setAttenuation((self._light_coef - 1, 0, self._light_coef))
+        self._light.node().setAttenuation((self._light_coef - 1, 0, self._light_coef))
         return task.again
 
-    def play(self):
-        """Do the actual explosion and plan its clearing."""
+    def play(self, parent):
+        """Do the actual explosion and plan its clearing.
+
+        Args:
+            parent (object): Object to explode.
+        """
+        self.parent = parent
+
+        self._sparks = self._particles.acquire("explode_sparks")
+        self._sparks.setY(0.2)
+
+        self._fire = self._particles.acquire(self._ptf)
+        self._fire.setY(0.1)
+
+        base.sound_mgr.attachSoundToObject(self._snd, parent.model)  # noqa: F821
         self._snd.play()
-        self._sparks.start(self._parent.model, render)  # noqa: F821
-        self._fire.start(self._parent.model, render)  # noqa: F821
+        self._sparks.start(parent.model, render)  # noqa: F821
+        self._fire.start(parent.model, render)  # noqa: F821
 
         if self._lights:
-            light = self._lights.pop()
-            light.reparentTo(self._parent.model)
-            light.setPos(0)
+            self._light_coef = 1.5
+            self._light = self._lights.pop()
+            self._light.reparentTo(parent.model)
+            self._light.setPos(0)
 
             taskMgr.doMethodLater(  # noqa: F821
-                0.02,
-                self._light_change,
-                self._parent.id + "_explosion_light",
-                extraArgs=[light],
-                appendTask=True,
+                0.02, self._light_change, self._name + "_light"
             )
 
         taskMgr.doMethodLater(  # noqa: F821
-            0.8,
-            self._fire.softStop,
-            self._parent.id + "_disable_exlode_fire",
-            extraArgs=[],
+            0.8, self._fire.softStop, self._name + "_soft_stop_fire", extraArgs=[]
         )
-
         taskMgr.doMethodLater(  # noqa: F821
             self._length,
             self._fire.disable,
-            self._parent.id + "_disable_exlode_fire",
-            extraArgs=[],
-        )
-        taskMgr.doMethodLater(  # noqa: F821
-            4.95,
-            self._sparks.disable,
-            self._parent.id + "_disable_exlode_sparks",
+            self._name + "_disable_fire",
             extraArgs=[],
         )
         taskMgr.doMethodLater(  # noqa: F821
-            5.05, self._clear, self._parent.id + "_clear_explode"
+            4.95, self._sparks.disable, self._name + "_disable_sparks", extraArgs=[]
         )
+        taskMgr.doMethodLater(5.05, self._clear, self._name + "_clear")  # noqa: F821
+
+    def stop(self):
+        """Stop this explosion and return its resources into the pools."""
+        taskMgr.removeTasksMatching(self._name + "_*")  # noqa: F821
+
+        if self._light is not None:
+            self._return_light()
+
+        self._snd.stop()
+        base.sound_mgr.detach_sound(self._snd)  # noqa: F821
+
+        self._particles.release("explode_sparks", self._sparks)
+        self._particles.release(self._ptf, self._fire)
+        self._sparks = None
+        self._fire = None
+        self.parent = None
 
 
 class BurnSmoke:
-    """Smoke from a burning object effect.
+    """Smoke from a burning object reusable effect.
 
     Args:
-        parent (object): Object to parent the effect to.
+        num (int): The effect number.
+        particles (effects.particles.ParticlesPool): Particle effects pool.
     """
 
-    def __init__(self, parent):
-        self._parent = parent
-        self._smoke = ParticleEffect()
-        self._smoke.loadConfig("effects/after_explode_smoke1.ptf")
+    def __init__(self, num, particles):
+        self.parent = None
+
+        self._name = "burn_smoke_" + str(num)
+        self._particles = particles
+        self._smoke = None
+
+    @property
+    def is_playing(self):
+        """Indicates if this smoke is playing now.
+
+        Returns:
+            bool: True if the smoke is playing.
+        """
+        return self.parent is not None
 
     def _clear_smoke(self, task):
         """Clear the smoke effect."""
-        self._smoke.softStop()
-        self._smoke.cleanup()
+        self.stop()
         return task.done
 
-    def play(self):
-        """Start playing the particle effect."""
-        self._smoke.start(self._parent.model, render)  # noqa: F821
-        taskMgr.doMethodLater(  # noqa: F821
-            11, self._clear_smoke, self._parent.id + "_stop_smoke"
-        )
+    def play(self, parent):
+        """Start playing the particle effect.
+
+        Args:
+            parent (object): Object to parent the effect to.
+        """
+        self.parent = parent
+
+        self._smoke = self._particles.acquire("after_explode_smoke1")
+        self._smoke.start(parent.model, render)  # noqa: F821
+        taskMgr.doMethodLater(11, self._clear_smoke, self._name)  # noqa: F821
+
+    def stop(self):
+        """Stop the smoke and return it into the particle effects pool."""
+        taskMgr.remove(self._name)  # noqa: F821
+
+        self._particles.release("after_explode_smoke1", self._smoke)
+        self._smoke = None
+        self.parent = None
 
 
 class BombExplosion:
@@ -243,17 +349,15 @@ class BombExplosion:
     Includes sound and particle effects.
 
     Args:
+        particles (effects.particles.ParticlesPool): Particle effects pool.
         parent (object): Object to explode. Must include "model" property.
     """
 
-    def __init__(self, parent):
+    def __init__(self, particles, parent):
         self._parent = parent
 
-        self._smoke = ParticleEffect()
-        self._smoke.loadConfig("effects/bomb_smoke1.ptf")
-
-        self._sparks = ParticleEffect()
-        self._sparks.loadConfig("effects/white_sparks1.ptf")
+        self._smoke = particles.acquire("bomb_smoke1")
+        self._sparks = particles.acquire("white_sparks1")
 
         self._snd = base.sound_mgr.loadSfx(  # noqa: F821
             "sounds/combat/bomb_explosion1.ogg"
@@ -318,6 +422,12 @@ class Stench:
         self._fog.setColor(1, 0.69, 0)
         self._fog.setExpDensity(0.1)
 
+        # there is no screen to copy in headless mode
+        if base.win is None:  # noqa: F821
+            self._bcard = background.attachNewNode("stench_back_card")
+            self._fcard = base.render2d.attachNewNode("stench_front_card")  # noqa: F821
+            return
+
         tex = Texture()
         tex.setMinfilter(Texture.FTLinear)
         base.win.addRenderTexture(  # noqa: F821
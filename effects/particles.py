@@ -0,0 +1,141 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Particle effects templates and pools API.
+"""
+from direct.particles import ParticleEffect as particle_effect
+from panda3d.core import Filename, VirtualFileSystem
+
+# number of the effects instances to build on the
+# game start for the most often played effects
+WARM_EFFECTS = {
+    "explode_sparks": 7,
+    "explode_fire": 4,
+    "explode_fire2": 3,
+    "after_explode_smoke1": 3,
+    "bonfire": 2,
+    "fireflies": 3,
+}
+# max number of the idle effects instances of a single template
+POOL_LIMIT = 8
+
+
+class ParticleTemplate:
+    """A particle effect template.
+
+    The .ptf file is read and compiled only once, and then the
+    compiled configuration is executed for every new effect.
+
+    Args:
+        name (str): Name of the particle effect file.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+        path = "effects/{}.ptf".format(name)
+        data = VirtualFileSystem.getGlobalPtr().readFile(Filename(path), True)
+        self._code = compile(data.replace(b"\r", b""), path, "exec")
+        self._transform = None
+
+    def build(self):
+        """Build a new effect of this template.
+
+        Returns:
+            direct.particles.ParticleEffect.ParticleEffect: New effect.
+        """
+        effect = particle_effect.ParticleEffect()
+        # configurations refer to the names imported
+        # by the module of the particle effect class
+        exec(self._code, vars(particle_effect), {"self": effect})
+
+        if self._transform is None:
+            self._transform = effect.getTransform()
+
+        return effect
+
+    def reset(self, effect):
+        """Return the given effect to its initial state.
+
+        Args:
+            effect (direct.particles.ParticleEffect.ParticleEffect):
+                Effect of this template.
+        """
+        effect.disable()
+        for particles in effect.getParticlesList():
+            particles.clearToInitial()
+
+        effect.softStart()
+        effect.setTransform(self._transform)
+
+
+class ParticlesPool:
+    """Pools of the ready to use particle effects.
+
+    Every effect taken from the pool must be
+    returned back with the release() method.
+    """
+
+    def __init__(self):
+        self._templates = {}
+        self._pools = {}
+
+    def _template(self, name):
+        """Get the particle effect template with the given name.
+
+        Args:
+            name (str): Name of the particle effect file.
+
+        Returns:
+            ParticleTemplate: The effect template.
+        """
+        if name not in self._templates:
+            self._templates[name] = ParticleTemplate(name)
+
+        return self._templates[name]
+
+    def acquire(self, name):
+        """Take an effect of the given template.
+
+        Args:
+            name (str): Name of the particle effect file.
+
+        Returns:
+            direct.particles.ParticleEffect.ParticleEffect: Ready to use effect.
+        """
+        pool = self._pools.setdefault(name, [])
+        if pool:
+            return pool.pop()
+
+        return self._template(name).build()
+
+    def release(self, name, effect):
+        """Return the given effect into the pool.
+
+        If the pool is already full, the effect is cleaned up.
+
+        Args:
+            name (str): Name of the particle effect file.
+            effect (direct.particles.ParticleEffect.ParticleEffect):
+                The effect, taken from the pool.
+        """
+        pool = self._pools.setdefault(name, [])
+        if len(pool) >= POOL_LIMIT:
+            effect.cleanup()
+            return
+
+        self._template(name).reset(effect)
+        pool.append(effect)
+
+    def warm_up(self):
+        """Build the most often played effects beforehand.
+
+        Effects configurations refer to the game world
+        (to hide particles from shadows), so this must
+        be called after the World is created.
+        """
+        for name, num in WARM_EFFECTS.items():
+            template = self._template(name)
+            pool = self._pools.setdefault(name, [])
+            pool += [template.build() for _ in range(num - len(pool))]
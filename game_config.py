@@ -17,20 +17,28 @@ class Config:
             self._create_default()
 
         with open(self.opts_file, "r") as opts_file:
-            (
-                self.resolution,
-                lang,
-                tutorial_on,
-                fps,
-                fps_meter,
-                multi_threading,
-            ) = opts_file.readlines()
+            options = opts_file.readlines()
+
+        # options file of the previous game versions
+        if len(options) == 6:
+            options.insert(5, "False")
+
+        (
+            self.resolution,
+            lang,
+            tutorial_on,
+            fps,
+            fps_meter,
+            profiler,
+            multi_threading,
+        ) = options
 
         self.resolution = self.resolution.strip()
         self.tutorial_enabled = tutorial_on.strip() == "True"
         self.language = lang.strip()
         self.fps_limit = int(fps)
         self.fps_meter = fps_meter.strip() == "True"
+        self.profiler = profiler.strip() == "True"
         self.multi_threading = multi_threading.strip() == "True"
 
     def _create_default(self):
@@ -42,15 +50,21 @@ class Config:
             Screen resolution: player's monitor size.
             Language: English
             Turorial: enabled
+            Tasks profiler: disabled
         """
-        with open(self.opts_file, "w") as opts_file:
-            opts_file.write(
+        # there is no display in headless mode
+        if base.pipe is None:  # noqa: F82
+            resolution = "1920x1080"
+        else:
+            resolution = (
                 str(base.pipe.getDisplayWidth())  # noqa: F82
                 + "x"
                 + str(base.pipe.getDisplayHeight())  # noqa: F82
-                + "\nEN\nTrue\n120\nFalse\nTrue"
             )
 
+        with open(self.opts_file, "w") as opts_file:
+            opts_file.write(resolution + "\nEN\nTrue\n120\nFalse\nFalse\nTrue")
+
     def update(self, resolution, lang, tutorial, fps_limit, fps_meter, multi_threading):
         """Update the game configurations with new values.
 
@@ -67,6 +81,14 @@ class Config:
         with open(self.opts_file, "w") as opts_file:
             opts_file.write(
                 "\n".join(
-                    (resolution, lang, tutorial, fps_limit, fps_meter, multi_threading)
+                    (
+                        resolution,
+                        lang,
+                        tutorial,
+                        fps_limit,
+                        fps_meter,
+                        str(self.profiler),
+                        multi_threading,
+                    )
                 )
             )
@@ -4,8 +4,6 @@ License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
 
 Game graphical interfaces module.
 """
-import os
-import shelve
 import sys
 import webbrowser
 
@@ -19,7 +17,9 @@ from direct.gui.DirectGui import (
 )
 from panda3d.core import TextNode, TransparencyAttrib
 
-from utils import clear_wids, drown_snd, save_exists
+from languages import LANGUAGES
+import save_file
+from utils import clear_wids, drown_snd
 from .character import CharacterGUI  # noqa: F401
 from .city import CityGUI  # noqa: F401
 from .journal import Journal  # noqa: F401
@@ -32,7 +32,6 @@ from .train import TrainGUI  # noqa: F401
 from .traits import TraitsGUI  # noqa: F401
 from .widgets import GUI_PIC, RUST_COL, SILVER_COL, ListChooser  # noqa: F401
 
-LANGUAGES = ("EN", "RU")
 FPS = ("30", "60", "120")
 RESOLUTIONS = [
     "800x600",
@@ -67,6 +66,7 @@ class MainMenu:
         self._not_welcome_img = None
         self._is_first_pause = True
         self._save_blocked_lab = None
+        self._save_progress_lab = None
         self._menu_music = loader.loadSfx(  # noqa: F821
             "sounds/music/Among Madness - Fever.mp3"
         )
@@ -104,6 +104,10 @@ class MainMenu:
             frameColor=(0.15, 0.15, 0.15, 0.8),
             state=DGG.NORMAL,
         )
+        # there is no player to greet in headless mode
+        if base.headless:  # noqa: F821
+            return
+
         wids = self._show_authors_word()
         taskMgr.doMethodLater(  # noqa: F821
             5, self._hide_authors_word, "stop_splash_screens", extraArgs=[wids]
@@ -128,7 +132,9 @@ class MainMenu:
         )
         self.bind_button(self._new_game_but)
 
-        is_save_exists = save_exists(1) or save_exists(2) or save_exists(3)
+        is_save_exists = (
+            save_file.exists(1) or save_file.exists(2) or save_file.exists(3)
+        )
         self._load_but = DirectButton(  # Load game
             pos=(-1.12, 0, 0.4),
             text_fg=RUST_COL if is_save_exists else (0.5, 0.5, 0.5, 1),
@@ -197,6 +203,8 @@ class MainMenu:
             cause = base.labels.MAIN_MENU[19]  # noqa: F821
         elif base.current_block.id < 4:  # noqa: F821
             cause = base.labels.MAIN_MENU[20]  # noqa: F821
+        elif base.is_saving:  # noqa: F821
+            cause = base.labels.MAIN_MENU[43]  # noqa: F821
         else:
             cause = None
 
@@ -347,6 +355,12 @@ class MainMenu:
         self._menu_music.play()
         self._build()
 
+    def _hide_save_progress(self, task):
+        """Hide the game save progress label."""
+        self._save_progress_lab.destroy()
+        self._save_progress_lab = None
+        return task.done
+
     def _highlight_but(self, button, _):
         """Highlight the button pointed by mouse.
 
@@ -367,8 +381,7 @@ class MainMenu:
         Args:
             num (int): The slot number.
         """
-        save_file = "saves/save{}.dat".format(num)
-        if not os.path.exists(save_file):
+        if not save_file.exists(num):
             return
 
         self.show_loading()
@@ -387,22 +400,8 @@ class MainMenu:
         """
         saves = []
         for num in range(1, 4):
-            if save_exists(num):
-                save = shelve.open("saves/save{}".format(str(num)))
-                classes = [char["class"] for char in save["team"]]
-
-                saves.append(
-                    {
-                        "save_time": save["save_time"],
-                        "miles": save["train"]["miles"],
-                        "chars": (
-                            classes.count("soldier"),
-                            classes.count("raider"),
-                            classes.count("anarchist"),
-                        ),
-                    }
-                )
-                save.close()
+            if save_file.exists(num):
+                saves.append(save_file.read_info(num))
             else:
                 saves.append({})
 
@@ -1026,6 +1025,7 @@ class MainMenu:
                 or base.world.is_on_et  # noqa: F821
                 or base.current_block.id < 4  # noqa: F821
                 or base.world.is_near_fork  # noqa: F821
+                or base.is_saving  # noqa: F821
             )
             command = base.save_game  # noqa: F821
 
@@ -1095,6 +1095,23 @@ class MainMenu:
             extraArgs=[self._chosen_crew],
         )
 
+    def _track_save_progress(self, job, task):
+        """Show the progress of the game save until it's finished.
+
+        Args:
+            job (save_file.SaveJob): The game save in progress.
+        """
+        labels = base.labels.MAIN_MENU  # noqa: F821
+        if not job.is_done:
+            self._save_progress_lab["text"] = labels[40].format(job.progress)
+            return task.again
+
+        self._save_progress_lab["text"] = labels[41 if job.error is None else 42]
+        taskMgr.doMethodLater(  # noqa: F821
+            3, self._hide_save_progress, "hide_save_progress"
+        )
+        return task.done
+
     def bind_button(self, button):
         """Bind the given button to visual effects.
 
@@ -1210,6 +1227,32 @@ class MainMenu:
             pos=(0, 0, -0.75),
         )
 
+    def show_save_progress(self, job):
+        """Show the progress of the given game save.
+
+        Args:
+            job (save_file.SaveJob): The game save in progress.
+        """
+        taskMgr.remove("hide_save_progress")  # noqa: F821
+        if self._save_progress_lab is None:
+            self._save_progress_lab = DirectLabel(
+                parent=self._main_fr,
+                pos=(-1.12, 0, 0.22),
+                frameColor=(0, 0, 0, 0),
+                text_scale=0.026,
+                text_fg=SILVER_COL,
+                text_font=base.main_font,  # noqa: F821
+                text_align=TextNode.ALeft,
+            )
+
+        taskMgr.doMethodLater(  # noqa: F821
+            0.1,
+            self._track_save_progress,
+            "track_save_progress",
+            extraArgs=[job],
+            appendTask=True,
+        )
+
     def show(self, is_game_over=False):
         """Show the main menu.
 
@@ -14,6 +14,7 @@ from direct.gui.DirectGui import (
 from direct.gui.OnscreenText import OnscreenText
 from panda3d.core import CardMaker, NodePath, TransparencyAttrib
 
+from units.crew.traits import label, labels, split
 from utils import clear_wids
 from .widgets import GUI_PIC, RUST_COL, SILVER_COL
 
@@ -161,7 +162,7 @@ class CharacterGUI:
 
         self._char_health["value"] = self.char.health
         self._char_energy["value"] = self.char.energy
-        self._traits["text"] = ", ".join(self.char.traits)
+        self._traits["text"] = ", ".join(labels(self.char.traits))
 
         if self.char.is_diseased:
             self._disease.show()
@@ -202,11 +203,11 @@ class CharacterGUI:
             float: Z-coor including the new widgets shift.
         """
         shift -= 0.03
-        for trait in self.char.traits + self.char.disabled_traits:
+        for trait in split(self.char.traits | self.char.disabled_traits):
             self._char_desc_wids.append(
                 DirectLabel(
                     parent=self._fr,
-                    text=trait,
+                    text=label(trait),
                     frameSize=(0.1, 0.1, 0.1, 0.1),
                     text_scale=0.03,
                     text_font=base.main_font,  # noqa: F821
@@ -219,7 +220,7 @@ class CharacterGUI:
             self._char_desc_wids.append(
                 DirectLabel(
                     parent=self._fr,
-                    text=base.labels.TRAIT_DESC[trait],  # noqa: F821
+                    text=base.labels.TRAIT_DESC[label(trait)],  # noqa: F821
                     text_font=base.main_font,  # noqa: F821
                     frameSize=(0.1, 0.1, 0.1, 0.1),
                     text_scale=0.029,
@@ -387,7 +388,7 @@ class CharacterGUI:
         """
         self._char_name["text"] = char.name
         self._char_class["text"] = char.class_.capitalize()
-        self._traits["text"] = ", ".join(char.traits)
+        self._traits["text"] = ", ".join(labels(char.traits))
 
         self._char_health["range"] = char.class_data["health"]
         self._char_health["value"] = char.health
@@ -549,13 +550,13 @@ class HealthBar(NodePath):
 
     def hide_health(self):
         """Hide the widget."""
-        taskMgr.remove(self._char.id + "_show_health")  # noqa: F821
+        base.units_timers.cancel(self._char.id, "_show_health")  # noqa: F821
         self.hide()
 
     def show_health(self):
         """Show the widget and start tracking the character's health on it."""
         self.show()
 
-        taskMgr.doMethodLater(  # noqa: F821
-            0.3, self._set_health, self._char.id + "_show_health"
+        base.units_timers.do_later(  # noqa: F821
+            0.3, self._set_health, self._char.id, "_show_health"
         )
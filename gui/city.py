@@ -4,11 +4,10 @@ License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
 
 A city GUI.
 """
-import random
-
 from direct.gui.DirectGui import DGG, DirectButton, DirectFrame, DirectLabel
 from panda3d.core import TextNode, TransparencyAttrib
 
+from units.crew.traits import NEGATIVE, POSITIVE, split
 from utils import clear_wids
 from .widgets import (
     GUI_PIC,
@@ -125,14 +124,11 @@ class RecruitChooser(CharacterChooser):
         """
         for id_, rec in items.items():
             cost = 150
-            for trait in rec.traits:
-                for trait_pair in base.labels.TRAITS:  # noqa: F821
-                    if trait == trait_pair[0]:
-                        cost += 20
-                        break
-                    if trait == trait_pair[1]:
-                        cost -= 20
-                        break
+            for trait in split(rec.traits):
+                if trait in POSITIVE:
+                    cost += 20
+                elif trait in NEGATIVE:
+                    cost -= 20
 
             self._costs[id_] = cost
 
@@ -588,7 +584,7 @@ class CityGUI:
         ):
             return
 
-        random.choice((self._coins_s_snd, self._coins_l_snd)).play()
+        base.rng.choice((self._coins_s_snd, self._coins_l_snd)).play()  # noqa: F821
 
         base.dollars -= self._res_chooser.chosen_resource_cost  # noqa: F821
         base.plus_resource(self._res_chooser.chosen_item, 1)  # noqa: F821
@@ -608,7 +604,7 @@ class CityGUI:
         if not base.resource(self._res_chooser.chosen_item):  # noqa: F821
             return
 
-        random.choice((self._coins_s_snd, self._coins_l_snd)).play()
+        base.rng.choice((self._coins_s_snd, self._coins_l_snd)).play()  # noqa: F821
 
         base.dollars += self._res_chooser.chosen_resource_cost  # noqa: F821
         base.plus_resource(self._res_chooser.chosen_item, -1)  # noqa: F821
@@ -674,6 +670,7 @@ class CityGUI:
 
         char.prepare()
         base.train.place_recruit(char)  # noqa: F821
+        base.common_ctrl.refresh_collisions()  # noqa: F821
         base.res_gui.update_chars()  # noqa: F821
         if not char.current_part.name == "part_rest":
             char.rest()
@@ -691,7 +688,7 @@ class CityGUI:
         if not base.res_gui.check_enough_money(spent):  # noqa: F821
             return
 
-        random.choice((self._coins_s_snd, self._coins_l_snd)).play()
+        base.rng.choice((self._coins_s_snd, self._coins_l_snd)).play()  # noqa: F821
 
         base.train.get_damage(-value)  # noqa: F821
         base.dollars -= spent  # noqa: F821
@@ -707,7 +704,7 @@ class CityGUI:
         if not base.res_gui.check_enough_money(value):  # noqa: F821
             return
 
-        random.choice((self._coins_s_snd, self._coins_l_snd)).play()
+        base.rng.choice((self._coins_s_snd, self._coins_l_snd)).play()  # noqa: F821
 
         self._char_chooser.chosen_item.health += value
         base.dollars -= value  # noqa: F821
@@ -724,7 +721,7 @@ class CityGUI:
         if not base.res_gui.check_enough_money(spent):  # noqa: F821
             return
 
-        random.choice((self._coins_s_snd, self._coins_l_snd)).play()
+        base.rng.choice((self._coins_s_snd, self._coins_l_snd)).play()  # noqa: F821
 
         self._char_chooser.chosen_item.energy += value
         base.dollars -= spent  # noqa: F821
@@ -4,8 +4,6 @@ License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
 
 In-game teaching notes GUI.
 """
-import random
-
 from direct.gui.DirectGui import DirectFrame, DirectLabel
 from panda3d.core import TransparencyAttrib
 
@@ -40,7 +38,7 @@ class TeachingNotes:
     def _hide_note(self, task):
         """Hide the current note and choose the next one."""
         self._fr.hide()
-        self._note_text = random.choice(base.labels.NOTES)  # noqa: F821
+        self._note_text = base.rng.choice(base.labels.NOTES)  # noqa: F821
         return task.done
 
     def _show_note(self, task):
@@ -54,7 +52,7 @@ class TeachingNotes:
 
     def resume(self):
         """Resume showing teaching notes."""
-        self._note_text = random.choice(base.labels.NOTES)  # noqa: F821
+        self._note_text = base.rng.choice(base.labels.NOTES)  # noqa: F821
         taskMgr.doMethodLater(200, self._show_note, "show_teaching_note")  # noqa: F821
 
     def start(self):
@@ -247,6 +247,7 @@ class OutingsGUI:
 
         char.prepare()
         base.train.place_recruit(char)  # noqa: F821
+        base.common_ctrl.refresh_collisions()  # noqa: F821
         base.res_gui.update_chars()  # noqa: F821
 
         self.hide_outing()
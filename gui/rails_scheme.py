@@ -9,10 +9,20 @@ from direct.gui.DirectGui import (
     DirectFrame,
     DirectLabel,
 )
-from panda3d.core import TextNode, TransparencyAttrib
+from panda3d.core import (
+    Camera,
+    NodePath,
+    OrthographicLens,
+    TextNode,
+    Texture,
+    TransparencyAttrib,
+)
 
 from utils import clear_wids
 
+# size of the texture, into which the static part of the scheme is rendered
+STATIC_TEX_SIZE = (1024, 280)
+
 
 class RailsScheme:
     """Rails scheme GUI.
@@ -20,6 +30,11 @@ class RailsScheme:
     Represents the railways map, which can be used by
     players to choose the right way across the game world.
 
+    The static part of the scheme: branches, cities, outings
+    and stations, is rendered into a texture, which is kept
+    until the world map changes. Only the Stench frontier
+    and the Train arrow are live widgets.
+
     Args:
         world_map (list): All the world blocks.
     """
@@ -27,6 +42,12 @@ class RailsScheme:
     def __init__(self, world_map):
         self.is_shown = False
         self._temp_wids = []
+        # the world map revision, which the static scheme texture shows
+        self._revision = None
+
+        self._static = NodePath("rails_scheme_static")
+        self._static.setDepthTest(False)
+        self._static.setDepthWrite(False)
 
         self._open_snd = loader.loadSfx("sounds/GUI/paper1.ogg")  # noqa: F821
         self._close_snd = loader.loadSfx("sounds/GUI/paper2.ogg")  # noqa: F821
@@ -56,12 +77,25 @@ class RailsScheme:
         )
         self._scheme.setTransparency(TransparencyAttrib.MAlpha)
 
+        self._static_card = DirectFrame(
+            parent=self._scheme,
+            frameSize=(-1.1, 1.1, -0.3, 0.3),
+            frameColor=(1, 1, 1, 1),
+        )
+        self._static_card.setTransparency(TransparencyAttrib.MAlpha)
+
         self._arrow = DirectFrame(
             parent=self._scheme,
             frameSize=(-0.02, 0.02, -0.02, 0.02),
             frameTexture="gui/tex/train_dir.png",
             pos=(-0.96, 0, 0.07),
         )
+        self._stench = DirectFrame(
+            parent=self._scheme,
+            frameColor=(0.71, 0.25, 0.05, 0.2),
+            frameSize=(0, 0, -0.22, 0.22),
+            pos=(-0.96, 0, 0),
+        )
         self._build_legend()
 
     def _build_legend(self):
@@ -118,13 +152,31 @@ class RailsScheme:
             **lab_opts,
         )
 
+    def _clear_static_render(self, buffer, cam, wids, frame, task):
+        """Destroy the offscreen scene of the static scheme.
+
+        Args:
+            buffer (panda3d.core.GraphicsOutput): One-shot buffer.
+            cam (panda3d.core.NodePath): Buffer camera.
+            wids (list): Widgets of the offscreen scene.
+            frame (int): Number of the frame, on which the render started.
+        """
+        # wait until the buffer is rendered
+        if globalClock.getFrameCount() <= frame + 1:  # noqa: F821
+            return task.cont
+
+        base.graphicsEngine.removeWindow(buffer)  # noqa: F821
+        cam.removeNode()
+        clear_wids(wids)
+        return task.done
+
     def _fill_branches(self):
         """Paint railway branches on the railways scheme."""
         for branch in base.world.branches:  # noqa: F821
             start = -0.96 + self._world_map[branch["start"]].id * 0.00385
             self._temp_wids.append(
                 DirectFrame(
-                    parent=self._scheme,
+                    parent=self._static,
                     frameTexture="gui/tex/dash.png",
                     frameSize=(-0.004, 0.004, -0.1, 0.1),
                     frameColor=(0, 0, 0, 0.2),
@@ -134,7 +186,7 @@ class RailsScheme:
             end = -0.96 + self._world_map[branch["end"]].id * 0.00385
             self._temp_wids.append(
                 DirectFrame(
-                    parent=self._scheme,
+                    parent=self._static,
                     frameTexture="gui/tex/dash.png",
                     frameSize=(-0.004, 0.004, -0.1, 0.1),
                     frameColor=(0, 0, 0, 0.2),
@@ -145,7 +197,7 @@ class RailsScheme:
             x_coor = (start + end) / 2
 
             horiz = DirectFrame(
-                parent=self._scheme,
+                parent=self._static,
                 frameTexture="gui/tex/dash.png",
                 frameSize=(-0.004, 0.004, -(x_coor - start), end - x_coor),
                 frameColor=(0, 0, 0, 0.2),
@@ -166,7 +218,7 @@ class RailsScheme:
                 outs = outs.lower()
                 self._temp_wids.append(
                     DirectLabel(
-                        parent=self._scheme,
+                        parent=self._static,
                         text=outs,
                         text_scale=0.035,
                         text_bg=(0, 0, 0, 0),
@@ -182,34 +234,40 @@ class RailsScheme:
         Shows cities, outings and railway branches on the scheme.
         """
         self._fill_branches()
+        topology = base.world.topology  # noqa: F821
+
+        # outings and stations of every hundred of the
+        # main line blocks are shown under the hundred
+        outs = {}
+        for block in topology.points("outing"):
+            if block.id < 500:
+                outs.setdefault(block.id // 100, []).append(
+                    (block.id, block.outing_available[0].lower())
+                )
 
-        outs = None
-        cities = 0
-        for block in self._world_map[:501]:
-            if block.id % 100 == 0:
-                if outs:
-                    self._temp_wids.append(
-                        DirectLabel(
-                            parent=self._scheme,
-                            text=outs,
-                            text_scale=0.035,
-                            text_bg=(0, 0, 0, 0),
-                            frameColor=(0, 0, 0, 0),
-                            pos=(-0.96 + (block.id - 50) * 0.00385, 0, -0.1),
-                        )
-                    )
-                outs = ""
-
-            if block.outing_available:
-                outs += block.outing_available[0].lower()
+        for block in topology.points("station"):
+            if block.id < 500:
+                outs.setdefault(block.id // 100, []).append((block.id, "i"))
 
-            if block.is_station:
-                outs += "i"
+        for hundred, hundred_outs in outs.items():
+            self._temp_wids.append(
+                DirectLabel(
+                    parent=self._static,
+                    text="".join(
+                        out for _, out in sorted(hundred_outs, key=lambda out: out[0])
+                    ),
+                    text_scale=0.035,
+                    text_bg=(0, 0, 0, 0),
+                    frameColor=(0, 0, 0, 0),
+                    pos=(-0.96 + (hundred * 100 + 50) * 0.00385, 0, -0.1),
+                )
+            )
 
-            if block.is_city:
+        for num, block in enumerate(topology.points("city")):
+            if block.id < 500:
                 self._temp_wids.append(
                     DirectFrame(
-                        parent=self._scheme,
+                        parent=self._static,
                         frameTexture="gui/tex/city.png",
                         frameSize=(-0.04, 0.04, -0.04, 0.04),
                         pos=(-0.96 + block.id * 0.00385, 0, 0),
@@ -217,8 +275,8 @@ class RailsScheme:
                 )
                 self._temp_wids.append(
                     DirectLabel(
-                        parent=self._scheme,
-                        text=base.labels.CITY_NAMES[cities],  # noqa: F821
+                        parent=self._static,
+                        text=base.labels.CITY_NAMES[num],  # noqa: F821
                         text_font=base.main_font,  # noqa: F821
                         text_scale=0.032,
                         text_bg=(0, 0, 0, 0),
@@ -226,21 +284,45 @@ class RailsScheme:
                         pos=(-0.96 + block.id * 0.00385, 0, 0.1),
                     )
                 )
-                cities += 1
-
-        self._temp_wids.append(
-            DirectFrame(
-                parent=self._scheme,
-                frameColor=(0.71, 0.25, 0.05, 0.2),
-                frameSize=(
-                    0,
-                    base.world.stench_step * 0.00385,  # noqa: F821
-                    -0.22,
-                    0.22,
-                ),
-                pos=(-0.96, 0, 0),
-            )
+
+    def _render_static(self):
+        """Render the static part of the scheme into a texture.
+
+        The scheme widgets are built in an offscreen scene, which
+        is rendered by a one-shot buffer together with the next
+        frame, and destroyed then.
+        """
+        self._fill_scheme()
+
+        tex = Texture("rails_scheme")
+        buffer = base.win.makeTextureBuffer(  # noqa: F821
+            "rails_scheme", *STATIC_TEX_SIZE, tex
         )
+        buffer.setClearColor((0, 0, 0, 0))
+        buffer.setOneShot(True)
+
+        lens = OrthographicLens()
+        lens.setFilmSize(2.2, 0.6)
+        lens.setNearFar(-1000, 1000)
+
+        cam = self._static.attachNewNode(Camera("rails_scheme_cam", lens))
+        buffer.makeDisplayRegion().setCamera(cam)
+
+        taskMgr.add(  # noqa: F821
+            self._clear_static_render,
+            "clear_rails_scheme_render",
+            extraArgs=[
+                buffer,
+                cam,
+                self._temp_wids,
+                globalClock.getFrameCount(),  # noqa: F821
+            ],
+            appendTask=True,
+        )
+        self._temp_wids = []
+
+        self._static_card["frameTexture"] = tex
+        self._revision = base.world.topology.revision  # noqa: F821
 
     def _update_arrow(self, task):
         """Update the Train position on the scheme."""
@@ -279,8 +361,6 @@ class RailsScheme:
             self._close_snd.play()
             self._list.hide()
             taskMgr.remove("update_scheme_arrow")  # noqa: F821
-
-            clear_wids(self._temp_wids)
         else:
             if base.world.is_on_et:  # noqa: F821
                 return
@@ -289,7 +369,15 @@ class RailsScheme:
             taskMgr.doMethodLater(  # noqa: F821
                 0.2, self._update_arrow, "update_scheme_arrow"
             )
-            self._fill_scheme()
+            if self._revision != base.world.topology.revision:  # noqa: F821
+                self._render_static()
+
+            self._stench["frameSize"] = (
+                0,
+                base.world.stench_step * 0.00385,  # noqa: F821
+                -0.22,
+                0.22,
+            )
             self._list.show()
             base.char_gui.clear_char_info(True)  # noqa: F821
 
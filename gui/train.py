@@ -225,7 +225,7 @@ class TrainGUI:
         """Turn the locomotive on the next fork.
 
         Args:
-            fork (world.block.Block): Fork block to turn on.
+            fork (world.block.BlockRecord): Fork block to turn on.
         """
         self._turn_snd.play()
         base.train.do_turn = 1  # noqa: F821
@@ -289,7 +289,7 @@ class TrainGUI:
         the default direction.
 
         Args:
-            fork (world.block.Block):
+            fork (world.block.BlockRecord):
                 Fork block to which the player is approaching.
             branch (str): Branch side indicator: "l" or "r".
             invert (bool):
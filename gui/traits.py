@@ -12,6 +12,7 @@ from direct.gui.DirectGui import (
 )
 from panda3d.core import TransparencyAttrib
 
+from units.crew.traits import count, label, split
 from utils import take_random
 from .widgets import GUI_PIC, RUST_COL, SILVER_COL, CharacterChooser
 
@@ -32,6 +33,9 @@ class TraitsGUI:
 
         self._cur_traits = []
         self._new_traits = []
+        # traits, shown on the buttons
+        self._cur_traits_shown = []
+        self._new_traits_shown = []
 
         self._open_snd = loader.loadSfx("sounds/GUI/paper1.ogg")  # noqa: F821
         self._close_snd = loader.loadSfx("sounds/GUI/paper2.ogg")  # noqa: F821
@@ -220,11 +224,11 @@ class TraitsGUI:
             return
 
         char = self._char_chooser.chosen_item
-        if len(char.traits) == 3:
+        if count(char.traits) == 3:
             return
 
         self._praise_snd.play()
-        char.traits.append(self._new_traits[self._ind_chosen][0]["text"])
+        char.traits |= self._new_traits_shown[self._ind_chosen]
 
         for but_pair in self._new_traits:
             but_pair[0]["text"] = ""
@@ -284,16 +288,17 @@ class TraitsGUI:
 
         char = self._char_chooser.chosen_item
 
-        pos_traits = list(base.labels.TRAIT_DESC.keys())  # noqa: F821
-        for trait in char.traits + char.disabled_traits:
-            pos_traits.remove(trait)
+        pos_traits = split(~(char.traits | char.disabled_traits))
+        self._new_traits_shown = []
 
         for index in range(3):
             new_trait = take_random(pos_traits)
-            self._new_traits[index][0]["text"] = new_trait
+            self._new_traits_shown.append(new_trait)
+
+            self._new_traits[index][0]["text"] = label(new_trait)
             self._new_traits[index][0]["text_fg"] = SILVER_COL
             self._new_traits[index][1]["text"] = base.labels.TRAIT_DESC[  # noqa: F821
-                new_trait
+                label(new_trait)
             ]
             self._new_traits[index][1]["text_fg"] = SILVER_COL
 
@@ -305,12 +310,10 @@ class TraitsGUI:
             return
 
         self._scold_snd.play()
-        trait = self._cur_traits[self._ind_chosen][0]["text"]
+        trait = self._cur_traits_shown[self._ind_chosen]
         char = self._char_chooser.chosen_item
-        if trait in char.traits:
-            char.traits.remove(trait)
-        if trait in char.disabled_traits:
-            char.disabled_traits.remove(trait)
+        char.traits &= ~trait
+        char.disabled_traits &= ~trait
 
         self._ind_chosen = None
         self._need_update = True
@@ -334,7 +337,8 @@ class TraitsGUI:
         self._scold_but["text_fg"] = SILVER_COL
         self._scold_but["command"] = None
 
-        traits = self._cur_char.traits + self._cur_char.disabled_traits
+        traits = split(self._cur_char.traits | self._cur_char.disabled_traits)
+        self._cur_traits_shown = traits
         self._cur_traits_num["text"] = "{label} ({num}/3):".format(
             label=base.labels.DISTINGUISHED[7], num=str(len(traits))  # noqa: F821
         )
@@ -349,12 +353,12 @@ class TraitsGUI:
         for index in range(3):
             if index + 1 <= len(traits):
                 trait = traits[index]
-                self._cur_traits[index][0]["text"] = trait
+                self._cur_traits[index][0]["text"] = label(trait)
                 self._cur_traits[index][0]["text_fg"] = SILVER_COL
                 self._cur_traits[index][1][
                     "text"
                 ] = base.labels.TRAIT_DESC[  # noqa: F821
-                    trait
+                    label(trait)
                 ]
                 self._cur_traits[index][1]["text_fg"] = SILVER_COL
             else:
@@ -0,0 +1,95 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+The game credits texts written in English language.
+"""
+
+CREDITS = """
+Great job, Captain! You've found your way through
+this rough and inimical country of Silewer. It's
+not over yet, there will be more to sacrifice,
+but until now you survived the adversity. Let's
+summarize the decisions you've made.
+\n\n
+Chapter 1
+"Something's acting up"
+- {decision_0}
+
+Chapter 2
+"Orphans"
+- {decision_1}
+
+Chapter 3
+"Bad cops"
+- {decision_2}
+
+Chapter 4
+"The last place"
+- {decision_3}
+
+Chapter 5
+"Refugees not welcome"
+- {decision_4}
+
+Chapter 6
+"Low on food"
+- {decision_5}
+
+Chapter 7
+"Blockpost"
+- {decision_6}
+
+Chapter 8
+"Supplies stealer"
+- {decision_7}
+
+Chapter 9
+"Little one"
+- {decision_8}
+\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n
+These decisions characterize you {leader_desc}
+\n\n\n\n\n\n\n\n\n\n\n\n\n
+Forward Only
+Episode 1
+Seepage
+\n\n
+Developed by
+Ilya Faer
+
+Music by
+Moloken
+Among Madness
+Yeruselem
+Квалиа
+
+\n\n\n\n\n\n\n\n
+To be continued...
+"""
+
+ROUGH_LEADER = """
+as a cold blooded and harsh leader. You see
+your purpose and you achieve it no matter
+the cost. The real life is cruel and unjust,
+you accept it and bring sacrifices when
+necessary. To make the machine move, you
+have to burn fuel after all.
+"""
+
+OPPORTUNIST_LEADER = """
+as an opportunist. It's hard to say
+whether you're good or cruel, you're
+mostly a selective one. You're making
+decisions that better fit the situation
+itself, than morals. And it brings good
+as well as pain to those around you.
+"""
+
+EMPATHIC_LEADER = """
+as an empathetic leader. You're doing
+your best for your people, but you also
+make sure not to hurt others without
+a good strong reason. Even the End Of
+Days doesn't destroy your compassion
+and human decency. Hold this!
+"""
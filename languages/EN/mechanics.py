@@ -0,0 +1,168 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+The game mechanics descriptions written in English language.
+"""
+
+MECHANIC_DESC = {
+    "locomotive": {
+        "descs": (
+            (
+                "This is the Adjutant - your locomotive. It moves fast\n"
+                "enough to outrun death, so take care of it. If\n"
+                "it'll not be able to ride, your hours are numbered.\n"
+                "Its Durability is reflected in the right bottom\n"
+                "corner of the GUI. Keep an eye for rusty rails, they\n"
+                "damage your wheels - slow down if you hear creak."
+            ),
+            (
+                "The Adjutant includes three parts and a rest\n"
+                "zone, where you can arrange your crewmates.\n"
+                "Wise units rotation is the key to success.\n\n"
+                "Train speed is reflected in the right bottom corner.\n"
+                "Hold W and S keys to accelerate and decelerate."
+            ),
+        ),
+        "previews": ("locomotive1", "locomotive2"),
+    },
+    "characters": {
+        "descs": (
+            (
+                "Your crew consists of several unique fighters. Every\n"
+                "unit has energy, which should be kept at a high\n"
+                "level, as it influences character's shooting accuracy\n"
+                "and efficiency on outings. The simplest way to\n"
+                "restore unit's energy and health is to make them rest."
+            ),
+            (
+                "Click LMB on a character to choose them; control\n"
+                "arrows will appear - click RMB on one to move\n"
+                "the character to the related locomotive part,\n"
+                "or click RMB on the rest zone to make them rest.\n"
+                "Number of unit cells on every part is limited."
+            ),
+        ),
+        "previews": (
+            "characters1",
+            "characters2",
+        ),
+    },
+    "the Stench": {
+        "descs": (
+            (
+                "The main threat is the Stench. Its poisonous clouds\n"
+                "are spreading fast and chaotic, and most likely will\n"
+                "cover the whole Silewer in a couple of weeks. If\n"
+                "you got into it, you better accelerate to cross the\n"
+                "cloud as fast as possible. You also should not\n"
+                "stay long on the same place or ride in circles."
+            ),
+            (
+                "You need to find a way to survive the Stench. There\n"
+                "are several places of interest in Silewer - visit at\n"
+                "least 8 of them for useful information. Use the\n"
+                "railways scheme (press M) to plan your route.\n"
+                "You can also see outing abilities and the Stench\n"
+                "coverage on the railways scheme."
+            ),
+        ),
+        "previews": ("the_stench1", "map"),
+    },
+    "cohesion": {
+        "descs": (
+            (
+                "Your characters build cohesion with each other\n"
+                "by time. Total crew cohesion is reflected at\n"
+                "the right top corner of the screen. Increasing\n"
+                "cohesion unlocks crew skills - powerful temporary\n"
+                "effects, which influence your every character.\n"
+            ),
+            (
+                "It's worth keeping units with high cohesion on\n"
+                "the same locomotive part, as they'll get higher\n"
+                "strength factor. Cohesion also increases faster\n"
+                "between characters on the same part. To see\n"
+                "cohesion level of the unit with others, press R."
+            ),
+        ),
+        "previews": ("cohesion1", "cohesion2"),
+    },
+    "outings": {
+        "descs": (
+            (
+                "Outings are the main source of money and other\n"
+                "facilities. It's an event that requires you to\n"
+                "stop and send units for it. There are three types\n"
+                "of outings: Looting, Meet and Enemy Camp, each\n"
+                "offers own type of trophies and prefers an\n"
+                "exact unit class to be sent for it."
+            ),
+            (
+                "An outing have five finals; the higher is your score,\n"
+                "the better is final. Score includes four items:\n"
+                "class fit - for the sent units class, condition - for\n"
+                "their health and energy, cohesion - for total cohesion\n"
+                "of the units, and a small random piece of score."
+            ),
+        ),
+        "previews": ("outings1", "outings2"),
+    },
+    "resources": {
+        "descs": (
+            (
+                "You can find resources on outings or buy in cities.\n"
+                "To use a resource, choose a unit and then click\n"
+                "the resource button. Money is the major resource\n"
+                "among all, you can spend it in cities for repair,\n"
+                "healing, recruiting and upgrading the Adjutant."
+            ),
+            (
+                "There is an active weapon on Adjutant - machine gun.\n"
+                "It enables during fight - press 2 to choose it,\n"
+                "aim at an enemy unit and hold left mouse button\n"
+                "to shoot. You can install more active weapons in a\n"
+                "city, but it'll require significant expenses."
+            ),
+        ),
+        "previews": ("resources1", "machine_gun"),
+    },
+    "character status": {
+        "descs": (
+            (
+                "Every character can have up to three traits (good\n"
+                "and bad). Traits give (dis-)advantages and can\n"
+                "be considered as perks. You can change character's\n"
+                "traits in Distinguished List, but remember that\n"
+                "it'll lower common crew cohesion for some time."
+            ),
+            (
+                "The current effects influencing the unit can be\n"
+                "seen in their Status GUI. Also keep an eye for\n"
+                "the disease icon - a sick character can bring a\n"
+                "lot of troubles for the crew. Try to isolate\n"
+                "diseased and cure them as soon as possible."
+            ),
+        ),
+        "previews": ("character_status1", "character_status2"),
+    },
+    "SCP": {
+        "descs": (
+            (
+                "You're about to meet SCP-4945-B! Kill instances\n"
+                "on its board, but don't use heavy weapons against\n"
+                "the train not to hurt the D. child. Avoid the\n"
+                "violet light, it can scorch your people. Speed\n"
+                "up or slow down to dodge the light ray."
+            ),
+            (
+                "Violet suns are very harmful - try to shot them,\n"
+                "including with the locomotive active weapons,\n"
+                "before they'll touch the Adjutant. Also you can\n"
+                "use the Armor Plate upgrade for protection\n"
+                "against their touch."
+            ),
+        ),
+        "previews": ("light", "suns"),
+    },
+}
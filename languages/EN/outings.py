@@ -2,817 +2,9 @@
 Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
 License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
 
-The game text labels wirrten in English language.
+The outings texts written in English language.
 """
 
-MAIN_MENU = (
-    "New game",
-    "Load game",
-    "Options",
-    "Exit",
-    (
-        "It's a beta release. The game is not finally balanced and some"
-        " features are in development yet. Enjoy your play!\n"
-        """(c) Created by Ilya "Faer" Gurov. All rights reserved."""
-    ),
-    "Choose your crew",
-    "Soldiers",
-    "Raiders",
-    "Anarchists",
-    "Crew description",
-    "Start",  # 10
-    (
-        "Soldiers are people of a tough discipline. They are good "
-        "shooters at medium\ndistance and good fortification assaulters. "
-        "Their tactic is based mostly on a good\ndefence and locomotive "
-        "upgrading, which can make the Train a real fortress.\n\n"
-        "You'll start with 3 soldier males. "
-        "Preferred outings type: Enemy Camp."
-    ),
-    (
-        "Raiders are accustomed to difficulties and can recover from "
-        "anything. They are\ngood fighters at short distance and they "
-        "know how to find resources. Their tactic\nis based on getting "
-        "and using expendable resources and fast recovering.\n\n"
-        "You'll start with 2 male and 1 female raiders. "
-        "Preferred outings type: Looting."
-    ),
-    (
-        "Anarchists are the force of nature! They build cohesion "
-        "faster than others and\nalways value those, who life brought "
-        "them with. The tactic is based on\ngetting more people, "
-        "tweaking their traits and using crew skills.\n\n"
-        "You'll start with 2 male and 1 female anarchists. "
-        "Preferred outings type: Meet."
-    ),
-    "Main menu",
-    "Save game",
-    "(blocked during fight)",
-    "(blocked near a city)",
-    "(blocked near a fork)",
-    "(blocked on game over)",
-    "(blocked on game start)",  # 20
-    "Resume",
-    "Resolution:",
-    "Tutorial:",
-    "Language:",
-    "Save and restart",
-    "Loading...",
-    "Take command",
-    (
-        "The Adjutant is critically damaged!\n"
-        "You're not able to continue the road, and\n"
-        "the Stench will not keep you waiting long.\n\n"
-        "It's all over...",
-    ),
-    "Framerate limit:",
-    "Credits",  # 30
-    """Created by Ilya "Faer" Gurov""",
-    "Project source code",
-    "Subscribe",
-    "Stack",
-    "Tools",
-    "FPS meter:",
-    "Multi threading:",
-    """(boosts FPS, but on some systems
-can cause flaky failures on
-new game start or loading)""",
-    "Music",
-)
-
-KEYS_INFO = """
-Game controls:
-Mouse Left Button - choose character/rest zone
-Mouse Right Button - move character/set target
-R - show the character's cohesion with others
-
-W - hold to accelerate
-S - hold to slow down
-F - toggle flood lights
-M - see railways scheme
-J - open journal
-
-Camera:
-\u2190\u2191\u2193\u2192 or push screen edge with mouse - move
-Alt + \u2190\u2191\u2193\u2192 or hold mouse wheel - rotate
-"+", "-" or scroll mouse wheel - zoom
-C - toggle centered view
-
-New Year spirit:
-7 - toggle the garland
-8 - flapper shot (if the garland is on)
-
-St. Valentine's Day:
-9 - toggle the mode
-
-SCP Crossover:
-0 - toggle dossiers
-"""
-
-RESOURCES = (
-    "Resources:",
-    "Medicine",
-    "Cure disease and wounds of a character",
-    "Smoke filter",
-    "Reduce skinhead attack chance (5 min)",
-    "Stimulator",
-    "Disable negative traits and deafening (5 min)",
-    " mi",
-    "Place of interest",
-    "Visit at least 8 of 10 to win the game",
-)
-
-CHARACTERS = ("Name:", "Class:", "Health", "Energy", "Status", "Traits")
-CITY = (
-    "Services",
-    "Party",
-    "Train",
-    "Exit city",
-    "Turn around and exit",
-    "Locomotive",
-    "Repair",
-    "Upgrades",
-    "Purchase",
-    "Crew",
-    "Recruits",  # 10
-    "Resources",
-    "Leave unit",
-    "Hire unit",
-    "Sell",
-    "Buy",
-    """The city government awards
-you with money for
-your help in clearing
-the region of skinheads.
-
-Heads you've taken:
-""",
-    "Total reward:\n",
-    """This city dwellers heard that
-you helped orphans to build
-camp. They respect good
-people and want to encourage
-you - the Adjutant gets +250
-Durability points free.""",
-)
-
-NOTES = (
-    # controls
-    """Don't forget to read notes
-in the Captain's Journal.
-They can tell you a lot.""",
-    """Don't forget to save your
-game progress!""",
-    """Choose a character and press
-right mouse button on
-another one to exchange
-their positions""",
-    # traits
-    """Single character can have up
-to three different traits""",
-    """Characters with strong cohesion
-can randomly adopt traits
-from each other""",
-    """You can exchange the crew
-cohesion for character
-traits in the List Of
-Distinguished""",
-    # enemy
-    """Skinheads activity is at
-maximum during evening""",
-    """Skinheads activity is at
-minimum during morning""",
-    """The slower the Train is moving
-the easier for enemies to
-hit it with throwing weapon""",
-    """Some enemies are shooting, some
-are slowing you down, some
-are deafening your people.
-Study their tactics!""",
-    """Enemy territory is not
-considered on the railways
-scheme""",
-    """Governments of Silewer cities
-will reward you with
-money for destroying
-skinheads nearby""",
-    # cohesion
-    """Increasing crew cohesion unlocks
-crew skills. These are powerful
-temporary effects, which can
-help you to survive.""",
-    """Raiders and soldiers don't like
-each other. It's hard to build
-cohesion between them.""",
-    """To build stronger cohesion
-between particular characters
-keep them closer to
-each other""",
-    """Good way to increase cohesion
-between particular characters
-is to send them for outing""",
-    # outings
-    """Different types of outings
-are offering different
-kinds of trophies""",
-    """Outing can turn dangerous, it's
-better to send people who are
-familiar with each other to
-get better chances""",
-    """You can not command your people
-while they are on outing. You
-only can choose right people
-to send.""",
-    """Some outings can turn very
-dangerous, while other are
-sure case. Take your risks!""",
-    """When planning a route on a
-railways scheme, don't
-forget to consider
-outings""",
-    """Press M to see the railways
-scheme and choose an
-optimal route""",
-    """Railway branches always merge
-back to the main
-railway line""",
-    """Even bad outing result can
-be very useful -
-characters will
-increase cohesion""",
-    """Recruits found on Meet outings
-request less fee
-than in cities""",
-    # Train
-    """You can turn around in a city.
-Consider it, while choosing
-an optimal route.""",
-    """It's reckless to stop while
-on enemy territory""",
-    """Switching on lights helps to save
-characters energy and to increase
-their accuracy, but also attracts
-enemy attention""",
-    """Deteriorated rusty rails
-can damage your Train wheels.
-Slow down when you hear a
-metal creak.""",
-    """Locomotive active weapons
-can only be used
-on enemy territory""",
-    """Want to increase fire power?
-Purchase active weapons
-in a city.""",
-    # characters and classes
-    """Women are nice and social, they
-reduce stress at any collective""",
-    """Women have less health points,
-but they are much more
-energetic""",
-    """People tired faster while in
-dark and during fight""",
-    """Don't forget to check units'
-status on the character
-detailed GUI""",
-    # raiders
-    """Raider's life is mostly about
-looting. They know how to find
-useful things.""",
-    """Raiders are good shooters at
-short distance""",
-    """Raiders are spending energy
-faster, but they also rest
-faster than others""",
-    # soldiers
-    """Soldiers are good shooters at
-medium distance""",
-    """If you want to hit an enemy
-fortification, soldiers are
-your choice""",
-    # anarchists
-    """Anarchists are companionable,
-they build cohesion much
-faster than others""",
-    """Anarchists get strength factor
-x2 from cohesion""",
-    """Anarchists are people from
-crowd. They value mutual
-assistance with those
-life has brought them.""",
-    # accuracy
-    """Shooting accuracy is affected
-by lighting, distance,
-character class and
-their energy level""",
-    """Send your character into a Train
-rest zone. Rest helps to regain
-energy and heal wounds.""",
-    # diseases
-    """Disease lowers character energy
-maximum down to 80 and disables
-all the positive traits until
-getting well""",
-    """Try to reduce diseased character
-contacts to avoid spreading
-the infection""",
-    """Wounded and tired characters are
-more vulnerable for diseases""",
-    # the Stench
-    """The Stench orange clouds are
-highly poisonous. Cross
-them as fast as you can.""",
-    # resources
-    """Stimulator temporarily disables
-the character's negative
-traits. It also gives
-immunity from deafening.""",
-)
-
-DEFAULT_NOTE = "Press F1 key to open game\ncontrols help"
-
-TIPS = ("Resting:", "Rest zone", "Approaching a city")
-
-COHESION = (
-    "Crew skills",
-    "Recall the past",
-    "Every character gets +10 energy. Cooldown: 4 min.",
-    "Cover fire",
-    "Every character gets +20% accuracy. Cooldown: 5 min.",
-    "Not leaving ours",
-    "Characters with health < 30 getting +25 health. Cooldown: 8 min.",
-    "Common rage",
-    "Every character gets +30% strength. Cooldown: 10 min.",
-    "Hold together",
-    "No characters will die in next 1 min. Cooldown: 10 min.",
-)
-
-DISTINGUISHED = (
-    "List of distinguished",
-    (
-        "Here you can praise your people or scold them "
-        "to change their traits.\nPointing to a person is "
-        "usually harmful for collective relations,\nso every "
-        "praise/scold will reduce common crew cohesion a bit.\n\n"
-        "Choose one of the current character's traits (positive "
-        "or negative) and\nscold the character to erase the trait. "
-        "It'll cost you 4 cohesion points.\n\n"
-        "If the character has less than 3 traits, you can praise "
-        "them to\ngenerate 3 new traits and add one of them "
-        "to the character's\ntraits list. It'll cost you 4 "
-        "cohesion points."
-    ),
-    "Cohesion points:",
-    "New traits:",
-    "Praise",
-    "Scold",
-    "Done",
-    "Current traits",
-)
-
-SPLASHES = (
-    "Word from author",
-    """Forward Only will strangle you gradually for your mistakes
-instead of punishing at once. Calculate steps ahead!""",
-)
-
-MECHANIC_DESC = {
-    "locomotive": {
-        "descs": (
-            (
-                "This is the Adjutant - your locomotive. It moves fast\n"
-                "enough to outrun death, so take care of it. If\n"
-                "it'll not be able to ride, your hours are numbered.\n"
-                "Its Durability is reflected in the right bottom\n"
-                "corner of the GUI. Keep an eye for rusty rails, they\n"
-                "damage your wheels - slow down if you hear creak."
-            ),
-            (
-                "The Adjutant includes three parts and a rest\n"
-                "zone, where you can arrange your crewmates.\n"
-                "Wise units rotation is the key to success.\n\n"
-                "Train speed is reflected in the right bottom corner.\n"
-                "Hold W and S keys to accelerate and decelerate."
-            ),
-        ),
-        "previews": ("locomotive1", "locomotive2"),
-    },
-    "characters": {
-        "descs": (
-            (
-                "Your crew consists of several unique fighters. Every\n"
-                "unit has energy, which should be kept at a high\n"
-                "level, as it influences character's shooting accuracy\n"
-                "and efficiency on outings. The simplest way to\n"
-                "restore unit's energy and health is to make them rest."
-            ),
-            (
-                "Click LMB on a character to choose them; control\n"
-                "arrows will appear - click RMB on one to move\n"
-                "the character to the related locomotive part,\n"
-                "or click RMB on the rest zone to make them rest.\n"
-                "Number of unit cells on every part is limited."
-            ),
-        ),
-        "previews": (
-            "characters1",
-            "characters2",
-        ),
-    },
-    "the Stench": {
-        "descs": (
-            (
-                "The main threat is the Stench. Its poisonous clouds\n"
-                "are spreading fast and chaotic, and most likely will\n"
-                "cover the whole Silewer in a couple of weeks. If\n"
-                "you got into it, you better accelerate to cross the\n"
-                "cloud as fast as possible. You also should not\n"
-                "stay long on the same place or ride in circles."
-            ),
-            (
-                "You need to find a way to survive the Stench. There\n"
-                "are several places of interest in Silewer - visit at\n"
-                "least 8 of them for useful information. Use the\n"
-                "railways scheme (press M) to plan your route.\n"
-                "You can also see outing abilities and the Stench\n"
-                "coverage on the railways scheme."
-            ),
-        ),
-        "previews": ("the_stench1", "map"),
-    },
-    "cohesion": {
-        "descs": (
-            (
-                "Your characters build cohesion with each other\n"
-                "by time. Total crew cohesion is reflected at\n"
-                "the right top corner of the screen. Increasing\n"
-                "cohesion unlocks crew skills - powerful temporary\n"
-                "effects, which influence your every character.\n"
-            ),
-            (
-                "It's worth keeping units with high cohesion on\n"
-                "the same locomotive part, as they'll get higher\n"
-                "strength factor. Cohesion also increases faster\n"
-                "between characters on the same part. To see\n"
-                "cohesion level of the unit with others, press R."
-            ),
-        ),
-        "previews": ("cohesion1", "cohesion2"),
-    },
-    "outings": {
-        "descs": (
-            (
-                "Outings are the main source of money and other\n"
-                "facilities. It's an event that requires you to\n"
-                "stop and send units for it. There are three types\n"
-                "of outings: Looting, Meet and Enemy Camp, each\n"
-                "offers own type of trophies and prefers an\n"
-                "exact unit class to be sent for it."
-            ),
-            (
-                "An outing have five finals; the higher is your score,\n"
-                "the better is final. Score includes four items:\n"
-                "class fit - for the sent units class, condition - for\n"
-                "their health and energy, cohesion - for total cohesion\n"
-                "of the units, and a small random piece of score."
-            ),
-        ),
-        "previews": ("outings1", "outings2"),
-    },
-    "resources": {
-        "descs": (
-            (
-                "You can find resources on outings or buy in cities.\n"
-                "To use a resource, choose a unit and then click\n"
-                "the resource button. Money is the major resource\n"
-                "among all, you can spend it in cities for repair,\n"
-                "healing, recruiting and upgrading the Adjutant."
-            ),
-            (
-                "There is an active weapon on Adjutant - machine gun.\n"
-                "It enables during fight - press 2 to choose it,\n"
-                "aim at an enemy unit and hold left mouse button\n"
-                "to shoot. You can install more active weapons in a\n"
-                "city, but it'll require significant expenses."
-            ),
-        ),
-        "previews": ("resources1", "machine_gun"),
-    },
-    "character status": {
-        "descs": (
-            (
-                "Every character can have up to three traits (good\n"
-                "and bad). Traits give (dis-)advantages and can\n"
-                "be considered as perks. You can change character's\n"
-                "traits in Distinguished List, but remember that\n"
-                "it'll lower common crew cohesion for some time."
-            ),
-            (
-                "The current effects influencing the unit can be\n"
-                "seen in their Status GUI. Also keep an eye for\n"
-                "the disease icon - a sick character can bring a\n"
-                "lot of troubles for the crew. Try to isolate\n"
-                "diseased and cure them as soon as possible."
-            ),
-        ),
-        "previews": ("character_status1", "character_status2"),
-    },
-    "SCP": {
-        "descs": (
-            (
-                "You're about to meet SCP-4945-B! Kill instances\n"
-                "on its board, but don't use heavy weapons against\n"
-                "the train not to hurt the D. child. Avoid the\n"
-                "violet light, it can scorch your people. Speed\n"
-                "up or slow down to dodge the light ray."
-            ),
-            (
-                "Violet suns are very harmful - try to shot them,\n"
-                "including with the locomotive active weapons,\n"
-                "before they'll touch the Adjutant. Also you can\n"
-                "use the Armor Plate upgrade for protection\n"
-                "against their touch."
-            ),
-        ),
-        "previews": ("light", "suns"),
-    },
-}
-
-MECHANIC_NAMES = (
-    "locomotive",
-    "characters",
-    "the Stench",
-    "cohesion",
-    "outings",
-    "resources",
-    "character status",
-)
-
-MECHANIC_BUTS = ("Next", "Got it!")
-
-CLASS_DESCS = {
-    "MotoShooter": {
-        "desc": (
-            "Moto shooter will try to shoot at you and\n"
-            "your locomotive as much as he can. Most of\n"
-            "the skinheads prefer such a way of\n"
-            "communication with foreigners, so stay\n"
-            "sharp - there will be a lot of them."
-        ),
-        "preview": "shooter",
-        "but_text": "Got it!",
-        "title": "Some skinheads searching for you!",
-    },
-    "BrakeThrower": {
-        "desc": (
-            "Brake thrower will try to outrun you and\n"
-            "throw a brake shoe under your wheels to slow\n"
-            "you down. Such guys are not tough themselves,\n"
-            "but they can make other skinhead attacks more\n"
-            "successful. Try to deal with them fast!"
-        ),
-        "preview": "brake_thrower",
-        "but_text": "Understood!",
-        "title": "Skinheads rumor about dare newcomers!",
-    },
-    "Barrier": {
-        "desc": (
-            "Now skinheads are using heavy barriers to get\n"
-            "to you. A barrier can do a lot of damage to your\n"
-            "locomotive on a clash. It's highly recommended to\n"
-            "set the Ram train upgrade in the nearest city\n"
-            "to get better protection from barriers."
-        ),
-        "preview": "barrier",
-        "but_text": "We'll deal with it!",
-        "title": "Skinheads start to use barriers!",
-    },
-    "StunBombThrower": {
-        "desc": (
-            "Such a guy uses stun bombs to make your fighters\n"
-            "non-operational for several seconds. It's hard for\n"
-            "a thrower to get right into a fast moving target,\n"
-            "but if you'll lose some of your speed, throw\n"
-            "efficiency will significantly increase."
-        ),
-        "preview": "bomb_thrower",
-        "but_text": "We're ready!",
-        "title": "Skinheads start to take you seriously!",
-    },
-    "DodgeShooter": {
-        "desc": (
-            "Dodge with a machine gun is a strong enemy! It can\n"
-            "do a lot of damage to your locomotive, but its\n"
-            "machine gun overheats fast and requires time to\n"
-            "cool down. Armor Plate train upgrade recommended\n"
-            "to be used for protection against this enemy."
-        ),
-        "preview": "dodge",
-        "but_text": "Bring'em on!",
-        "title": "Skinheads gather vehicles to deal with you!",
-    },
-    "Rocket": {
-        "desc": (
-            "Your progress is really pissing skinheads off.\n"
-            "To stop you they bring more and more forces.\n"
-            "Their new thought - telecontrolled rockets - can\n"
-            "do a lot of damage to your locomotive. Use Armor\n"
-            "Plate upgrade to cover a side targeted by a rocket."
-        ),
-        "preview": "rocket",
-        "but_text": "They won't stop us!",
-        "title": "Skinheads start to use rockets!",
-    },
-    "Kamikaze": {
-        "desc": (
-            "Skinhead kamikazes are after you! They can do\n"
-            "a lot of damage to the Adjutant, use Armor Plate\n"
-            "upgrade to protect the locomotive. You can also\n"
-            "destroy those guys before they'll ignite the wick.\n"
-            "If done in a right moment, they damage other enemies."
-        ),
-        "preview": "kamikaze",
-        "but_text": "We'll defeat them!",
-        "title": "All skinheads are chasing you!",
-    },
-}
-
-SCHEME = (
-    "Silewer Railways Scheme",
-    "Legend:\nm - Meet\nl - Looting\ne - Enemy Camp\ni - Place of interest",
-    "- city",
-    "- railway branch",
-    "- the Stench",
-)
-
-TRAITS = [
-    ("Fast hands", "Snail"),  # 0
-    ("Cat eyes", "Fear of dark"),  # 1
-    ("Masochism", "Hemophobia"),  # 2
-    ("Immunity", "Weak immunity"),  # 3
-    ("Liberal", "Loner"),  # 4
-    ("Bloodthirsty", "Nervousness"),  # 5
-    ("Deep breath", "Motion sickness"),  # 6
-    ("Mechanic", "Pharmacophobia"),  # 7
-]
-
-TRAIT_DESC = {
-    "Fast hands": "+30% shooting speed",
-    "Snail": "-20% shooting speed",
-    "Cat eyes": "+25% accuracy in darkness",
-    "Fear of dark": "+50% energy spend in darkness",
-    "Masochism": "regain energy when getting damage",
-    "Hemophobia": "+25% energy spend, if health < 50%",
-    "Immunity": "-40% chance to get sick",
-    "Weak immunity": "+20% chance to get sick",
-    "Liberal": "+30% cohesion increase with other classes",
-    "Loner": "x1.3 strength while alone on the Train part",
-    "Bloodthirsty": "+7 health for a killed enemy unit",
-    "Nervousness": "+25% energy spend while in fight",
-    "Deep breath": "Avoid the Stench poison for the first 1 min",
-    "Motion sickness": "Doesn't restore on high movement speed",
-    "Mechanic": "Repairs the Train, while not resting",
-    "Pharmacophobia": "Self-healing 40% slower",
-}
-
-UPGRADES_DESC = {
-    "Ram": {
-        "name": "Ram",
-        "desc": """With this ram your locomotive
-will be breaking road barriers
-without getting damage""",
-        "cost": "120$",
-        "model": "ram1",
-        "threshold": 1,
-    },
-    "Floodlights": {
-        "name": "Floodlights",
-        "desc": """All the negative darkness
-factors are no more actual
-with these floodlights on""",
-        "cost": "190$",
-        "model": "floodlights1",
-        "threshold": 2,
-    },
-    "Armor Plate": {
-        "name": "Armor Plate",
-        "desc": """An active shield which can
-cover one of the Train sides.
-Press 4, 5, 6 keys to move it.""",
-        "cost": "70$",
-        "model": "armor_plate",
-        "threshold": 1,
-    },
-    "Fire Extinguishers": {
-        "name": "Fire Extinguishers",
-        "desc": """Gradually restores locomotive
-durability up to 400 points
-in case of a big damage""",
-        "cost": "190$",
-        "model": "fire_extinguishers",
-        "threshold": 2,
-    },
-    "Grenade Launcher": {
-        "name": "Grenade Launcher",
-        "desc": """Active gun, which can do a
-lot of damage on a small area.
-Press 1 key to aim and shoot.""",
-        "cost": "170$",
-        "model": "grenade_launcher",
-        "threshold": 1,
-    },
-    "Sleeper": {
-        "name": "Sleeper",
-        "desc": """Add one more character cell
-into the locomotive rest zone""",
-        "cost": "140$",
-        "model": "sleeper1",
-        "threshold": 1,
-    },
-    "Window Frames": {
-        "name": "Window Frames",
-        "desc": """With this window frames
-characters in the rest zone are
-protected from the Stench""",
-        "cost": "150$",
-        "model": "isolation",
-        "threshold": 2,
-    },
-    "Cluster Howitzer": {
-        "name": "Cluster Howitzer",
-        "desc": """Shots a cluster rocket, which
-splits to four grenades, doing
-damage on several circles.
-Press 3 to aim and shoot.""",
-        "cost": "180$",
-        "model": "cluster_bomb_launcher",
-        "threshold": 2,
-    },
-    "Machine Gun": {
-        "name": "Machine Gun",
-        "desc": """Fires aiming burst. Better be
-used for a single target.
-Press 2 to aim and shoot.""",
-        "cost": "150$",
-        "model": "machine_gun",
-        "threshold": 2,
-    },
-    "Protectors": {
-        "name": "Protectors",
-        "desc": """Armor for wheels and pushing
-mechanism. Increases max
-Durability to 150%.""",
-        "cost": "160$",
-        "model": "armor",
-        "threshold": 1,
-    },
-}
-
-FORKS = (
-    "Approaching a fork:\npress T to turn right\nignore to proceed",
-    "Approaching a fork:\npress T to turn left\nignore to proceed",
-    "Approaching a fork:\npress T to turn to branch\nignore to proceed",
-)
-
-JOURNAL = ("Journal", "Notes:", "Diary:")
-
-STATUSES = (
-    "Cat eyes: +5% accuracy",
-    "Dark: -10% accuracy",
-    "Dark: -20% accuracy",
-    "Tired: -{}% accuracy",
-    "Strength factor: x{}",
-    "Hemophobia: +25% energy spend",
-    "Sick: -20 max energy",
-    "Motion sickness: doesn't restore",
-)
-
-OUTINGS_GUI = (
-    "People to send ({cur_as}/{max_as}):",
-    "Total outing score:\n",
-    "Don't send",
-    "Send",
-    "Outing score:",
-    "Character classes fit:",
-    "Characters condition:",
-    "Characters cohesion:",
-    "Day part:",
-    "Crew:",
-    "Recruit",  # 10
-    "Don't recruit",
-    "You can recruit {name} for {cost}$",
-    "Get {trait} trait\n ({desc})",
-    "Select one character as a target for the effect:",
-    "Cohesion increased: +{value} points",
-)
-
-NOTIFIERS = (
-    "Place of interest! Stopping",
-    '"{}" outing available in 2 miles',
-    "2 miles",
-    "1 miles",
-    "Stop to start outing",
-)
-
 OUTINGS = [
     {  # 0
         "name": "Car Column",
@@ -2974,1968 +2166,3 @@ One person can be recruited""",
         ),
     },
 ]
-
-OUTING_TYPES = {"Looting": "Looting", "Meet": "Meet", "Enemy Camp": "Enemy Camp"}
-
-PRONOUNS = ("he", "his", "him", "she", "her", "her")
-
-SCENARIO = (
-    {  # 1
-        "intro": """Kenneth - the Adjutant mechanic approaches your table and
-sits to the right of you. "Captain, we probably have a
-trouble." You're uppering a spoon full of dry porridge
-to your mouth: "Yeah?!" "Yeah. Come see me after your
-snack is over." He gets up and leaves the deckhouse.
-
-Finished the awfully tasteless portion, you're walking to the
-lower level of the Adjutant. Before you pronounce a word,
-Kenneth rises his finger up, asking you to listen. You're
-concentrating on the noises of the dark and smelling with
-masut room... "Hear that?" - the mechanic points to the
-left wall, and you understand what he's trying to say. Some
-metal screeching can be heard from there. "The axle box,
-something's acting up." - Kenneth explains silently. - "We
-need to check, it'll take time." You're trying to remember
-how far was the Stench frontier, when you last heard of it.
-"Options?" Looking at you, Kenneth calculates something in his
-mind: "We need five hours long stop to deal with it." It's
-much. "Other options?" The mechanic seems to be not very
-pleasant to say it, but he does: "We can try to do it on move.
-But it's dangerous and will require two men - me here and
-someone on the other side of the locomotive. The second
-guy can get injured, I warn you. Anyway not dealing with
-it can cause significant pace lose. Your call, Cap." """,
-        "variants": {
-            "Stop the Adjutant for a revision": {
-                "desc": """You're making a decision to stop for, as planned, five hours. The
-crew starts to work without delays. Dismantling the axle box,
-you see that a couple of details do not fit each other, and
-rub hard. Your people start to deal with the problem, leaded
-by Kenneth. Seeing that they are okay to fix the trouble
-without you, you return to the deckhouse and turn on radio.
-"The Stench clouds were noticed in Stuttgart! On the south
-of the city several people already found dead, others leaving
-their homes, trying to get out of the city. Stay on this
-station, we'll keep you posted!" Stuttgart. Looks like the
-Stench frontier moves from south-east direction. It should
-be considered while planning the further route...
-
-Four hours passed, and the crew reports you that the axle
-box is good to go. Calling everyone back on board, you're
-commanding to continue the road in the same moment. Four
-hours is not five, but it's still long. Better keep your
-pace high now.
-
-The Stench frontier came 20 miles closer to you,
-but the Adjutant is in a good shape for now.
-
-You're getting a Captain's diary page. Better read it while
-on move not to lose distance from the Stench frontier.
-Press J to open/close Captain's journal.""",
-                "effects": (("do_stench_moves_effect", [20]),),
-                "goodness": 5,
-            },
-            "Try to deal with the axle box on move": {
-                "desc": """You're giving Kenneth command to choose one of your crew mates
-and try to deal with the axle box on move. You see that the
-mechanic doesn't like your decision, but he still accepts
-the order. You're returning back to the deckhouse, and
-some time later see Kenneth taking one of the fighters
-to the lower level of the Adjutant. For several
-long hours they slip out of your radars...
-
-Exiting on the fresh cool air, you incline above the railings
-and see a blood spot on one of the wheels, blinking on
-every turnover. Without delays you go to find the
-mechanic. Kenneth, seeing you concerned, uppers his hands
-in the same moment: "It's okay, it's okay! Small wound,
-but the axle box is fine now. Nothing serious!" Making a
-deep breath, you nod your head, trying to calm down. You
-knew the risks from the beginning, but it's still about
-your people safety. It's good the helper didn't get
-serious wounds. You better find them later to say thanks.
-
-One of your fighters getting -20 health
-
-You're getting a Captain's diary page. Better read it while
-on move not to lose distance from the Stench frontier.
-Press J to open/close Captain's journal.""",
-                "effects": (("do_characters_effect", [{"health": -20}, True]),),
-                "goodness": 1,
-            },
-            "Ignore the problem": {
-                "desc": """It's worth not to stop for such a long period. Asking Kenneth
-to wait for some time, you return back to the deckhouse. It
-is better to double check. The Stench frontier is far back
-for now, but three hours later... Looking at the map, you
-understand that you can't afford even three hours. Too risky,
-in these days it's better to keep some spare time. Returning
-back to Kenneth, you tell him to ignore the noises for now.
-He doesn't like your decision very much, you can see it on
-his face, but your common past outweighs everything. You
-helped him and his family more times than you both can
-count, so he's not going to argue with you...
-
-Some time later you'll understand that the problem was not
-one of those to be ignored. The axle box will be damaged.
-
-The Adjutant loses 50 Durability
-
-You're getting a Captain's diary page. Better read it while
-on move not to lose distance from the Stench frontier.
-Press J to open/close Captain's journal.""",
-                "effects": (("do_locomotive_damage", [50]),),
-                "goodness": 3,
-            },
-        },
-    },
-    {  # 2
-        "intro": """Taking a closer look at the bunch of people walking through
-the meadow, you understand that there are mostly children.
-Weird! Asking a couple of crewmates to follow, you get
-closer to the crowd, seeing a woman moving towards
-your party. In a few words she tells that they are
-workers and children from an orphan shelter.
-Understanding that the Stench moves fast to the place,
-and the governors are too busy saving themselves,
-adults, who worked there, gathered all the children
-and decided to move to Silewer on foot. Looking at
-pale and tired kids, you silently think that it was
-really tough idea. But probably it saved their lives...
-
-Complaining about walking for six hours without a stop,
-the woman asks you to help them build a field camp.
-You understand that it'll take a lot of time, as there
-are about sixty children. On the other hand, it
-doesn't look right to just leave them here, in the
-foreign country, tired and shelterless. Maybe there
-is some time to help them a little?""",
-        "variants": {
-            "Help them to build a camp": {
-                "desc": """Feeling some qualm inside, you give an order to help the
-children. Losing time is not okay... Still, twenty minutes
-later, seeing your people and children smiling while setting
-up big tents, igniting bonfires and boiling pottage in big
-cauldrons, you forget these heavy thoughts. This small break
-will be useful for the crew as well...
-
-It takes about two hours to finish preparing the camp.
-Getting a lot of thanks from the children and their teachers,
-you gather again on the Adjutant. Everyone seems to be
-enlivened, still, the road calls. Giving an order to start
-engine, you approach a couple of your crewmates, who are
-viewing some kind of an article on a smartphone. "Hey,
-Captain, you need to see this! Some of those children visited
-kinda scientist summit and took an interview there. The
-woman speaks about interesting things." Telling them that
-you're going to take a closer look at the article later,
-you go to the deckhouse to plan the route, considering
-the recent delay.
-
-The Stench frontier came 20 miles closer to you
-
-A note added into Captain's journal. You can read it
-on move not to stay long at the same place, losing
-distance from the Stench frontier.
-
-An SCP dossier page acquired. Press 0 to toggle.""",
-                "effects": (
-                    ("do_build_camp_effect", []),
-                    ("do_stench_moves_effect", [20]),
-                ),
-                "goodness": 5,
-            },
-            "Agree in words, but steal from them": {
-                "desc": """Calling the crew to speak aside, you're trying to convince
-them to use an ability to replenish resources. "The situation
-is getting tougher day after day, it's becoming about us or
-them." Your crewmates lower their eyes. Everybody know that
-sooner or later it'll come to this, still, no one wants to take
-responsibility. "It's hard to admit, but those children are not
-going to make it. They are not fighters nor survivors. The first
-meet with skinheads, and..." The crew continue to keep silence,
-bit you feel them accepting the situation, so you're giving an
-order: "Build the camp hastily and take useful stuff in case you
-see it!" Your crewmates, avoiding to look at each other, go out
-of the deckhouse... About an hour and half passed, and all of
-your people gather together on the Adjutant. They still doesn't
-want to look at each other, but they put an aid kit and an energy
-drink on the table. "Okay, let's move on!" - you command.
-
-Some time later you find a paper on your table, which looks like
-an interview log. It appears those children visited a kind of a
-scientist summit recently and had a word with one of scientists.
-No ideas why someone left the paper for you, but it worth reading.
-
-You're getting 1 medicine and 1 stimulator
-Soon people of Silewer will know that you've stolen from kids.
-This will be a bad example of what foreigners are like and will
-bring more people under the skinhead banners.
-
-A note added into Captain's journal. You can read it
-on move not to stay long at the same place, losing
-distance from the Stench frontier.
-
-An SCP dossier page acquired. Press 0 to toggle.""",
-                "effects": (
-                    ("do_enemy_inc_effect", []),
-                    ("do_plus_resource", ["medicine_boxes", 1]),
-                    ("do_plus_resource", ["stimulators", 1]),
-                ),
-                "goodness": 1,
-            },
-            "Don't help them and continue the road": {
-                "desc": """You go back to the deckhouse and negotiate with the crew. It
-appears most of them would like to help orphans, but all
-understand that it'll take at least several hours. The Stench
-will not let you wait, so it makes sense to move faster.
-Overthinking it again, and again, you decide to ignore
-the teachers plea. The crew don't like the decision very
-much, but everyone mind the situation. A hard silence
-forms in the air. No one wants to go there and say those
-orphans that you're going to leave. "So, what?" - you ask
-quietly. - "Should we continue the road without the last
-word? What's the point in it?" Your crewmates lower their
-eyes and nod their heads. Taking this as an answer, you give
-a command to go...
-
-Some time later you see a paper on your table. Running through
-it with your eyes, you find out it's an interview log. Those
-orphans visited kind of a scientist summit some time ago and
-took an interview from one of the scientists. Most likely one
-of your people got it from the children somehow. No thoughts
-why it was left on your table, but it should be read.
-
-A note added into Captain's journal. You can read it
-on move not to stay long at the same place, losing
-distance from the Stench frontier.
-
-An SCP dossier page acquired. Press 0 to toggle.""",
-                "effects": (("do_no_effect", []),),
-                "goodness": 3,
-            },
-        },
-    },
-    {  # 3
-        "intro": """Looking at an aged house, standing in about 200 meters
-aside of the railway, you see some kind of a fuss there.
-The hut is really old, the walls are crumbled, the junk
-dark wooden roof holds on a promise, but through small
-windows you can discern several people moving actively
-inside. You also hear some noise, even screams
-sometimes. It's worth checking the place...
-
-You take a couple of your crewmates and get closer to the
-building. It appears a police jeep is standing from the other
-side of the hut. Entering the house, you see a couple of men
-in uniform, threatening an old pair and a young girl, most
-likely their daughter. Interrupted and surprised, the police
-officers look at you, trying to understand who are you.
-Seeing your guns, they become very friendly: "Hey, folks!
-Nothing interesting here, we're just helping this family with
-something." Throwing a gaze at the scared people, you realise
-it's a lie. "Maybe we can bet a deal and live on happy?" - one
-of the officers does a step to you, lingering a wallet from his
-pocket. No doubts, they are caught doing something bad, two
-officers threatening people in backcountry - witnesses can turn
-it dangerous for them. The law didn't collapse completely yet.""",
-        "variants": {
-            "Take the bribe and go away": {
-                "desc": """Nodding your head to the door, you're commanding your people
-to leave the house. It's not your fight, not your people, not
-your business. The threatened family keeps silence, but you
-can feel with your skin that, seeing your gesture, they've
-lost the last hope for a better end. As if emptiness filled
-the part of the room, where they're sitting. Taking money
-from the officer, you exit the hut without a word...
-
-While walking back to the Adjutant, you're all trying to hear
-anything from the house side, but nothing happens. Turning
-your head back, you see one of the men standing near the door,
-looking at your crew. Seems like they are scared by themselves
-and doesn't believe you'll just leave. Still, you're leaving.
-Soon this will be happening everywhere - those, who has
-power and strength, will be using it to survive, destroying
-others if needed. And it will be needed. You can't save
-all the others anyway, but you can take care about your crew.
-
-You're getting $100
-
-You've got one more diary page in Captain's
-journal. Better read it on move.""",
-                "effects": (("do_get_money", [100]),),
-                "goodness": 3,
-            },
-            "Kill the bastards and free the family": {
-                "desc": """Lighting fast overthinking the situation, you upper your gun
-and shoot both policemen. With the same surprised faces they
-loudly fall to the floor. Taking away the gun, you do a step
-towards the threatened people, but they all upper their hands
-in the same moment. "Please, just leave us!" - the old man says
-with a trembling voice. Seeing they became even more frightened
-than before you killed the intruders, you realise that it
-wasn't a good idea to do it in front of them... Everyone
-in the room seems to be little bit lost. It probably will be
-better to just leave. Still, you decide to give an order to
-your people to pull both bodies out of the hut and drop them
-in some distance. Without arguments, they take both dead
-policemen and exit the house. After a few seconds long pause
-you throw the last gaze at the frightened family: "Sorry...
-Sorry for the mess." Not getting any sound from them, you're
-leaving the hut.
-
-You've got one more diary page in Captain's
-journal. Better read it on move.""",
-                "effects": (("do_no_effect", []),),
-                "goodness": 1,
-            },
-            "Use your superiority and intimidate them": {
-                "desc": """You see clearly that all the points are on your side. These
-men are weekly armed, they are policemen, and they were
-caught on very bad dids. Every part of the situation is
-against them. Tinkering the gun in your hands, you say
-overbearingly: "You two better leave this family and forget
-the way to this house!" Smiles disappear from their faces
-in the same moment. Throwing gazes to each other, they seem
-to be confused greatly. "We all will forget what happened
-here, you only need to leave" - you add. - "But if you have
-counter arguments... Well..." - you move the gun again.
-"Okay!" - one of the policemen uppers his hands. The second
-one follows his gesture in the next second. "We'll go. Let's
-just... Just forget about what happened here." - the officer
-seems to be even ashamed, and this fact makes you think they'll
-not return here - maybe they even understood the filth of their
-doings... When the men left, and their car silenced somewhere
-in distance, the young girl stands up: "Thank you! Thank you!"
-- she seems to be too touched, and you all hear her gratitude
-for several minutes. In return she proposes your crew a
-medical examination. Yeah, she's a doctor! Feeling a lucky
-coincidence, you command your people to use the opportunity.
-
-All people in the crew getting +20 Health
-
-You've got one more diary page in Captain's
-journal. Better read it on move.""",
-                "effects": (("do_characters_effect", [{"health": 20}, False]),),
-                "goodness": 5,
-            },
-        },
-    },
-    {  # 4
-        "intro": """From a very far distance you can discern that near the small
-motel a long line of cars jamms. You can even see a
-string of people standing in front of the entrance. Looks
-like a lot of Silewer newcomers want to rent a room here.
-Sending your people to try to get inside the building, you
-caught eyes on two banches of refugees arguing hard.
-Getting closer to them, you can hear they are brawling
-because of the last place in the building. When they see
-you, however, they become silent, gazing at your guns. In
-a couple of moments you take a place of judge, you see
-both sides looking at you with hopes to get your help.
-Observing them, you get it that one of them is a man with
-sick boy, about eight years old, most likely his son. The
-lad doesn't look good, his face is pale, dark rounds mark
-his eyes and skin is covered with sweat. But on the other
-side of the conflict you see a pregnant woman, skinny and
-tired. Both the father and the woman expect your judgment
-somewhy, probably because others are too busy to think
-about people around... Or maybe it's just because of
-guns... Anyway the decision is yours - there is only one
-place left in the motel and someone will have to sleep
-in the car here.""",
-        "variants": {
-            "The pregnant woman should rest": {
-                "desc": """Pondering the situation, you tend to think that the
-woman is the one to take the last place. The man with
-the sick boy throws something on the ground and, grabbing
-his son, goes away. The woman, who still seem to be
-scared, thanks you greatly - you can even see tears in
-her eyes. Seeing your people returning back from the
-motel, you say her goodbye and join the crew. According
-their words, the place is filled to the very top, some
-unfamiliar people even rent rooms together. Plus to what
-you already understood by yourself, your crew mates
-give you a log paper - one of them heard motel dwellers
-conversing about the same scientist those orphans were
-interviewing. She was here not long ago! That's
-something should be read.
-
-You're going to give a command to start engine, but
-suddenly see the man, who was trying to get the last
-place in the motel. The one you forced to go - he walks
-from the Adjutant back in the motel direction. What does
-it mean? You ask the crew to check if everything is okay
-on the locomotive, and it appears the man ignited it!
-You deal with fire fast, but still the Adjutant gets
-some damage.
-
-The Adjutant loses 70 Durability
-You've got one more note in the Captain's journal
-
-An SCP dossier page acquired. Press 0 to toggle.""",
-                "effects": (("do_locomotive_damage", [70]),),
-                "goodness": 5,
-            },
-            "The man with the sick son should rest": {
-                "desc": """Overthinking the conflict, you decide that the man with
-the sick boy should rest in the motel. The woman seems to
-be tired, but not hard ill. Saying something silently, most
-likely damnations, she leaves the place. The man holds
-out his hand: "Thank you!" - he lowers his eyes back to
-son: "Jerry!" The boy slowly gets what his father is asking:
-"Thanks!" - he pronounces with a weak voice. Left them,
-you join your crew. They tell you that the motel is filled
-to the very top, but it's something you already got by
-yourself. In addition, they give you a note - they heard
-a conversation between two motel dwellers, who saw the same
-scientist woman those orphans were interviewing. And they
-said that she's one of those who responsible for cataclysms
-like the Stench. Interesting! Should be read.
-
-You're doing a short technical review of the Adjutant and
-then start the engine to continue the road.
-
-Soon all the Silewer will know that armed foreigners forced
-a pregnant woman to leave the motel, where she was going to
-rest after long road. This will bring more people into the
-skinhead bands.
-
-You've got one more note in the Captain's journal.
-
-An SCP dossier page acquired. Press 0 to toggle.""",
-                "effects": (("do_enemy_inc_effect", []),),
-                "goodness": 3,
-            },
-            "Force them both out and take their place": {
-                "desc": """The last room in the motel... Maybe it's better to keep
-it for your crew? A couple of hours in not moving place
-and shower would be good. Looking straight at both the
-man and the pregnant woman, you say in a cold voice: "Me
-and my crew will take the room." Your visavis stagger back,
-surprised greatly by the turn. Several seconds they look
-at each other, and then simultaneously turn around and go
-away. You join your crew, stand in line and then rent the
-room... The short rest goes okay, one of your crew mates
-even give you a paper, on which he noted a conversation
-between two motel dwellers, who were speaking about that
-scientist woman, interviewed by orphans you met earlier,
-blaming her in cataclysms like the Stench. Interesting!
-
-In some moment you understand that a kind of a noise
-increases fast in the motel. Taking your guns, you all
-get out of the room and get into a fight! It takes about
-ten minutes for you to exit the building. Without clear
-understanding what happened - are refugees, who didn't
-manage to get a room, decided to attack the building? -
-you return back to the Adjutant. No one got serious
-wounds, still, there are several small injuries. Not
-the best stop!
-
-All people in the crew getting -20 health
-You've got one more note in the Captain's journal
-
-An SCP dossier page acquired. Press 0 to toggle.""",
-                "effects": (("do_characters_effect", [{"health": -20}]),),
-                "goodness": 1,
-            },
-        },
-    },
-    {  # 5
-        "intro": """Seeing a couple of cars and a crowd, you're giving an order
-to stop the Adjutant and see what happened. Approaching, you
-understand that a fight just finished here - a big bus is full of
-bullet holes, and a black jeep lies on its side, also shot bad.
-
-A man walks to you and tells: "Some bandits were following a
-column of black jeeps. Good they didn't stop for us, still,
-several gun bursts hit our bus." Looking at dense smoke
-rising from it, you get it's not gonna ride. The man notices
-your gaze and asks for help in repair. You start weighing,
-while your collocutor adds: "We searched the jeep for tools -
-poor bastards both caught bullets. Unfortunately, there is
-nothing useful, only tons of paper, some high science mumbo
-jumbo and gas masks." Listening to the guy more carefully,
-you start to suspect you already know who was in those
-cars... Helga Wagner! Looks like you're almost following her.
-It's worth checking the jeep - last pieces of info about
-the Wahrsager project sounded intriguingly.
-
-The only thing left to decide is of helping these people.
-Throwing one more gaze at the bus, you see a lot of bags
-on the car top, german car number - they are refugees.
-If bandits they met were skinheads, shooting at the
-bus wasn't occasional. The scum can return here when
-they'll deal with Helga's group...""",
-        "variants": {
-            "Help them to repair the bus": {
-                "desc": """Overthinking the situation carefully, you decide to
-help these people. Your crew brings tools from the
-Adjutant and starts to reanimate the car. Taking part in
-it, you're studying the refugees. Confused and nervous,
-they seem frustrated hard. Usually, refugees coming TO
-Europe, but the Stench seems to be turning everyone into
-the opposite direction. Europe! The place of comfort,
-order and civilization became the most dangerous place
-in the World. Where to go now? Who'll welcome us?
-Countries, which are not able to help themselves? Most
-of their citizens would like to live in Europe, but it's
-unlikely they want us to come to them and take their
-places. Especially now, when number of places reduces
-really fast, and no one know if it'll stop one day...
-
-A couple of hours passed, and the bus engine finally
-starts to roar, gathered from, literally, pieces. People
-give you sluggish thanks, you see they are still too
-shocked after getting under a machine gun fire. Anyway,
-they at least can now move forward.
-
-The Stench frontier came 20 miles closer to you.
-In the black jeep your people found a piece of Helga's
-diary. It's added to your journal, worth reading.
-
-An SCP dossier page acquired. Press 0 to toggle.
-""",
-                "effects": (("do_stench_moves_effect", [20]),),
-                "goodness": 5,
-            },
-            "Give them tools from the Adjutant": {
-                "desc": """Seeing you doubt, the man proposes: "Maybe you can
-at least bring us some tools? Money is critically
-needed now, but we'll pay you!" Don't do a stop,
-help them and get some money - sounds good. You're
-commanding the crew to give the people stuff, which'll
-help to repair the shot bus, while the man gathers
-money from his passengers. Approaching you back, he
-gives you $80 totally. "Not much actually, sorry." -
-he pronounces quietly. - "Those people are still
-shocked by the skirmish, that's not what we expected.
-Not in the second day of the road at least!" Nodding
-your head, you think that it's weakly said. Usually
-people go TO Europe, not out of it. But now the spot
-of comfort, civilization and order became the most
-dangerous place in the whole World. A lot of directions
-changed to opposite. Who'll welcome new refugees from
-Europe? People, who wanted to refuge to Europe? Looking
-at the bus covered with bullet holes, you think it's
-unlikely. What happens in Silewer is just a start,
-it'll become more worse, if the Stench will grow.
-
-You're getting $80.
-Soon you'll understand that you gave too many things to
-those people, so you're not able to fix problems on the
-locomotive. The Adjutant getting -70 Durability.
-
-In the black jeep your people found a piece of Helga's
-diary. It's added to your journal, worth reading.
-
-An SCP dossier page acquired. Press 0 to toggle.""",
-                "effects": (("do_locomotive_damage", [70]), ("do_get_money", [80])),
-                "goodness": 3,
-            },
-            "Don't help them": {
-                "desc": """Overthinking the situation, you decide it's too risky to
-do another stop. The bus looks pretty bad - it'll take
-hours to reanimate it. You don't have hours.
-
-Saying goodbye to the man, you turn back to the Adjutant,
-by the way looking at the bus passengers. Refugees.
-Yeah, it's time people come out of Europe instead of
-moving into it, who'd knew. The spot of order,
-civilization and comfort became the most dangerous place
-in the World. An interesting question is: who will
-welcome new refugees? Looks like the answer is right
-in front of your eyes - the bus shotted with a
-machine gun. And this can be only a beginning! No one
-stopped the Stench yet, no one have any ideas about it
-actually. If it'll continue to grow, more people will
-left their homes and will go to the neighbour countries
-and even further. Some will not stop in face of any
-counteraction, because it's no longer about simply
-comfort and wealth, it became about survival...
-
-Climbing on the Adjutant, you give an order for your
-crew to search the black jeep for anything useful and
-continue the road. Survival - so, let's not waste time!
-
-In the black jeep your people found a piece of Helga's
-diary. It's added to your journal, worth reading.
-
-An SCP dossier page acquired. Press 0 to toggle.""",
-                "effects": (("do_no_effect", []),),
-                "goodness": 1,
-            },
-        },
-    },
-    {  # 6
-        "intro": """Running a rag across the floor, you're working out your turn
-to cleanup the Adjutant. Tidiness is important - so many days
-in the same cold and coarse locomotive rises chances of
-sickness and pests emergence...
-
-At some moment Daren, the Adjutant machinist, approaches
-you. You see he has something to tell, but he can't find
-proper words. "Come on, Daren, birth it." - you say, trying to
-make things faster. "Well... We've a problem. It's big.
-Precisely, we don't have food." Stopping to run the rag, you
-straighten your back: "How so?!" "Well, everyone is waiting
-you." - he answers and disappears in the doorway. Thinking a
-couple of seconds what it should mean, you decide to hurry
-up - if EVERYONE is waiting, it's serious.
-
-Entering the back room, you see all of your people standing
-in a circle. Everyone seems to be concerned, but you don't
-find any aggression in the room, fortunately. "Well, Captain,
-here we are." - Kenneth starts the talk. - "Our food supplies
-are running out faster than we thought. We need to speak
-about limits, otherwise, we'll soon start to starve." Rubbing
-wet hands, you're trying to concentrate on the new problem.
-In current situation everybody should be energetic and
-healthy, as there are a lot of maintenance questions and
-the need to fight. But if it's impossible, maybe it's worth
-choosing who should have a priority in food questions?!""",
-        "variants": {
-            "Fighters will have food priority": {
-                "desc": """Keeping silence for about two minutes, you come to
-a decision that fighters, those who protect the Adjutant
-from skinheads and who search resources on outings,
-should eat enough. If they'll not be able to fight back,
-you all will become victims of savages people turning
-into. As for the Adjutant mechanic and machinist, well,
-their work is less nervous and doesn't require that
-big efforts and concentration.
-
-Pronouncing your decision to the crew, you see they are
-not very pleased with it. Most likely, they are ready to
-starve together, instead of choosing special ones...
-Still, these days require tough turns and tactical
-thinking. Fortunately, Kenneth and Daren doesn't seem to
-be offended that their ration was reduced. They are not
-young, both seen a lot in their lives, they understand
-and can handle it. Good. Not that good, of course, but
-at least you don't need to think about riot in the crew.
-
-Finishing the talk, you return back to your cleaning duty.
-
-Some time later you'll find out that reducing mechanic's
-ration was not the best solution, because malnutrition
-lowered his competence, and the locomotive suffered.
-The Adjutant getting -80 Durability.
-
-You're getting a new diary page. Check the Journal.""",
-                "effects": (("do_locomotive_damage", [80]),),
-                "goodness": 1,
-            },
-            "Adjutant maintainers will have priority": {
-                "desc": """You're keeping silence for several minutes, weighing
-all the points. Fighters are needed, but you have enough
-ammunition - it's the main part of the defence. But if
-the locomotive engine will stop... In this case you all,
-without counter arguments, will die really soon. Keeping
-the pace is important, more important right now than
-killing those savages.
-
-With this in mind, you're pronouncing your thoughts to
-the crew. Kenneth and Daren seems to be not very
-pleasant with your solution - they both are not young,
-they've seen a lot and can handle some starvation. Your
-order little bit offends their pride. Still, order is
-yours, and you believe the mechanic and the machinist
-should been in the best condition that is possible in
-the current situation.
-
-Finishing the talk, you return to your cleaning duty.
-
-Some time later it'll become obvious that fighters
-tired much faster with this malnutrition, and their
-productivity significantly reduced.
-
-All the fighters getting -40 energy.
-
-You're getting one more diary page. Check the Journal.""",
-                "effects": (("do_characters_effect", [{"energy": -40}]),),
-                "goodness": 3,
-            },
-            "Limit food for all": {
-                "desc": """Taking a couple of minutes to think about the situation,
-you decide it's not the best idea to make a part of the
-crew somewhat special. Everyone is important, everyone
-here do something for the whole company. If food supplies
-are not enough, it'll be better to reduce ration equally
-for all, no matter their duties.
-
-Sounding your solution, you see that everyone in the room
-is completely okay with it. Good, the team spirit is still
-here, and the food crisis will be dealt with by common
-and equal limitation.
-
-Calculating the new ration with others, you understand
-the limitation will be actually small - spreaded to every
-person, it became not very significant for separately
-taken member of the crew. With this, you all approve
-the decision and return to your duties.
-
-Ration limitation results:
-All the characters getting -10 energy and the Adjutant
-getting -20 Durability.
-
-You're getting one more diary page. Check the Journal.""",
-                "effects": (
-                    ("do_characters_effect", [{"energy": -10}]),
-                    ("do_locomotive_damage", [20]),
-                ),
-                "goodness": 5,
-            },
-        },
-    },
-    {  # 7
-        "intro": """The traffic jam stretched to the left of the railway lasts
-for about 15 miles, and it's only the part you've seen,
-there are even more cars around the highway turn.
-Massive! And at some moment you see the start of this
-serpent - a road blockpost.
-
-You order to make a stop, take several people and go
-to the place. From the very far distance you can
-discern shouts - refugees are arguing with the police
-hard. You order others to stay in distance and
-give them your gun not to provoke anyone. Getting
-closer to the officers, you see that they completely
-closed the way, they're not even checking, just holding
-this huge column of refugees. You can't understand
-if they have a government order, or it's something
-they've decided to do on their own.
-
-The blockpost doesn't seem to be strong, and people,
-most likely, understand this. Probably, one more news
-report about the Stench came closer will billow these
-people to do something agressive.
-
-Should you care about it? Maybe it's worth to speak
-with someone and try to regulate the situation. Not
-much of hopes, still, it can work...""",
-        "variants": {
-            "Ask officers to let people ride": {
-                "desc": """Seeing that officers are on alert and can start to
-shoot at any moment, you approach them slowly and
-quietly. The one standing in front seem to be getting
-that you're not a threat, so he nods you. You come
-closer, saying: "Hey! Quite a mess here." The officer
-takes a look at the people: "Weakly said! But we have
-an order not to let them get deeper into the country.
-There is already disorder everywhere."
-
-You incline your head and calmly silently say: "Just
-try to understand them. The Stench is coming, they're
-trying to survive, save their families... No one yet
-said it'll stop - chances we all will soon become
-refugees." The officer seems to be overthinking your
-words. "The Stench is in just several hours from here.
-You'll have to leave the blockpost eventually, if you
-want to survive." The officer throws a glance at others,
-it looks like they understood what you're talking about.
-"Okay... We actually got it that we need to leave, it's
-just..." You nod your head in agreement gesture.
-
-The officer gives a command to open the gates, and the
-refugees feverishly return to their cars to continue
-the way.
-
-More refugees in the Silewer will soon make skinheads
-much more active.
-
-You're getting a new diary page. Check the Journal.""",
-                "effects": (("do_enemy_inc_effect", []),),
-                "goodness": 5,
-            },
-            "Instigate a refugees assault": {
-                "desc": """You are silently approaching the refugees, and,
-seeing that you're a fighter, they move closer towards
-you. You feel they are ready, there are several active
-guys, and others are going to support them, they only
-need a small push. Thinking that they have a right to
-do this, as the Stench is getting closer, and it's not
-fair for so many people to just die here, you're
-starting to say something, but in the next moment
-you see they don't even listen. Your appearance is
-enough for them to start the assault, without words.
-
-Everything around you comes to move, the crowd turns
-to an avalanche. You're retreating to safe distance,
-as riot becomes chaotic and uncontrollable from the
-very start. Police officers are smashed in just
-several seconds, and the long serpent of cars starts
-to feverishly crawl through the demolished gates.
-
-When the situation became little bit more calm,
-your people get closer to the blockpost and take
-some stuff from it: tools and guns.
-
-Knowing about the assault, skinheads will become
-much more aggressive. The Adjutant gets 90 Durability.
-
-You're getting one more diary page. Check the Journal.""",
-                "effects": (
-                    ("do_locomotive_damage", [90]),
-                    ("do_enemy_inc_effect", []),
-                ),
-                "goodness": 1,
-            },
-            "Don't do anything": {
-                "desc": """Slowly and silently getting closer to the blockpost, you
-try not to attract attention - the situation smells
-gasoline, it's better to stay quiet.
-
-Several refugees, males, are actively arguing with
-the officers, and you see that everyone here
-understand that policemen have very weak positions.
-People in behind seems to be ready to rush forward
-in case of a one wrong move. It's just six officers,
-armed, but there are hundreds of refugees against
-them. And some of them may be armed as well...
-
-Still, for some time the tension here will hold.
-Not willing to be the rock which starts the avalanche,
-you're silently turning around and go to your crew
-mates. It's better just to leave.
-
-You're getting one more diary page. Check the Journal.""",
-                "effects": (("do_no_effect", []),),
-                "goodness": 3,
-            },
-        },
-    },
-    {  # 8
-        "intro": """While you're looking at the map, trying to plan the further
-route, Daren approaches you silently. "Captain, we
-need to talk." - he observes the room. - "Privately,
-I mean." His lowered voice makes you feel it's
-somehow related to other crew members, and this is
-pretty strange to hear from Daren, who doesn't
-gossip about others at all.
-
-You showing that you'll follow him, and he leads
-you out on a fresh air. "Captain, we... I think
-we've a stealer on our ship." "What?!" - you're
-trying to make sure that he's really saying it.
-"Our supplies, they're running out fast. And after
-we've reduced ration it didn't change, at
-all. Someone is stealing food, constantly."
-
-This is an accusation you didn't expect. The crew
-seems to be honest and patient, all of them, who
-could do this? And, more than this, what to do
-with it? Find the stealer first or just talk
-with everyone? The situation can harm cohesion
-bad in unpredictable way.""",
-        "variants": {
-            "Ask Daren to investigate deeper": {
-                "desc": """Overthinking it again and again, you understand that
-speaking about it with the whole crew is a bad
-idea. They'll start to suspect each other, think
-about it, maybe even blame... No, it should be
-solved quietly, perfectly, with only the one who's
-doing it. It's not clear for now how to regulate
-this behaviour, but let's be solving one problem
-at a time.
-
-You're quietly saying Daren to observe the storage,
-try to figure out who's the stealer, but not to stop
-them yet. He likes your idea to deal with it without
-making noise and he promises to find the stealer.
-
-After several days of observing Daren will still
-don't know who's stealing the supplies. No one
-seems to be doing anything wrong, but food
-disappears as it would be stolen by a ghost.
-
-Forced to buy more food in cities, you're losing
-money - about $60.
-
-One of your crew mates intercepts a radio
-transmission on which Helga Wagner is instructed
-about a place safe from the Stench. Check
-the Journal for the transmission log.""",
-                "effects": (("do_get_money", [-60]),),
-                "goodness": 3,
-            },
-            "Speak with the crew": {
-                "desc": """After some overthinking you're coming to the
-idea to speak with the whole crew. The problem should
-be solved fast, and the stealer should be ashamed in
-front of their crew mates. It seems fair.
-
-You're gathering the whole collective and describe
-them the situation. People seems to be surprised
-and confused, but, looking at them, you don't see
-the stealer among them. No one reacts like a
-delinquent. And several days later Daren will
-tell you that supplies are still disappearing.
-The suspicions you brought into the crew,
-however, make the collective atmosphere a bit
-colder and even wary.
-
-Daren's attempts to hunt down the stealer are also
-resultless - no one seems to be taking more than
-they should, but supplies are still missing, like
-a kind of a ghost stealing them right through
-the walls.
-
-Crew cohesion is decreased by 5 points.
-
-One of your crew mates intercepts a radio
-transmission on which Helga Wagner is instructed
-about a place safe from the Stench. Check
-the Journal for the transmission log.""",
-                "effects": (("do_spend_cohesion", [5]),),
-                "goodness": 1,
-            },
-            "Speak with everyone separately": {
-                "desc": """The idea of making noise of this situation looks pretty
-bad to you. It's not easy to stay optimistic during
-the days of late, no need to make people suspect
-or even blame each other. It's better to speak with
-them one by one, and try to find the stealer quietly.
-
-You're spending several hours in talks, trying to
-understand your every crew mate mood. It doesn't
-look like any of them is desperate enough to steal
-from the common storage. You're still cautiously
-alluding that there can be problems, but no one
-reacts in an unusual way.
-
-Several days later Daren will tell you that food
-is still missing, though he didn't notice anyone
-taking more that they should. Like a ghost is
-stealing supplies.
-
-However, heart-to-heart conversations you've done
-with every crew member increases the cohesion.
-
-One of your crew mates intercepts a radio
-transmission on which Helga Wagner is instructed
-about a place safe from the Stench. Check
-the Journal for the transmission log.""",
-                "effects": (("do_spend_cohesion", [-5]),),
-                "goodness": 5,
-            },
-        },
-    },
-    {  # 9
-        "intro": """Hearing cries and a lot of noise inside the machinery section,
-you hurry up there to figure out what's happening. You
-see that your crew mates are trying to pull out a boy
-about nine years old out of the dark of the locomotive
-mechanisms. The lad's left leg is grinded, he seems to
-be losing consciousness, there is blood everywhere.
-Seeing you, Daren shouts: "Cap, it's our food thief I
-bet! Been hiding in the mechanisms. I've decided to
-clean up things today, and he probably got scared,
-tried to get deeper, got too close to the moving parts,
-and then..."
-
-Kenneth, who's also here, moves closer to you. You can
-feel he's shaking. He silently asks: "What should we
-do, Captain? We're no medics here, and the kid is hurt
-bad. We can try to transfuse blood, probably from two
-people, as he lost really a lot. Or we can use
-medicaments to stabilize him. We need to act quickly,
-he's leaving, and we're not good enough for such an
-operation I'm afraid. Every second counts!"
-
-Assessing your crew state and the medicines supply,
-you're trying to find the right solution to this
-unexpected distress.""",
-        "variants": {
-            "Save the kid with transfusion": {
-                "desc": """You're giving an order to figure out the lad's blood type
-and start transfusion as soon as possible. The child
-didn't deserve this! If he would just... just tell
-you, that he's here. Probably was too afraid you'll
-get him off somewhere in the wild lands, alone. Or
-even worse... Deft enough to hide under your noses
-for such a long period! Most likely one of those
-orphans you met earlier...
-
-It appears two of your crew mates has the same blood
-type that the kid does, so with common efforts
-you're all trying to organize a blood transfusion
-system of improvised means.
-
-Several hours passed, and you understand that it's
-working! The child's hands stop trembling, his skin
-gets a bit of colors. Yes, the kid is stabilized,
-though his leg and stress he transferred are going
-to keep him in the bed for a long time.
-
-Two of your crew mates losing 30 health.
-While you've been saving the child, one of your
-sentries recorded a new encrypted message from
-Unterriff. Check the Journal to read it.""",
-                "effects": (("do_transfusion_effect", []),),
-                "goodness": 5,
-            },
-            "Save the kid with medicines": {
-                "desc": """Lighting fast overthinking the situation, you decide
-that the child should be saved, still, it's better
-not to involve your crew too much. You have your
-own route, you promised your people that you'll
-lead them through this in one piece. And the
-blood transfusion is a risk, which calls your
-promise into question.
-
-Your people start to gather all the medicines and
-stuff needed to stabilize the child. It appears
-you don't really have enough for such an
-operation, but you don't lose hope.
-
-After several hours full of stress and hard work
-you understand that you saved the boy. It cost
-a lot of energy and supplies, but his limbs stop
-trembling, skin gets some color and blood
-pressure becomes more acceptable. He'll be okay,
-though full recovery will take a lot of time.
-
-You're losing 2 medicines. In case of lack of
-medicines your fighters lose 40 energy.
-
-While you've been saving the child, one of your
-sentries recorded a new encrypted message from
-Unterriff. Check the Journal to read it.""",
-                "effects": (
-                    ("do_medicine_save", []),
-                    ("do_medicine_save", []),
-                ),
-                "goodness": 3,
-            },
-            "Don't save the kid": {
-                "desc": """Fastly overthinking the situation, you're coming to the conclusion
-that you can't help the child. You have your own way,
-you need to save your crew. And blood transfusion or
-spending extremely valuable medicines in such a
-critical situation? No.
-
-You're ordering not to waste anything to save the
-kid. A long tense pause fills the air in the
-locomotive. Everybody seems to be so shocked by your
-decision that can't even say anything, they are just
-looking at you.
-
-Daren becomes the first who voices: "Cap... but...
-child. We can't just... No!" You're repeating your
-order, and several people exit the machinery in the
-same second, overreacting hard. Others still stay
-in hopeless attempts to help.
-
-You're returning to your desk, and several hours
-later Kenneth, walking near you, shakes his head,
-showing that the kid died.
-
-Your ruthless decision becomes a heavy hit to the
-crew spirit. People seem to be crushed, and they
-blame you in this darkest of the days. Leader's fate.
-
-Crew cohesion is decreased by 30 points.
-One of your sentries recorded a new encrypted
-message from Unterriff. Check the Journal to read it.""",
-                "effects": (("do_spend_cohesion", [30]),),
-                "goodness": 1,
-            },
-        },
-    },
-    {  # 10
-        "intro": """Observing flakes of snow calmly getting down from the skies,
-you hear someone's approaching you. Kenneth. "Captain,
-we've caught one more transmission from Unterriff."
-You're nodding your head, showing that you're
-following him. Together you enter the deckhouse,
-where the crew is gathered around the radio.
-"Starts!" - Daren shouts, making everyone go silent.
-
-"Code 773-L, I repeat, code 773-L. Message for all the
-Unterriff-8 program members. The Stench cataclysm
-is designated as the highest level menace. All the
-members with code 773-L and higher are recommended
-to immediately move to the designated rendezvous point.
-Reception party will be revoked in 173 hours. If
-you're not able to get to them in time, you'll have
-to follow the road 804 and proceed to the path
-described in the item 26.3.1 of your project
-Unterriff agreement by yourself, I repeat, by
-yourself. At the Unterriff gates you'll have to
-identify yourself by the microchip attached to your
-agreement. Persons without a chip or below code
-773-L will not be allowed to Unterriff-8 facility."
-
-The message suddenly breaks up. Everyone seem to be
-concerned - a whole system is built around Unterriff.
-Chips, agreements, hierarchy of codes... But you had
-no idea! No one had! Seems there are a lot of...
-chosen ones, who are welcome in the underwater
-shelter, but not all. Someone selected those, who
-must survive, and those who not.""",
-        "variants": {
-            "Plan the route": {
-                "desc": """Kenneth moves to the center of the deckhouse, holding
-hand on his forehead. "Road 804, road 804... I
-know the place! I've been there a couple of times.
-It's a railway path stretched along the Black Sea
-coast. There are several small forsaken branches
-forked from it in the direction of the sea..."
-
-"I suppose, not forsaken. Just not for everyone."
-- you say silently.
-
-Kenneth uppers his eyes to you: "Then, I assume...
-let's go! Though, we still need an access chip to
-get inside the facility..."
-
-You're nodding your head confidently. You already
-have ideas about what to do next. They started
-a great gathering - there will be a lot of fuss
-in the region. It can help you.
-
-Looking out everyone inside the deckhouse, you're
-surely saying: "Seems like they forgot to send us
-an invitation card. Well, we'll get it by
-ourselves. Let's go see this Unterriff!" """,
-                "effects": (("do_no_effect", []),),
-                "goodness": 0,
-            },
-        },
-    },
-)
-
-SCENARIO_LABELS = ("Chapter ", "Scenario", "Seepage")
-CITY_NAMES = ("Sneeuwstad", "Naaldstad")
-
-PREAMBULA = """Good morning, Captain!
-
-We've crossed Silewer border at 11:45 pm, the checkpoint was abandoned. Soon we've made
-a stop near an improvised refugees camp. Criminals, looking pretty much like skinheads,
-were humiliating the camp dwellers in the meantime. We've shown them our guns, and they
-let those people be, but also promised to find us later. Still, we've decided not to
-wake you up and let you rest till the morning...
-
-The Adjutant, our good locomotive, is in acceptable shape, and crew is ready for duty.
-Munich just went dark, which means the Stench frontier is in a couple of hours behind.
-We should keep the speed high not to let those poisonous orange clouds overtake us.
-
-That's all, Captain, handing command over to you!"""
-
-JOURNAL_PAGES = (
-    (
-        "diary",
-        "1. Panic",
-        """Never wrote diaries earlier, but now
-I feel that I need to put my
-thoughts down on paper and try to
-look at what happened recently,
-see a bigger picture...
-
-About a month ago social networks
-gave birth to a new flow of videos:
-people were filming streets, talking
-about some kind of orange mist.
-Though there was no mist! What they
-were trying to film were only
-buildings, cars, sidewalks and
-crystal clear air. Like they were
-hallucinating.
-
-It all looked as a new stupid prank
-or a creepy thread we got used to,
-so no one took it serious first.
-Zoomers do have fun as usual. I
-thought the same, I must confess...
-But at some moment they started to
-find bodies, for real. Big news
-agencies picked up the story:
-people are dying right on a street,
-but no one able to say why! Here
-someone said out loud: they die
-because of the orange mist, spotted
-there.
-
-As it usually happens, government
-first tried to hide the adversities
-scale. They started to speak of
-stupid explanations, ask citizens
-to stay at home if possible and
-use respirators; censor newspapers,
-websites and discredit rumor authors.
-They also closed several city blocks,
-but only those in dormitory areas.
-Recreation and business regions,
-which bring money, of course, were
-working in normal regime, so there
-you still could trip over a corpse
-not yet removed by the police. In
-the meantime, in Germany,
-Switzerland, Netherlands more and
-more people were getting that
-something serious is happening.
-
-Finally, several police officers,
-seeing that the disaster is gaining
-momentum, gathered all their
-conscience and decided to whistleblow.
-Photos they posted publicly were
-showing tens of dead bodies on
-streets, like a new Jonestown, and
-several documents, where chemical
-specialists were summaring up that
-the orange mist, called by them as
-"The Stench", selectively kills
-people, no matter how good is their
-isolation or air filtering...
-
-This action caused panic to stroke
-most of the Europe countries, and
-in this moment I reilized I should
-do something.""",
-    ),
-    (
-        "note",
-        "2. Wahrsager",
-        """Interview protocol from 2021-06-23,
-Zurich, 56th World Scientist Summit.
-Interviewer: Emily Schlosser
-Interviewee: doctor Helga Wagner,
-leading system engineer of Wahrsager
-project team.
-
-- E: Helga, could you explain our
-subscribers in simple words what the
-Wahrsager project actually is?
-- H: Before talking about the project
-itself we should remember determinism:
-the methodology which proclaims that
-every event in the world has particular
-causes. This idea actually means that
-our past directs our future. With this
-in mind our group of scientist tried to
-find a way to take a look at our past,
-see what was actually happening there,
-measure previous events and, probably,
-we hope, use this information to
-predict our future! That's how the
-Wahrsager project idea was created.
-
-- E: What you're talking about sounds
-pretty much like a time machine!
-- H: Ya! But let's mention this machine
-doesn't make passages into another
-time, it only gives us an ability to
-take a look at it, do a detailed
-snapshot, which can be analyzed. Like
-a photo (smiles). The main point here
-is accuracy - our world consists of
-immeasurable number of events, which
-influence each other. We need
-Laplace's Demon to get results -
-without high accuracy our data will
-be giving pretty unreliable
-predictions.
-
-- E: Sounds incredible! But it seems
-you need the best equipment and
-experts.
-- H: Sure, our team consists
-of the highest level professionals,
-some of them even came from SCP
-Foundation itself! It's a great
-honor for me to work with these
-brilliant people! As for equipment,
-our government provides us
-everything we need since we've
-run the very first presentation.
-
-- E: Could you tell us how it was?
-- H: Right now we proceeded further
-than that, but the first presentation
-included only a chamber with a
-chemical substance and equipment,
-which was able to show the state of
-this substance 48 hours back in the
-past...
-
-On this question our interview came
-to its end, as doctor Wagner was
-called by her colleagues to take
-part in some kind of an urgent
-online meeting.""",
-    ),
-    (
-        "diary",
-        "3. Proposal",
-        """When it became obvious that the
-Stench adversity is real, and it's
-not going to stop in the near future,
-I decided to close my company. Those
-who worked for me - we were always
-like a family. I don't have another,
-so it was hard to say goodbye to
-everyone... Still, we all made a
-decision to leave the city as soon
-as possible. The first Stench
-reports were made in Germany and
-Switzerland, most likely on the
-west, so we had an approximate
-direction - considering that the
-mist is going to spread in circle.
-
-As we were little bit slowly, we
-really got stuck! Airplanes, which've
-taken some people, flew away and
-refused to return. No single airplane
-left in the whole country! As for the
-cars, well, it was even worse - every
-road on the east of the city was
-clogged up in miles, MILES! Everybody
-was trying to leave the place.
-
-Here one of my friends, a machinist,
-called me. He was in search of people,
-who are brave or desperate enough to
-help him to hijack the locomotive he
-was working on during the last several
-years. He know me as a daredevil and
-decided to call me first. I liked his
-idea and made a proposition to my
-workers. Some of them have families
-to care, so they refused to take part
-in this risky operation, but three of
-them and Kenneth, my old friend
-mechanic, agreed.
-
-Daren, the machinist, who proposed
-all of it, told us about the Adjutant
-- tough locomotive he was driving,
-the fast and powerful machine, which
-is old, but very reliable transport.
-He said he knows a forsaken closed
-railway, which condition is still
-quite good and which can lead us
-out of the city. On that we all
-made a decision.""",
-    ),
-    (
-        "note",
-        "4. Scientist",
-        """Following is what I've heard from one
-of the motel dwellers, who was in
-a very dissatisfied manner telling
-a story about a strange woman to
-his friend.
-
-According to the source of
-information, yesterday in the
-morning he met a woman with a very
-strange thing on her neck, looking
-pretty much like a high-tech gas
-mask. She had several metal boxes
-and a bunch of helpers, all seem
-to be a part of university or a
-science group.
-
-The woman have been talking a lot
-with someone on the other end of
-the phone. He said she was reporting.
-According to what our man heard,
-they were working on some kind of a
-machine, which attracted government
-and SCP Foundation attention
-pretty strong.
-
-It's able to make a window into the
-past (Wahrsager project, no doubts).
-They wanted to use it to check if
-people are lying about things
-already happened, and for espionage
-- getting info about what happened
-some time ago, but didn't yet cause
-any consequences. As the machine
-shows how it was actually been,
-without hiding or concealing,
-just an objective truth, it sounds
-smart. Let's say, a spy was rooted
-a couple of days ago into your
-organization; with this machine
-you can see the past, the period
-when he was recruited and
-instructed. You'll detect danger
-before the guy will actually get
-hands on something valuable. You
-can actually track anyone! With
-some delay, yes, but still...
-
-The woman also told about their
-early experiments. They created
-portable version of the machine and
-tried to look into 1928 to
-investigate a murder of a 10 years
-old girl named Grace. They've got
-good results and were able to track
-the whole horrors of the crime
-from the very start to the last
-second.
-
-An interesting thing is that on
-images scientists noticed color
-deformation of some fluids
-(blood?!). They said that it has
-too much of red and green. Which
-means they were more ORANGE than
-they should. (I think here the guy
-gave free rein to his imagination,
-and there was nothing about it in
-the scientist's conversation).
-
-To the end of the story the man
-cursed scientists, saying that
-it's they who start adversities
-like the Stench, Bhopal Disaster,
-Fukushima-1 Nuclear Accident,
-Minamata Disease and others, and
-one day they will kill us all. On
-that the interesting part of the
-conversation ends.""",
-    ),
-    (
-        "note",
-        "5. Bastards",
-        """Helga Wagner science diary.
-A record made on 2021-07-06.
-Several dark spots on the paper
-hints the author was crying
-while writing it.
-
-Finally, I have time to put my
-thoughts on a paper. Can't
-remember when I wrote the last
-time. Three month ago? More? Not
-in a mood to check now...
-
-Those bastards, bastards ruined
-our work today! Fat ugly politicians
-decided Wahrsager should be used
-for espionage. Espionage! I
-suspected long ago that their interest
-is not that big, they don't want to
-pay tons of money to make it really
-great. They don't need to see future,
-they just want a damn spying machine
-to catch video of another fat ugly
-politician shagging with his student
-boyfriend. Blackmail! So stupid that
-I want to puke!!! A machine which
-can PREDICT FUTURE will be used
-for prying at deeds of the last days!
-I hoped that at least SCP will say
-something... But they are too busy
-with their own organization to
-argue with our government.
-
-Of course, now I can't leave. They've
-thrown hooks, and now we all are
-slaves of our own ambitions...
-
-Gut, it's a science diary, not a school
-girl crying napkin. Back to business.
-The curator forced us to check what
-is Wahrsager time limit. We've taken
-a look at different ages, even before
-humans appeared on Earth. Looks like
-the last machine version doesn't have
-a limit at all. The strange thing we
-all noticed - the more ancient times
-we're trying to look at the more
-color deformation we get. Everything
-becomes orange. No one have ideas
-what it is, we're working hard on
-understanding the phenomenon.
-
-Still, we probably are late on it.
-About a month ago those idiots
-asked us to try to open a passage
-into the past. Now I'm trying to
-imagine what another stupid thing
-they had on their minds, but back
-there we were thrilled to try!
-And we tried...
-
-Jeffrey Bowers, our assistant from
-US, accepted a risk to spend 10
-seconds in 8000 BCE and take a
-fistful of sand from there. At the
-very first moment since we opened
-the passage, he fallen into some
-kind of a seizure, lost consciousness
-for several minutes, then returned
-to the world of living, started to
-rave and to knock his teeth from
-time to time. Analysis shown he
-feeled cold for some time, which
-is strange - we were sending him
-into the Arabian desert. The
-experiments were paused until
-we'll understand everything.
-
-Several days later Jeffrey became
-well and soon returned to work,
-but we all noticed that from time
-to time he uppers his eyes to the
-ceiling, like he sees something
-there... Later we all saw it...""",
-    ),
-    (
-        "diary",
-        "6. Time To Act",
-        """When we decided on who's going for
-the Adjutant, when and how, it
-appeared that only six of us are
-in the company. Daren said he'll
-try to find more people, but no
-one responded to him.
-
-In such a collective, seeing that
-the situation becoming more and
-more hot, we decided not to waste
-time, took guns, supplies and one
-night went to the railway station,
-where Daren was working.
-
-When we got there, it appeared that
-we are not the only that smart people
-in the city. Looking at a bunch of
-thugs preparing the Adjutant for a
-road, I feeled like a good chance is
-eluding me. All of us...
-
-We all frozen, trying to understand
-what to do next, but in some moment
-Daren stood up and loudly asked:
-"Ronnie?! That you?". A fat heavily
-breathing guy walked out of hangar
-shadows. "It's a strange coincidence
-you're here after rejecting my
-proposition." The fat guy finally
-identified Daren and smiled: "Ah,
-that's you, my honest friend! I
-decided I don't need your old ass
-and took other guys to release this
-metal beast. So, thank you for
-friendship, but we'll take it from
-here!"
-
-Thoughts flewed through my head
-faster than light. There is no way
-to bet a deal with such a bastard,
-the locomotive is not big enough to
-accommodate two of our groups, and
-this chance can be the last one in
-the whole city. The time to act has
-come much earlier than I expected...
-Still, it's time to act.
-
-I've draw my pistol and without
-any words stood up from my cover
-and shot the fat bastard. As I
-hoped within my soul, others
-understood what needs to be done
-without explicit instructions -
-everyone started to shoot. In
-closed hangar insides sounds of
-guns were thunder-like, but after
-several seconds it became obvious
-that our rivals are not as prepared
-as us. Forced them out of the
-building, we all jumped on the
-locomotive and pushed pedal to the
-metal before we lose the opportunity.
-
-That was our first skirmish on long
-road... As Daren promised, we were
-able to leave the city by a forsaken
-and overgrown with grass railway. He
-knew all the neighbour roads, so our
-pace was quite fast. We didn't meet
-anyone at all, like we were the last
-ones leaving the country on a train.
-Most likely we were.""",
-    ),
-    (
-        "diary",
-        "7. Stench",
-        """The Stench, the Stench, the Stench...
-What is it? Despite of everything
-that we saw, I still don't even have
-a strong opinion on it. It's not
-just a mist, no, it's a state. You
-can't see it from distance, but
-when you get into a cloud... It's
-like standing under a waterfall,
-like something is pressuring you
-with vibrations. They are not low
-or high, just... the middle, but
-they are very heavy, rough.
-
-Yes, vibrations pressure on you,
-it all starts to shake in front
-of your eyes. Skin covers with
-sticky cold sweat in the same
-moment. You're freezing, so, in
-addition to air vibrations, you
-start to shiver by yourself and
-knock your teeth.
-
-It feels like you're a weakly
-balanced machine working on high
-frequencies, too high, so high
-that your organism starts to worn
-in minutes. You're losing all of
-your energy and can disctinctly
-feel, like parts of your body
-stopping in a completely
-exhausted condition.
-
-After you spent about a minute in
-the Stench, you need at least 10
-minutes just to return to reality
-and stop shivering.
-
-And the smell. They called it "The
-Stench", but it should better be
-called "The Hell". Because it
-smells like a very strong burnt
-plastic mixed with moisture and
-mold. You breath it, and it
-scorches your lungs, fills it with
-fat cinter from inside.
-
-With all of this, it's pretty hard
-to keep your consciousness within
-a cloud. All you want is to leave
-it as soon as possible, but you
-can never see where it ends. From
-inside the Stench looks endless,
-a veil, which goes into infinity
-in all directions. Only when you
-got out, you can see that it was...
-a comparatively small cloud.
-
-The thing I fear is that one day
-there will be nowhere to get out,
-and that this day will come real
-soon. The Stench is spreading,
-every hour it covers more and more
-of Europe. Governments and
-scientists are useless, it feels
-like no one really working on it,
-everyone is just trying to hype
-and earn on the disaster.
-
-In the meantime Silewer is already
-full of refugees, and what we'll
-see in the next country? How fast
-hordes of people will stuck without
-an ability to make a step further
-in the queue to survival?""",
-    ),
-    (
-        "note",
-        "8. Unterriff",
-        """Following is the log of an encrypted
-radio transmission we've intercepted.
-It contains a conversation between
-Helga Wagner (H) and her bosses (B).
-
-- B: Helga Wagner group, Helga
-Wagner group, come in.
-- H: Hearing you loud and clear.
-- B: Glad to hear from you, Helga,
-are you alright? We heard you've
-been attacked several times on
-your way through Silewer.
-- H: Yes, we've lost a couple of men
-and some science documentation. It
-doesn't contain any sensitive
-information, so we decided not to
-waste time for retrieving the
-documents back.
-- B: Helga, the situation in Silewer is
-getting out of control, and we don't
-have jurisdiction to regulate it. We
-recommend you not to do unnecessary
-stops there.
-- H: Oh, I assure you, we don't.
-- B: Good. Helga, our people are
-waiting you in the location, which
-coordinates we've sent you just a
-minute ago. Come there, they'll
-take you to Unterriff, it's safe
-here.
-- H: Sorry, you said "Unterriff"? I
-thought it's a fable!
-- B: No, Helga, it's real, the city
-is under the Black Sea, so it's
-going to be a short way for you.
-We're waiting for you.
-- H: Oh, but... How? I mean... How???
-- B: Just get here soon, it's safe
-down here.
-- H: How do you know the Stench
-can't get there?
-- B: Helga, we pretty sure we know
-how to protect the city from the
-Stench. It was designed for exactly
-such occasions, there is everything
-that's needed for a comfort life.
-Just get here, the Stench adversity
-is spreading in an unpredictable
-way, it doesn't fit wind or
-atmosphere masses movements. We
-can't analyze it and we're not
-sure how much time you have to
-get to Unterriff, so we advise
-you to hurry.
-- H: Yes, I got you, sorry, I just...
-I guess I need some time to
-process what you said.
-- B: Process it, Helga, and make
-your way to Unterriff. Reach us
-on this frequency in case you
-need anything. The situation
-is complicated, but we'll do
-our best to help you.
-- H: Yes, sir, thanks. We're on our
-way. Helga Wagner group out.
-""",
-    ),
-    (
-        "note",
-        "9. Advice",
-        """The following is a log of another
-radio transmission we've
-intercepted from Unterriff.
-
-- B: Helga Wagner group, Helga
-Wagner group, come in.
-- H: Helga Wagner group on the line,
-hearing you loud and clear.
-- B: Helga, where are you now? Are
-you getting closer to the
-rendezvous point?
-- H: Yes, we're almost out of Silewer.
-- B: Good! We're reaching you, because
-there are two more groups of our
-people, who're following your path
-through the country. They're meeting
-heavy resistance from the local bands.
-Can you advise a safe route?
-- H: Oh, sir! I'm afraid it'll be hard!
-We think about 30% of the country is
-already covered with the Stench - all
-of it on South-West. North, however,
-is under skinheads control.
-- B: Helga, you keep saying "skinheads".
-What does it mean?
-- H: It means it's an alt-right band
-of criminals, who've been harassing
-foreigners in Silewer for years.
-Because of the Stench and a wave of
-refugees they've got huge support
-from locals recently. People say
-they have a new leader, who ordered
-to rob everyone, not just
-foreigners, and prepare for a big
-war for survival! They have
-supplies, ammunition, people, and
-they're getting more every day!
-- B: What do you advise, Helga?
-- H: We've crossed the country by
-Checkpoint 46 - Sneeuwstad -
-Naaldstad route, but this path is
-no more safe. We've heard someone
-purposefully rides along the
-railway, giving hell to skinheads.
-They've gathered significant forces
-to stop those people and get their
-locomotive for themselves, so I
-think it's safer to stay away of
-railways. Say them to take to the
-South, about 80 miles.
-- B: Thank you, Helga! We'll tell
-them! What else can you say?
-- H: The situation is bad. Police
-almost disappeared or joined
-skinheads, and everyone feels it.
-Shooting, robbery, killing is
-already everywhere. A lot of people
-are trying to loot as much supplies
-as they can and get under the
-ground. Stashes and bunkers. For
-others transport became the main
-value, as it can get you away from
-the Stench - tell your people not
-to leave their cars without guard,
-not even for a second. And let
-them ready for fight!
-- B: Thanks, Helga, we'll pass on
-your words to them! We all appreciate
-your help. Looking forward to see
-you in Unterriff. If you don't have
-anything else, then Unterriff out.
-- H: Helga Wagner group out.""",
-    ),
-    ("note", "", ""),
-)
-
-UNTERRIFF_DISCOVERED_TITLE = "Hope"
-UNTERRIFF_DISCOVERED = """
-When read the log, you're walking into the deckhouse
-and asking everyone to gather. Pacing from wall to
-wall, waiting for all to take their places, you're
-trying to find the right words.
-
-"Attention, everyone! We've got information, which
-gives us hope. A hope that we can get to safety.
-There is... an underwater city called Unterriff."
-- you can see how your crew mates start to exchange
-glances. - "It seems this place is built by government
-or other powerful structure, so chances are high
-that it's a real deal. We have coordinates, which
-lead us close to the Black Sea. I think... and I
-hope you agree with me, we must check this clue. No
-one can guarantee it'll save us from the Stench...
-but, at least, we have a clear direction now."
-
-Everyone's keeping silence for several seconds.
-"I guess we've to try!" - Daren shouts finally,
-and others start to happily nod their heads and
-smile. The crew agree!
-
-Then let's leave this cold inimical country and
-search for Unterriff! Turn up the heat!
-"""
-
-CREDITS = """
-Great job, Captain! You've found your way through
-this rough and inimical country of Silewer. It's
-not over yet, there will be more to sacrifice,
-but until now you survived the adversity. Let's
-summarize the decisions you've made.
-\n\n
-Chapter 1
-"Something's acting up"
-- {decision_0}
-
-Chapter 2
-"Orphans"
-- {decision_1}
-
-Chapter 3
-"Bad cops"
-- {decision_2}
-
-Chapter 4
-"The last place"
-- {decision_3}
-
-Chapter 5
-"Refugees not welcome"
-- {decision_4}
-
-Chapter 6
-"Low on food"
-- {decision_5}
-
-Chapter 7
-"Blockpost"
-- {decision_6}
-
-Chapter 8
-"Supplies stealer"
-- {decision_7}
-
-Chapter 9
-"Little one"
-- {decision_8}
-\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n
-These decisions characterize you {leader_desc}
-\n\n\n\n\n\n\n\n\n\n\n\n\n
-Forward Only
-Episode 1
-Seepage
-\n\n
-Developed by
-Ilya Faer
-
-Music by
-Moloken
-Among Madness
-Yeruselem
-Квалиа
-
-\n\n\n\n\n\n\n\n
-To be continued...
-"""
-
-ROUGH_LEADER = """
-as a cold blooded and harsh leader. You see
-your purpose and you achieve it no matter
-the cost. The real life is cruel and unjust,
-you accept it and bring sacrifices when
-necessary. To make the machine move, you
-have to burn fuel after all.
-"""
-
-OPPORTUNIST_LEADER = """
-as an opportunist. It's hard to say
-whether you're good or cruel, you're
-mostly a selective one. You're making
-decisions that better fit the situation
-itself, than morals. And it brings good
-as well as pain to those around you.
-"""
-
-EMPATHIC_LEADER = """
-as an empathetic leader. You're doing
-your best for your people, but you also
-make sure not to hurt others without
-a good strong reason. Even the End Of
-Days doesn't destroy your compassion
-and human decency. Hold this!
-"""
-
-SCP_PAGES = [
-    "scp_1_eng.png",
-    "scp_2_eng.png",
-    "scp_3_eng.png",
-]
-
-
-SCP_END = (
-    "Doppelganger",
-    """Finding your people by gaze, you're trying to understand
-what did just happen. Was it really SCP-4945-B, the
-train? No, no, no, impossible! But the model of the
-machine... more than this... you saw yourself among
-the people shooting from it! Cold needles run on your
-neck because of these thoughts.
-
-And this scorching violet light...  The Stench is
-not enough, now this! What does the D. child was
-thinking about? Observing nearlands with concerns
-to see the violet light again, you answer the
-question by yourself: he thought about you. Most
-likely he learnt somehow about your crew, maybe
-a news report or kinda video in internet.
-Imagining you, he materialized your copies in
-the train, mixed with something... supernatural.
-You close your eyes - no, better not to think
-about it, or you gonna lose your mind completely.
-Let's just... move forward and hope it's not
-gonna happen again.""",
-)
@@ -0,0 +1,36 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+The SCP episode texts written in English language.
+"""
+
+SCP_PAGES = [
+    "scp_1_eng.png",
+    "scp_2_eng.png",
+    "scp_3_eng.png",
+]
+
+SCP_END = (
+    "Doppelganger",
+    """Finding your people by gaze, you're trying to understand
+what did just happen. Was it really SCP-4945-B, the
+train? No, no, no, impossible! But the model of the
+machine... more than this... you saw yourself among
+the people shooting from it! Cold needles run on your
+neck because of these thoughts.
+
+And this scorching violet light...  The Stench is
+not enough, now this! What does the D. child was
+thinking about? Observing nearlands with concerns
+to see the violet light again, you answer the
+question by yourself: he thought about you. Most
+likely he learnt somehow about your crew, maybe
+a news report or kinda video in internet.
+Imagining you, he materialized your copies in
+the train, mixed with something... supernatural.
+You close your eyes - no, better not to think
+about it, or you gonna lose your mind completely.
+Let's just... move forward and hope it's not
+gonna happen again.""",
+)
@@ -0,0 +1,683 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+The game text labels wirrten in Russian language.
+"""
+from languages import lazy_sections
+
+MAIN_MENU = (
+    "Новая игра",
+    "Загрузить",
+    "Настройки",
+    "Выход",
+    (
+        "Это бета-версия игры. Она не до конца сбалансирована, и"
+        " некоторые её части ещё в разработке. Приятной игры!\n"
+        """(c) Автор: Илья "Фаер" Гуров. Все права защищены."""
+    ),
+    "Выберите команду",
+    "Солдаты",
+    "Рейдеры",
+    "Анархисты",
+    "Описание",
+    "Начать",  # 10
+    (
+        "Солдаты - это люди крепкой дисциплины. Они отлично стреляют "
+        "на средних\nдистанциях и хороши при атаке на укрепления. "
+        "Их тактика строится на защите\nи развитии локомотива, "
+        "вплоть до превращения его в передвижную крепость.\n\n"
+        "Вы начнёте с 3 мужчинами. "
+        "Лучший тип вылазок: Укрепление."
+    ),
+    (
+        "Рейдеры привычны к трудностям и могут восстановиться после "
+        "чего угодно. Они\nхороши в ближнем бою и умеют добывать "
+        "ресурсы. Их тактика базируется на\nполучении и использовании "
+        "расходуемых предметов и быстрой регенерации.\n\n"
+        "Вы начнёте с 2 мужчинами и 1 женщиной. "
+        "Лучший тип вылазок: Расхищение."
+    ),
+    (
+        "Анархисты - это стихия самой природы! Они ценят тех, с кем их "
+        "свела жизнь,\nи сплочаются намного быстрее других классов. "
+        "Их тактика построена на\nнаборе людей, настройке "
+        "их черт характера и командных навыках.\n\n"
+        "Вы начнёте с 2 мужчинами и 1 женщиной. "
+        "Лучший тип вылазок: Встреча."
+    ),
+    "Главное меню",
+    "Сохранить игру",
+    "(нельзя в бою)",
+    "(нельзя у города)",
+    "(нельзя у развилки)",
+    "(нельзя при поражении)",
+    "(нельзя в начале)",  # 20
+    "Продолжить",
+    "Разрешение:",
+    "Обучение:",
+    "Язык:",
+    "Сохранить и перезагрузить",
+    "Загрузка...",
+    "Принять командование",
+    (
+        "Состояние Адъютанта критическое!\n"
+        "Дальше он уже не поедет, а Смрад\n"
+        "не заставит себя долго ждать.\n\n"
+        "Всё кончено...",
+    ),
+    "Лимит кадров/сек:",
+    "Титры",  # 30
+    """Автор: Илья "Фаер" Гуров""",
+    "Исходный код игры",
+    "Подписка",
+    "Стек",
+    "Также",
+    "Счётчик FPS:",
+    "Многопоточность:",
+    """(повышает FPS, но может вызвать
+плавающие вылеты на старте
+новой игры или загрузке)""",
+    "Музыка",
+    "Сохранение... {}%",  # 40
+    "Игра сохранена",
+    "Ошибка сохранения",
+    "Идёт другое сохранение",
+)
+
+KEYS_INFO = """
+Управление:
+Левая кнопка мыши - выбрать юнита/зону отдыха
+Правая кнопка мыши - переместить юнита/указать цель
+R - показать сплочение персонажа с другими
+
+W - удерживать для ускорения
+S - удерживать для замедления
+F - включить прожекторы
+M - показать схему дороги
+J - открыть журнал
+
+Камера:
+\u2190\u2191\u2193\u2192 или толкнуть край экрана мышью - сдвинуть
+Alt + \u2190\u2191\u2193\u2192 или удерживать колесо мыши - повернуть
+"+", "-" или крутить колесо - приблизить/отдалить
+C - центрировать камеру
+
+Новогоднее настроение:
+7 - включить гирлянду
+8 - выстрел хлопушкой (если гирлянда включена)
+
+День Св. Валентина:
+9 - включить мод
+
+Кроссовер SCP:
+0 - переключить досье
+"""
+
+RESOURCES = (
+    "Ресурсы:",
+    "Лекарство",
+    "Вылечить болезни и раны персонажа",
+    "Фильтр дыма",
+    "Исключить нападение скинхедов на 5 мин.",
+    "Стимулятор",
+    "Убрать плохие черты и оглушение (5 мин.)",
+    " км",
+    "Место интереса",
+    "Посетите хотя бы 8 из 10, чтобы выиграть",
+)
+
+CHARACTERS = ("Имя:", "Класс:", "Здоровье", "Энергия", "Статус", "Черты")
+CITY = (
+    "Услуги",
+    "Люди",
+    "Поезд",
+    "Покинуть",
+    "Развернуться и покинуть",
+    "Локомотив",
+    "Ремонт",
+    "Детали",
+    "Поставить",
+    "Экипаж",
+    "Рекруты",  # 10
+    "Предметы",
+    "Исключить",
+    "Нанять",
+    "Продать",
+    "Купить",
+    """Правительство города выдаёт
+Вам награду за помощь
+в зачистке региона от
+скинхедов.
+
+Вы уничтожили:
+""",
+    "Награда всего:\n",
+    """Жители города слышали о том,
+как Ваш экипаж помог сиротам
+построить лагерь. Они уважают
+отзывчивых людей и поощряют
+Вас - Адъютант получает 250
+единиц Прочности бесплатно.""",
+)
+
+NOTES = (
+    # controls
+    """Не забывайте читать заметки
+в дневнике Капитана.
+Они расскажут многое.""",
+    """Не забывайте сохраняться!""",
+    """Выберите персонажа и нажмите
+правую кнопку мыши на
+другом, чтобы поменять
+их местами""",
+    # traits
+    """Персонаж может иметь до трёх
+различных черт характера""",
+    """Персонажи с высоким сплочением
+могут случайным образом
+перенимать черты друг
+у друга""",
+    """Вы можете обменять сплочение
+экипажа на черты
+характера в Листе
+Отличившихся""",
+    # enemy
+    """Скинхеды максимально
+активны по вечерам""",
+    """По утрам активность
+скинхедов минимальна""",
+    """Чем медленнее движется паровоз,
+тем проще врагам попасть
+в него метательным
+оружием""",
+    """Одни враги стреляют, другие
+замедляют, третьи оглушают.
+Изучайте их тактику!""",
+    """Вражеская территория
+не учитывается на схеме
+Ж/Д путей""",
+    """Правительства городов Сайлевера
+поощрят Вас деньгами за
+уничтожение скинхедов
+поблизости""",
+    # сплочение
+    """Повышение общей сплочённости
+открывает навыки экипажа. Это
+сильные временные эффекты,
+которые помогут Вам выжить.""",
+    """Солдаты и рейдеры не любят друг
+друга. Построить сплочение
+между ними будет сложно.""",
+    """Чтобы увеличить сплочение
+между конкретными персонажами,
+держите их ближе друг
+к другу""",
+    # вылазки
+    """Хороший способ увеличить
+сплочение между конкретными
+персонажами - это послать
+их вместе на вылазку""",
+    """Даже слабый результат на
+вылазке может быть
+полезным - персонажи
+сплочатся""",
+    """Разные типы вылазок дают
+разные виды трофеев""",
+    """Вылазка может стать очень
+опасной. Лучше отправлять
+на неё людей, хорошо
+знакомых друг с другом.""",
+    """Вы не можете командовать своими
+людьми, пока они на вылазке.
+Вы можете только отправить
+подходящих людей.""",
+    """Вылазка может как обернуться
+опасностью, так и оказаться
+плёвым делом. Рискуйте!""",
+    """Не забывайте учитывать вылазки,
+когда планируете маршрут""",
+    """Рекруты, найденные на вылазках
+типа Встреча, запрашивают
+меньшее вознаграждение,
+чем в городах""",
+    """Нажмите M, чтобы посмотреть
+на схему Ж/Д путей и
+спланировать маршрут""",
+    """Ж/Д ветки всегда соединяются
+обратно в главную
+магистраль""",
+    """Вы можете развернуться в городе.
+Учитывайте это во время
+планирования маршрута.""",
+    """Останавливаться на вражеской
+территории безрассудно""",
+    """Включение света поможет Вам
+сохранить энергию персонажей и
+повысить точность стрельбы,
+но так же привлечёт внимание""",
+    """Изношенные ржавые рельсы
+могут сильно повредить колёса
+локомотива. Сбросьте скорость,
+если слышите скрип металла.""",
+    """Активные орудия локомотива
+можно использовать только
+на вражеской территории""",
+    """Хотите увеличить огневую
+мощь? Купите в городе
+активные орудия.""",
+    # characters and classes
+    """Женщины милы и социальны. Они
+снижают стресс в любом
+коллективе.""",
+    """У женщин меньше здоровья, но
+они куда энергичнее""",
+    """Люди устают быстрее в темноте
+и во время боя""",
+    """Не забывайте проверять статус
+персонажей в расширенном
+интерфейсе юнитов""",
+    # raiders
+    """Жизнь рейдеров полна грабежа.
+Они умеют находить полезные
+ресурсы и предметы.""",
+    """Рейдеры - хорошие стрелки на
+короткой дистанции""",
+    """Рейдеры растрачивают энергию
+быстро, но они так же
+быстро отдыхают""",
+    # soldiers
+    """Солдаты - хорошие стрелки на
+средней дистанции""",
+    """Если Вы хотите ударить по
+вражеским укрепления,
+солдаты - это Ваш выбор""",
+    # anarchists
+    """Анархисты демократичны. Они
+выстраивают сплочение
+быстрее других.""",
+    """Анархисты получают множитель
+урона x2 от сплочения""",
+    """Анархисты - это люди толпы.
+Они ценят тех, с кем их
+свела жизнь.""",
+    # accuracy
+    """Точность стрельбы зависит от
+освещения, дистанции,
+класса персонажа и
+его энергии""",
+    """Отправьте персонажа в Зону
+Отдыха локомотива. Отдых
+восстанавливает здоровье
+и энергию.""",
+    # diseases
+    """Болезни снижают максимум
+энергии персонажа до 80 и
+отключают все его
+положительные черты""",
+    """Ограничьте контакты больного
+персонажа с другими, чтобы
+остановить распространение
+инфекции""",
+    """Раненные и уставшие персонажи
+более уязвимы для болезней""",
+    # the Stench
+    """Оранжевые облака Смрада
+очень ядовиты. Пересекайте
+их как можно быстрее!""",
+    # resources
+    """Стимулятор временно отключает
+негативные черты юнита.
+Так же он даёт иммунитет
+к оглушению.""",
+)
+
+DEFAULT_NOTE = "Нажмите F1, чтобы открыть\nсправку по управлению"
+
+TIPS = ("Отдыхают:", "Зона отдыха", "Приближаемся к городу")
+
+COHESION = (
+    "Навыки экипажа",
+    "Вспомним былое",
+    "Каждый юнит получает +10 энергии. Зарядка: 4 мин.",
+    "Прикрывающий огонь",
+    "Каждый юнит получает +20% точности. Зарядка: 5 мин.",
+    "Своих не бросаем",
+    "Юниты со здоровьем < 30 получают +25 здоровья. Зарядка: 8 мин.",
+    "Общая ярость",
+    "Каждый юнит получает +30% к силе. Зарядка: 10 мин.",
+    "Держимся, вместе",
+    "Ни один юнит не погибнет в следующие 1 мин. Зарядка: 10 мин.",
+)
+
+DISTINGUISHED = (
+    "Лист отличившихся",
+    (
+        "Здесь Вы можете хвалить и отчитывать своих людей, "
+        "чтобы изменить их черты.\nУказание на личность часто "
+        "вредит коллективу, поэтому\nкаждое действие будет "
+        "немного сокращать сплочённость команды.\n\n"
+        "Выберите одну из черт персонажа (положительную или "
+        "отрицательную)\nи отчитайте юнита, чтобы убрать её. "
+        "Это будет стоить 4 очка сплочения.\n\n"
+        "Если у юнита менее трёх черт, Вы можете похвалить его, "
+        "чтобы\nсгенерировать 3 новые черты и добавить одну из них "
+        "юниту.\nЭто будет стоить Вам 4 очка сплочения."
+    ),
+    "Очков сплочения:",
+    "Новые черты:",
+    "Похвалить",
+    "Отчитать",
+    "Готово",
+    "Текущие черты",
+)
+
+SPLASHES = (
+    "Напутствие от автора",
+    """Forward Only не наказывает сразу, но каждая ошибка
+затягивает петлю сильнее. Планируйте наперёд!""",
+)
+
+MECHANIC_NAMES = (
+    "локомотив",
+    "персонажи",
+    "Смрад",
+    "сплочение",
+    "вылазки",
+    "предметы",
+    "состояние юнита",
+)
+
+MECHANIC_BUTS = ("Далее", "Принято!")
+
+CLASS_DESCS = {
+    "MotoShooter": {
+        "desc": (
+            "Мотострелок постарается выпустить в Вас\n"
+            "и локомотив столько пуль, сколько сможет.\n"
+            "Большинство скинхедов предпочитает такой\n"
+            "способ общения с иностранцами, так что\n"
+            "сохраняйте бдительность - их будет много.\n"
+        ),
+        "preview": "shooter",
+        "but_text": "Принято!",
+        "title": "Скинхеды ищут Вас!",
+    },
+    "BrakeThrower": {
+        "desc": (
+            "Башмачник постарается обогнать Вас и бросить\n"
+            "тормозной башмак Вам под колёса, чтоб замедлить.\n"
+            "Эти парни не особо сильны сами по себе, но\n"
+            "они могут сделать атаки других скинхедов\n"
+            "успешнее. Старайтесь убивать их первыми!"
+        ),
+        "preview": "brake_thrower",
+        "but_text": "Понятно!",
+        "title": "Скинхеды обсуждают дерзких новичков!",
+    },
+    "Barrier": {
+        "desc": (
+            "Скинхеды стали использовать барьеры против\n"
+            "Вас. Барьер наносит значительный урон локомотиву\n"
+            "при столкновении. Рекомендуется установить\n"
+            "Таран в ближайшем городе, чтобы обеспечить\n"
+            "себя хорошей защитой от них."
+        ),
+        "preview": "barrier",
+        "but_text": "Мы справимся!",
+        "title": "Скинхеды начали расставлять барьеры!",
+    },
+    "StunBombThrower": {
+        "desc": (
+            "Такой боец будет бросать оглушающие шашки,\n"
+            "чтобы обездвижить Ваших людей на несколько\n"
+            "секунд. Ему будет сложно попасть по быстро\n"
+            "движущемуся локомотиву, но если Вы потеряете\n"
+            "часть скорости, точность его бросков повысится."
+        ),
+        "preview": "bomb_thrower",
+        "but_text": "Мы готовы!",
+        "title": "Скинхеды начали воспринимать Вас всерьёз!",
+    },
+    "DodgeShooter": {
+        "desc": (
+            "Dodge с пулемётом - это сильный враг. Он может\n"
+            "нанести много урона локомотиву, но его орудие\n"
+            "быстро перегревается и требует паузы на\n"
+            "охлаждение. Рекомендуется установить Пластину\n"
+            "Брони, чтобы защититься от этого типа врага."
+        ),
+        "preview": "dodge",
+        "but_text": "Ясно!",
+        "title": "Скинхеды собирают технику, чтобы достать Вас!",
+    },
+    "Rocket": {
+        "desc": (
+            "Ваш прогресс приводит скинхедов в бешенство!\n"
+            "Они бросают всё больше сил на Вас. Их последняя\n"
+            "идея - телеуправляемые ракеты, могут серьёзно\n"
+            "навредить локомотиву. Используйте Пластину\n"
+            "Брони, чтобы защитить целевую сторону поезда."
+        ),
+        "preview": "rocket",
+        "but_text": "Нас не остановить!",
+        "title": "Скинхеды начали использовать ракеты!",
+    },
+    "Kamikaze": {
+        "desc": (
+            "На Вас идут камикадзе! Они могут нанести большой\n"
+            "урон Адъютанту, но только один раз. Рекомендуется\n"
+            "установка Пластины Брони. Так же можно уничтожать\n"
+            "камикадзе до того, как они зажигают фитиль. Если\n"
+            "улучить момент, взрыв камикадзе нанесёт урон\n"
+            "другим врагам поблизости!"
+        ),
+        "preview": "kamikaze",
+        "but_text": "Переживём!",
+        "title": "Все силы скинхедов направлены на Вас!",
+    },
+}
+
+SCHEME = (
+    "Ж/Д схема Сайлевера",
+    "Обозначения:\nm - Встреча\nl - Расхищение\ne - Укрепление\ni - Место интереса",
+    "   - город",
+    "- Ж/Д ветка",
+    "- Смрад",
+)
+
+TRAITS = [
+    ("Шустрость", "Улитка"),
+    ("Сова", "Страх темноты"),
+    ("Мазохизм", "Гемофобия"),
+    ("Иммунитет", "Тепличность"),
+    ("Либерализм", "Одиночка"),
+    ("Жестокость", "Нервозность"),
+    ("Ныряльщик", "Морская болезнь"),
+    ("Механик", "Фармакофобия"),
+]
+
+TRAIT_DESC = {
+    "Шустрость": "+30% скорость стрельбы",
+    "Улитка": "-20% скорость стрельбы",
+    "Сова": "+25% точность в темноте",
+    "Страх темноты": "+50% затрат энергии в темноте",
+    "Мазохизм": "С уроном восполняет энергию",
+    "Гемофобия": "+25% затрат энергии, если здоровье < 50%",
+    "Иммунитет": "-40% шанс заболеть",
+    "Тепличность": "+20% шанс заболеть",
+    "Либерализм": "+30% рост сплочения с другими классами",
+    "Одиночка": "x1.3 урона, если один на части поезда",
+    "Жестокость": "+7 здоровья за уничтожение врага",
+    "Нервозность": "+25% затрат энергии в бою",
+    "Ныряльщик": "Не вдыхает Смрад в течении 1 мин.",
+    "Морская болезнь": "Не отдыхает на высокой скорости",
+    "Механик": "Чинит локомотив, если не отдыхает",
+    "Фармакофобия": "Лечится на 40% медленнее",
+}
+
+UPGRADES_DESC = {
+    "Таран": {
+        "name": "Таран",
+        "desc": """С тараном Ваш локомотив
+будет сбивать барьеры,
+не получая никакого урона""",
+        "cost": "120$",
+        "model": "ram1",
+        "threshold": 1,
+    },
+    "Прожекторы": {
+        "name": "Прожекторы",
+        "desc": """Все негативные факторы
+темноты станут неактуальны
+с этими прожекторами""",
+        "cost": "190$",
+        "model": "floodlights1",
+        "threshold": 2,
+    },
+    "Пластина Брони": {
+        "name": "Пластина Брони",
+        "desc": """Активный щит, закрывает
+одну сторону локомотива.
+Нажмите 4, 5, 6, чтобы двигать.""",
+        "cost": "70$",
+        "model": "armor_plate",
+        "threshold": 1,
+    },
+    "Огнетушители": {
+        "name": "Огнетушители",
+        "desc": """Постепенно повышает
+Прочность поезда до 400 ед.
+в случае большого урона""",
+        "cost": "190$",
+        "model": "fire_extinguishers",
+        "threshold": 2,
+    },
+    "Гранатомёт": {
+        "name": "Гранатомёт",
+        "desc": """Активное орудие, наносит
+урон по области. Нажмите
+1, чтобы активировать.""",
+        "cost": "170$",
+        "model": "grenade_launcher",
+        "threshold": 1,
+    },
+    "Место": {
+        "name": "Место",
+        "desc": """Добавляет одну ячейку
+юнита в зону отдыха
+локомотива""",
+        "cost": "140$",
+        "model": "sleeper1",
+        "threshold": 1,
+    },
+    "Оконные Рамы": {
+        "name": "Оконные Рамы",
+        "desc": """С этим оконными рамами
+юниты в зоне отдыха будут
+защищены от Смрада""",
+        "cost": "150$",
+        "model": "isolation",
+        "threshold": 2,
+    },
+    "Ракетомёт": {
+        "name": "Ракетомёт",
+        "desc": """Пускает ракеты, которые
+разделяются на 4 гранаты
+и наносят урон в 4-х местах.
+Нажмите 3, чтобы стрелять.""",
+        "cost": "180$",
+        "model": "cluster_bomb_launcher",
+        "threshold": 2,
+    },
+    "Пулемёт": {
+        "name": "Пулемёт",
+        "desc": """Даёт прицельный залп.
+Лучше стрелять по одной цели.
+Нажмите 2, чтобы стрелять.""",
+        "cost": "150$",
+        "model": "machine_gun",
+        "threshold": 2,
+    },
+    "Протекторы": {
+        "name": "Протекторы",
+        "desc": """Броня для колёс и толкающего
+механизма. Повышает макс.
+Прочность до 150%.""",
+        "cost": "160$",
+        "model": "armor",
+        "threshold": 1,
+    },
+}
+
+FORKS = (
+    "Подъезжаем к стрелке:\nповерните вправо - T,\nили игнорируйте",
+    "Подъезжаем к стрелке:\nповерните влево - T,\nили игнорируйте",
+    "Подъезжаем к стрелке:\nсвернуть на ветку - Т,\nили игнорируйте",
+)
+
+JOURNAL = ("Журнал", "Листы", "Очерк")
+
+STATUSES = (
+    "Сова: +5% точности",
+    "Темно: -10% точности",
+    "Темно: -20% точности",
+    "Усталость: -{}% точности",
+    "Множитель силы: x{}",
+    "Гемофобия: +25% затрат энергии",
+    "Болезнь: -20 макс. энергии",
+    "Морская болезнь: не восстанавливается",
+)
+
+OUTINGS_GUI = (
+    "Отправить людей ({cur_as}/{max_as}):",
+    "Всего очков вылазки:\n",
+    "Отмена",
+    "Отправить",
+    "Очки вылазки:",
+    "Класс юнитов:",
+    "Состояние юнитов:",
+    "Сплочение юнитов:",
+    "Время суток:",
+    "Экипаж:",
+    "Нанять",  # 10
+    "Не нанимать",
+    "Можно нанять {name} за {cost}$",
+    "Получить черту {trait}\n ({desc})",
+    "Выберите персонажа как цель эффекта:",
+    "Сплочение повышено: +{value} очков",
+)
+
+NOTIFIERS = (
+    "Место интереса! Остановка",
+    'Вылазка "{}" через 2 км',
+    "2 км",
+    "1 км",
+    "Остановитесь для начала вылазки",
+)
+
+OUTING_TYPES = {"Looting": "Расхищение", "Meet": "Встреча", "Enemy Camp": "Укрепление"}
+
+PRONOUNS = ("он", "его", "ему", "она", "её", "ей")
+
+SCENARIO_LABELS = ("Глава ", "Сценарий", "Течь")
+CITY_NAMES = ("Снюустад", "Наальдстад")
+
+PREAMBULA = """Доброе утро, Капитан!
+
+Мы пересекли границу Сайлевера в 23:45, на контрольном пункте никого не было. Вскоре
+мы сделали остановку у импровизированного лагеря беженцев. Шушера, очень похожая на
+скинхедов, унижала его обитателей - мы пригрозили оружием, и они оставили людей в
+покое, но пообещали найти нас позже. Решено было не будить Вас по этому поводу, дать
+отдохнуть до утра.
+
+Адъютант, наш добрый локомотив, в приемлемом состоянии, и экипаж готов к службе.
+Только что пропала связь с Мюнхеном, значит, фронт Смрада в паре часов позади. Нужно
+держать высокую скорость, чтобы его ядовитые оранжевые облака не нагнали нас.
+
+На этом всё, Капитан, передаю командование Вам!"""
+
+UNTERRIFF_DISCOVERED_TITLE = "Надежда"
+
+# heavy texts, imported on the first access
+__getattr__ = lazy_sections(__name__)
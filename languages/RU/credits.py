@@ -0,0 +1,95 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+The game credits texts written in Russian language.
+"""
+
+CREDITS = """
+Отличная работа, Капитан! Вы успешно прошли
+через жёсткий и недружелюбный Сайлевер. Это
+ещё не конец, впереди Вас ждут немалые жертвы,
+но на данный момент Вы выживаете успешно.
+Посмотрим на принятые Вами решения.
+\n\n
+Глава 1
+"Что-то не в порядке"
+- {decision_0}
+
+Глава 2
+"Сироты"
+- {decision_1}
+
+Глава 3
+"Плохие полицейские"
+- {decision_2}
+
+Глава 4
+"Последнее место"
+- {decision_3}
+
+Глава 5
+"Беженцам не рады"
+- {decision_4}
+
+Глава 6
+"Голод"
+- {decision_5}
+
+Глава 7
+"Блокпост"
+- {decision_6}
+
+Глава 8
+"Вор"
+- {decision_7}
+
+Глава 9
+"Малый"
+- {decision_8}
+\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n
+Принятые Вами решения характеризуют Вас как {leader_desc}
+\n\n\n\n\n\n\n\n\n\n\n\n\n
+Forward Only
+Эпизод 1
+Течь
+\n\n
+Разработка
+Ilya Faer
+
+Музыка
+Moloken
+Among Madness
+Yeruselem
+Квалиа
+
+\n\n\n\n\n\n\n\n
+Продолжение следует...
+"""
+
+ROUGH_LEADER = """
+хладнокровного и сурового лидера. Вы знаете
+свою цель и достигаете её, чего бы это ни
+стоило. Реальная жизнь жестока и несправедлива,
+Вы это принимаете и готовы принести жертвы,
+когда необходимо. Чтобы машина двигалась,
+нужно жечь топливо, в конце концов.
+"""
+
+OPPORTUNIST_LEADER = """
+приспособленца. Сложно сказать, добры Вы
+или жестоки, Вы, скорее, избирательны.
+Вы принимаете решение, которое лучше
+подходит ситуации, а не соответствует
+неким моральным установкам. И это
+приносит как добро, так и боль тем,
+кто Вас окружает.
+"""
+
+EMPATHIC_LEADER = """
+эмпатичного лидера. Вы делаете всё для
+своих людей, но так же старатесь не вредить
+окружающим без веских на то причин. Даже
+Конец Света не смог стереть Ваши сострадание
+и порядочность. Держитесь за них!
+"""
@@ -0,0 +1,717 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+The journal pages written in Russian language.
+"""
+
+JOURNAL_PAGES = (
+    (
+        "diary",
+        "1. Паника",
+        """Никогда раньше не вёл дневников, но
+чувствую, что мне нужно изложить
+мысли на бумаге, попробовать
+взглянуть на картину в целом....
+
+Около месяца назад соц. сети
+произвели на свет очередной
+тренд: люди снимали улицы,
+рассказывая о некоем оранжевом
+тумане. Только никакого тумана
+на видео не было! Здания,
+машины, тротуары и...
+кристально чистый воздух. Как
+будто они галлюцинировали.
+
+Смотрелось как очередной
+бестолковый пранк или крипи
+тред, к которым все привыкли,
+так что никто не обратил внимание.
+Зумерки развлекаются, как обычно.
+Я думал так же... Но в какой-то
+момент они начали находить тела,
+всерьёз. Новостные агентства
+подхватили историю: люди умирают
+посреди улицы, но никто не может
+объяснить почему! И вдруг кто-то
+громко сказал: они умирают из-за
+замеченного там оранжевого тумана.
+
+Как обычно, государство сначала
+попыталось скрыть масштабы
+бедствия. Зазвучали какие-то
+тупые объяснения, просьбы к
+людям оставаться дома, если
+можно, использовать респираторы.
+Цензура новостей, сайтов,
+дискредитация авторов слухов.
+Были даже перекрыты некоторые
+блоки городов, но только в
+спальных районах.
+Рекреационные и бизнес кварталы,
+которые приносят деньги,
+работали в нормальном режиме,
+так что там можно было
+споткнуться о труп, ещё не
+убранный полицией. Тем временем
+в Германии, Швейцарии и
+Нидерландах всё больше людей
+понимали, что всё серьёзно.
+
+Наконец, несколько полицейских,
+видя, что бедствие набирает
+обороты, собрали всю свою
+совесть и решились сделать
+заявление. Опубликованные ими
+фото показывали десятки мёртвых,
+лежащих прямо на улице, будто
+новый Джонстаун, и несколько
+документов, в которых эксперты
+-химики подводили итог, что
+оранжевый туман, прозванный
+ими Смрадом, селективно убивает
+людей, независимо от того,
+какие средства защиты они
+применяют...
+
+Эта акция вызвала настоящую
+панику в странах Европы, и я
+понял, что нужно делать что-то.""",
+    ),
+    (
+        "note",
+        "2. Прорицатель",
+        """Запись интервью от 2021-06-23,
+Цюрих, 56-ой Международный
+Саммит Учёных.
+Интервьюер: Эмили Шлёссер
+Собеседник: доктор Хельга Вагнер,
+ведущий системный инженер
+проекта Прорицатель.
+
+- Э: Хельга, не могли бы Вы
+простыми словами объяснить
+нашим подписчикам, что
+такое проект Прорицатель?
+- Х: Перед тем, как говорить
+о самом проекте, нужно понять
+детерменизм: методологию,
+которая утверждает, что у
+каждого события в мире есть
+конкретные причины. Фактически,
+она говорит, что прошлое
+направляет будущее. С этими
+мыслями, наша группа учёных
+вознамерилась найти способ
+заглянуть в прошлое, узнать,
+что именно там произошло,
+измерить предыдущие события и,
+возможно, мы надеемся,
+использовать эти данные,
+чтобы предсказать будущее!
+Такова цель проекта Прорицатель.
+
+- Э: Вы говорите о чём-то очень
+похожем на машину времени!
+- Х: Да! Но давайте заметим,
+что она не открывает проходов
+в другое время, она только
+даёт возможность взглянуть
+на него, сделать детальный
+снимок, который можно
+проанализировать. Как фото
+(улыбается). Основной пункт
+здесь - это точность, ведь наш
+мир состоит из неизмеримого
+числа событий, влияющих друг
+на друга. Нам нужен Демон
+Лапласа, чтобы получить
+результаты - без высокой
+точности наши предсказания
+будут ненадёжны.
+
+- Э: Звучит грандиозно! Но,
+похоже, Вам необходимы
+высококлассное оборудование
+и специалисты.
+- Х: Разумеется. Наша команда
+состоит из лучших умов мира,
+кое-кто из них даже пришёл из
+SCP Foundation! Это большая
+честь для меня работать с ними.
+Оборудование, что ж,
+правительство предоставляет
+нам всё необходимое со дня
+первой презентации.
+
+- Э: Расскажете, как это было?
+- Х: Сейчас мы продвинулись
+много дальше, но на первой
+презентации у нас была лишь
+камера с химическим веществом
+и приборы, чтобы замерить
+состояние этого вещества на
+48 часов назад во времени...
+
+На этом вопросе наше интервью
+завершилось, так как доктора
+Вагнер вызвали на онлайн
+совещание с коллегами.""",
+    ),
+    (
+        "diary",
+        "3. Предложение",
+        """Когда стало очевидно, что Смрад
+реален, и бедствие не собирается
+останавливаться в ближайшее время,
+я решил закрыть свою компанию. Те,
+кто работал на меня - мы всегда
+были, как семья. Другой у меня
+нет, так что прощаться со всеми
+было... Но мы приняли решение
+покинуть город как можно скорее.
+Первые упоминания Смрада пришли
+из Германии и Швейцарии,
+приблизительно, с запада, так
+что у нас было направление - при
+условии, конечно, что туман будет
+расходиться по кругу.
+
+Собирались мы долго, отчего
+наглухо и застряли! Самолёты,
+забравшие часть людей, улетели и
+отказались возвращаться. Ни
+одного воздушного судна во всей
+стране! Что до машин, ну, тут
+ещё хуже - каждая дорога на
+востоке города была наглухо
+забита пробками на мили, МИЛИ!
+Все ринулись прочь из региона.
+
+Тут-то мне и позвонил один мой
+друг, машинист. Он искал людей,
+храбрых или отчаявшихся
+достаточно, чтобы помочь ему
+угнать локомотив, на котором он
+работал последние несколько лет.
+Он знал, что я сорвиголова, и
+позвонил мне первому. Мне
+понравилась его идея и я
+предложил её своим работникам.
+У некоторых из них семьи, так
+что они отказались от рискованной
+операции, но трое и Кеннет, мой
+старый товарищ механик,
+согласились.
+
+Дарен, машинист, предложивший
+всё это, рассказал нам об
+Адъютанте - быстром и мощном
+локомотиве, старом, но очень
+надёжном транспорте. Он сказал,
+что знает заброшенный Ж/Д путь
+из города, состояние которого
+всё ещё приемлемо для одного
+проезда. На этом мы и порешили.""",
+    ),
+    (
+        "note",
+        "4. Учёная",
+        """Следующее ниже я услышал от одного
+обитателя мотеля, который с
+недовольным видом рассказывал
+товарищу о встреченной им женщине.
+
+Согласно источнику информации,
+вчера утром он заметил особу со
+странной штуковиной на шее,
+похожей на высокотехнологичный
+противогаз. У неё было
+несколько металлических
+контейнеров и толпа помощников,
+все выглядели университетской
+группой.
+
+Женщина много говорила с кем-то
+по телефону, докладывала. "Наш
+человек" услышал, что она работала
+над устройством, которое приковало
+внимание правительства и SCP -
+машина, способная открывать окна
+в прошлое (очевидно, проект
+Прорицатель). Её хотели
+использовать для проверки
+не врёт ли человек о вещах,
+которые произошли совсем недавно,
+а так же шпионажа - получения
+данных о событиях прошлого, ещё
+не приведших к последствиям. Так
+как устройство показывает, как
+всё было на самом деле, без
+обмана и сокрытия, звучит это
+умно. Пусть, в Вашу организацию
+внедрили шпиона пару дней назад;
+благодаря устройству можно
+увидеть прошлое, период, когда
+этого человека инструктировали.
+Вы заметите опасность ещё до того,
+как он доберётся до чего-то ценного.
+Можно следить вообще за всеми!
+С небольшой задержкой, конечно, но...
+
+Женщина рассказала и о ранних
+стадиях экспериментов. Они создали
+портативную версию устройства и
+заглянули в 1928 год, чтобы
+расследовать убийство 10-летней
+девочки по имени Грейс. Результаты
+впечатляющие - им удалось
+проследить все ужасы преступления
+от первой и до последней секунды.
+
+Интересно, что на изображениях
+учёные обнаружили деформацию
+цветов жидкостей (крови?!). В них
+якобы слишком много красного и
+зелёного. Это означает, что они
+были ОРАНЖЕВЕЕ, чем должны (я
+думаю, здесь наш парень дал волю
+воображению, и женщина ничего
+подобного не говорила).
+
+В заключение рассказчик проклял
+всех учёных, утверждая, что это
+они устраивают бедствия, вроде
+Смрада, Бхопальской катастрофы,
+Инцидента Фукусима-1, болезни
+Минаматы и т.д., и что однажды
+они уничтожат нас всех. На
+этом интересная часть его
+истории заканчивается.""",
+    ),
+    (
+        "note",
+        "5. Ублюдки",
+        """Научный дневник Хельги Вагнер.
+Запись от 2021-07-06. Тёмные
+пятна на листе подсказывают,
+что автор плакала, когда
+писала это.
+
+Наконец-то, у меня есть время
+предать мысли бумаге. Не могу
+вспомнить, когда писала
+последний раз. Три месяца?
+Больше? Не в настроении
+выяснять...
+
+Эти ублюдки, ублюдки, разрушили
+всё! Жирные уродливые
+политиканы решили, что
+Прорицатель нужно использовать
+для шпионажа. Я подозревала, что
+их интерес не так грандиозен, они
+не хотят тратить тонны денег. Им
+нужно не будущее, а шпионский
+гаджет, чтобы заснять, как другой
+жирный уродливый политикан
+трахается со своим мальчиком.
+Шантаж! Такой идиотизм, что меня
+выворачивает!!! Машину, способную
+ПРЕДСКАЗЫВАТЬ БУДУЩЕЕ,
+применять для слежки! Я
+надеялась, что хотя бы SCP
+как-то повлияют на ситуацию,
+но они слишком заняты своими делами.
+
+Разумеется, мне уже не уйти. Они
+забросили крючки, и теперь все
+мы заложники своих амбиций...
+
+Ладно, это научный дневник, а не
+салфетка для плачущей школьницы. К
+делу. Куратор заставил нас
+проверить, каков лимит Прорицателя.
+Мы опробовали разные эпохи, даже
+до появления людей на Земле.
+Похоже, у последней версии предела
+нет вообще. Странно, но чем дальше
+в прошлое мы уходим, тем больше
+цветовых деформаций обнаруживаем.
+Всё становится оранжевым. Никто
+не знает, что это, мы вкладываем
+все силы в понимание феномена.
+
+Но, боюсь, мы опоздали. С месяц
+назад эти ублюдки попросили нас
+попробовать открыть проход в
+прошлое. Пытаюсь представить,
+какая ещё тупая идея у них
+была, но тогда мы жаждали
+попробовать! И попробовали.
+
+Джеффри Бауерс, наш ассистент из
+Штатов, рискнул провести десять
+секунд в 8000-ом году до н.э. и
+взять с собой пригоршень песка.
+В момент, когда мы открыли проход,
+у него случился припадок, он
+потерял сознание на несколько
+минут, придя в себя, начал бредить
+и периодически стучать зубами.
+Анализ показал, что ему было очень
+холодно, что странно, ведь мы
+отправляли его в Аравийскую
+пустыню. Эксперименты
+приостановили до выяснения
+деталей произошедшего.
+
+Несколько дней спустя Джеффри
+поправился и вернулся к работе,
+но все мы заметили, что временами
+он поднимает глаза к потолку, как
+будто видит там что-то... Вскоре
+увидели и мы...""",
+    ),
+    (
+        "diary",
+        "6. Время пришло",
+        """Когда мы определились, кто пойдёт
+за Адъютантом и как, оказалось,
+что нас всего шесть человек. Дарен
+сказал, что попробует найти ещё,
+но никто ему не ответил.
+
+Таким коллективом, видя, что
+ситуация выходит из-под контроля,
+мы решили торопиться, взяли
+оружие, припасы и одной ночью
+пришли на станцию, где работал
+Дарен.
+
+Когда мы оказались на месте,
+выяснилось, что мы не одни такие
+умные. Глядя на группу громил,
+подготавливающих Адъютанта к
+дороге, я чувствовал, как наши
+шансы улетучиваются.
+
+Все мы замерли, пытаясь понять, что
+же теперь делать, но в какой-то
+момент Дарен поднялся и громко
+спросил: "Ронни?! Это ты?". Тяжело
+дышащий толстяк вышел из теней
+ангара. "Странное совпадение -
+видеть тебя здесь после того, как
+ты отказался от моего предложения."
+Ронни, наконец, узнал Дарена и
+улыбнулся: "А-а, мой честный друг!
+Я решил, что нам ни к чему твоя
+старая задница, и взял других ребят,
+чтобы выпустить этого зверя. Спасибо
+за дружбу, но дальше мы сами!"
+
+Мысли понеслись в моей голове
+быстрее молнии. С таким ублюдком
+не договориться, локомотив не
+настолько велик, чтобы вместить
+обе наши группы, и это может быть
+последним транспортом, способным
+покинуть город. Время действовать
+пришло куда раньше, чем я
+рассчитывал... Уже пришло.
+
+Я выхватил пистолет из кобуры, без
+единого слова вышел из укрытия и
+пристрелил жирного козла. Как я и
+надеялся, другие поняли, что делать,
+без особых инструкций - все начали
+палить. В закрытом помещении
+ангара стрельба звучала оглушающе,
+но спустя несколько секунд стало
+ясно, что противник не так
+подготовлен, как мы. Вытеснив их
+из здания, мы запрыгнули в
+локомотив и выжали скорость,
+чтобы не упустить преимущества.
+
+Это была первая стычка на длинном
+пути... Как и обещал Дарен, мы без
+труда покинули город по заброшенной,
+поросшей травой ветке. Он знал
+все дороги в районе, так что мы
+двигались быстро. Нам не
+встретилось ни одного поезда,
+как будто мы последние, кто
+оставляет город по железной дороге.
+Вероятно, так оно и было.""",
+    ),
+    (
+        "diary",
+        "7. Смрад",
+        """Смрад... Смрад... Смрад... Что это?
+Несмотря на всё то, что мы повидали,
+у меня всё ещё нет чёткого мнения.
+Это не просто туман, нет, это...
+состояние. Его не видно издалека,
+но когда попадаешь в облако - это
+как стоять под водопадом. Будто
+что-то давит на тебя вибрациями.
+Они не низки и не высоки -
+посередине, но они очень тяжелы
+и грубы.
+
+Да, вибрации давят на тебя, всё
+начинает трястить перед глазами.
+Кожа мгновенно покрывается
+холодным липким потом. Ты
+замерзаешь и, вдобавок к
+вибрациям воздуха, сам начинаешь
+трястись и стучать зубами.
+
+Ощущение такое, будто ты плохо
+сбалансированная машина,
+работающая на высоких частотах,
+слишком высоких, таких высоких,
+что организм начинает
+изнашиваться в считанные минуты.
+Ты теряешь всю энергию и
+отчётливо чувствуешь, как части
+тела останавливаются одна за
+другой в совершенно измождённом
+состоянии.
+
+После нахождения в Смраде в
+течении минуты нужны десять
+минут на то, чтобы прийти в
+себя и перестать трястись.
+
+И запах... Они называют его
+"Смрадом", но стоило назвать
+этот туман "Адом". Он как
+терпкий запах горелого пластика
+вперемешку с сыростью и плесенью.
+Ты вдыхаешь его, он обжигает
+лёгкие и покрывает их слоем
+жирной сажи изнутри.
+
+Со всеми этими ощущениями сложно
+не потерять в облаке сознание.
+Всё, чего ты хочешь, это покинуть
+его так быстро, как только можно,
+вот только неясно, где оно
+заканчивается. Изнутри Смрад
+выглядит всезаполняющим, вуалью,
+уходящей в бесконечность во всех
+направлениях. Только выйдя из
+облака, ты понимаешь, что оно
+было... относительно невелико.
+
+Чего я боюсь, так это того, что
+однажды выйти будет некуда, и
+что этот день настанет очень
+скоро. Смрад распространяется,
+с каждым часом покрывая Европу
+всё больше и больше.
+Правительства и учёные
+бесполезны, такое чувство, что
+проблемой вообще никто не
+занимается, все только пытаются
+хайпануть и заработать на
+катастрофе.
+
+Тем временем Сайлевер уже полон
+беженцами. А что мы увидим в
+следующей стране? Как быстро
+орды, орды людей застрянут на
+месте без возможности сделать
+шаг вперёд в очереди на
+выживание?""",
+    ),
+    (
+        "note",
+        "8. Унтерриф",
+        """Следующее ниже - это запись
+шифрованного радио эфира,
+перехваченного нами. Она содержит
+разговор между Хельгой Вагнер (Х)
+и её руководством (Р).
+
+- Р: Группа Хельги Вагнер, группа
+Хельги Вагнер, приём!?
+- Х: Слышим Вас чётко и ясно.
+- Р: Рады, что Вы на связи, Хельга,
+Вы в порядке? Мы слышали, что Вы
+подверглись нескольким нападениям
+на пути через Сайлевер.
+- Х: Да, мы потеряли несколько
+человек и кое-какую научную
+документацию. Она не содержит
+особо важной информации, так
+что мы решили не тратить время
+на возврат документов.
+- Р: Хельга, ситуация в Сайлевере
+выходит из-под контроля, и регуляция
+её вне нашей юрисдикции. Мы
+рекомендуем Вам не делать
+остановок без необходимости.
+- Х: О, будьте уверены, мы не делаем.
+- Р: Хорошо. Хельга, наши люди ждут
+Вас в точке, координаты которой мы
+отправили Вам буквально минуту
+назад. Доберитесь туда, Вас
+встретят и доставят в Унтерриф,
+здесь безопасно.
+- Х: Простите, Вы сказали
+"Унтерриф"? Я думала, это выдумка!
+- Р: Нет, Хельга, он реален, город
+расположен под Чёрным морем, так
+что для Вас это будет короткое
+путешествие. Мы ожидаем Вас.
+- Х: Но, как? В смысле... Как???
+- Р: Просто доберитесь сюда,
+здесь безопасно.
+- Х: Откуда Вы знаете, что Смрад
+не проникнет туда?
+- Р: Хельга, мы вполне уверены, что
+знаем как защитить город от Смрада.
+Он был построен именно для таких
+ситуаций, здесь есть всё, что
+нужно для комфортной жизни.
+Просто доберитесь сюда, Смрад
+распространяется очень
+непредсказуемо, его движение не
+совпадает ни с ветром, ни с
+другими атмосферными массами.
+Мы не можем проанализировать
+его и потому не знаем, как
+много времени у Вас есть. Мы
+советуем Вам торопиться.
+- Х: Да, я понимаю, простите.
+Я просто... Мне, наверно, нужно
+время, чтобы обработать то, что
+Вы сказали.
+- Р: Обработайте, Хельга, и
+доберитесь до Унтеррифа. Свяжитесь
+с нами по этой же частоте в случае,
+если Вам что-то понадобится.
+Ситуация сложная, но мы сделаем
+всё, чтобы Вам помочь.
+- Х: Да, сэр, спасибо. Мы уже в
+пути. Группа Хельги Вагнер,
+конец связи.
+""",
+    ),
+    (
+        "note",
+        "9. Совет",
+        """Нижеследующее - ещё одна запись
+радио передачи, случайно
+перехваченной нами из
+Унтеррифа.
+
+- Р: Группа Хельги Вагнер, группа
+Хельги Вагнер, приём.
+- Х: Группа Хельги Вагнер на связи,
+слышим Вас хорошо.
+- Р: Хельга, где Вы сейчас
+находитесь? Удалось ли Вам
+приблизиться к точке встречи?
+- Х: Да, мы почти покинули Сайлевер.
+- Р: Хорошо! Мы вышли на связь,
+потому что две другие наши группы
+следуют по Вашему пути через
+страну. Они столкнулись с мощным
+сопротивлением со стороны местных
+банд. Не могли бы Вы посоветовать
+безопасный маршрут?
+- Х: О, сэр, боюсь, это будет
+трудно! Мы думаем, что около 30%
+страны уже покрыто Смрадом -
+весь юго-восток. На севере же
+всё под контролем скинхедов.
+- Р: Хельга, Вы всегда говорите
+"скинхеды". Что это значит?
+- Х: Значит, это ультра-правая
+преступная группировка, которая
+терроризировала иностранцев в
+Сайлевере на протяжении нескольких
+лет. Из-за Смрада и волны беженцев
+они в последнее время получают
+мощную поддержку местных. Говорят,
+в банде новый лидер, и он приказал
+грабить вообще всех, не только
+иностранцев, и готовиться к войне
+за выживание! У них есть припасы,
+оружие и люди, и они становятся
+сильнее с каждым днём!
+- Р: Что посоветуете, Хельга?
+- Х: Мы пересекли страну по
+маршруту Блокпост 46 - Снюустад
+- Наальстад, но, боюсь, этот
+путь уже небезопасен. Мы
+слышали, что кто-то
+целеустремлённо движется по
+железной дороге, по пути
+разбивая скинхедов. Они
+стянули большие силы, чтобы
+остановить этих людей и забрать
+их локомотив себе, так что я
+думаю, что безопаснее держаться
+подальше от железной дороги.
+Скажите своим, чтобы взяли
+80 км на юг.
+- Р: Спасибо, Хельга! Мы передадим
+им! Что-нибудь ещё?
+- Х: Ну, здесь полный хаос! Полиция
+почти исчезла или присоединилась к
+скинхедам, и все это чувствуют.
+Стрельба, грабёж и убийства уже
+повсюду. Многие пытаются награбить
+как можно больше припасов и
+спрятаться под землёй. Для
+остальных главной ценностью
+стал транспорт - на нём можно
+убраться подальше от Смрада.
+Скажите своим людям, чтобы не
+оставляли машины без присмотра
+ни на секунду и были готовы к
+бою!
+- Р: Спасибо, Хельга, мы
+передадим им! Мы очень ценим
+Вашу помощь. Надеемся скоро
+увидеть Вас в Унтеррифе. Если
+это всё, конец связи.
+- Х: Группа Хельги Вагнер, конец
+связи.""",
+    ),
+    ("note", "", ""),
+)
+
+UNTERRIFF_DISCOVERED = """
+Прочитав запись, Вы двигаетесь в рубку локомотива и
+просите всех собраться. Быстро шагая от одной стены
+до другой, пока все занимают места, Вы пытаетесь
+подобрать правильные слова.
+
+"Внимание, все! Мы только что получили информацию,
+которая даёт нам надежду. Надежду на безопасное место.
+Существует... подводный город под названием Унтерриф."
+- Вы видите, как Ваши товарищи по команде начинают
+переглядываться. - "Похоже, он построен правительством
+или другой серьёзной структурой, так что шансы велики,
+что всё по-настоящему. У нас есть координаты, которые
+ведут к Чёрному морю. Я думаю... и я надеюсь, что Вы
+со мной согласны, мы должны проверить эту зацепку.
+Никто не гарантирует, что там мы будем в безопасности,
+но, по крайней мере, у нас, наконец, есть направление."
+
+Все сохраняют молчание в течении нескольких секунд.
+"Так а что, надо попробовать!" - вдруг выкрикивает
+Дарен, и остальные начинают радостно кивать
+головами и улыбаться. Экипаж согласен!
+
+Раз так, давайте покинем эту холодную недружелюбную
+страну и найдём Унтерриф! Поддайте жару!
+"""
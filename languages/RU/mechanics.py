@@ -0,0 +1,169 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+The game mechanics descriptions written in Russian language.
+"""
+
+MECHANIC_DESC = {
+    "локомотив": {
+        "descs": (
+            (
+                "Это Адъютант - Ваш локомотив, он едет достаточно\n"
+                "быстро, чтобы обогнать смерть. Берегите его -\n"
+                "приди он в негодность, и Ваши часы сочтены! Его\n"
+                "Прочность указана в правом нижнем углу экрана.\n"
+                "Ржавые рельсы могут повредить Вам колёса -\n"
+                "замедлитесь, если слышите металлический скрип."
+            ),
+            (
+                "Адъютант состоит из трёх частей и Зоны Отдыха,\n"
+                "по которым Вы можете расставлять своих людей.\n"
+                "Мудрая ротация юнитов - залог Вашего успеха.\n\n"
+                "Скорость указана в правом нижнем углу экрана.\n"
+                "Удерживайте W и S для ускорения и замедления."
+            ),
+        ),
+        "previews": ("locomotive1", "locomotive2"),
+    },
+    "персонажи": {
+        "descs": (
+            (
+                "В Вашем экипаже нескольких бойцов. У каждого\n"
+                "юнита есть энергия, поддерживайте её на высоком\n"
+                "уровне, т.к. она влияет на точность стрельбы и\n"
+                "результат на вылазках. Лучший способ восполнить\n"
+                "энергию и здоровье юнита - это дать ему отдохнуть."
+            ),
+            (
+                "Кликните ЛКМ на юните, чтобы выбрать его, затем\n"
+                "ПКМ на одной из стрелок, чтобы переместить\n"
+                "юнита в соответствующую часть локомотива; или\n"
+                "кликните ПКМ на Зоне Отдыха, чтобы он отдохнул.\n"
+                "Кол-во мест в каждой части локомотива ограничено."
+            ),
+        ),
+        "previews": (
+            "characters1",
+            "characters2",
+        ),
+    },
+    "Смрад": {
+        "descs": (
+            (
+                "Смрад - наибольшая из проблем. Его ядовитые облака\n"
+                "расползаются быстро, хаотично, и, вероятно,\n"
+                "он покроет весь Сайлевер за пару недель.\n"
+                "Если Вы попали в облако, ускорьтесь, чтобы\n"
+                "побыстрее пересечь его. Так же не стоит долго\n"
+                "стоять на одном месте или ездить кругами."
+            ),
+            (
+                "Ищите способ пережить Смрад! В Сайлевере есть\n"
+                "несколько мест интереса - посетите хотя бы 8\n"
+                "из них, чтобы получить полезную информацию.\n"
+                "Используйте карту (клавиша M), чтобы построить\n"
+                "оптимальный маршрут. Там же, на карте, Вы можете\n"
+                "увидеть вылазки и покрытие Сайлевера Смрадом."
+            ),
+        ),
+        "previews": ("the_stench1", "map"),
+    },
+    "сплочение": {
+        "descs": (
+            (
+                "Ваши юниты со временем вырабатывают сплочение.\n"
+                "Общая сплочённость экипажа показана в правом\n"
+                "верхнем углу экрана. Наращивание сплочения\n"
+                "открывает навыки экипажа - сильные временные\n"
+                "эффекты, оказывающие влияние на каждого юнита.\n"
+            ),
+            (
+                "Стоит держать юнитов с высоким сплочением на\n"
+                "одной части локомотива, тогда они получат бонус\n"
+                "к силе. Сплочение растёт быстрее между юнитами\n"
+                "на одной части локомотива. Увидеть сплочение\n"
+                "юнита с другими можно, выбрав его и нажав R."
+            ),
+        ),
+        "previews": ("cohesion1", "cohesion2"),
+    },
+    "вылазки": {
+        "descs": (
+            (
+                "Вылазки - основной источник денег и других\n"
+                "ресурсов. Это событие, которое требует остановки\n"
+                "и отправки нескольких юнитов. Существует 3 типа\n"
+                "вылазок: Встреча, Расхищение и Укрепление, каждая\n"
+                "с определённым типом трофеев и требованием\n"
+                "определённого класса юнитов."
+            ),
+            (
+                "У каждой вылазки 5 исходов; чем больше очков\n"
+                "набрано, тем лучше исход. Очки начисляются за:\n"
+                "классы отправленных юнитов, их состояние -\n"
+                "здоровье и энергия, за сплочение между ними\n"
+                "и 0-10 случайно набираемых очков."
+            ),
+        ),
+        "previews": ("outings1", "outings2"),
+    },
+    "предметы": {
+        "descs": (
+            (
+                "Вы можете найти предметы на вылазках или на\n"
+                "рынках городов. Выберите юнита и кликните на\n"
+                "кнопку предмета, чтобы использовать его. Деньги\n"
+                "- это основной ресурс, Вы можете тратить их в\n"
+                "городах на починку и апгрейд локомотива,\n"
+                "лечение и отдых, наём новых людей."
+            ),
+            (
+                "На Адъютант установлено активное орудие - пулемёт.\n"
+                "Он активируется в бою - нажмите 2, что начать\n"
+                "прицеливание, а затем зажмите левую кнопку мыши,\n"
+                "чтобы стрелять. В городах можно установить и\n"
+                "другие орудия, но обойдётся это недёшево."
+            ),
+        ),
+        "previews": ("resources1", "machine_gun"),
+    },
+    "состояние юнита": {
+        "descs": (
+            (
+                "У каждого юнита может быть до трёх черт\n"
+                "(хороших или плохих). Черты дают преимущества\n"
+                "или слабости в разных ситуациях. Вы можете\n"
+                "изменить черты юнита в Листе Отличившихся, но\n"
+                "это понизит сплочённость команды на время."
+            ),
+            (
+                "Текущие эффекты, влияющие на юнита, отражены\n"
+                "в его Статусе. Так же следите за иконкой\n"
+                "болезни - больной юнит может принести много\n"
+                "проблем экипажу. Постарайтесь изолировать\n"
+                "заражённого и вылечить его как можно скорее."
+            ),
+        ),
+        "previews": ("character_status1", "character_status2"),
+    },
+    "SCP": {
+        "descs": (
+            (
+                "Вас ждёт встреча с SCP-4945-B. Убейте агрессивные\n"
+                "объекты на борту, но не применяйте тяжёлые орудия\n"
+                "против поезда, чтобы не навредить Д. Избегайте\n"
+                "фиолетового света, он обжигает: ускорьтесь\n"
+                "или замедлитесь, чтобы увернуться от луча."
+            ),
+            (
+                "Фиолетовые солнца весьма опасны - постарайтесь\n"
+                "расстрелять их (включая активные орудия\n"
+                "локомотива) до того, как они коснутся Адъютанта.\n"
+                "Так же для защиты от них Вы можете использовать\n"
+                "Пластину Брони Адъютанта."
+            ),
+        ),
+        "previews": ("light", "suns"),
+    },
+}
@@ -0,0 +1,1128 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+The scenario texts written in Russian language.
+"""
+
+SCENARIO = (
+    {  # 1
+        "intro": """Кеннет - механик Адъютанта, приближается к столу и
+садится справа от Вас. "Капитан, у нас проблема." Вы
+подносите ко рту ложку ужасно сухой каши: "Да?!" "Да.
+Подходите ко мне в отделение, когда закончите обед."
+Он встаёт и медленно покидает рубку.
+
+Покончив с безвкусной порцией, Вы спускаетесь на нижний
+уровень Адъютанта. До того, как Вы произносите первое
+слово, Кеннет поднимает палец, предлагая Вам прислушаться.
+Вы концентрируетесь на шумах тёмного пахнущего мазутом
+помещения... "Слышите?" - механик показывает в левую
+часть комнаты, и Вы понимаете, о чём он. Резкий
+металлический скрип раздаётся из-за стены. "Это
+букса, что-то не в порядке." - тихо объясняет
+Кеннет. - "Нужно проверить, это займёт время." Вы
+пытаетесь вспомнить, как далеко был фронт Смрада, когда
+Вы слышали о нём в последний раз. "Варианты?" Глядя на
+Вас, Кеннет рассчитывает в уме: "Нам нужна остановка
+часов на пять, чтоб разобраться." Немало. "Ещё варианты?"
+Механик, очевидно, не хочет озвучивать свои мысли, но
+всё же говорит: "Можем попробовать разобраться на ходу.
+Но это опасно, и потребует двух человек - я здесь, и
+кто-то на другой стороне локомотива. Предупреждаю -
+второй человек может получить травмы. В любом случае,
+если ничего не сделать, мы можем сильно потерять
+ход. Решение за Вами, капитан." """,
+        "variants": {
+            "Сделать остановку для ревизии": {
+                "desc": """Вы принимаете решение остановиться на пять часов.
+Экипаж без задержек начинает работу. Разбирая буксу, Вы
+обнаруживаете, что пара деталей не особо подходят друг к
+другу, отчего они сильно трутся. Ваши люди принимаются за
+решение проблемы под руководством Кеннета. Видя, что они
+справятся и без Вас, Вы возвращаетесь в рубку и включаете
+радио. "Облака Смрада замечены в Штутгарте! На юге города
+уже обнаружены несколько тел, люди покидают свои дома и
+выбираются из города. Оставайтесь с нами, мы будем держать
+Вас в курсе!" Штутгарт. Похоже, Смрад распространяется на
+юго-запад. Стоит учитывать при планировании маршрута...
+
+Проходит четыре часа, и Ваши люди докладывают, что букса
+в порядке. Созывая всех на борт, Вы командуете продолжить
+путь. Четыре часа не пять, но всё же очень много.
+Лучше держать высокий темп!
+
+Фронт Смрада приблизился к Вам на 20 км,
+но Адъютант на ближайшее время в порядке.
+
+Вы получаете страницу дневника капитана. Лучше прочтите
+её на ходу, дабы не дать Смраду догнать Вас.
+Нажмите J, чтобы открыть журнал капитана.""",
+                "effects": (("do_stench_moves_effect", [20]),),
+                "goodness": 5,
+            },
+            "Попробовать решить проблему на ходу": {
+                "desc": """Вы даёте Кеннету команду выбрать члена экипажа и попробовать
+разобраться с буксой на ходу. Вы видите, что механику
+не нравится Ваше решение, но он всё же принимает
+приказ, обещая подумать, кто подходит для этой задачи
+лучше. Вы возвращаетесь в рубку, откуда через некоторое
+время видите, как Кеннет берёт с собой одного из бойцов,
+и они вместе идут на нижний уровень. На несколько часов
+оба пропадают из Вашего поля зрения...
+
+Выйдя на свежий воздух, Вы наклоняетесь на перилах, как
+вдруг видите на одном из колёс кровавое пятно, мелькающее
+на каждом его обороте. В ту же секунду Вы направляетесь
+на поиски механика. Кеннет, видя Ваше беспокойство,
+поднимает руки: "Всё хорошо, хорошо! Небольшая рана, но
+букса теперь в порядке. Ничего серьёзного!" Глубоко
+вдохнув, Вы киваете головой, стараясь успокоиться. Вы
+знали риски с самого начала, да, но всё же это Ваши люди.
+Хорошо, что помогавший Кеннету не получил серьёзных
+травм. Стоит найти и поблагодарить его.
+
+Один из Ваших бойцов теряет 20 здоровья
+
+Вы получаете страницу дневника капитана. Лучше
+прочтите её на ходу, дабы не дать Смраду догнать
+Вас. Нажмите J, чтобы открыть журнал капитана.""",
+                "effects": (("do_characters_effect", [{"health": -20}, True]),),
+                "goodness": 1,
+            },
+            "Игнорировать проблему": {
+                "desc": """Не стоит останавливаться на такой длительный период. Попросив
+Кеннета немного подождать, Вы возвращаетесь в рубку. Лучше
+перепроверить. Фронт Смрада пока далёк, но уже через три
+часа... Глядя на карту, Вы понимаете, что не можете
+позволить себе даже трёхчасовую остановку. Слишком опасно,
+в наши дни лучше держать немного времени в запасе.
+Возвращаясь к Кеннету, Вы говорите ему пока игнорировать
+шум. Ему не особо нравится Ваше решение, Вы видите это
+по его лицу, но Ваше общее прошлое перевешивает. Вы
+помогали ему и его семье больше раз, чем Вы оба можете
+сосчитать, так что он не станет спорить с Вами.
+
+Через некоторое время Вы поймёте, что проблема не из
+тех, что можно игнорировать. Букса окажется повреждена.
+
+Адъютант теряет 50 Прочности
+
+Вы получаете страницу дневника капитана. Лучше прочтите
+её на ходу, дабы не дать Смраду догнать Вас.
+Нажмите J, чтобы открыть журнал капитана.""",
+                "effects": (("do_locomotive_damage", [50]),),
+                "goodness": 3,
+            },
+        },
+    },
+    {  # 2
+        "intro": """Внимательно присмотревшись к группе людей, идущих
+через луг, Вы понимаете, что там в основном дети.
+Странно! Взяв с собой пару членов экипажа, Вы
+подходите поближе к ним и видите, как навстречу Вам
+выходит женщина. В нескольких словах она рассказывает,
+что они работники детского приюта. Понимая, что Смрад
+быстро движется к ним, а местные власти слишком
+заняты спасением самих себя, взрослые, которые
+работали в этом приюте, решили собрать всех детей и
+двигаться в Сайлевер пешком. Глядя на бледных и
+уставших чад, Вы думаете про себя, что это весьма
+суровое решение. Хотя, вероятно, оно спасло их жизни...
+
+Жалуясь на шесть часов ходьбы без остановки, женщина
+просит Вас помочь им построить лагерь. Вы понимаете,
+что это займёт много времени, поскольку здесь около
+шестидесяти детей. С другой стороны, как-то неправильно
+просто оставить их в чужой стране, уставших и не
+имеющих нормальной стоянки. Может, стоит помочь?""",
+        "variants": {
+            "Помочь им устроить стоянку": {
+                "desc": """Ощущая внутреннее беспокойство, Вы приказываете экипажу
+помочь детям. Потеря времени - всё же плохо... Однако
+уже минут через двадцать, видя, как Ваши люди, улыбаясь,
+помогают детям ставить большие палатки, разжигать
+костры и варить похлёбку в массивных казанах, Вы
+забываете об этих тяжёлых мыслях. Небольшой перерыв
+и общение с людьми пойдёт на пользу всем...
+
+Подготовка стоянки занимает около двух часов.
+Наслушавшись благодарностей от детей и их учителей,
+Вы собираетесь на Адъютанте. Все выглядят
+воодушевлёнными, но дорога всё же зовёт вперёд.
+Отдав приказ запускать двигатель, Вы приближаетесь
+к паре своих компаньонов, которые читают на
+смартфоне некую статью. "Эй, капитан, Вам стоит видеть
+это! Кое-кто из тех детей посетил некий саммит учёных,
+там они взяли интервью. Женщина говорит интересные
+вещи." Пообещав им, что прочтёте статью позже, Вы
+двигаетесь в рубку, чтобы спланировать маршрут с
+учётом задержки.
+
+Фронт Смрада приблизился к Вам на 20 км
+
+Записка добавлена в журнал капитана. Лучше прочтите
+её на ходу, чтобы не дать Смраду догнать Вас.
+
+Получена страница досье SCP. Нажмите 0, чтобы
+посмотреть.""",
+                "effects": (
+                    ("do_build_camp_effect", []),
+                    ("do_stench_moves_effect", [20]),
+                ),
+                "goodness": 5,
+            },
+            "Согласиться помочь, но обокрасть их": {
+                "desc": """Отведя экипаж в сторону для разговора, Вы стараетесь
+убедить их использовать возможность восполнить ресурсы.
+"Ситуация становится жёстче с каждым днём, речь идёт на
+уровне либо они, либо мы." Ваши компаньоны опускают глаза.
+Все знали, что рано или поздно придёт к этому, но никто
+не хочет брать на себя ответственность. "Тяжело признавать,
+но этим детям не выжить. Они не бойцы, не выживальщики.
+Первая встреча со скинхедами, и..." Ваш экипаж продолжает
+молчать, но Вы чувствуете, что они принимают положение, так
+что даёте команду: "Обустраивайте стоянку наспех и, если
+видите что-то полезное, берите!" Ваши люди, стараясь не
+смотреть друг на друга, покидают рубку... Проходит около
+получаса, и все Вы снова собираетесь на Адъютанте. Так же
+все стараются не смотреть в глаза друг другу, но на столе
+появляются энергетик и небольшая аптечка. "Хорошо.
+продолжим путь!" - подытоживаете Вы.
+
+Спустя некоторое время Вы находите лист бумаги на своём
+столе, он выглядит, как запись диалога или интервью.
+Похоже, кто-то из тех детей посетил саммит учёных и
+побеседовал с одним из светлых умов. Не ясно, зачем
+оставлять лист на Вашем столе, но стоит прочитать его.
+
+Вы получаете 1 стимулятор и 1 лекарство
+Скоро люди Сайлевера узнают, что Вы обокрали сирот. Это
+послужит плохим примером поведения приезжих, так что
+ряды скинхедов пополнятся новыми добровольцами.
+
+Записка добавлена в журнал капитана. Лучше прочтите
+её на ходу, чтобы не дать Смраду догнать Вас.
+
+Получена страница досье SCP. Нажмите 0, чтобы
+посмотреть.""",
+                "effects": (
+                    ("do_enemy_inc_effect", []),
+                    ("do_plus_resource", ["medicine_boxes", 1]),
+                    ("do_plus_resource", ["stimulators", 1]),
+                ),
+                "goodness": 1,
+            },
+            "Не помогать им, а двигаться дальше": {
+                "desc": """Вы возвращаетесь в рубку и говорите с экипажем. По итогам
+получается, что большинство хотело бы сделать остановку и
+помочь сиротам, однако все понимают, что это займёт не
+менее нескольких часов. Так как Смрад себя ждать не
+заставит, есть смысл шевелиться побыстрее. Обдумав всё
+снова, и снова, и снова, Вы решаете проигнорировать просьбу
+учителя. Экипажу не сильно это нравится, но все понимают
+ситуацию. Тяжёлая тишина повисает в воздухе. Никто не хочет
+пойти туда и сказать детям, что Вы не поможете им. "Так
+что?" - тихо спрашиваете Вы. - "Может, стоит молча
+продолжить путь? К чему лишние слова?" Ваши люди
+опускают глаза и кивают головами. Принимая это как
+ответ, Вы даёте команду трогаться...
+
+Чуть позже Вы обнаруживаете на своём столе бумагу. Пробежав
+по ней глазами, Вы понимаете, что это запись интервью. Те
+сироты посетили некий саммит учёных и побеседовали с кем-то
+из светлых умов. Вероятно, один из Ваших людей получил
+этот лист от детей. Непонятно, зачем его оставили на Вашем
+столе, но, видимо, стоит прочесть.
+
+Записка добавлена в журнал капитана. Лучше прочтите
+её на ходу, чтобы не дать Смраду догнать Вас.
+
+Получена страница досье SCP. Нажмите 0, чтобы смотреть.""",
+                "effects": (("do_no_effect", []),),
+                "goodness": 3,
+            },
+        },
+    },
+    {  # 3
+        "intro": """Глядя на дом, стоящий примерно в 200 метрах от ж/д путей,
+Вы замечаете в нём движение. Хата невероятно стара,
+стены потрескались, ветхая деревянная крыша держится на
+добром слове, но через маленькие окна Вы можете различить
+несколько активно двигающихся внутри людей. Вы так же
+слышите шум, даже крики. Стоит проверить...
+
+Вы берёте с собой пару членов экипажа и подходите ближе
+к строению. С другой стороны хаты обнаруживается
+полицейский джип. Войдя в дом, Вы видите, что двое
+людей в форме запугивают немолодую уже пару и некую
+девушку, вероятно, их дочь. Удивлённые тем, что их
+прервали, полицейские смотрят на Вас, пытаясь понять,
+кто Вы такие. Разглядев Ваше оружие, они становятся
+весьма вежливыми: "Ребята, мы помогаем этой семье
+кое-с-чем, ничего интересного." Глядя на напуганных
+людей, Вы понимаете, что это ложь. "Может, мы
+договоримся и будем счастливо жить дальше?" - один из
+полицейских достаёт кошелёк. Несомненно, они попались
+на весьма нехороших делах, двое полицейских
+терроризируют людей в глуши - свидетели могут им
+сильно навредить. Закон пока ещё не развалился
+окончательно.""",
+        "variants": {
+            "Принять взятку и уйти": {
+                "desc": """Кивая головой на дверь, Вы приказываете своим бойцам покинуть
+дом. Это не Ваш бой, не Ваши люди и не Ваше дело. Пожилая
+пара хранит молчание, но Вы всем существом ощущаете, как,
+увидев Ваш жест, они потеряли последнюю надежду на
+положительный исход. Как будто пустота наполнила ту
+часть комнаты, где они сидят.
+
+Взяв деньги у полицейского, Вы выходите из хаты, не произнеся
+ни одного слова... Пока движетесь обратно к Адъютанту, Вы
+все прислушиваетесь к тому, что происходит в стороне дома,
+но ничего не слышите. Повернув голову назад, Вы видите,
+что один из полицейских стоит у дверей и смотрит в след
+Вашему экипажу. Видимо, они сами порядочно испугались и
+всё ещё не верят, что Вы просто уйдёте. Всё же Вы уходите.
+Скоро это будет происходить везде - те, у кого есть власть
+и сила, будут использовать её для выживания, уничтожая
+окружающих, если понадобится. А оно понадобится. Всех
+Вам, разумеется, не спасти, но Вы можете хотя бы
+позаботиться об экипаже Адъютанта.
+
+Вы получаете $100
+
+Вы получаете страницу дневника капитана. Лучше
+прочтите её на ходу.""",
+                "effects": (("do_get_money", [100]),),
+                "goodness": 3,
+            },
+            "Убить ублюдков и освободить семью": {
+                "desc": """Моментально оценив всю ситуацию, Вы поднимаете своё
+оружие и стреляете в обоих полицейских. С по-прежнему
+удивлёнными лицами они громко падают на пол. Убрав
+оружие, Вы делаете шаг в сторону напуганных людей, но
+они все разом поднимают руки. "Пожалуйста, просто
+оставьте нас!" - произносит мужчина дрожащим голосом.
+Видя, что теперь они напуганы ещё больше прежнего, Вы
+понимаете, что идея убить полицейских у них на глазах
+была не лучшей... Все в комнате выглядят несколько
+растерянными. Вероятно, будет лучше просто уйти. Всё
+же Вы решаете дать своим людям команду вынести оба тела
+и бросить их где-нибудь подальше от дома. Без возражений
+они поднимают полицейских и выходят наружу. После
+некоторой паузы Вы бросаете последний взгляд на напуганных
+людей: "Извините... За этот бардак." Не услышав в ответ
+ни звука, Вы покидаете старую хату.
+
+Вы получаете страницу дневника капитана. Лучше
+прочтите её на ходу.""",
+                "effects": (("do_no_effect", []),),
+                "goodness": 1,
+            },
+            "Используя своё превосходство, запугать их": {
+                "desc": """Вы ясно видите, что все преимущества на Вашей стороне.
+Эти двое слабо вооружены, они полицейские и пойманы на
+весьма непорядочных делах. Каждая часть ситуации против
+них. Покачав оружие в руках, Вы уверенно говорите:
+"Вам двоим лучше оставить эту семью в покое и забыть
+дорогу сюда!" Улыбки исчезают с их лиц моментально.
+Покосившись друг на друга, они демонстрируют полную
+растерянность. "Мы все забудем, что здесь произошло, Вам
+только найдо уйти" - добавляете Вы. - "Но если есть
+возражения... Что ж..." - Вы снова покачиваете оружием.
+"Ладно!" - один из них поднимает руки. Второй тут же
+повторяет его движение. "Мы уйдём. Давайте просто...
+Просто забудем, что здесь произошло." - полицейский
+выглядит даже пристыженным, и этот факт заставляет Вас
+верить, что они не вернутся сюда - возможно, они поняли
+мерзость своих действий... Когда они уходят, и двигатель
+их машины затихает вдали, девушка встаёт: "Спасибо!
+Спасибо!" - она выглядит тронутой Вашими действиями, и
+все Вы слушаете её благодарности в течении нескольких
+минут. В качестве ответной услуги она предлагает Вашему
+экипажу медицинский осмотр. Да, она врач! Чувствуя
+удачное стечение обстоятельств, Вы говорите своим
+людям использовать возможность.
+
+Все члены экипажа получают 20 здоровья
+
+Вы получаете страницу дневника капитана. Лучше
+прочтите её на ходу.""",
+                "effects": (("do_characters_effect", [{"health": 20}, False]),),
+                "goodness": 5,
+            },
+        },
+    },
+    {  # 4
+        "intro": """С достаточно большой дистанции Вы можете различить, что
+рядом со скромным мотелем собралась огромная пробка. Вы
+так же видите длинную очередь людей, стоящих перед входом.
+Похоже, многим новоприбывшим в Сайлевер нужна комната.
+Отправив своих людей попытаться попасть внутрь здания, Вы
+останавливаете взгляд на двух группах кричащих беженцев.
+Подходя ближе к ним, Вы слышите, что они спорят о том,
+кому должно достаться последнее место в здании. Когда
+они видят Вас, они замолкают, поглядывая на Ваше оружие.
+Буквально за миг Вы становитесь судьёй - они смотрят на
+Вас с надеждой, что Вы им поможете. Вы присматриваетесь
+к ним: с одной стороны мужчина с больным сыном,
+примерно восьми лет возраста. Парень выглядит неважно -
+бледное лицо, огромные тёмные круги вокруг глаз и густо
+покрытая потом кожа. С другой же стороны конфликта стоит
+беременная женщина, очень худая и, с виду, уставшая. Обе
+стороны ожидают Вашего слова, видимо, дело в том, что все
+остальные слишком заняты самими собой... Или дело в Вашем
+оружии... В любом случае - решение за Вами - в мотеле
+осталось только одно место, и кому-то из этих людей
+придётся спать в машине.""",
+        "variants": {
+            "Беременная женщина займёт место": {
+                "desc": """Рассуждая о ситуации, Вы склоняетесь к мысли, что женщина
+должна занять место в мотеле. Мужчина в ярости бросает
+что-то на землю и, схватив за руку сына, уходит прочь.
+Женщина, несколько напуганная произошедшим, благодарит
+Вас - Вы даже видите слёзы в её глазах. Заметив, что
+Ваши люди возвращаются из мотеля, Вы прощаетесь с
+ней и присоединяетесь к экипажу. По их словам, мотель
+забит полностью, некоторые незнакомые друг с другом
+люди даже снимают комнаты вместе. Вдобавок к тому, что
+Вы уже поняли и самостоятельно, Ваши компаньоны дают
+Вам записку - они слышали, как человек в мотеле говорил
+о той самой учёной, которую интервьюировали сироты. Она
+была здесь совсем недавно! Стоит почитать.
+
+Вы даёте команду заводить двигатель, как вдруг замечаете
+того мужчину, который пытался занять последнее место в
+мотеле. Тот, кого Вы прогнали - он идёт от Адъютанта в
+сторону здания. Что бы это значило? Вы просите команду
+внимательно проверить локомотив, и в итоге обнаруживаете,
+что Вас подожгли! Вы быстро справляетесь с огнём, но
+Адъютант всё же получает немного урона.
+
+Адъютант теряет 70 Прочности
+Вы получили новую записку в дневнике капитана
+
+Получена страница досье SCP. Нажмите 0, чтобы смотреть""",
+                "effects": (("do_locomotive_damage", [70]),),
+                "goodness": 5,
+            },
+            "Мужчина с больным сыном займёт место": {
+                "desc": """Обдумывая конфликт, Вы решаете, что мужчина с больным
+сыном должен отдохнуть. Женщина выглядит уставшей, но не
+тяжело больной. Говоря что-то себе под нос, вероятно,
+проклятия, она уходит. Мужчина протягивает Вам руку:
+"Спасибо!" - он опускает глаза на сына. - "Джерри!"
+Парень медленно понимает, чего от него ждёт его отец:
+"Спасибо!" - произносит он чуть слышным голосом. Оставив
+их, Вы присоединяетесь к экипажу. Они говорят, что мотель
+забит донельзя, но это Вы и так уже поняли. Вдобавок они
+дают Вам записку - они услышали разговор двух людей в
+мотеле об учёной, что интервьюировали те сироты. И они
+сказали, что эта женщина - одна из ответственных за
+катаклизмы вроде Смрада. Интересно, стоит прочесть!
+
+Вы быстро проверяете состояние Адъютанта и
+запускаете двигатель, чтобы продолжить путь.
+
+Вскоре все в Сайлевере узнают, что вооруженные
+приезжие выгнали беременную женщину из мотеля,
+где она собиралась отдохнуть после долгой дороги.
+Это приведёт больше людей к скинхедам.
+Вы получили новую записку в дневнике капитана
+
+Получена страница досье SCP. Нажмите 0, чтобы смотреть""",
+                "effects": (("do_enemy_inc_effect", []),),
+                "goodness": 3,
+            },
+            "Прогнать их обоих и занять место": {
+                "desc": """Последнее место в мотеле... Может, оставить его для
+своего экипажа? Пара часов на неподвижной земле и душ
+будут очень кстати. Глядя прямо на беременную женщину
+и мужчину с больным сыном, Вы холодным голосом говорите:
+"Я и мой экипаж забираем последнюю комнату." Ваши визави
+отступают назад, сильно удивлённые таким поворотом.
+Несколько секунд они смотрят друг на друга, после чего
+одновременно разворачиваются и уходят прочь. Вы находите
+своих людей, отстаиваете в очереди и занимаете комнату...
+Небольшой отдых идёт хорошо, один из членов экипажа даёт
+Вам лист бумаги, на котором он записал разговор между
+двумя обитателями мотеля, рассуждающими о той женщине,
+которую интервьюировали сироты. Они обвиняли её и учёных
+вообще в катаклизмах, вроде Смрада. Интересно!
+
+В какой-то момент Вы понимаете, что в мотеле нарастает
+шум. Взяв своё оружие, Вы всем экипажем выходите из
+комнаты и вступаете в бой! Выход из здания занимает
+у Вас около десяти минут. Не очень понимая, что
+произошло - беженцы, которым не хватило места, решили
+напасть на здание? - Вы возвращаетесь на Адъютант.
+Никто не получил серьёзных травм, но всё же без пары
+мелких ран не обошлось. Не лучшая остановка!
+
+Все члены экипажа теряют 20 здоровья
+Вы получили новую записку в дневнике капитана
+
+Получена страница досье SCP. Нажмите 0, чтобы смотреть""",
+                "effects": (("do_characters_effect", [{"health": -20}]),),
+                "goodness": 1,
+            },
+        },
+    },
+    {  # 5
+        "intro": """Увидев машины и толпу людей, Вы приказываете остановиться
+посмотреть, что происходит. На месте, Вы понимаете,
+что здесь только что закончился бой - большой
+автобус полон дыр от пуль, и чёрный джип лежит
+на боку чуть в стороне, так же расстрелянный.
+
+Мужчина подходит к Вам: "Какие-то бандиты преследовали
+колонну чёрных джипов. Хорошо не обратили внимания на
+нас, хотя несколько очередей попало в наш автобус."
+Глядя на густой дым, поднимающийся из него, Вы
+понимаете, что он уже не поедет. Мужчина замечает Ваш
+взгляд и просит помочь с ремонтом. Вы взвешиваете
+ситуацию, но Ваш собеседник добавляет: "Мы поискали
+инструменты в джипе - их тоже расстреляли. К сожалению,
+там ничего полезного, только тонны бумаг,
+высокотехнологичное мумбо-юмбо и газовые маски." Слушая
+его всё с большим вниманием, Вы подозреваете, что уже
+знаете, кто был в этой колонне... Хельга Вагнер! Похоже,
+Вы практически следуете за ней. Стоит проверить джип -
+последние данные о проекте Прорицатель интригуют.
+
+Единственно, что осталось решить - это помогать ли этим
+людям. Снова осмотрев автобус, Вы видите сумки на крыше
+и немецкие номера - беженцы. Если теми бандитами были
+скинхеды, стрельба в автобус не случайна. Мрази могут
+вернуться, когда разделаются с группой Хельги...""",
+        "variants": {
+            "Помочь починить автобус": {
+                "desc": """Как следует обдумав ситуацию, Вы всё же решаете
+помочь людям. Ваш экипаж приносит инструменты с
+Адъютанта и начинает реанимировать машину. Принимая
+участие, Вы изучаете беженцев: нервные и напуганные,
+они выглядят безнадёжными. Обычно, беженцы едут в
+Европу, но Смрад, похоже, изменил все направления на
+противоположные. Европа! Земля комфорта, порядка и
+цивилизации стала самым опасным место на Земле. Куда
+идти? Кто примет нас? Страны, которые не способны
+решить свои собственные проблемы? Их граждане хотели
+бы жить в Европе, но вряд ли они хотят, чтобы мы
+пришли к ним и заняли их места. Конечно, не хотят,
+особенно, сейчас, когда место сокращается весьма
+быстро, и никто не знает, прекратится ли это...
+
+Проходит пара часов, двигатель автобуса, наконец,
+начинает рычать, собранный, буквально, по частям.
+Люди вяло благодарят Вас, похоже, они всё ещё в шоке
+от того, что попали под пулемётный огонь. Но теперь
+они хотя бы смогут двигаться вперёд.
+
+Фронт Смрада приблизился к Вам на 20 км.
+В чёрном джипе Ваши люди находят часть дневника Хельги.
+Она добавлена в журнал капитана, стоит прочесть.
+
+Получена страница досье SCP. Нажмите 0, чтобы смотреть""",
+                "effects": (("do_stench_moves_effect", [20]),),
+                "goodness": 5,
+            },
+            "Дать им инструменты с Адъютанта": {
+                "desc": """Видя Ваши сомнения, мужчина предлагает: "Может, хоть
+дадите нам инструментов? Деньги сейчас нужны, но мы
+заплатим!" Не задерживаться, помочь им и немного
+заработать - звучит неплохо. Вы командуете экипажу
+дать этим людям необходимое для ремонта автобуса,
+а Ваш собеседник тем временем собирает деньги своих
+пассажиров. Возвращаясь к Вам, он даёт $80. "Немного,
+извините." - произносит он тихо. - "Люди всё ещё в
+состоянии шока от перестрелки, такого мы не ожидали.
+По крайней мере, не на второй день дороги!" Кивая
+головой, Вы думаете, что это ещё слабо сказано.
+Обычно люди едут в Европу, а не наоборот. Но теперь
+место комфорта, цивилизации и порядка стало самым
+опасным регионом в мире. Многие направления сменились
+на противоположные. Кто примет новых беженцев из
+Европы? Глядя на покрытый дырами от пуль автобус, Вы
+думаете, что никто. То, что происходит в Сайлевере -
+это только начало, с распространением Смрада всё
+станет намного хуже.
+
+Вы получаете $80.
+Вскоре Вы поймёте, что отдали слишком много инструментов,
+так что теперь не в состоянии решить проблемы на
+локомотиве. Адъютант теряет 70 Прочности.
+
+В чёрном джипе Ваши люди находят часть дневника Хельги.
+Она добавлена в журнал капитана, стоит прочесть.
+
+Получена страница досье SCP. Нажмите 0, чтобы смотреть""",
+                "effects": (("do_locomotive_damage", [70]), ("do_get_money", [80])),
+                "goodness": 3,
+            },
+            "Не помогать им": {
+                "desc": """Обдумав ситуацию, Вы решаете, что делать ещё одну
+остановку слишком рискованно. Автобус выглядит
+очень плохо - потребуются часы, чтобы реанимировать
+его. У Вас нет столько времени.
+
+Попрощавшись с водителем, Вы поворачиваете к Адъютанту,
+по пути глядя на пассажиров автобуса. Беженцы. Да,
+пришло время, когда люди покидают Европу, вместо того,
+чтобы ехать туда - кто бы мог подумать. Регион порядка,
+цивилизации и комфорта стал самым опасным местом в
+мире. Интересный вопрос: кто примет новых беженцев?
+Похоже, ответ прямо перед Вами - автобус, покрытый
+дырами от пуль. И это ещё только начало! Никто не
+остановил Смрад, нет даже идей, как это сделать. Если
+он продолжит распространяться, всё больше людей будут
+покидать свои дома, двигаться в соседние страны и даже
+дальше. Некоторые не остановятся, встретив
+сопротивление, потому что речь уже не просто о комфорте
+и достатке, речь уже о выживании...
+
+Забираясь на Адъютант, Вы даёте приказ экипажу обыскать
+чёрный джип на предмет полезных в дороге вещей, а
+затем продолжать путь. Выживание - не тратим время!
+
+В чёрном джипе Ваши люди находят часть дневника Хельги.
+Она добавлена в журнал капитана, стоит прочесть.
+
+Получена страница досье SCP. Нажмите 0, чтобы смотреть""",
+                "effects": (("do_no_effect", []),),
+                "goodness": 1,
+            },
+        },
+    },
+    {  # 6
+        "intro": """Двигая тряпкой по полу, Вы отрабатываете свою очередь проводить
+уборку на Адъютанте. Чистота важна - столько дней в одном и
+том же прохладном и грубом помещении повышает шансы на
+появление болезней и паразитов...
+
+В какой-то момент Дарен, машинист Адъютанта, приближается к
+Вам. Вы видите, что он хочет сказать что-то, но никак не
+подберёт слова. "Давай, Дарен, рожай!" - говорите Вы,
+пытаясь ускорить его. "Ну, есть проблема. Большая. Конкретно,
+у нас заканчивается провиант." Прекратив возить тряпкой, Вы
+выпрямляете спину: "Как это?!" "Ну, все ждут Вас." - отвечает
+он и исчезает в дверном проёме. Обдумав пару секунд, что это
+значит, Вы решаете поторопиться - если уж ВСЕ ждут Вас,
+это серьёзно.
+
+Войдя в заднее помещение, Вы видите, что экипаж собрался
+в круг. Все выглядят озадаченными, но, к счастью, Вы не
+видите никакой враждебности в комнате. "Что ж, капитан, мы
+все здесь." - начинает Кеннет. - "Наши запасы еды убывают
+быстрее, чем мы думали. Нужно поговорить об ограничениях,
+иначе мы вскоре начнём голодать." Потирая влажные руки, Вы
+пытаетесь сконцентрироваться на новой проблеме. В текущей
+ситуации все должны быть в форме, потому что требуется
+решать множество вопросов обслуживания локомотива, а также
+сражаться. Но, если это невозможно, стоит подумать над
+тем, кому присвоить приоритет в вопросах питания.""",
+        "variants": {
+            "Бойцы в приоритете": {
+                "desc": """Помолчав пару минут, Вы приходите к решению, что
+бойцы, те, кто защищает Адъютант от скинхедов и ищет
+ресурсы на вылазках, должны питаться хорошо. Если они
+будут не в состоянии отбивать атаки, Вы все падёте жертвами
+дикарства, к которому скатываются люди. Что до механика
+и машиниста Адъютанта, что ж, у них работа не такая нервная
+и не требует больших усилий или концентрации.
+
+Озвучив своё решение экипажу, Вы видите, что им оно не
+особо-то нравится. Вероятно, они готовы голодать вместе,
+но на равных, без избранных... Тем не менее, сейчас
+необходимы суровые решения и тактическое мышление. К
+счастью, Дарен и Кеннет не выглядят обиженными тем, что
+их рацион урезали. Они уже не молоды, многое повидали,
+понимают ситуацию и справятся с этим. Хорошо. Не то
+чтоб действительно хорошо, но по крайней мере Вам не
+приходится думать о бунте в экипаже.
+
+Закончив совещание, Вы возвращаетесь к уборке локомотива.
+
+Некоторое время спустя Вы обнаружите, что урезать рацион
+механика - это не самое лучшее решение, так как недоедание
+снизит его производительность, и Адъютант пострадает.
+
+Адъютант теряет 80 Прочности
+Вы получаете страницу дневника. Проверьте журнал!""",
+                "effects": (("do_locomotive_damage", [80]),),
+                "goodness": 1,
+            },
+            "Специалисты Адъютанта в приоритете": {
+                "desc": """Несколько минут Вы молчите, взвешивая все за и против.
+Бойцы нужны, но у Вас достаточно аммуниции - это главный
+пункт в защите. Но если двигатель локомотива заглохнет...
+В этом случае все Вы, без контраргументов, умрёте весьма
+быстро. Важно сохранять скорость движения - даже важнее,
+чем убивать дикарей.
+
+С такими мыслями Вы озвучиваете своё решение экипажу.
+Кеннет и Дарен, похоже, не очень довольны Вашим приказом
+- они уже немолоды, повидали многое и вполне справились
+бы с небольшим голоданием. Ваше решение несколько
+задевает их гордость. Всё же приказ отдан, и Вы верите,
+что машинист и механик должны быть в наилучшем
+состоянии, дозволенном текущей ситуацией.
+
+Закончив совещание, Вы возвращаетесь к уборке локомотива.
+
+Спустя некоторое время становится заметно, что бойцы
+устают гораздо быстрее из-за недоедания, и их
+производительность заметно снизилась.
+
+Все бойцы теряют 40 энергии
+
+Вы получаете страницу дневника. Проверьте журнал!""",
+                "effects": (("do_characters_effect", [{"energy": -40}]),),
+                "goodness": 3,
+            },
+            "Урезать рацион всем": {
+                "desc": """Взяв пару минут на размышление над ситуацией, Вы решаете,
+что выделять кого-то в экипаже - это не очень хорошо.
+Все важны, все вносят вклад в общее дело коллектива.
+Если провианта недостаточно, будет лучше урезать
+рацион всем и одинакого, независимо от обязанностей.
+
+Озвучивая своё решение, Вы видите, что все в помещении
+вполне довольны им. Хорошо, командный дух всё ещё с
+Вами, и пищевой кризис будет решён совместными усилиями.
+
+Подсчитав новый рацион с другими, Вы обнаруживаете, что
+снижение его будет совсем малым - распространённое на
+каждого члена экипажа, оно становится незначительным
+с точки зрения одного человека. С такими результатами,
+Вы закрепляете своё решение и возвращаетесь к своим
+обязанностям.
+
+Результаты снижения рациона:
+Все члены экипажа теряют 10 энергии, и Адъютант теряет
+20 Прочности.
+
+Вы получаете страницу дневника. Проверьте журнал!""",
+                "effects": (
+                    ("do_characters_effect", [{"energy": -10}]),
+                    ("do_locomotive_damage", [20]),
+                ),
+                "goodness": 5,
+            },
+        },
+    },
+    {  # 7
+        "intro": """Автомобильная пробка, вытянувшаяся по левую сторону от
+железной дороги, длится миль пятнадцать, и это только
+та часть, что видна Вам, за поворотом машин ещё больше.
+Ужас! В какой-то момент Вы видите начало этого
+гигантского змея - дорожный блокпост.
+
+Вы приказываете сделать остановку, берёте несколько
+человек и идёте к месту. С большой дистанции Вам
+удаётся различить крики - беженцы громко спорят с
+полицейскими. Вы просите остальных оставаться на
+расстоянии и отдаёте им своё оружие, чтобы никого
+не провоцировать. Подходя поближе к офицерам, Вы
+обнаруживаете, что дорога полностью перекрыта, они
+даже не досматривают людей, просто не пропускают
+огромную колонну беженцев. Неясно что это, приказ
+правительства или какая-то самодеятельность.
+
+Блокпост не выглядит крепким, и все, вероятно, это
+понимают. Скорее всего, следующая новость о том, что
+Смрад приближается сюда, всколыхнёт всех этих
+людей на агрессивные действия.
+
+Стоит ли беспокоиться об этом? Возможно, есть смысл
+поговорить с кем-то, попробовать урегулировать
+ситуацию. Надежд мало, но кто знает...""",
+        "variants": {
+            "Убедить офицеров пропустить людей": {
+                "desc": """Видя, что полицейские наготове и могут начать стрелять
+в любой момент, Вы приближаетесь к ним медленно и
+тихо. Тот из них, что стоит впереди, видит, что Вы
+не угроза, и кивает Вам. Вы подходите ближе: "Какой,
+однако, бардак." Офицер бросает взгляд на людей: "Не
+то слово! Но у нас приказ не пускать никого глубже
+в страну. Там и так уже повсюду чёрти-что творится."
+
+Вы чуть склоняете голову и тихо спокойно говорите:
+"Просто поймите их. Смрад приближается, они пытаются
+выжить, спасти свои семьи... Никто не обещал остановить
+бедствие - вполне вероятно, что скоро мы все станем
+беженцами". Офицер обдумывает Ваши слова. "Смрад всего
+в нескольких часах отсюда. Вам всё равно придётся
+покинуть блокпост, если хотите выжить." Он смотрит на
+своих коллег, которые, похоже, поняли, о чём разговор.
+"Ладно... Мы и сами уже поняли, что надо валить...
+просто..." Вы понимающе киваете головой.
+
+Полицейский приказывает открыть ворота, и беженцы
+начинают лихорадочно запрыгивать в машины, чтобы
+продолжить путь.
+
+Волна приезжих в Сайлевере сделает скинхедов агрессивнее.
+
+Вы получаете страницу дневника. Проверьте Журнал.""",
+                "effects": (("do_enemy_inc_effect", []),),
+                "goodness": 5,
+            },
+            "Подбить беженцев на штурм": {
+                "desc": """Вы тихо приближаетесь к беженцам, и, видя, что Вы боец,
+они делают шаг навстречу. Вы чувствуете, что они
+уже готовы: среди них есть несколько особо активных
+людей, и остальные готовы поддержать их, им нужен
+всего один толчок. Считая, что они в своём праве, ведь
+Смрад приближается, и это несправедливо для стольких
+людей просто умереть здесь, Вы начинаете говорить
+с ними, но в следующий момент понимаете, что они не
+слушают. Ваше появление здесь уже запустило штурм.
+
+Всё вокруг приходит в движение, толпа оборачивается
+лавиной. Вы отступаете на безопасную дистанцию, потому
+что бунт с самого начала превращается в бесконтрольное
+и хаотичное варево. Офицеров сносят буквально за
+несколько секунд, и длинный змей машин начинает
+лихорадочно ползти сквозь разбитые ворота.
+
+Когда ситуация более или менее успокаивается, Ваши
+люди подходят к аванпосту и собирают то, что от него
+осталось: инструменты и оружие.
+
+Узнав об атаке, скинхеды станут гораздо агрессивнее.
+Адъютант получает 90 Прочности.
+
+Вы получаете страницу дневника. Проверьте Журнал.""",
+                "effects": (
+                    ("do_locomotive_damage", [90]),
+                    ("do_enemy_inc_effect", []),
+                ),
+                "goodness": 1,
+            },
+            "Ничего не делать": {
+                "desc": """Медленно и тихо приближаясь к аванпосту, Вы стараетесь
+не привлекать внимания - ситуация пахнет
+киросином, лучше держаться незаметно.
+
+Несколько беженцев, мужчины, активно спорят с
+офицерами, и Вы видите, что все здесь понимают -
+позиции полиции более, чем слабы. Люди чуть позади
+явно готовы ринуться вперёд при первом же неверном
+движении кого-либо из присутствующих. Здесь всего
+шесть офицеров, вооружённых, но против них сотни
+беженцев. И, скорее всего, многие из них так же
+вооружены.
+
+Тем не менее, некоторое время напряжение здесь ещё
+удастся сдерживать. Не желая быть камнем, что начинает
+камнепад, Вы разворачиваетесь и возвращаетесь к
+своему экипажу. Лучше просто покинуть это место.
+
+Вы получаете страницу дневника. Проверьте Журнал.""",
+                "effects": (("do_no_effect", []),),
+                "goodness": 3,
+            },
+        },
+    },
+    {  # 8
+        "intro": """В то время, как Вы осматриваете карты, пытаясь спланировать
+дальнейший маршрут, к Вам подкрадывается Дарен:
+"Капитан, надо поговорить." - он оглядывает помещение
+- "Наедине." Его пониженный голос вызывает у Вас
+ощущение, что это как-то связано с другими членами
+Вашей команды, что весьма странно для Дарена - он
+вообще никогда никого не обсуждает.
+
+Вы показываете, что готовы следовать за ним, и он
+выводит Вас на свежий воздух. "Капитан, у нас...
+Я думаю, на нашем корабле завёлся вор." "Что?!"
+- Вы пытаетесь убедиться в том, что не ослышались.
+"Наши запасы, они иссякают весьма быстро. И после
+урезания рациона ничего не изменилось, вообще.
+Кто-то крадёт еду, постоянно."
+
+Таких обвинений Вы уж никак не ожидали. Экипаж
+кажется честным, все терпеливы - все, кто мог бы
+пойти на такое? И, более того, что с этим делать?
+Найти вора и говорить с ним одним? Или со всеми
+сразу? Сложившаяся ситуация может сильно
+навредить сплочённости коллектива.""",
+        "variants": {
+            "Просить Дарена выследить вора": {
+                "desc": """Обдумывая происходящее снова и снова, Вы понимаете,
+что говорить о таком сразу со всем экипажем - это
+плохая идея. Люди начнут подозревать друг друга,
+думать об этом, может, даже обвинять... Нет, лучше
+разобраться тихо, в идеале, только с тем, кто это
+делает. Пока непонятно, как урегулировать такое
+поведение, но давайте решать проблемы по одной.
+
+Вы тихо говорите Дарену понаблюдать за хранилищем,
+попытаться выяснить, кто крадёт, но не останавливать
+его пока. Ему нравится Ваша идея разобраться со
+всем без лишнего шума, и он обещает вычислить вора.
+
+Через несколько дней наблюдений Дарен объявит, что
+не знает, кто крадёт припасы. Никто не делает
+ничего особенного, но еда исчезает, как будто
+её уволакивает бестелесный призрак.
+
+Вынужденные покупать больше провизии в городах,
+Вы теряете деньги - $60.
+
+Один из членов экипажа перехватывает радиоэфир,
+в котором Хельгу Вагнер инструктируют о месте
+безопасном от Смрада. Смотрите запись разговора
+в своём журнале.""",
+                "effects": (("do_get_money", [-60]),),
+                "goodness": 3,
+            },
+            "Поговорить со всем экипажем": {
+                "desc": """После некоторых размышлений, Вы приходите к
+мысли, что надо говорить сразу со всеми. Проблему
+нужно решить быстро, а вор должен быть опозорен
+перед членами экипажа. Это будет справедливо.
+
+Вы собираете весь коллектив и описываете им, какая
+сложилась ситуация. Люди выглядят весьма удивлёнными,
+сбитыми с толку, но, рассматривая их, Вы не видите
+вора в их числе. Все ведут себя абсолютно естественно.
+Через несколько дней Дарен объявит Вам, что припасы
+всё так же исчезают. Подозрительность, тем не менее,
+принесённая Вами в экипаж, делает атмосферу в
+коллективе прохладной и даже напряжённой.
+
+Попытки Дарена выследить вора безрезультатны -
+никто не берёт больше положенного, но припасы
+всё равно исчезают, как будто их уволакивает
+призрак, прямо сквозь стену.
+
+Сплочённость экипажа снижается на 5 единиц.
+
+Один из членов экипажа перехватывает радиоэфир,
+в котором Хельгу Вагнер инструктируют о месте
+безопасном от Смрада. Смотрите запись разговора
+в своём журнале.""",
+                "effects": (("do_spend_cohesion", [5]),),
+                "goodness": 1,
+            },
+            "Поговорить с каждым отдельно": {
+                "desc": """Идея поднимать шум из этой ситуации выглядит
+плохой. Сейчас нелегко поддерживать оптимизм,
+не стоит заставлять людей вдобавок подозревать
+или даже обвинять друг друга. Лучше поговорить
+с каждым по отдельности и попробовать найти
+вора тихо.
+
+Вы проводите несколько часов, беседуя с членами
+экипажа, пытаетесь понять их настрой. Не похоже,
+чтобы кто-то из них был настолько в отчаянии,
+чтобы красть общие припасы. Вы осторожно намекаете
+на обнаруженную Вами проблему, но никто не
+никак не реагирует на это.
+
+Спустя несколько дней Дарен скажет Вам, что припасы
+всё так же исчезают, хотя он и не заметил, чтобы
+кто-то вёл себя странно. Как будто бестелесный
+призрак завёлся на локомотиве и постоянно ворует
+еду прямо сквозь стены.
+
+Открытые разговоры с членами экипажа увеличили
+общую сплочённость на 5 единиц.
+
+Один из членов экипажа перехватывает радиоэфир,
+в котором Хельгу Вагнер инструктируют о месте
+безопасном от Смрада. Смотрите запись разговора
+в своём журнале.""",
+                "effects": (("do_spend_cohesion", [-5]),),
+                "goodness": 5,
+            },
+        },
+    },
+    {  # 9
+        "intro": """Услышав какую-то суматоху и крики в машинном отсеке, Вы
+спешите туда, выяснить, что произошло. Входя, Вы
+видите, как Ваши люди пытаются вытащить мальчика лет
+девяти из темноты механизмов локомотива. Левая нога
+ребёнка перемолота, он явно теряет сознание, его кровь
+повсюду. Видя Вас, Дарен выкрикивает: "Капитан, это
+тот самый вор! Прятался в механизмах. Я хотел сегодня
+навести здесь порядок как следует, видимо, он
+испугался и попытался спрятаться поглубже, подполз
+слишком близко к движущим частям и..."
+
+Кеннет, так же находящийся здесь, подходит к Вам. Вы
+чувствуете, что его трясёт от увиденного. Он тихо
+спрашивает: "Что нам делать, Капитан? Мы не медики,
+а парень ранен более чем серьёзно. Мы можем попробовать
+сделать переливание, наверно, от двух людей, потому
+что он потерял много. Или можем попробовать
+стабилизировать его лекарствами. Нужно решать быстро,
+он плох, а мы не настолько мастера, чтобы провести
+нормальную операцию. Каждая секунда на счету!"
+
+Прикинув текущее состояние экипажа и запас
+медикаментов, Вы пытаетесь найти правильное
+решение для этого неожиданного несчастья.""",
+        "variants": {
+            "Сделать переливание": {
+                "desc": """Вы даёте приказ максимально быстро выяснить, что у парня
+за группа крови, и начать переливание. Ребёнок не
+заслуживает такого! Если бы он просто... просто
+сказал Вам, что он здесь. Вероятно, боялся, что Вы
+высадите его где-то в дебрях, одного. Или и того
+хуже... Достаточно ловкий, чтобы прятаться так
+долго прямо у Вас под носом. Скорее всего, он
+один из тех детей, что Вы встретили ранее. Сирота.
+
+Оказывается, что у двух членов Вашего экипажа та
+же группа крови, что и у парня, так что общими
+усилиями Вы начинаете из подручных средств
+мастерить систему переливания.
+
+Проходит несколько часов, и Вы понимаете, что Ваше
+решение сработало! Его руки перестали трястись,
+кожа чуть приобрела цвета. Да, парень
+стабилизирован, хотя его нога и стресс вообще ещё
+долго будут держать его в кровати.
+
+Два члена экипажа теряют 30 здоровья.
+Пока Вы спасали мальчика, один из Ваших дозорных
+записал новое шифрованное сообщение из Унтеррифа.
+Ищите его в Журнале Капитана.""",
+                "effects": (("do_transfusion_effect", []),),
+                "goodness": 5,
+            },
+            "Стабилизировать с помощью медикаментов": {
+                "desc": """Со скоростью молнии Вы обдумываете ситуацию и
+решаете, что мальчика нужно спасти, однако нельзя
+слишком сильно увлекаться. У Вас свой путь, Вы
+обещали своим людям, что проведёте их по нему,
+и они выживут. Тем не менее, переливание крови
+- это риск, который ставит Ваше обещание под
+большое сомнение.
+
+Ваши люди начинают собирать все препараты, что
+есть, чтобы стабилизировать парня. Выходит, что
+припасов недостаточно для такой операции, но Вы
+всё же не теряете надежды.
+
+Спустя несколько полных стресса и тяжёлых трудов
+часов Вы понимаете, что спасли ребёнка. Это
+стоило огромных затрат энергии и ресурсов, но
+его конечности перестали дёргаться, кожа чуть
+обрела цвет, а давление стало приемлемым. Он
+будет в порядке, хотя полное восстановление
+займёт очень много времени.
+
+Вы тратите 2 Лекарства. Если Лекарств недостаточно,
+Ваши бойцы теряют 40 энергии.
+
+Пока Вы спасали мальчика, один из Ваших дозорных
+записал новое шифрованное сообщение из Унтеррифа.
+Ищите его в Журнале Капитана.""",
+                "effects": (
+                    ("do_medicine_save", []),
+                    ("do_medicine_save", []),
+                ),
+                "goodness": 3,
+            },
+            "Не спасать парня": {
+                "desc": """Быстро обдумывая ситуацию, Вы приходите к выводу, что
+не можете помочь парню. У Вас свой путь, Вам нужно
+заботиться об экипаже. Переливание крови или
+трата весьма ценных сейчас медикаментов? Нет.
+
+Вы приказываете ничего не расходовать на спасение
+мальчика. Долгая напряжённая пауза повисает в
+атмосфере локомотива. Все выглядят настолько
+шокироваными Вашим решением, что не могут ничего
+сказать и просто смотрят на Вас.
+
+Дарен первым подаёт голос: "Капитан... но... дитя.
+Мы не можем просто... Нет!" Вы повторяете свой
+приказ, и несколько человек в ту же секунду в
+чувствах покидают рубку. Прочие остаются в
+безнадёжных попытках оказать мальчику хоть
+какую-то помощь.
+
+Вы возвращаетесь к своему столу, и пару часов
+спустя Кеннет, проходя мимо Вас, качает головой,
+показывая, что парень не выжил.
+
+Ваше безжалостное решение наносит тяжёлый удар по
+атмосфере в коллективе. Люди раздавлены и винят
+Вас в том, что этот чёрный день имеет место в их
+жизнях. Лидерская доля.
+
+Сплочённость экипажа снижается на 30 очков.
+Один из Ваших часовых записал новое шифрованное
+сообщение из Унтеррифа. Проверьте Журнал Капитана.""",
+                "effects": (("do_spend_cohesion", [30]),),
+                "goodness": 1,
+            },
+        },
+    },
+    {  # 10
+        "intro": """Следя за хлопьями снега, медленно спускающимися с неба, Вы
+слышите, что к Вам кто-то подходит. Кеннет. "Капитан,
+мы поймали ещё одну передачу из Унтеррифа." Вы киваете
+головой, показывая, что следуете за ним. Вместе Вы
+входите в рубку, где весь экипаж уже собрался вокруг
+радио. "Начинается!" - выкрикивает Дарен, заставляя
+всех замолчать.
+
+"Код 773-Л, повторяю, код 773-Л. Сообщение всем
+участникам программы Унтерриф-8. Смрад определён
+как угроза наивысшего уровня. Всем участникам с кодом
+773-Л и выше рекомендуется немедленно двигаться в
+указанное место встречи. Принимающая группа будет
+отозвана через 173 часа. Если Вы не успеете
+добраться до группы в указанное время, Вам придётся
+самостоятельно проследовать по дороге 804 и далее
+по пути, описанном в пункте 26.3.1 Вашего соглашения
+по проекту Унтерриф. Повторяю, самостоятельно. У
+ворот Унтеррифа Вам необходимо идентифицировать
+себя с помощью микрочипа, приложенного к Вашему
+договору. Лица, не имеющие при себе чипа, а так же
+имещие код ниже 773-Л не будут допущены в Унтерриф."
+
+Сообщение обрывается. Все выглядят озадаченными -
+целая система построена вокруг этого Унтеррифа. Чипы,
+соглашения, иерархия кодов... Но никто даже не
+догадывается! Никто! Похоже, есть множество...
+избранных, которым рады в подводном убежище, но
+двери открыты не для всех. Кто-то выбрал тех, кто
+должен выжить, и тех, кто нет.""",
+        "variants": {
+            "Проложить маршрут": {
+                "desc": """Кеннет выходит в центр рубки, с силой потирая лоб
+рукой: "Дорога 804, дорога 804... Я знаю, где она!
+Я проезжал по ней несколько раз. Это путь, вытянутый
+вдоль побережья Чёрного Моря. На нём есть несколько
+маленьких, как будто бы нефункционирующих
+ответвлений в сторону моря..."
+
+"Видимо, они функционируют. Просто не для всех." -
+тихо произносите Вы.
+
+Кеннет поднимает на Вас свои глаза: "Ну, тогда, я
+полагаю... Вперёд! Правда, нам ещё нужен чип
+доступа, чтобы попасть в сам город..."
+
+Вы уверенно киваете головой. Идеи о том, что
+делать дальше, у Вас уже есть. Они начали большой
+сбор - значит, в регионе будет много суматохи.
+Это Вам на руку.
+
+Оглядев всех присутствующих в рубке, Вы уверенно
+объявляете: "Похоже, нам забыли выслать
+приглашение. Что ж, мы сами его достанем.
+Давайте посмотрим, что это за Унтерриф!" """,
+                "effects": (("do_no_effect", []),),
+                "goodness": 0,
+            },
+        },
+    },
+)
@@ -0,0 +1,35 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+The SCP episode texts written in Russian language.
+"""
+
+SCP_PAGES = [
+    "scp_1_rus.png",
+    "scp_2_rus.png",
+    "scp_3_rus.png",
+]
+
+SCP_END = (
+    "Доппельгангер",
+    """Найдя взглядом своих людей, Вы пытаетесь понять, что
+только что произошло. Это действительно был SCP-4945-B,
+тот поезд? Нет, нет, нет, невозможно! Но модель...
+и, более того... Вы видели самого себя среди людей,
+стрелявших с локомотива! Холодные иголки бегут по
+Вашей шее от этих мыслей.
+
+И этот обжигающий фиолетовый свет... Смрада было
+мало, теперь ещё и SCP! О чём думал этот парень,
+Д.? Осматривая окрестности с опасением снова
+увидеть фиолетовый свет, Вы самостоятельно отвечаете
+на свой вопрос: он думал о Вас. Вероятно, он как-то
+узнал о Вашем экипаже, наверно, из новостей или
+видео в интернете. Представив Вас, он материализовал
+Ваши копии в поезде, смешав их с чем-то...
+сверхъестественным... Вы закрываете глаза - нет уж,
+лучше об этом не думать, так можно и рассудка
+лишиться. Нужно просто... двигаться дальше и
+надеяться, что стычка не повторится.""",
+)
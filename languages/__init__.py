@@ -0,0 +1,71 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+The game text labels catalogs.
+
+Every language is a package with the frequently used labels. Heavy
+and rarely used texts are kept in the language submodules, which are
+imported (from their compiled bytecode cache) on the first access.
+"""
+import importlib
+import sys
+
+LANGUAGES = ("EN", "RU")
+
+# heavy texts and the language submodules, which keep them
+SECTIONS = {
+    "MECHANIC_DESC": "mechanics",
+    "OUTINGS": "outings",
+    "SCENARIO": "scenario",
+    "JOURNAL_PAGES": "journal",
+    "UNTERRIFF_DISCOVERED": "journal",
+    "CREDITS": "credits",
+    "ROUGH_LEADER": "credits",
+    "OPPORTUNIST_LEADER": "credits",
+    "EMPATHIC_LEADER": "credits",
+    "SCP_PAGES": "scp",
+    "SCP_END": "scp",
+}
+
+
+def load(language):
+    """Import the labels catalog of the given language.
+
+    Only the chosen language is imported.
+
+    Args:
+        language (str): Language code, like "EN".
+
+    Returns:
+        module: The language labels catalog.
+    """
+    return importlib.import_module("languages." + language)
+
+
+def lazy_sections(package):
+    """Build a language package __getattr__, which loads heavy texts.
+
+    When a heavy text is accessed for the first time, its
+    submodule is imported, and the text is cached in the
+    language package, so it's not looked up again.
+
+    Args:
+        package (str): The language package name.
+
+    Returns:
+        function: Module level attributes getter.
+    """
+
+    def get_section(name):
+        if name not in SECTIONS:
+            raise AttributeError(
+                "module '{}' has no attribute '{}'".format(package, name)
+            )
+
+        module = importlib.import_module(package + "." + SECTIONS[name])
+        value = getattr(module, name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return get_section
@@ -5,18 +5,26 @@ License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
 The main game file. Starts the game itself and maintains major systems.
 """
 import dbm.dumb  # noqa: F401
-import languages.EN  # noqa: F401
-import languages.RU  # noqa: F401
 import logging
 import os
-import shelve
+import random
 import sys
 import time
 
 from direct.showbase import Audio3DManager
 from direct.showbase.ShowBase import ShowBase
-from panda3d.core import loadPrcFileData, ClockObject, Filename, WindowProperties
+from panda3d.core import (
+    loadPrcFileData,
+    Camera,
+    ClockObject,
+    Filename,
+    ModelNode,
+    MouseWatcher,
+    PerspectiveLens,
+    WindowProperties,
+)
 
+from audio import VoicesManager
 from controls import CameraController, CommonController
 from effects import EffectsManager
 from game_config import Config
@@ -29,15 +37,15 @@ from gui import (
     TeachingNotes,
     TraitsGUI,
 )
+import languages
+from profiler import TasksProfiler
+import save_file
 from train import Train
 from world import Scenario, World
 from units.crew.crew import Crew
+from units.scheduler import TimerWheel
 from utils import clear_wids
 
-# build hack: import languages module to add it into the build,
-# delete the module later not to keep both languages in game
-del languages
-
 loadPrcFileData(
     "",
     "audio-library-name "
@@ -59,17 +67,33 @@ class ForwardOnly(ShowBase):
     holds the game resources, orchestrates GUIs and the high level game
     instances. The main mechanism represents infinite locomotive movement
     along the World blocks, which are loaded and unloaded on a fly.
+
+    Args:
+        headless (bool):
+            Optional. If True, the game is started without
+            a window and sounds, on a fixed-step clock.
+        seed (int):
+            Optional. Seed of the game random generator,
+            from which all the game systems draw.
     """
 
-    def __init__(self):
-        ShowBase.__init__(self)
+    def __init__(self, headless=False, seed=None):
+        self.headless = headless
+        self.rng = random.Random(seed)
+        if headless:
+            loadPrcFileData("", "audio-library-name null")
+
+        ShowBase.__init__(self, windowType="none" if headless else None)
         self.game_config = Config()
 
-        self.labels = getattr(
-            __import__("languages." + self.game_config.language),
-            self.game_config.language,
-        )
-        self._win_prors = self._configure_window()
+        self.labels = languages.load(self.game_config.language)
+        if headless:
+            self._win_prors = None
+            self._configure_headless()
+        else:
+            self._win_prors = self._configure_window()
+
+        self.profiler = TasksProfiler() if self.game_config.profiler else None
 
         if not os.path.exists("saves"):
             os.mkdir("saves")
@@ -80,8 +104,10 @@ class ForwardOnly(ShowBase):
 
         self.sound_mgr = Audio3DManager.Audio3DManager(self.sfxManagerList[0], self.cam)
         self.sound_mgr.setDropOffFactor(5)
+        self.voices_mgr = VoicesManager(self.sound_mgr)
 
         self.effects_mgr = EffectsManager()
+        self.units_timers = TimerWheel(self.profiler)
 
         self._dollars = 0
         self._resources = {
@@ -91,6 +117,7 @@ class ForwardOnly(ShowBase):
         }
         self._heads = {}
         self._cur_mouse_pointer = "normal"
+        self._save_job = None
         self.scp_pages = []
         self.helped_children = False
         self.decisions = {}
@@ -129,6 +156,15 @@ class ForwardOnly(ShowBase):
         """
         return self._heads
 
+    @property
+    def is_saving(self):
+        """Indicates if a game save is being written.
+
+        Returns:
+            bool: True if a game save is in progress.
+        """
+        return self._save_job is not None and not self._save_job.is_done
+
     def _configure_window(self):
         """Configure the game window.
 
@@ -155,6 +191,28 @@ class ForwardOnly(ShowBase):
 
         return props
 
+    def _configure_headless(self):
+        """Configure the game to run without a window.
+
+        Create the camera and the mouse watcher, which are used by
+        the game systems, and switch the clock into the mode, in
+        which every frame takes a fixed amount of time. The clock
+        is restarted, so that the time spent on the start doesn't
+        affect the game.
+        """
+        self.camera = self.render.attachNewNode(ModelNode("camera"))
+        self.camNode = Camera("cam", PerspectiveLens())
+        self.cam = self.camera.attachNewNode(self.camNode)
+        self.camLens = self.camNode.getLens()
+        self.camList.append(self.cam)
+
+        # the mouse watcher, which never has a mouse
+        self.mouseWatcherNode = MouseWatcher("mouse_watcher")
+
+        globalClock.setMode(ClockObject.MNonRealTime)  # noqa: F82
+        globalClock.setFrameRate(self.game_config.fps_limit)  # noqa: F82
+        globalClock.reset()  # noqa: F82
+
     def _move_along_block(self):
         """Move the locomotive along the current world block.
 
@@ -293,6 +351,9 @@ class ForwardOnly(ShowBase):
             return
 
         self._cur_mouse_pointer = state
+        if self.headless:
+            return
+
         self._win_prors.setCursorFilename(
             Filename.binaryFilename("GUI/pointers/" + state + ".ico")
         )
@@ -304,8 +365,12 @@ class ForwardOnly(ShowBase):
         Args:
             num (int): The save slot number.
         """
+        # the slot can be still written
+        if self._save_job is not None:
+            self._save_job.wait()
+
         clear_wids(self.main_menu.save_wids)
-        save = shelve.open("saves/save{}".format(num))
+        save, world_map = save_file.read(num)
 
         self.train = Train(save["train"])
 
@@ -320,8 +385,9 @@ class ForwardOnly(ShowBase):
 
         # build game world
         self.world = World(save["day_part"])
+        self.effects_mgr.particles.warm_up()
         self.world.load_location(
-            num,
+            world_map,
             save["enemy_score"],
             save["disease_threshold"],
             save["stench_step"],
@@ -362,8 +428,8 @@ class ForwardOnly(ShowBase):
         for num in range(save["chapter"] + 1):
             self.journal.add_page(num)
 
-        save.close()
-        self.main_menu.hide_loading_msg()
+        if not self.headless:
+            self.main_menu.hide_loading_msg()
 
     def plus_resource(self, name, value):
         """Increase the amount of the given resource.
@@ -390,20 +456,32 @@ class ForwardOnly(ShowBase):
 
     def restart_game(self):
         """Completely restart the game program."""
+        if self._save_job is not None:
+            self._save_job.wait()
+
         self.destroy()
         os.execl(sys.executable, sys.executable, *sys.argv)
 
     def save_game(self, num):
         """Save the current game description into a file.
 
+        The game snapshot is taken at once, while the file is
+        written in a background thread. If another save is
+        going, its progress is shown instead.
+
         Args:
             num (int): The save slot number.
+
+        Returns:
+            save_file.SaveJob: The started save, None if another save is going.
         """
-        clear_wids(self.main_menu.save_wids)
-        self.world.save_map(num)
+        if self.is_saving:
+            self.main_menu.show_save_progress(self._save_job)
+            return
 
-        save = shelve.open("saves/save{}".format(num))
+        clear_wids(self.main_menu.save_wids)
 
+        save = {}
         save["save_time"] = time.strftime("%a, %d %b %Y %H:%M", time.localtime())
         save["cur_blocks"] = self.world.current_blocks
         save["last_angle"] = self.world.last_cleared_block_angle
@@ -431,7 +509,9 @@ class ForwardOnly(ShowBase):
         save["scp_pages"] = self.scp_pages
         save["meet_scp"] = self.world.meet_scp
 
-        save.close()
+        self._save_job = save_file.SaveJob(num, save, self.world.map_description)
+        self.main_menu.show_save_progress(self._save_job)
+        return self._save_job
 
     def start_new_game(self, chosen_crew):
         """Start new game.
@@ -453,6 +533,7 @@ class ForwardOnly(ShowBase):
 
         # build game world
         self.world = World()
+        self.effects_mgr.particles.warm_up()
         self.world.generate_location(500, chosen_crew)
         self.current_block = self.world.prepare_next_block()
 
@@ -460,7 +541,9 @@ class ForwardOnly(ShowBase):
 
         self.char_gui = CharacterGUI()
         self.res_gui = ResourcesGUI()
-        self.main_menu.show_start_button()
+        if not self.headless:
+            self.main_menu.show_start_button()
+
         self.dollars = 300
 
         self.train.install_upgrade(
@@ -486,8 +569,9 @@ def configure_cull_draw():
         loadPrcFileData("", "threading-model Cull/Draw")
 
 
-try:
-    configure_cull_draw()
-    ForwardOnly().run()
-except Exception:
-    logging.exception("Exception occured:")
+if __name__ == "__main__":
+    try:
+        configure_cull_draw()
+        ForwardOnly().run()
+    except Exception:
+        logging.exception("Exception occured:")
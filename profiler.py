@@ -0,0 +1,201 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Game tasks profiler API.
+"""
+import csv
+import functools
+import os
+import re
+import time
+
+from direct.gui.OnscreenText import OnscreenText
+from panda3d.core import AsyncTask, TextNode
+
+# seconds between two profiler reports
+REPORT_PERIOD = 1
+# number of the task families to show on the screen
+TOP_NUM = 12
+TRACE_FILE = "profile.csv"
+OLD_TRACE_FILE = "profile.old.csv"
+# number of the trace rows, after which the trace file is rotated
+TRACE_MAX_ROWS = 50000
+
+ID_PATTERN = re.compile(r"\d+")
+
+
+def task_family(name):
+    """Get the family of the task with the given name.
+
+    Ids are stripped from the name, so that all the tasks
+    like "enemy_5_float_move" are counted together.
+
+    Args:
+        name (str): Task name.
+
+    Returns:
+        str: Task family name.
+    """
+    return ID_PATTERN.sub("#", name)
+
+
+class TasksProfiler:
+    """Profiler of the game tasks.
+
+    Wraps functions of all the tasks, added after the profiler
+    start, to measure their execution time. Every report period
+    the time is summed by task families, the top families are
+    shown on the screen, and all of them are written into the
+    CSV trace file.
+    """
+
+    def __init__(self):
+        self._stats = {}
+        self._last_stats = {}
+        self._frame = globalClock.getFrameCount()  # noqa: F821
+        self._rows = 0
+        # time spent in the measured functions, to
+        # exclude it from the functions, calling them
+        self._nested = 0
+        self._start_trace()
+
+        self._text = OnscreenText(
+            parent=base.a2dTopLeft,  # noqa: F821
+            pos=(0.05, -0.1),
+            scale=0.03,
+            fg=(1, 1, 1, 1),
+            shadow=(0, 0, 0, 1),
+            align=TextNode.ALeft,
+            mayChange=True,
+        )
+
+        self._add = taskMgr.add  # noqa: F821
+        self._do_method_later = taskMgr.doMethodLater  # noqa: F821
+        taskMgr.add = self._timed_add  # noqa: F821
+        taskMgr.doMethodLater = self._timed_do_method_later  # noqa: F821
+
+        self._do_method_later(REPORT_PERIOD, self._report, "tasks_profiler_report")
+
+    def _start_trace(self):
+        """Start a new trace file, keeping the previous one."""
+        if os.path.exists(TRACE_FILE):
+            os.replace(TRACE_FILE, OLD_TRACE_FILE)
+
+        with open(TRACE_FILE, "w", newline="") as trace:
+            csv.writer(trace).writerow(
+                ("time", "family", "ms_per_frame", "calls_per_frame", "frames")
+            )
+
+        self._rows = 0
+
+    def timed(self, func, name):
+        """Wrap the given task function to measure its execution time.
+
+        Time of the measured functions, called from the
+        function, isn't counted into the function time.
+
+        Args:
+            func (callable): Task function.
+            name (str): Task name.
+
+        Returns:
+            callable: Wrapped task function.
+        """
+        if isinstance(func, AsyncTask):
+            return func
+
+        family = task_family(name or getattr(func, "__name__", "task"))
+        if family not in self._stats:
+            self._stats[family] = [0, 0]
+
+        stats = self._stats[family]
+
+        @functools.wraps(func)
+        def timed(*args):
+            nested = self._nested
+            start = time.perf_counter()
+            result = func(*args)
+            spent = time.perf_counter() - start
+
+            stats[0] += spent - (self._nested - nested)
+            stats[1] += 1
+            self._nested = nested + spent
+            return result
+
+        return timed
+
+    def _timed_add(self, func, name=None, *args, **kwargs):
+        """Add a task with its time measuring."""
+        return self._add(self.timed(func, name), name, *args, **kwargs)
+
+    def _timed_do_method_later(self, delay, func, name, *args, **kwargs):
+        """Add a delayed task with its time measuring."""
+        return self._do_method_later(
+            delay, self.timed(func, name), name, *args, **kwargs
+        )
+
+    def _report(self, task):
+        """Count tasks time spent since the last report and show it."""
+        frame = globalClock.getFrameCount()  # noqa: F821
+        frames = max(1, frame - self._frame)
+        self._frame = frame
+
+        rows = []
+        for family, (spent, calls) in self._stats.items():
+            last_spent, last_calls = self._last_stats.get(family, (0, 0))
+            if calls > last_calls:
+                rows.append(
+                    (
+                        family,
+                        (spent - last_spent) * 1000 / frames,
+                        (calls - last_calls) / frames,
+                    )
+                )
+            self._last_stats[family] = (spent, calls)
+
+        rows.sort(key=lambda row: row[1], reverse=True)
+
+        self._show(rows, frames)
+        self._write(rows, frames)
+        return task.again
+
+    def _show(self, rows, frames):
+        """Show the top task families on the screen.
+
+        Args:
+            rows (list): Task families stats, sorted by time.
+            frames (int): Number of frames in the report period.
+        """
+        lines = [
+            "Tasks, ms per frame ({fps:.0f} fps, {total:.2f} ms):".format(
+                fps=frames / REPORT_PERIOD,
+                total=sum(row[1] for row in rows),
+            )
+        ]
+        for family, spent, calls in rows[:TOP_NUM]:
+            lines.append(
+                "{family}: {spent:.3f} ({calls:.1f} calls)".format(
+                    family=family, spent=spent, calls=calls
+                )
+            )
+
+        self._text.setText("\n".join(lines))
+
+    def _write(self, rows, frames):
+        """Write the task families stats into the trace file.
+
+        Args:
+            rows (list): Task families stats.
+            frames (int): Number of frames in the report period.
+        """
+        if self._rows + len(rows) > TRACE_MAX_ROWS:
+            self._start_trace()
+
+        now = round(time.time(), 3)
+        with open(TRACE_FILE, "a", newline="") as trace:
+            writer = csv.writer(trace)
+            for family, spent, calls in rows:
+                writer.writerow((now, family, round(spent, 4), round(calls, 2), frames))
+
+        self._rows += len(rows)
@@ -0,0 +1,428 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Game saves API.
+
+Every save slot is a single file: a header with the format version,
+the slot info shown in the main menu, and then the compressed game
+description and world map. In the
+world map every model name is stored once in the names table, and
+environment layouts are stored as seeds, from which blocks derive
+their models arrangement.
+
+Saves made while playing are written in a background thread, so
+that the game doesn't freeze while compressing and writing them.
+"""
+import copy
+import os
+import pickle
+import random
+import shelve
+import struct
+import threading
+import traceback
+import zlib
+
+MAGIC = b"FOSAVE"
+VERSION = 3
+HEADER = struct.Struct("<6sH")
+# size of the pickled slot info
+INFO_HEADER = struct.Struct("<I")
+SAVE_FILE = "saves/save{}.fo"
+# shelve files, in which the previous game versions kept saves
+LEGACY_FILES = (
+    "saves/save{}.dat",
+    "saves/save{}.bak",
+    "saves/save{}.dir",
+    "saves/world{}.dat",
+    "saves/world{}.bak",
+    "saves/world{}.dir",
+)
+# block description flags
+IS_CITY = 1
+IS_RUSTY = 2
+IS_STENCHY = 4
+IS_STATION = 8
+IS_ET_LAYOUT = 16
+# size of the data chunks to compress at once
+CHUNK_SIZE = 1 << 16
+
+
+def exists(num):
+    """Indicates if a saved game exists in the given slot.
+
+    Args:
+        num (int): The save slot number.
+
+    Returns:
+        bool: True if a valid game save exists, False otherwise.
+    """
+    if os.path.exists(SAVE_FILE.format(num)):
+        return True
+
+    return all(os.path.exists(path.format(num)) for path in LEGACY_FILES)
+
+
+def _slot_info(game):
+    """Build the save slot info to show in the main menu.
+
+    Args:
+        game (dict): The game description.
+
+    Returns:
+        dict: The save time, the Train miles and the crew classes numbers.
+    """
+    classes = [char["class"] for char in game["team"]]
+    return {
+        "save_time": game["save_time"],
+        "miles": game["train"]["miles"],
+        "chars": (
+            classes.count("soldier"),
+            classes.count("raider"),
+            classes.count("anarchist"),
+        ),
+    }
+
+
+def _pack_map(world_map):
+    """Pack the world map description.
+
+    Args:
+        world_map (dict): The main line blocks descriptions and the branches.
+
+    Returns:
+        dict: Packed world map.
+    """
+    names = []
+    indexes = {}
+
+    def intern(name):
+        if name not in indexes:
+            indexes[name] = len(names)
+            names.append(name)
+
+        return indexes[name]
+
+    blocks = []
+    for desc in world_map["main_line"]:
+        blocks.append(
+            (
+                intern(desc["name"]),
+                desc["id"],
+                desc["branch"],
+                dict(desc["directions"]),
+                desc["outing_available"],
+                (IS_CITY if desc["is_city"] else 0)
+                | (IS_RUSTY if desc["is_rusty"] else 0)
+                | (IS_STENCHY if desc["is_stenchy"] else 0)
+                | (IS_STATION if desc["is_station"] else 0)
+                | (IS_ET_LAYOUT if desc["et_layout"] else 0),
+                desc["station_side"],
+                intern(desc["l_surface"]),
+                intern(desc["r_surface"]),
+                desc["l_angle"],
+                desc["r_angle"],
+                desc["seed"],
+            )
+        )
+
+    return {
+        "names": names,
+        "blocks": blocks,
+        "branches": copy.deepcopy(world_map["branches"]),
+    }
+
+
+def _unpack_map(packed, version):
+    """Unpack the world map description.
+
+    Version 1 saves kept the full environment layouts
+    instead of seeds. These layouts are not migrated:
+    the blocks get new seeds, so their environment is
+    generated anew after the migration.
+
+    Args:
+        packed (dict): Packed world map.
+        version (int): The save file format version.
+
+    Returns:
+        dict: The main line blocks descriptions and the branches.
+    """
+    names = packed["names"]
+
+    main_line = []
+    for block in packed["blocks"]:
+        (
+            name,
+            id_,
+            branch,
+            directions,
+            outing_available,
+            flags,
+            station_side,
+            l_surface,
+            r_surface,
+            l_angle,
+            r_angle,
+            seed,
+        ) = block
+
+        if version == 1:
+            seed = random.getrandbits(32)
+            flags |= IS_ET_LAYOUT if "surface_en1" in names[l_surface] else 0
+
+        main_line.append(
+            {
+                "name": names[name],
+                "id": id_,
+                "branch": branch,
+                "directions": directions,
+                "outing_available": outing_available,
+                "is_city": bool(flags & IS_CITY),
+                "is_rusty": bool(flags & IS_RUSTY),
+                "is_stenchy": bool(flags & IS_STENCHY),
+                "station_side": station_side,
+                "l_surface": names[l_surface],
+                "r_surface": names[r_surface],
+                "l_angle": l_angle,
+                "r_angle": r_angle,
+                "seed": seed,
+                "et_layout": bool(flags & IS_ET_LAYOUT),
+                "is_station": bool(flags & IS_STATION),
+            }
+        )
+
+    return {"main_line": main_line, "branches": packed["branches"]}
+
+
+def _read_legacy(num):
+    """Read a shelve save of the previous game versions.
+
+    Blocks of these saves kept their full environment layouts.
+    The layouts are not migrated: the blocks get new seeds, so
+    their environment is generated anew after the migration.
+
+    Args:
+        num (int): The save slot number.
+
+    Returns:
+        dict, dict: The game description, the world map description.
+    """
+    save = shelve.open("saves/save{}".format(num), "r")
+    game = dict(save)
+    save.close()
+
+    world_save = shelve.open("saves/world{}".format(num), "r")
+    world_map = {
+        "main_line": world_save["main_line"],
+        "branches": world_save["branches"],
+    }
+    world_save.close()
+
+    # blocks were saved with their full environment
+    # layouts, which are replaced with new seeds
+    for desc in world_map["main_line"]:
+        desc["seed"] = random.getrandbits(32)
+        desc["et_layout"] = "surface_en1" in desc["l_surface"]
+
+    # branches were saved with the blocks objects, which
+    # had no records yet, so take ids from their pickled state
+    for branch in world_map["branches"]:
+        branch["blocks"][1:-1] = [
+            block.__dict__["id"] for block in branch["blocks"][1:-1]
+        ]
+
+    return game, world_map
+
+
+def _snapshot(game, world_map):
+    """Take a snapshot of the game save.
+
+    The snapshot doesn't share any mutable objects with
+    the game, so it can be written in another thread.
+
+    Args:
+        game (dict): The game description.
+        world_map (dict): The world map description.
+
+    Returns:
+        dict: The game save snapshot.
+    """
+    return {"game": copy.deepcopy(game), "world": _pack_map(world_map)}
+
+
+def _write_snapshot(num, snapshot, progress=None):
+    """Write the game save snapshot into the given slot.
+
+    The file is written under a temporary name, flushed to the
+    disk and then renamed, so a broken write will not corrupt
+    the save.
+
+    Args:
+        num (int): The save slot number.
+        snapshot (dict): The game save snapshot.
+        progress (callable):
+            Optional. Called with the share of the written data.
+    """
+    info = pickle.dumps(_slot_info(snapshot["game"]), protocol=4)
+    data = pickle.dumps(snapshot, protocol=4)
+    compressor = zlib.compressobj()
+
+    path = SAVE_FILE.format(num)
+    with open(path + ".tmp", "wb") as save:
+        save.write(HEADER.pack(MAGIC, VERSION))
+        save.write(INFO_HEADER.pack(len(info)))
+        save.write(info)
+
+        for start in range(0, len(data), CHUNK_SIZE):
+            save.write(compressor.compress(data[start : start + CHUNK_SIZE]))
+            if progress is not None:
+                progress(min(1, (start + CHUNK_SIZE) / len(data)))
+
+        save.write(compressor.flush())
+        save.flush()
+        os.fsync(save.fileno())
+
+    os.replace(path + ".tmp", path)
+
+
+def write(num, game, world_map):
+    """Write the game save into the given slot.
+
+    Args:
+        num (int): The save slot number.
+        game (dict): The game description.
+        world_map (dict): The world map description.
+    """
+    _write_snapshot(num, {"game": game, "world": _pack_map(world_map)})
+
+
+class SaveJob:
+    """Game save, written in a background thread.
+
+    The snapshot of the game is taken on creation, so the
+    game can go on right after that, while the save is
+    compressed and written in a worker thread.
+
+    Args:
+        num (int): The save slot number.
+        game (dict): The game description.
+        world_map (dict): The world map description.
+    """
+
+    def __init__(self, num, game, world_map):
+        self.num = num
+        self.progress = 0
+        self.error = None
+
+        self._thread = threading.Thread(
+            target=self._write,
+            args=(_snapshot(game, world_map),),
+            name="save_game_{}".format(num),
+        )
+        self._thread.start()
+
+    @property
+    def is_done(self):
+        """Indicates if the save is finished.
+
+        Returns:
+            bool: True if the save is written or failed.
+        """
+        return not self._thread.is_alive()
+
+    def _set_progress(self, share):
+        """Remember the share of the written save data.
+
+        Args:
+            share (float): Share of the written data.
+        """
+        self.progress = int(share * 100)
+
+    def _write(self, snapshot):
+        """Write the save snapshot. Runs in the worker thread.
+
+        Args:
+            snapshot (dict): The game save snapshot.
+        """
+        try:
+            _write_snapshot(self.num, snapshot, self._set_progress)
+        except Exception as exc:
+            self.error = exc
+            traceback.print_exc()
+
+    def wait(self):
+        """Wait until the save is finished."""
+        self._thread.join()
+
+
+def _read_header(save, path):
+    """Read and check the save file header.
+
+    Args:
+        save (io.BufferedReader): The opened save file.
+        path (str): The save file path.
+
+    Returns:
+        int: The save file format version.
+    """
+    magic, version = HEADER.unpack(save.read(HEADER.size))
+    if magic != MAGIC or version > VERSION:
+        raise ValueError("Unsupported save file format: " + path)
+
+    return version
+
+
+def read(num):
+    """Read the game save from the given slot.
+
+    Saves of the previous game versions are
+    converted into the current format on read.
+
+    Args:
+        num (int): The save slot number.
+
+    Returns:
+        dict, dict: The game description, the world map description.
+    """
+    path = SAVE_FILE.format(num)
+    if not os.path.exists(path):
+        write(num, *_read_legacy(num))
+
+    with open(path, "rb") as save:
+        version = _read_header(save, path)
+        if version >= 3:
+            (size,) = INFO_HEADER.unpack(save.read(INFO_HEADER.size))
+            save.seek(size, os.SEEK_CUR)
+
+        data = pickle.loads(zlib.decompress(save.read()))
+
+    game, world_map = data["game"], _unpack_map(data["world"], version)
+    if version < VERSION:
+        write(num, game, world_map)
+
+    return game, world_map
+
+
+def read_info(num):
+    """Read the save slot info to show in the main menu.
+
+    Only the slot info is read, not the whole save.
+
+    Args:
+        num (int): The save slot number.
+
+    Returns:
+        dict: The save time, the Train miles and the crew classes numbers.
+    """
+    path = SAVE_FILE.format(num)
+    if os.path.exists(path):
+        with open(path, "rb") as save:
+            if _read_header(save, path) >= 3:
+                (size,) = INFO_HEADER.unpack(save.read(INFO_HEADER.size))
+                return pickle.loads(save.read(size))
+
+    # saves of the previous game versions
+    # don't have the slot info until converted
+    return _slot_info(read(num)[0])
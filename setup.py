@@ -27,7 +27,9 @@ setup(
                 "**/*.ptf",
                 "**/*.ttf",
             ],
-            "include_modules": {"*": ["__builtin__", "shelve", "dbm"]},
+            # languages are imported dynamically, so
+            # they must be included into the build explicitly
+            "include_modules": {"*": ["__builtin__", "shelve", "dbm", "languages.*"]},
             "gui_apps": {"Forward Only": "main.py"},
             "plugins": ["pandagl", "p3fmod_audio", "p3openal_audio"],
         }
@@ -0,0 +1,138 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Headless deterministic game simulation.
+
+Plays the game without a window and sounds on a fixed-step
+clock, so that the same seed always gives the same game. Can
+be used to reproduce bugs and to profile the game systems:
+
+    python simulation.py --seed 7 --blocks 100
+"""
+import argparse
+import json
+import time
+
+from main import ForwardOnly
+
+# simulated seconds without a passed block, after
+# which the Train is considered stopped for good
+STALL_TIME = 120
+
+
+class Simulation(ForwardOnly):
+    """The game, which plays itself in headless mode.
+
+    All the game systems (the world, units and the Train) draw from
+    the single game random generator, so seeding it makes the whole
+    game reproducible. Every frame is simulated as 1 / frame_rate
+    seconds long, whatever time it actually took to process.
+
+    Args:
+        seed (int): Random generator seed.
+        frame_rate (int): Optional. Simulated frames per second.
+    """
+
+    def __init__(self, seed, frame_rate=30):
+        ForwardOnly.__init__(self, headless=True, seed=seed)
+
+        globalClock.setFrameRate(frame_rate)  # noqa: F821
+        # there is no player to read the tutorial
+        self.game_config.tutorial_enabled = False
+
+        self.blocks_passed = 0
+        self._block_time = 0
+
+    @property
+    def state(self):
+        """The simulated game state.
+
+        Two simulations with the same seed must have equal states.
+
+        Returns:
+            dict: The main game values.
+        """
+        return {
+            "blocks_passed": self.blocks_passed,
+            "time": round(globalClock.getFrameTime(), 3),  # noqa: F821
+            "block": self.current_block.id,
+            "durability": self.train.durability,
+            "enemy_score": self.world.enemy.score,
+            "dollars": self.dollars,
+            "chars": {
+                id_: (char.health, char.energy)
+                for id_, char in sorted(self.team.chars.items())
+            },
+            "rng": self.rng.random(),
+        }
+
+    def _move_along_block(self):
+        """Move the locomotive along the current world block.
+
+        Counts the passed blocks.
+        """
+        ForwardOnly._move_along_block(self)
+
+        self.blocks_passed += 1
+        self._block_time = globalClock.getFrameTime()  # noqa: F821
+
+    def run_blocks(self, num, chosen_crew="soldiers"):
+        """Start a new game and simulate it for the given number of blocks.
+
+        The simulation stops earlier, if the Train stopped
+        moving for good (for example, the game is over).
+
+        Args:
+            num (int): Number of the world blocks to pass.
+            chosen_crew (str): Optional. The initial crew type.
+
+        Returns:
+            int: Number of the actually passed blocks.
+        """
+        self.start_new_game(chosen_crew)
+        self.start_game()
+
+        clock = globalClock  # noqa: F821
+        while self.blocks_passed < num:
+            self.taskMgr.step()
+
+            if clock.getFrameTime() - self._block_time > STALL_TIME:
+                break
+
+        return self.blocks_passed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless game simulation.")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--blocks", type=int, default=100, help="blocks to pass")
+    parser.add_argument("--fps", type=int, default=30, help="simulated frame rate")
+    parser.add_argument(
+        "--crew",
+        default="soldiers",
+        choices=("soldiers", "raiders", "anarchists"),
+        help="initial crew type",
+    )
+    parser.add_argument(
+        "--state", action="store_true", help="print the final game state"
+    )
+    args = parser.parse_args()
+
+    sim = Simulation(args.seed, args.fps)
+
+    start = time.perf_counter()
+    passed = sim.run_blocks(args.blocks, args.crew)
+    spent = time.perf_counter() - start
+
+    print(
+        "{passed} blocks passed in {spent:.2f} s ({rate:.1f} blocks/s), "
+        "{sim_time:.0f} s simulated".format(
+            passed=passed,
+            spent=spent,
+            rate=passed / spent,
+            sim_time=globalClock.getFrameTime(),  # noqa: F821
+        )
+    )
+    if args.state:
+        print(json.dumps(sim.state))
@@ -0,0 +1,18 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Common tests configurations.
+"""
+import os
+
+from panda3d.core import Filename, getModelPath
+
+# the game modules import each other cyclically, so they
+# must be imported in the same order, as the game does
+import main  # noqa: F401
+
+# assets are looked for relative to the game directory
+getModelPath().prependDirectory(
+    Filename.fromOsSpecific(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
@@ -0,0 +1,33 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Enemy units actors pool tests.
+"""
+from panda3d.core import NodePath
+
+from units.enemy.pool import ActorsPool
+
+
+def test_take_release():
+    """A released actor is reset and reused."""
+    pool = ActorsPool()
+
+    actor = pool.take("skinhead_shooter1")
+    own_children = actor.getNumChildren()
+
+    actor.reparentTo(NodePath("train"))
+    actor.attachNewNode("gun_fire")
+    actor.setPos(1, 2, 3)
+    actor.setColorScale(1, 0, 0, 1)
+    actor.hide()
+
+    pool.release("skinhead_shooter1", actor)
+
+    assert actor.getParent().isEmpty()
+    assert actor.getNumChildren() == own_children
+    assert actor.getPos() == (0, 0, 0)
+    assert not actor.hasColorScale()
+    assert not actor.isHidden()
+
+    assert pool.take("skinhead_shooter1") is actor
@@ -0,0 +1,28 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Enemy units formation tests.
+"""
+import builtins
+import random
+from unittest import mock
+
+from units.enemy.formation import LANES, Formation
+
+
+def test_lanes_overflow(monkeypatch):
+    """When all the lanes are taken, a unit can share a random one."""
+    monkeypatch.setattr(builtins, "taskMgr", mock.Mock(), raising=False)
+    monkeypatch.setattr(
+        builtins, "base", mock.Mock(rng=random.Random(0)), raising=False
+    )
+    formation = Formation()
+
+    lanes = {formation.take_lane("front") for _ in range(LANES["front"][2] * 2)}
+    assert None not in lanes
+    assert formation.take_lane("front") is None
+    assert formation.random_lane("front") in lanes
+
+    formation.clear()
+    taskMgr.remove.assert_called_once_with(formation._task)  # noqa: F821
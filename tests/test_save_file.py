@@ -0,0 +1,43 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Game saves tests.
+"""
+import os
+import shutil
+
+import save_file
+
+# shelve save of the previous game version, in which
+# branches are kept with the pickled Block objects
+LEGACY_SAVE = os.path.join(os.path.dirname(__file__), "data", "legacy_save")
+
+
+def test_read_legacy(tmp_path, monkeypatch):
+    """A legacy save is converted into the current format."""
+    shutil.copytree(LEGACY_SAVE, tmp_path / "saves")
+    monkeypatch.chdir(tmp_path)
+
+    game, world_map = save_file.read(1)
+
+    assert os.path.exists(save_file.SAVE_FILE.format(1))
+    assert game["cur_blocks"] == (4, 5, 6)
+    assert game["dollars"] == 320
+
+    assert [block["id"] for block in world_map["main_line"]] == list(range(16))
+    for block in world_map["main_line"]:
+        assert "env_mods" not in block
+        assert isinstance(block["seed"], int)
+
+    assert world_map["main_line"][1]["et_layout"]
+    assert not world_map["main_line"][2]["et_layout"]
+    assert world_map["main_line"][6]["station_side"] == "l"
+    assert world_map["main_line"][5]["outing_available"] == "Looting"
+
+    (branch,) = world_map["branches"]
+    assert branch["blocks"] == ["l_fork", 12, 13, 14, 15, "l_fork"]
+
+    # the converted save is read as is
+    assert save_file.read(1) == (game, world_map)
+    assert save_file.read_info(1)["chars"] == (1, 1, 0)
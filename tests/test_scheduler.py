@@ -0,0 +1,98 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Units delayed actions scheduler tests.
+"""
+import builtins
+from unittest import mock
+
+import pytest
+
+from units.scheduler import TICK, TimerWheel
+
+
+@pytest.fixture
+def wheel(monkeypatch):
+    """Timer wheel with a manually moved clock."""
+    clock = mock.Mock()
+    clock.getFrameTime.return_value = 0
+    monkeypatch.setattr(builtins, "globalClock", clock, raising=False)
+    monkeypatch.setattr(builtins, "taskMgr", mock.Mock(), raising=False)
+
+    return TimerWheel()
+
+
+def _move(wheel, delay):
+    """Move the clock forward and tick the wheel.
+
+    Args:
+        wheel (units.scheduler.TimerWheel): The wheel to tick.
+        delay (float): Time to move the clock by.
+    """
+    globalClock.getFrameTime.return_value += delay  # noqa: F821
+    wheel._turn(mock.Mock())
+
+
+def test_cancel_in_same_tick(wheel):
+    """An action cancelled by an earlier action of the same tick isn't done."""
+    calls = []
+
+    def die():
+        calls.append("die")
+        wheel.cancel("enemy_2", "_shoot")
+
+    wheel.do_later(0.1, die, "enemy_1", "die", args=[])
+    wheel.do_later(0.1, calls.append, "enemy_2", "_shoot", args=["shoot"])
+
+    _move(wheel, 0.1 + TICK)
+    assert calls == ["die"]
+
+
+def test_replace_in_same_tick(wheel):
+    """An action replaced by an earlier action of the same tick is postponed."""
+    calls = []
+
+    def aim():
+        calls.append("aim")
+        wheel.do_later(1, calls.append, "enemy_2", "_shoot", args=["shoot"])
+
+    wheel.do_later(0.1, aim, "enemy_1", "_aim", args=[])
+    wheel.do_later(0.1, calls.append, "enemy_2", "_shoot", args=["miss"])
+
+    _move(wheel, 0.1 + TICK)
+    assert calls == ["aim"]
+
+    _move(wheel, 1 + TICK)
+    assert calls == ["aim", "shoot"]
+
+
+def test_repeat(wheel):
+    """An action returning again is repeated with its new delay."""
+    calls = []
+
+    def reduce_energy(task):
+        calls.append(task.delayTime)
+        task.delayTime = 2
+        return task.again if len(calls) < 2 else task.done
+
+    wheel.do_later(1, reduce_energy, "student1", "_reduce_energy")
+
+    _move(wheel, 1 + TICK)
+    _move(wheel, 2 + TICK)
+    _move(wheel, 2 + TICK)
+    assert calls == [1, 2]
+
+
+def test_profiled_actions(wheel):
+    """Every action is measured under its own name."""
+    wheel._profiler = mock.Mock()
+    wheel._profiler.timed.side_effect = lambda func, name: func
+
+    wheel.do_later(1, print, "enemy_1", "_shoot", args=[])
+    wheel.do_later(1, print, "student1", "energy_spend", args=[])
+
+    assert [call.args[1] for call in wheel._profiler.timed.call_args_list] == [
+        "enemy_1_shoot",
+        "student1_energy_spend",
+    ]
@@ -0,0 +1,52 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Headless game simulation tests.
+"""
+import json
+import os
+import subprocess
+import sys
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _simulate(seed, hash_seed):
+    """Simulate a game in a separate process.
+
+    Args:
+        seed (int): The game random generator seed.
+        hash_seed (int): Python hashing seed of the process.
+
+    Returns:
+        dict: The final game state.
+    """
+    out = subprocess.run(
+        (
+            sys.executable,
+            "simulation.py",
+            "--seed",
+            str(seed),
+            "--blocks",
+            "60",
+            "--state",
+        ),
+        cwd=GAME_DIR,
+        env=dict(os.environ, PYTHONHASHSEED=str(hash_seed)),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+def test_same_seed_same_game():
+    """Simulations with the same seed end in the same state."""
+    state = _simulate(3, 1)
+
+    assert state["blocks_passed"] == 60
+    # the enemy attacked at least once
+    assert state["enemy_score"] > 3
+    assert _simulate(3, 2) == state
@@ -0,0 +1,40 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Surface models vertices cache tests.
+"""
+import builtins
+from unittest import mock
+
+import numpy
+
+from world import World
+from world.vertices import SurfaceVertices
+
+
+def _index():
+    """Build a small vertices index."""
+    return SurfaceVertices(
+        numpy.zeros((2, 3)), {"wide": numpy.arange(2), "narrow": numpy.arange(1)}
+    )
+
+
+def test_cache_reused(tmp_path, monkeypatch):
+    """Vertices of an unchanged surface model are read only once."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(builtins, "loader", mock.Mock(), raising=False)
+
+    (tmp_path / "models" / "bam").mkdir(parents=True)
+    (tmp_path / "models" / "bam" / "surface1.bam").write_bytes(b"surface")
+
+    world = mock.Mock()
+    world._read_vertices.return_value = _index()
+
+    World._load_surf_vertices(world)
+    assert world._read_vertices.call_count == 1
+    assert (tmp_path / "cache" / "surf_vertices.npz").exists()
+
+    surf_vertices = World._load_surf_vertices(world)
+    assert world._read_vertices.call_count == 1
+    assert surf_vertices["models/bam/surface1.bam"].squares["narrow"].tolist() == [0]
@@ -8,7 +8,6 @@ Includes the systems of the locomotive loading, preparations,
 animation, sounds, lights, physics, upgrades.
 """
 import copy
-import random
 
 from direct.actor.Actor import Actor
 from direct.particles.ParticleEffect import ParticleEffect
@@ -19,7 +18,7 @@ from controls import TrainController
 from gui.train import TrainGUI
 from utils import address, take_random
 
-from .part import RestPart, TrainPart
+from .part import RestPart, ShootingRanges, TrainPart
 from .upgrades import (
     ArmorPlate,
     ClusterHowitzer,
@@ -97,6 +96,14 @@ class Train:
             ),
             "part_rest": RestPart(self.model, "part_rest"),
         }
+        self._shooting_ranges = ShootingRanges(
+            self.model,
+            [
+                self.parts["part_left"],
+                self.parts["part_right"],
+                self.parts["part_front"],
+            ],
+        )
 
         self._lights = self._set_lights()
         self.lights_on = False
@@ -567,7 +574,7 @@ class Train:
             self.durability -= 2
 
             if not self._creak_snd_cooldown:
-                random.choice(self._creak_snds).play()
+                base.rng.choice(self._creak_snds).play()  # noqa: F821
                 self._creak_snd_cooldown = True
 
                 taskMgr.doMethodLater(  # noqa: F821
@@ -831,14 +838,18 @@ class Train:
                 (self._armor_plate.cur_position == "left" and not right_side)
                 or (self._armor_plate.cur_position == "right" and right_side)
             ):
-                x, y_range, z_range = random.choice(PLATE_SHOT_COORS)
+                x, y_range, z_range = base.rng.choice(PLATE_SHOT_COORS)  # noqa: F821
             else:
-                x, y_range, z_range = random.choice(SHOT_COORS)
+                x, y_range, z_range = base.rng.choice(SHOT_COORS)  # noqa: F821
 
             if not right_side:
                 x = -x
 
-            shot.setPos(x, random.uniform(*y_range), random.uniform(*z_range))
+            shot.setPos(
+                x,
+                base.rng.uniform(*y_range),  # noqa: F821
+                base.rng.uniform(*z_range),  # noqa: F821
+            )
             shot.start(self.model, self.model)
             shot.softStart()
 
@@ -886,7 +897,7 @@ class Train:
         """Show turning GUI.
 
         Args:
-            fork (world.block.Block): Fork block to turn on.
+            fork (world.block.BlockRecord): Fork block to turn on.
             branch (str): Branch direction indicator: "l" or "r".
             invert (bool):
                 True if the Train is moving in the opposite
@@ -4,19 +4,25 @@ License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
 
 The locomotive parts API.
 """
+import numpy
 from panda3d.core import CollisionBox, CollisionNode, CollisionPolygon, Point3
-from const import MOUSE_MASK, NO_MASK, SHOT_RANGE_MASK
+from const import MOUSE_MASK, NO_MASK
 from utils import address, take_random
 
+# a part shooting range: a rectangle in the part
+# coordinates, within which the part characters see enemies
+SHOOT_RANGE = ((-0.4, -0.06), (0.4, 1))
+# enemy units are considered as circles of this radius
+ENEMY_RADIUS = 0.05
+
 
 class TrainPart:
     """A locomotive part where characters can be set.
 
-    Contains characters set on this part and tracks enemies
-    within its shooting range. Has a manipulating arrow,
-    which can be used to move a character to this part.
-    Also includes a "shooting range" collider - area, on
-    which characters can choose their enemy unit targets.
+    Contains characters set on this part and enemies
+    within its shooting range - area, on which characters
+    can choose their enemy unit targets. Has a manipulating
+    arrow, which can be used to move a character to this part.
 
     Args:
         parent (panda3d.core.NodePath):
@@ -38,22 +44,12 @@ class TrainPart:
         # enemies within shooting range of this part
         self.enemies = []
         self.angle = angle
+        # the shooting range origin on the Train
+        self.range_pos = (arrow_pos[0], arrow_pos[1])
         self._cells = positions
 
         self._arrow = self._prepare_arrow(name, arrow_pos)
 
-        # shooting range for this TrainPart
-        col_node = CollisionNode("shoot_zone_" + name)
-        col_node.setFromCollideMask(NO_MASK)
-        col_node.setIntoCollideMask(SHOT_RANGE_MASK)
-        col_node.addSolid(CollisionBox(Point3(-0.4, -0.06, 0), Point3(0.4, 1, 0.2)))
-        col_np = self.parent.attachNewNode(col_node)
-        col_np.setPos(arrow_pos[0], arrow_pos[1], 0)
-        col_np.setH(angle)
-
-        base.accept("into-shoot_zone_" + name, self.enemy_came)  # noqa: F821
-        base.accept("out-shoot_zone_" + name, self.enemy_leave)  # noqa: F821
-
     @property
     def free_cells(self):
         """The number of free cells on this part.
@@ -94,23 +90,25 @@ class TrainPart:
         arrow.attachNewNode(col_node)
         return arrow
 
-    def enemy_came(self, event):
-        """Enemy unit entered this part shooting range."""
-        enemy = base.world.enemy.active_units.get(  # noqa: F821
-            event.getFromNodePath().getName()
-        )
-        if enemy is not None and not enemy.is_dead:
-            self.enemies.append(enemy)
-            enemy.enter_the_part(self)
-
-    def enemy_leave(self, event):
-        """Enemy unit leaved this part shooting range."""
-        enemy = base.world.enemy.active_units.get(  # noqa: F821
-            event.getFromNodePath().getName()
-        )
-        if enemy is not None:
+    def enemy_came(self, enemy):
+        """Enemy unit entered this part shooting range.
+
+        Args:
+            enemy (units.enemy.enemy_unit.EnemyUnit): The enemy unit.
+        """
+        self.enemies.append(enemy)
+        enemy.enter_the_part(self)
+
+    def enemy_leave(self, enemy):
+        """Enemy unit leaved this part shooting range.
+
+        Args:
+            enemy (units.enemy.enemy_unit.EnemyUnit): The enemy unit.
+        """
+        if enemy in self.enemies:
             self.enemies.remove(enemy)
-            enemy.leave_the_part(self)
+
+        enemy.leave_the_part(self)
 
     def give_cell(self, character):
         """Choose a non taken cell.
@@ -222,3 +220,82 @@ class RestPart:
     def show_arrow(self):
         """Rest parts doesn't have manipulating arrows."""
         pass
+
+
+class ShootingRanges:
+    """Tracker of enemies within the Train parts shooting ranges.
+
+    Positions of all the enemy units relative to the Train are
+    checked against all the shooting ranges in a single pass
+    every frame, and the parts are notified about changes.
+
+    Args:
+        train_mod (panda3d.core.NodePath): The Train model, the parts parent.
+        parts (list): The Train parts with shooting ranges.
+    """
+
+    def __init__(self, train_mod, parts):
+        self._train_mod = train_mod
+        self._parts = parts
+        self._origins = numpy.array([part.range_pos for part in parts])
+
+        angles = numpy.radians([part.angle for part in parts])
+        self._cos = numpy.cos(angles)
+        self._sin = numpy.sin(angles)
+
+        # shooting ranges, within which every tracked unit is
+        self._in_range = {}
+        self._out_of_range = numpy.zeros(len(parts), dtype=bool)
+
+        taskMgr.add(self._track, "track_shooting_ranges")  # noqa: F821
+
+    def _track(self, task):
+        """Detect enemies entering and leaving the shooting ranges."""
+        enemy = getattr(getattr(base, "world", None), "enemy", None)  # noqa: F821
+        if enemy is None:
+            return task.cont
+
+        units = [unit for unit in enemy.active_units.values() if not unit.is_dead]
+        # dead and removed units don't leave the ranges
+        ids = {unit.id for unit in units}
+        for id_ in self._in_range.keys() - ids:
+            self._in_range.pop(id_)
+
+        if not units:
+            return task.cont
+
+        delta = (
+            numpy.array(
+                [tuple(unit.model.getPos(self._train_mod))[:2] for unit in units]
+            )[:, None, :]
+            - self._origins
+        )
+        # units coordinates in every part coordinates
+        x = delta[..., 0] * self._cos + delta[..., 1] * self._sin
+        y = delta[..., 1] * self._cos - delta[..., 0] * self._sin
+
+        (min_x, min_y), (max_x, max_y) = SHOOT_RANGE
+        dist_x = numpy.maximum(numpy.maximum(min_x - x, x - max_x), 0)
+        dist_y = numpy.maximum(numpy.maximum(min_y - y, y - max_y), 0)
+        in_range = dist_x**2 + dist_y**2 <= ENEMY_RADIUS**2
+
+        was_in_range = numpy.array(
+            [self._in_range.get(unit.id, self._out_of_range) for unit in units]
+        )
+        for num in numpy.flatnonzero((in_range != was_in_range).any(axis=1)):
+            unit = units[num]
+            self._in_range[unit.id] = in_range[num]
+
+            for part, was_in, is_in in zip(
+                self._parts, was_in_range[num], in_range[num]
+            ):
+                if was_in and not is_in:
+                    part.enemy_leave(unit)
+
+            for part, was_in, is_in in zip(
+                self._parts, was_in_range[num], in_range[num]
+            ):
+                if is_in and not was_in:
+                    part.enemy_came(unit)
+
+        return task.cont
@@ -8,8 +8,6 @@ Upgrades can be active and passive. Passive upgrades give some permanent
 effects. Acitve uprades (weapons mostly) are manually controlled by
 player, otherwise doesn't give any effects.
 """
-import random
-
 from direct.actor.Actor import Actor
 from direct.interval.IntervalGlobal import (
     Func,
@@ -287,6 +285,7 @@ class GrenadeLauncher:
     def _end_aiming(self):
         """Stop aiming and disable aiming GUI."""
         self._range_col_np.removeNode()
+        base.common_ctrl.refresh_collisions()  # noqa: F821
         base.common_ctrl.set_mouse_events()  # noqa: F82
 
     def _explode_grenade(self, grenade_pos):
@@ -411,6 +410,7 @@ class GrenadeLauncher:
             )
         )
         self._range_col_np = base.train.model.attachNewNode(col_node)  # noqa: F821
+        base.common_ctrl.refresh_collisions()  # noqa: F821
 
         base.accept("mouse1", self._shot)  # noqa: F821
         base.accept("mouse_ray-into", self._move_sight)  # noqa: F821
@@ -461,8 +461,8 @@ class ClusterHowitzer:
             self._smokes.append(smoke)
 
             snd = loader.loadSfx("sounds/combat/bomb_explosion1.ogg")  # noqa: F821
-            snd.setVolume(random.uniform(0.1, 0.15))
-            snd.setPlayRate(random.uniform(0.8, 1))
+            snd.setVolume(base.rng.uniform(0.1, 0.15))  # noqa: F821
+            snd.setPlayRate(base.rng.uniform(0.8, 1))  # noqa: F821
             self._explosion_snds.append(snd)
 
             hole = loader.loadModel(address("ground_hole"))  # noqa: F821
@@ -561,7 +561,9 @@ class ClusterHowitzer:
             self._bombs.append((bomb, smoke))
             move_par.append(
                 LerpPosInterval(
-                    bomb, random.uniform(0.45, 0.7), (*self._coors[num], 0)
+                    bomb,
+                    base.rng.uniform(0.45, 0.7),  # noqa: F821
+                    (*self._coors[num], 0),
                 ),
             )
 
@@ -636,7 +638,7 @@ class ClusterHowitzer:
             self._smokes[num].softStart()
 
             taskMgr.doMethodLater(  # noqa: F82
-                random.uniform(0, 0.5),
+                base.rng.uniform(0, 0.5),  # noqa: F821
                 self._explosion_snds[num].play,
                 "play_explosion_snd",
                 extraArgs=[],
@@ -712,8 +714,10 @@ class ClusterHowitzer:
     def _move_sights(self, task=None):
         """Randomly periodically move aiming sights within shoot-range."""
         for ind, sight in enumerate(self._sights):
-            x = random.uniform(*random.choice(((-1.1, -0.15), (1.1, 0.15))))
-            y = random.uniform(-0.11, 0.5)
+            x = base.rng.uniform(  # noqa: F821
+                *base.rng.choice(((-1.1, -0.15), (1.1, 0.15)))  # noqa: F821
+            )
+            y = base.rng.uniform(-0.11, 0.5)  # noqa: F821
 
             self._coors[ind] = (x, y)
             sight.setPos(x, y, 0.01)
@@ -823,6 +827,7 @@ class MachineGun:
         taskMgr.remove("aim_machine_gun")  # noqa: F82
 
         self._range_col_np.removeNode()
+        base.common_ctrl.refresh_collisions()  # noqa: F821
         base.common_ctrl.set_mouse_events()  # noqa: F82
 
         LerpHprInterval(self._model, 0.5, (0, 0, 0)).start()
@@ -836,8 +841,8 @@ class MachineGun:
                     self._sight,
                     0.125,
                     (
-                        pos.getX() + random.uniform(-0.05, 0.05),
-                        pos.getY() + random.uniform(-0.05, 0.05),
+                        pos.getX() + base.rng.uniform(-0.05, 0.05),  # noqa: F821
+                        pos.getY() + base.rng.uniform(-0.05, 0.05),  # noqa: F821
                         0,
                     ),
                 ),
@@ -888,6 +893,7 @@ class MachineGun:
             )
         )
         self._range_col_np = base.train.model.attachNewNode(col_node)  # noqa: F821
+        base.common_ctrl.refresh_collisions()  # noqa: F821
 
         base.accept("mouse1", self._start_shooting)  # noqa: F821
         base.accept("mouse1-up", self._stop_shooting)  # noqa: F821
@@ -5,7 +5,6 @@ License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
 Characters (player units) API.
 """
 import copy
-import random
 
 from direct.actor.Actor import Actor
 from direct.interval.IntervalGlobal import (
@@ -14,7 +13,6 @@ from direct.interval.IntervalGlobal import (
     LerpScaleInterval,
     Sequence,
 )
-from direct.particles.ParticleEffect import ParticleEffect
 from panda3d.core import CollisionCapsule
 
 from const import MOUSE_MASK, NO_MASK
@@ -23,7 +21,9 @@ from utils import address, chance, take_random
 
 from units.shooter import Shooter
 from units.unit import Unit
+from . import traits
 from .character_data import CLASSES, NAMES
+from .traits import Trait
 
 # cohesion relation indicator colors
 RELATION_COLORS = {
@@ -88,23 +88,21 @@ class Character(Shooter, Unit):
             self._energy = desc["energy"]
             self.is_diseased = desc["is_diseased"]
             self.get_well_score = desc["get_well_score"]
-            self.traits = desc["traits"]
-            self.disabled_traits = desc["disabled_traits"]
+            self.traits = traits.load(desc["traits"])
+            self.disabled_traits = traits.load(desc["disabled_traits"])
 
             if self.is_diseased:
-                taskMgr.doMethodLater(  # noqa: F821
-                    60, self.get_well, self.id + "_get_well"
-                )
+                self._do_later(60, self.get_well, "_get_well")
         else:
             self._energy = 100
             self.is_diseased = False
             self.get_well_score = 0
 
-            self.disabled_traits = []
-            self.traits = []
-            traits = copy.copy(base.labels.TRAITS)  # noqa: F821
-            for _ in range(random.randint(0, 2)):
-                self.traits.append(random.choice(take_random(traits)))
+            self.disabled_traits = traits.NO_TRAITS
+            self.traits = traits.NO_TRAITS
+            pairs = list(traits.PAIRS)
+            for _ in range(base.rng.randint(0, 2)):  # noqa: F821
+                self.traits |= base.rng.choice(take_random(pairs))  # noqa: F821
 
     @property
     def clear_delay(self):
@@ -124,7 +122,7 @@ class Character(Shooter, Unit):
         Returns:
             float: Damage one-time made by this character.
         """
-        return random.uniform(*self.damage_range) * self.damage_factor
+        return base.rng.uniform(*self.damage_range) * self.damage_factor  # noqa: F821
 
     @property
     def damage_factor(self):
@@ -139,7 +137,7 @@ class Character(Shooter, Unit):
         factor = self._team.calc_cohesion_factor(self.current_part.chars, self)
         if (
             # Loner
-            base.labels.TRAITS[4][1] in self.traits  # noqa: F821
+            Trait.LONER in self.traits
             and len(self.current_part.chars) == 1
         ):
             return factor * 1.3
@@ -163,8 +161,8 @@ class Character(Shooter, Unit):
             "health": self.health,
             "energy": self.energy,
             "place": self.current_part.name,
-            "traits": self.traits,
-            "disabled_traits": self.disabled_traits,
+            "traits": int(self.traits),
+            "disabled_traits": int(self.disabled_traits),
             "is_diseased": self.is_diseased,
             "get_well_score": self.get_well_score,
         }
@@ -194,15 +192,15 @@ class Character(Shooter, Unit):
         Returns:
             float: Delay between shots in seconds.
         """
-        if base.labels.TRAITS[0][0] in self.traits:  # noqa: F821
+        if Trait.FAST_HANDS in self.traits:
             # Fast hands
-            return 1.1 + random.uniform(0.1, 0.8)
+            return 1.1 + base.rng.uniform(0.1, 0.8)  # noqa: F821
 
-        if base.labels.TRAITS[0][1] in self.traits:  # noqa: F821
+        if Trait.SNAIL in self.traits:
             # Snail
-            return 2 + random.uniform(0.1, 1.1)
+            return 2 + base.rng.uniform(0.1, 1.1)  # noqa: F821
 
-        return 1.7 + random.uniform(0.1, 0.9)
+        return 1.7 + base.rng.uniform(0.1, 0.9)  # noqa: F821
 
     @property
     def statuses(self):
@@ -213,7 +211,7 @@ class Character(Shooter, Unit):
         """
         statuses = []
         if base.world.sun.is_dark:  # noqa: F821
-            if base.labels.TRAITS[1][0] in self.traits:  # noqa: F821
+            if Trait.CAT_EYES in self.traits:
                 statuses.append(base.labels.STATUSES[0])  # noqa: F821
             elif base.train.lights_on:  # noqa: F821
                 if "Floodlights" not in base.train.upgrades:  # noqa: F821
@@ -231,14 +229,14 @@ class Character(Shooter, Unit):
             if factor != 1:
                 statuses.append(base.labels.STATUSES[4].format(factor))  # noqa: F821
 
-        if self.health < 50 and base.labels.TRAITS[2][1] in self.traits:  # noqa: F821
+        if self.health < 50 and Trait.HEMOPHOBIA in self.traits:
             statuses.append(base.labels.STATUSES[5])  # noqa: F821
 
         if self.is_diseased:
             statuses.append(base.labels.STATUSES[6])  # noqa: F821
 
         if (
-            base.labels.TRAITS[6][1] in self.traits  # noqa: F821
+            Trait.MOTION_SICKNESS in self.traits
             and base.train.ctrl.current_speed > 0.75  # noqa: F821
         ):
             statuses.append(base.labels.STATUSES[7])  # noqa: F821
@@ -298,29 +296,26 @@ class Character(Shooter, Unit):
 
         base.team.init_relations(self)  # noqa: F821
 
-        taskMgr.doMethodLater(  # noqa: F821
-            random.randint(40, 60), self._idle_animation, self.id + "_idle_anim"
+        self._do_later(
+            base.rng.randint(40, 60), self._idle_animation, "_idle_anim"  # noqa: F821
         )
         self._col_node = self._init_col_node(
             NO_MASK, MOUSE_MASK, CollisionCapsule(0, 0, 0, 0, 0, 0.035, 0.035)
         )
         self.shot_snd = self._set_shoot_snd(self.class_data["shot_snd"])
-        self._cough_snd = base.sound_mgr.loadSfx(  # noqa: F821
-            "sounds/{sex}_cough.ogg".format(sex=self.sex)
+        self._cough_snd = base.voices_mgr.load(  # noqa: F821
+            "sounds/{sex}_cough.ogg".format(sex=self.sex), self.model
         )
-        base.sound_mgr.attachSoundToObject(self._cough_snd, self.model)  # noqa: F821
-        self._die_snd = base.sound_mgr.loadSfx(  # noqa: F821
-            "sounds/combat/{sex}_death.ogg".format(sex=self.sex)
+        self._die_snd = base.voices_mgr.load(  # noqa: F821
+            "sounds/combat/{sex}_death.ogg".format(sex=self.sex), self.model
         )
-        base.sound_mgr.attachSoundToObject(self._die_snd, self.model)  # noqa: F821
-
         for i in range(1, 4):
-            yeah_snd1 = base.sound_mgr.loadSfx(  # noqa: F821
-                "sounds/{sex}_yes{num}.ogg".format(sex=self.sex, num=str(i))
+            self._yeah_snds.append(
+                base.voices_mgr.load(  # noqa: F821
+                    "sounds/{sex}_yes{num}.ogg".format(sex=self.sex, num=str(i)),
+                    self.model,
+                )
             )
-            base.sound_mgr.attachSoundToObject(yeah_snd1, self.model)  # noqa: F821
-
-            self._yeah_snds.append(yeah_snd1)
 
         if self.class_ == "soldier":
             z = 0.063 if self.sex == "male" else 0.062
@@ -332,30 +327,23 @@ class Character(Shooter, Unit):
         self._shoot_anim = self._set_shoot_anim(
             (0.004, 0.045, z), 97, self.class_data["shots_num"]
         )
-        taskMgr.doMethodLater(  # noqa: F821
-            self.class_data["energy_spend"],
-            self._reduce_energy,
-            self.id + "_reduce_energy",
+        self._do_later(
+            self.class_data["energy_spend"], self._reduce_energy, "_reduce_energy"
         )
         self._prepare_cohesion_particles()
         self._prepare_auras()
 
     def _prepare_cohesion_particles(self):
         """Prepare cohesion skills particle effects."""
-        effect = ParticleEffect()
-        effect.loadConfig("effects/recall_the_past.ptf")
-
-        self.effects["recall_the_past"] = {"length": 0.7, "effect": effect}
-
-        effect = ParticleEffect()
-        effect.loadConfig("effects/not_leaving_ours.ptf")
-
-        self.effects["not_leaving_ours"] = {"length": 2, "effect": effect}
-
-        effect = ParticleEffect()
-        effect.loadConfig("effects/common_rage.ptf")
-
-        self.effects["common_rage"] = {"length": 90, "effect": effect}
+        for name, length in (
+            ("recall_the_past", 0.7),
+            ("not_leaving_ours", 2),
+            ("common_rage", 90),
+        ):
+            self.effects[name] = {
+                "length": length,
+                "effect": base.effects_mgr.particles.acquire(name),  # noqa: F821
+            }
 
     def _prepare_auras(self):
         """Prepare cohesion skills aura effects."""
@@ -407,11 +395,11 @@ class Character(Shooter, Unit):
         self.effects[name]["effect"].start(self.model, self.model)
         self.effects[name]["effect"].softStart()
 
-        taskMgr.doMethodLater(  # noqa: F821
+        self._do_later(
             self.effects[name]["length"],
             self.effects[name]["effect"].softStop,
-            "stop_cohesion_effect",
-            extraArgs=[],
+            "_stop_" + name,
+            args=[],
         )
 
     def play_cohesion_aura(self, name):
@@ -425,7 +413,7 @@ class Character(Shooter, Unit):
 
     def play_yes(self):
         """Play a voice sound, when the character is chosen."""
-        random.choice(self._yeah_snds).play()
+        base.voices_mgr.play(base.rng.choice(self._yeah_snds))  # noqa: F821
 
     def stop_aura_effect(self, name):
         """Stop the given aura effect.
@@ -510,12 +498,13 @@ class Character(Shooter, Unit):
         effects = copy.deepcopy(effects)
         self.get_damage(-effects.pop("health", 0))
 
-        if "add_trait" in effects and len(self.traits + self.disabled_traits) < 3:
+        all_traits = self.traits | self.disabled_traits
+        if "add_trait" in effects and traits.count(all_traits) < 3:
             ind1, ind2 = effects["add_trait"]
-            trait = base.labels.TRAITS[ind1][ind2]  # noqa: F821
+            trait = traits.PAIRS[ind1][ind2]
 
-            if trait and trait not in self.traits + self.disabled_traits:
-                self.traits.append(trait)
+            if trait not in all_traits:
+                self.traits |= trait
                 base.char_gui.move_status_label(-1)  # noqa: F821
                 effects.pop("add_trait")
 
@@ -537,9 +526,7 @@ class Character(Shooter, Unit):
         LerpAnimInterval(self.model, 0.8, "stand", "stand_and_aim").start()
         self._current_anim = "stand_and_aim"
 
-        taskMgr.doMethodLater(  # noqa: F821
-            0.5, self._choose_target, self.id + "_choose_target"
-        )
+        self._do_later(0.5, self._choose_target, "_choose_target")
         self._health_bar.show_health()
 
     def rest(self):
@@ -553,19 +540,12 @@ class Character(Shooter, Unit):
         self.model.hide()
         self._col_node.stash()
 
-        taskMgr.doMethodLater(  # noqa: F821
-            0.05,
-            self._calm_down,
-            self.id + "_calm_down",
-            extraArgs=[True],
-        )
-        taskMgr.doMethodLater(  # noqa: F821
-            self.class_data["energy_gain"], self._gain_energy, self.id + "_gain_energy"
+        self._do_later(0.05, self._calm_down, "_calm_down", args=[True])
+        self._do_later(
+            self.class_data["energy_gain"], self._gain_energy, "_gain_energy"
         )
         if self.health < self.class_data["health"]:
-            taskMgr.doMethodLater(  # noqa: F821
-                self.class_data["healing"], self._heal, self.id + "_heal"
-            )
+            self._do_later(self.class_data["healing"], self._heal, "_heal")
 
     def surrender(self):
         """Stop fighting, surrender."""
@@ -583,10 +563,8 @@ class Character(Shooter, Unit):
         base.char_gui.destroy_char_button(self.id)  # noqa: F821
 
         self._stop_tasks("_gain_energy", "_heal")
-        taskMgr.doMethodLater(  # noqa: F821
-            self.class_data["energy_spend"],
-            self._reduce_energy,
-            self.id + "_reduce_energy",
+        self._do_later(
+            self.class_data["energy_spend"], self._reduce_energy, "_reduce_energy"
         )
         if base.world.enemy.active_units:  # noqa: F821
             self.prepare_to_fight()
@@ -604,27 +582,25 @@ class Character(Shooter, Unit):
             else:
                 task.delayTime = 20
 
-            if base.labels.TRAITS[1][1] in self.traits:  # noqa: F821
+            if Trait.FEAR_OF_DARK in self.traits:
                 # Fear of dark
                 task.delayTime /= 2
 
         elif self._target:
             # Nervousness
-            task.delayTime = (
-                15 if base.labels.TRAITS[5][1] in self.traits else 20  # noqa: F821
-            )
+            task.delayTime = 15 if Trait.NERVOUSNESS in self.traits else 20
         else:
             task.delayTime = self.class_data["energy_spend"]
 
         if (
-            base.labels.TRAITS[2][1] in self.traits  # noqa: F821
+            Trait.HEMOPHOBIA in self.traits
             and self.health < self.class_data["health"] / 2
         ):
             # Hemophobia
             task.delayTime *= 0.75
 
         self.energy -= 1
-        if base.labels.TRAITS[7][0] in self.traits:  # noqa: F821
+        if Trait.MECHANIC in self.traits:
             # Mechanic
             base.train.get_damage(-3)  # noqa: F821
 
@@ -636,7 +612,7 @@ class Character(Shooter, Unit):
         Used as a timed task while the character is resting.
         """
         if (
-            base.labels.TRAITS[6][1] in self.traits  # noqa: F821
+            Trait.MOTION_SICKNESS in self.traits
             and base.train.ctrl.current_speed > 0.75  # noqa: F821
         ):
             # Motion sickness
@@ -657,13 +633,13 @@ class Character(Shooter, Unit):
         Used as a timed task while the character is resting.
         """
         if (
-            base.labels.TRAITS[6][1] in self.traits  # noqa: F821
+            Trait.MOTION_SICKNESS in self.traits
             and base.train.ctrl.current_speed > 0.75  # noqa: F821
         ):
             # Motion sickness
             return task.again
 
-        if base.labels.TRAITS[7][1] in self.traits and chance(40):  # noqa: F821
+        if Trait.PHARMACOPHOBIA in self.traits and chance(40):
             # Pharmacophobia
             return task.again
 
@@ -680,9 +656,9 @@ class Character(Shooter, Unit):
         range can be chosen as a target.
         """
         if self.current_part and self.current_part.enemies:
-            self._target = random.choice(self.current_part.enemies)
-            taskMgr.doMethodLater(0.1, self._aim, self.id + "_aim")  # noqa: F821
-            taskMgr.doMethodLater(1, self._shoot, self.id + "_shoot")  # noqa: F821
+            self._target = base.rng.choice(self.current_part.enemies)  # noqa: F821
+            self._do_later(0.1, self._aim, "_aim")
+            self._do_later(1, self._shoot, "_shoot")
             return task.done
 
         # enemies retreated - return to passive state
@@ -690,23 +666,14 @@ class Character(Shooter, Unit):
             not base.world.enemy.active_units  # noqa: F821
             and base.world.scp_train is None  # noqa: F821
         ):
-            taskMgr.doMethodLater(  # noqa: F821
-                7,
-                self._calm_down,
-                self.id + "_calm_down",
-                extraArgs=[False],
-            )
+            self._do_later(7, self._calm_down, "_calm_down", args=[False])
             return task.done
 
         return task.again
 
     def _aim(self, task):
         """Rotate the character to aim on enemy."""
-        if (
-            self._target
-            and self._target.is_dead
-            and base.labels.TRAITS[5][0] in self.traits  # noqa: F821
-        ):
+        if self._target and self._target.is_dead and Trait.BLOODTHIRSTY in self.traits:
             # Bloodthirsty
             self.health += 7
 
@@ -719,17 +686,13 @@ class Character(Shooter, Unit):
         self._target = None
 
         if base.world.enemy.active_units:  # noqa: F821
-            taskMgr.doMethodLater(  # noqa: F821
-                0.5, self._choose_target, self.id + "_choose_target"
-            )
+            self._do_later(0.5, self._choose_target, "_choose_target")
             return task.done
 
         if base.world.scp_train is not None:  # noqa: F821
             return task.again
 
-        taskMgr.doMethodLater(  # noqa: F821
-            7, self._calm_down, self.id + "_calm_down", extraArgs=[False]
-        )
+        self._do_later(7, self._calm_down, "_calm_down", args=[False])
         return task.done
 
     def _calm_down(self, force):
@@ -757,8 +720,8 @@ class Character(Shooter, Unit):
             LerpAnimInterval(self.model, 2, self._current_anim, "stand").start()
 
         self._current_anim = "stand"
-        taskMgr.doMethodLater(  # noqa: F821
-            random.randint(40, 60), self._idle_animation, self.id + "_idle_anim"
+        self._do_later(
+            base.rng.randint(40, 60), self._idle_animation, "_idle_anim"  # noqa: F821
         )
         self._health_bar.hide_health()
 
@@ -770,9 +733,9 @@ class Character(Shooter, Unit):
         """
         if self.is_diseased and chance(80):
             self._current_anim = "cough"
-            self._cough_snd.play()
+            base.voices_mgr.play(self._cough_snd)  # noqa: F821
         else:
-            self._current_anim = random.choice(
+            self._current_anim = base.rng.choice(  # noqa: F821
                 ("incline1", "gun_up", "release_gun", "tread1", "turn_head1")
             )
         LerpAnimInterval(self.model, 0.2, "stand", self._current_anim).start()
@@ -783,7 +746,7 @@ class Character(Shooter, Unit):
         )
         self._idle_seq.start()
 
-        task.delayTime = random.randint(40, 60)
+        task.delayTime = base.rng.randint(40, 60)  # noqa: F821
         return task.again
 
     def _stand(self):
@@ -821,9 +784,9 @@ class Character(Shooter, Unit):
         LerpAnimInterval(self.model, 0.3, self._current_anim, "die").start()
         self.model.hprInterval(1, (self.current_part.angle, 0, 0)).start()
         self.model.play("die")
-        self._die_snd.play()
+        base.voices_mgr.play(self._die_snd)  # noqa: F821
 
-        taskMgr.doMethodLater(3, self._hide, self.id + "_hide")  # noqa: F821
+        self._do_later(3, self._hide, "_hide")
 
     def _hide(self, task):
         """Hide the main model."""
@@ -836,7 +799,7 @@ class Character(Shooter, Unit):
         Used only when sending a character away in a city.
         """
         self._stop_tasks("_calm_down", "_gain_energy", "_heal", "_infect", "_get_well")
-        taskMgr.doMethodLater(0.05, self.clear, self.id + "_clear")  # noqa: F821
+        self._do_later(0.05, self.clear, "_clear")
 
     def clear(self, task):
         """Clear this character.
@@ -844,14 +807,16 @@ class Character(Shooter, Unit):
         Release models and sounds memory, release the part
         cell and delete the character from the crew list.
         """
+        for name in ("recall_the_past", "not_leaving_ours", "common_rage"):
+            base.effects_mgr.particles.release(  # noqa: F821
+                name, self.effects[name]["effect"]
+            )
+
+        base.voices_mgr.release(self.model)  # noqa: F821
         self.model.cleanup()
         self._health_bar.removeNode()
         self.model.removeNode()
-        base.sound_mgr.detach_sound(self.shot_snd)  # noqa: F821
-        base.sound_mgr.detach_sound(self._cough_snd)  # noqa: F821
-        base.sound_mgr.detach_sound(self._die_snd)  # noqa: F821
-        for snd in self._yeah_snds:
-            base.sound_mgr.detach_sound(snd)  # noqa: F821
+        base.common_ctrl.refresh_collisions()  # noqa: F821
 
         self._team.chars.pop(self.id)
         base.res_gui.update_chars()  # noqa: F821
@@ -921,7 +886,7 @@ class Character(Shooter, Unit):
                 miss_chance += 20
 
         if base.world.sun.is_dark:  # noqa: F821
-            if base.labels.TRAITS[1][0] in self.traits:  # noqa: F821
+            if Trait.CAT_EYES in self.traits:
                 # Cat eyes
                 miss_chance -= 5
             elif base.train.lights_on:  # noqa: F821
@@ -951,9 +916,25 @@ class Character(Shooter, Unit):
         self.model.play("stunned")
         LerpAnimInterval(self.model, 0.05, "stand_and_aim", "stunned").start()
 
-        taskMgr.doMethodLater(  # noqa: F821
-            6, self._stop_stunning, self.id + "_stop_stunning"
-        )
+        self._do_later(6, self._stop_stunning, "_stop_stunning")
+
+    def _disable_traits(self, kind):
+        """Disable traits of the given kind.
+
+        Args:
+            kind (units.crew.traits.Trait): Mask of the traits to disable.
+        """
+        self.disabled_traits |= self.traits & kind
+        self.traits &= ~kind
+
+    def _enable_traits(self, kind):
+        """Return back disabled traits of the given kind.
+
+        Args:
+            kind (units.crew.traits.Trait): Mask of the traits to enable.
+        """
+        self.traits |= self.disabled_traits & kind
+        self.disabled_traits &= ~kind
 
     def get_sick(self, is_infect=False):
         """Calculations to get this character sick.
@@ -979,9 +960,9 @@ class Character(Shooter, Unit):
                 percent
                 + (20 if is_infect else 0)
                 # Immunity
-                - (40 if base.labels.TRAITS[3][0] in self.traits else 0)  # noqa: F821
+                - (40 if Trait.IMMUNITY in self.traits else 0)
                 # Weak immunity
-                + (20 if base.labels.TRAITS[3][1] in self.traits else 0)  # noqa: F821
+                + (20 if Trait.WEAK_IMMUNITY in self.traits else 0)
             ),
         )
 
@@ -989,16 +970,10 @@ class Character(Shooter, Unit):
             self.is_diseased = True
             self.get_well_score = 0
 
-            for traits_pair in base.labels.TRAITS:  # noqa: F821
-                if traits_pair[0] in self.traits:
-
-                    self.traits.remove(traits_pair[0])
-                    self.disabled_traits.append(traits_pair[0])
+            self._disable_traits(traits.POSITIVE)
 
-            taskMgr.doMethodLater(  # noqa: F821
-                60, self.get_well, self.id + "_get_well"
-            )
-            taskMgr.doMethodLater(240, self.infect, self.id + "_infect")  # noqa: F821
+            self._do_later(60, self.get_well, "_get_well")
+            self._do_later(240, self.infect, "_infect")
             self.energy = min(self.energy, 80)
 
     def get_stimulated(self):
@@ -1006,25 +981,17 @@ class Character(Shooter, Unit):
 
         Disables all the negative traits for some time.
         """
-        for traits_pair in base.labels.TRAITS:  # noqa: F821
-            if traits_pair[1] in self.traits:
-                self.traits.remove(traits_pair[1])
-                self.disabled_traits.append(traits_pair[1])
+        self._disable_traits(traits.NEGATIVE)
 
         self._is_stimulated = True
-        taskMgr.doMethodLater(  # noqa: F821
-            300, self._stop_stimul, self.id + "_stop_stimul"
-        )
+        self._do_later(300, self._stop_stimul, "_stop_stimul")
 
     def _stop_stimul(self, task):
         """Stop stimulation of this character.
 
         Returns back all the disabled negative traits.
         """
-        for trait_pair in base.labels.TRAITS:  # noqa: F821
-            if trait_pair[1] in self.disabled_traits:
-                self.traits.append(trait_pair[1])
-                self.disabled_traits.remove(trait_pair[1])
+        self._enable_traits(traits.NEGATIVE)
 
         self._is_stimulated = False
         return task.done
@@ -1040,10 +1007,7 @@ class Character(Shooter, Unit):
             return task.again
 
         self.is_diseased = False
-        for trait_pair in base.labels.TRAITS:  # noqa: F821
-            if trait_pair[0] in self.disabled_traits:
-                self.traits.append(trait_pair[0])
-                self.disabled_traits.remove(trait_pair[0])
+        self._enable_traits(traits.POSITIVE)
 
         self._stop_tasks("_infect")
         return task.done
@@ -1071,8 +1035,8 @@ class Character(Shooter, Unit):
         self._current_anim = "stand_and_aim"
         self.model.loop("stand_and_aim")
 
-        taskMgr.doMethodLater(0.1, self._aim, self.id + "_aim")  # noqa: F821
-        taskMgr.doMethodLater(1, self._shoot, self.id + "_shoot")  # noqa: F821
+        self._do_later(0.1, self._aim, "_aim")
+        self._do_later(1, self._shoot, "_shoot")
 
         return task.done
 
@@ -1082,7 +1046,7 @@ class Character(Shooter, Unit):
         Args:
             damage (int): Damage points to get.
         """
-        if base.labels.TRAITS[2][0] in self.traits:  # noqa: F821
+        if Trait.MASOCHISM in self.traits:
             # Masochism
             self.energy += 1
 
@@ -1095,7 +1059,7 @@ class Character(Shooter, Unit):
 
     def get_stench_damage(self):
         """Get damage from the Stench."""
-        if base.labels.TRAITS[6][0] in self.traits and self.inhale > 0:  # noqa: F821
+        if Trait.DEEP_BREATH in self.traits and self.inhale > 0:
             # Deep breath
             self.inhale -= 1
             return
@@ -1122,7 +1086,7 @@ def generate_char(id_, class_, sex, team=None):
     Returns:
         Character: The generated character.
     """
-    return Character(id_, random.choice(NAMES[sex]), class_, sex, team)
+    return Character(id_, base.rng.choice(NAMES[sex]), class_, sex, team)  # noqa: F821
 
 
 def load_char(desc, team, parts):
@@ -5,23 +5,13 @@ License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
 Player characters as a single crew object.
 """
 import copy
-import random
 
-from utils import chance, take_random
-from .character import generate_char, load_char
+import numpy
 
-# cohesion factors, which are used on every cohesion increasing step
-COHESION_FACTORS = {
-    ("anarchist", "anarchist"): 0.77,
-    ("soldier", "soldier"): 0.57,
-    ("raider", "raider"): 0.57,
-    ("soldier", "raider"): 0.43,
-    ("raider", "soldier"): 0.43,
-    ("raider", "anarchist"): 0.61,
-    ("anarchist", "raider"): 0.61,
-    ("anarchist", "soldier"): 0.58,
-    ("soldier", "anarchist"): 0.58,
-}
+from . import traits
+from .character import generate_char, load_char
+from .relations import Relations
+from .traits import Trait
 
 
 class Crew:
@@ -29,7 +19,7 @@ class Crew:
 
     def __init__(self):
         self._char_id = 0  # variable to count character ids
-        self._relations = {}  # cohesion relations between characters
+        self._relations = Relations()  # cohesion relations between characters
         self._is_in_stench = False
 
         self.chars = {}
@@ -73,7 +63,7 @@ class Crew:
             float, dict:
                 Total crew cohesion, relations index.
         """
-        return self.cohesion, self._relations
+        return self.cohesion, self._relations.description
 
     @property
     def description(self):
@@ -142,8 +132,8 @@ class Crew:
 
         return generate_char(
             self._char_id,
-            random.choice(("soldier", "raider", "anarchist")),
-            random.choice(("male", "female")),
+            base.rng.choice(("soldier", "raider", "anarchist")),  # noqa: F821
+            base.rng.choice(("male", "female")),  # noqa: F821
             self,
         )
 
@@ -156,7 +146,7 @@ class Crew:
             dict: Recruits index.
         """
         chars = {}
-        for _ in range(random.randint(6, 11)):
+        for _ in range(base.rng.randint(6, 11)):  # noqa: F821
             chars["character_" + str(self._char_id)] = self.generate_recruit()
 
         return chars
@@ -175,7 +165,7 @@ class Crew:
             self._char_id = max(self._char_id, int(char.id.split("_")[1]))
 
         self.cohesion = cohesion_desc[0]
-        self._relations = cohesion_desc[1]
+        self._relations.load(cohesion_desc[1])
 
         base.res_gui.update_cohesion(self.cohesion)  # noqa: F821
         base.res_gui.update_chars()  # noqa: F821
@@ -308,7 +298,9 @@ class Crew:
 
             for char in self.chars.values():
                 taskMgr.doMethodLater(  # noqa: F821
-                    random.uniform(0.1, 0.5), char.celebrate, "celebrate_victory"
+                    base.rng.uniform(0.1, 0.5),  # noqa: F821
+                    char.celebrate,
+                    "celebrate_victory",
                 )
 
         base.world.stop_fight_music()  # noqa: F821
@@ -347,43 +339,49 @@ class Crew:
         of all relations in the crew. Different unit classes
         have different cohesion factors.
         """
-        for char1 in self.chars.values():
-            for char2 in self.chars.values():
-                if char1.id == char2.id:
-                    continue
-
-                rel_id = tuple(sorted([char1.id, char2.id]))
-                factor = 1.35 if char1.current_part == char2.current_part else 1
-
-                if (
-                    base.labels.TRAITS[4][0]  # noqa: F821
-                    in char1.traits + char2.traits
-                    and char1.class_ != char2.class_
-                ):
-                    # Liberal
-                    factor *= 1.15
-
-                if rel_id in self._relations:
-                    plus = COHESION_FACTORS[(char1.class_, char2.class_)] * factor
-                    self._relations[rel_id] = min(100, plus + self._relations[rel_id])
-
-                    # propagate traits from one character to another
-                    if self._relations[rel_id] > 80 and chance(50):
-                        pair = [char1, char2]
-                        from_char = take_random(pair)
-                        if from_char.traits:
-                            trait = random.choice(from_char.traits)
-                            if trait not in pair[0].traits and len(pair[0].traits) < 3:
-                                pair[0].traits.append(trait)
-                else:
-                    self._relations[rel_id] = (
-                        COHESION_FACTORS[(char1.class_, char2.class_)] * factor
-                    )
+        # dead characters don't have relations anymore
+        chars = [char for char in self.chars.values() if char.id in self._relations]
+        if len(chars) > 1:
+            classes = numpy.array([char.class_ for char in chars])
+            parts = numpy.array([id(char.current_part) for char in chars])
+            liberal = numpy.array([Trait.LIBERAL in char.traits for char in chars])
+
+            factors = numpy.where(parts[:, None] == parts[None, :], 1.35, 1)
+            factors *= numpy.where(
+                (liberal[:, None] | liberal[None, :])
+                & (classes[:, None] != classes[None, :]),
+                1.15,
+                1,
+            )
+            # every pair of characters is increased twice: for both of them
+            self._relations.increase(chars, factors * 2, limit=100)
+            self._propagate_traits(chars)
 
         self._calc_total_cohesion()
         task.delayTime = 135
         return task.again
 
+    def _propagate_traits(self, chars):
+        """Propagate traits between characters with strong relations.
+
+        A character gets a random trait of another character,
+        whom it has a strong relation with, by chance.
+
+        Args:
+            chars (list): All the crew characters.
+        """
+        rng = numpy.random.default_rng(base.rng.getrandbits(32))  # noqa: F821
+
+        relations = self._relations.matrix(chars)
+        for to_num, from_num in zip(
+            *numpy.nonzero((relations > 80) & (rng.random(relations.shape) < 0.25))
+        ):
+            to_char, from_char = chars[to_num], chars[from_num]
+            if from_char.traits and traits.count(to_char.traits) < 3:
+                to_char.traits |= base.rng.choice(  # noqa: F821
+                    traits.split(from_char.traits)
+                )
+
     def init_relations(self, new_char):
         """Initialize new character's relations with other characters.
 
@@ -391,22 +389,14 @@ class Crew:
             new_char (units.character.Character):
                 A new character in the crew.
         """
-        for char in self.chars.values():
-            if char.id == new_char.id:
-                continue
-            self._relations[tuple(sorted([new_char.id, char.id]))] = 0
+        self._relations.add(new_char)
 
     def _calc_total_cohesion(self):
         """Calculate total cohesion score considering all the relations."""
         if not self._relations:
             return
 
-        rel_max = 100 / len(self._relations)
-        cohesion = 0
-        for relation in self._relations.values():
-            cohesion += relation / 100 * rel_max
-
-        self.cohesion = min(100, cohesion)
+        self.cohesion = min(100, self._relations.total())
         base.res_gui.update_cohesion(self.cohesion)  # noqa: F821
 
     def calc_cohesion_for_chars(self, chars):
@@ -424,30 +414,7 @@ class Crew:
         Returns:
             float: Cohesion score for the given characters.
         """
-        cohesion = 0
-        rel_num = 0
-        if len(chars) == 1:
-            for key in self._relations.keys():
-                if chars[0].id in key:
-                    rel_num += 1
-                    cohesion += self._relations[key] / 100
-        else:
-            used_rels = []
-            for char1 in chars:
-                for char2 in chars:
-                    if char1.id == char2.id:
-                        continue
-
-                    rel_id = tuple(sorted([char1.id, char2.id]))
-                    if rel_id in used_rels:
-                        continue
-
-                    rel_num += 1
-                    used_rels.append(rel_id)
-                    cohesion += self._relations[rel_id] / 100
-
-        cohesion = round((cohesion / rel_num) * 25, 2)
-        return cohesion
+        return round(self._relations.mean(chars) / 100 * 25, 2)
 
     def calc_cohesion_factor(self, chars, for_char):
         """Calculate the damage factor for the given characters.
@@ -468,12 +435,8 @@ class Crew:
         if len(chars) < 2:
             return 1
 
-        rel_id = tuple(sorted([chars[0].id, chars[1].id]))
-        try:
-            cohesion = self._relations[rel_id] / 100
-        except KeyError:
-            # character was killed during calculations
-            cohesion = 0
+        # relations of a killed character are zero
+        cohesion = self._relations.get(chars[0].id, chars[1].id) / 100
         return 1 + cohesion * 0.5 * (1.9 if for_char.class_ == "anarchist" else 1)
 
     def delete_relations(self, char_id):
@@ -482,13 +445,7 @@ class Crew:
         Args:
             char_id (str): Character whose relations should be erased.
         """
-        to_del = []
-        for rel_id in self._relations.keys():
-            if char_id in rel_id:
-                to_del.append(rel_id)
-
-        for id_ in to_del:
-            self._relations.pop(id_)
+        self._relations.remove(char_id)
 
     def increase_cohesion_for_chars(self, chars, outing_score):
         """Increase cohesion for those who went for an outing.
@@ -500,22 +457,8 @@ class Crew:
             chars (list): Chars who went for an outing.
             outing_score (float): Total outing score.
         """
-        for char1 in chars:
-            for char2 in chars:
-                if char1.id == char2.id:
-                    continue
-
-                rel_id = tuple(sorted([char1.id, char2.id]))
-                factor = 1 + outing_score // 25 * 0.3
-
-                if rel_id in self._relations:
-                    self._relations[rel_id] += (
-                        COHESION_FACTORS[(char1.class_, char2.class_)] * factor
-                    )
-                else:
-                    self._relations[rel_id] = (
-                        COHESION_FACTORS[(char1.class_, char2.class_)] * factor
-                    )
+        # every pair of characters is increased twice: for both of them
+        self._relations.increase(chars, (1 + outing_score // 25 * 0.3) * 2)
         self._calc_total_cohesion()
 
     def show_relations(self, char):
@@ -531,10 +474,8 @@ class Crew:
         """
         char.hide_relations_ball()
 
-        for rel_id, relation in self._relations.items():
-            if char.id in rel_id:
-                to_id = rel_id[1] if char.id == rel_id[0] else rel_id[0]
-                self.chars[to_id].show_relation(relation)
+        for to_id, relation in self._relations.of(char.id).items():
+            self.chars[to_id].show_relation(relation)
 
     def hide_relations(self):
         """Hide all the relations GUI."""
@@ -581,17 +522,8 @@ class Crew:
         if not self._relations:
             return
 
-        factor = (self.cohesion - value) / self.cohesion
-
-        rel_max = 100 / len(self._relations)
-        cohesion = 0
-
-        for rel_id in self._relations.keys():
-            self._relations[rel_id] *= factor
-            cohesion += self._relations[rel_id] / 100 * rel_max
-
-        self.cohesion = min(100, cohesion)
-        base.res_gui.update_cohesion(self.cohesion)  # noqa: F821
+        self._relations.scale((self.cohesion - value) / self.cohesion)
+        self._calc_total_cohesion()
 
     def start_stench_activity(self):
         """Start dealing the Stench damage to characters."""
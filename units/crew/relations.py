@@ -0,0 +1,238 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Crew relations API.
+
+Relations between characters are kept in a dense symmetric matrix.
+Every character owns a slot: a row and a column of the matrix, so
+the cohesion of any group of characters is computed by indexing the
+matrix with their slots, without iterating over characters pairs.
+"""
+import numpy
+
+CLASSES = ("soldier", "raider", "anarchist")
+# cohesion factors, which are used on every cohesion increasing step
+COHESION_FACTORS = {
+    ("anarchist", "anarchist"): 0.77,
+    ("soldier", "soldier"): 0.57,
+    ("raider", "raider"): 0.57,
+    ("soldier", "raider"): 0.43,
+    ("raider", "soldier"): 0.43,
+    ("raider", "anarchist"): 0.61,
+    ("anarchist", "raider"): 0.61,
+    ("anarchist", "soldier"): 0.58,
+    ("soldier", "anarchist"): 0.58,
+}
+FACTORS = numpy.array(
+    [[COHESION_FACTORS[(class1, class2)] for class2 in CLASSES] for class1 in CLASSES]
+)
+# number of the slots to allocate at once
+SLOTS_STEP = 16
+
+
+class Relations:
+    """Cohesion relations between all the crew characters.
+
+    Every pair of the characters, which are added
+    into the relations, has a relation value in
+    the range [0: 100], starting with 0.
+    """
+
+    def __init__(self):
+        self._matrix = numpy.zeros((SLOTS_STEP, SLOTS_STEP))
+        self._classes = numpy.zeros(SLOTS_STEP, dtype=int)
+        self._slots = {}
+        self._free = list(range(SLOTS_STEP - 1, -1, -1))
+
+    def __contains__(self, char_id):
+        """Check if the given character is added into the relations."""
+        return char_id in self._slots
+
+    def __len__(self):
+        """Number of the relations between characters."""
+        num = len(self._slots)
+        return num * (num - 1) // 2
+
+    @property
+    def description(self):
+        """Saveable relations description.
+
+        Returns:
+            dict: Relation values, indexed by sorted pairs of character ids.
+        """
+        ids = list(self._slots)
+        desc = {}
+        for num, id1 in enumerate(ids):
+            for id2 in ids[num + 1 :]:
+                desc[tuple(sorted((id1, id2)))] = float(
+                    self._matrix[self._slots[id1], self._slots[id2]]
+                )
+        return desc
+
+    def _grow(self):
+        """Allocate more slots for characters."""
+        size = len(self._matrix)
+
+        matrix = numpy.zeros((size + SLOTS_STEP, size + SLOTS_STEP))
+        matrix[:size, :size] = self._matrix
+        self._matrix = matrix
+
+        self._classes = numpy.concatenate(
+            (self._classes, numpy.zeros(SLOTS_STEP, dtype=int))
+        )
+        self._free = list(range(size + SLOTS_STEP - 1, size - 1, -1))
+
+    def _index(self, chars):
+        """Get slots of the given characters.
+
+        Args:
+            chars (list): Characters, added into the relations.
+
+        Returns:
+            numpy.ndarray: The characters slots.
+        """
+        return numpy.array([self._slots[char.id] for char in chars], dtype=int)
+
+    def add(self, char):
+        """Add the given character into the relations.
+
+        Args:
+            char (units.crew.character.Character): New character.
+        """
+        if not self._free:
+            self._grow()
+
+        slot = self._free.pop()
+        self._matrix[slot, :] = 0
+        self._matrix[:, slot] = 0
+        self._classes[slot] = CLASSES.index(char.class_)
+        self._slots[char.id] = slot
+
+    def get(self, id1, id2):
+        """Get the relation between the given characters.
+
+        Args:
+            id1 (str): The first character id.
+            id2 (str): The second character id.
+
+        Returns:
+            float: The relation value. Zero for unknown characters.
+        """
+        if id1 not in self._slots or id2 not in self._slots:
+            return 0
+
+        return self._matrix[self._slots[id1], self._slots[id2]]
+
+    def increase(self, chars, factors, limit=None):
+        """Increase relations between the given characters.
+
+        Every relation is increased by the cohesion factor
+        of the characters classes multiplied by the factor
+        given for this pair of characters.
+
+        Args:
+            chars (list): Characters, added into the relations.
+            factors (numpy.ndarray | float):
+                Square matrix of the pairs factors, or a common factor.
+            limit (float): Optional. The max relation value.
+        """
+        index = self._index(chars)
+        block = numpy.ix_(index, index)
+        classes = self._classes[index]
+
+        values = self._matrix[block] + FACTORS[numpy.ix_(classes, classes)] * factors
+        numpy.fill_diagonal(values, 0)
+        if limit is not None:
+            numpy.minimum(values, limit, out=values)
+
+        self._matrix[block] = values
+
+    def load(self, desc):
+        """Load relation values from the given description.
+
+        Args:
+            desc (dict): Relations description.
+        """
+        for (id1, id2), value in desc.items():
+            if id1 in self._slots and id2 in self._slots:
+                slot1, slot2 = self._slots[id1], self._slots[id2]
+                self._matrix[slot1, slot2] = self._matrix[slot2, slot1] = value
+
+    def matrix(self, chars):
+        """Get relations between the given characters.
+
+        Args:
+            chars (list): Characters, added into the relations.
+
+        Returns:
+            numpy.ndarray: Square matrix of the relations.
+        """
+        index = self._index(chars)
+        return self._matrix[numpy.ix_(index, index)]
+
+    def mean(self, chars):
+        """Get the mean relation value for the given characters.
+
+        Only relations between the given characters are considered.
+        If only one character given, all of its relations are.
+
+        Args:
+            chars (list): Characters, added into the relations.
+
+        Returns:
+            float: The mean relation value.
+        """
+        if len(chars) == 1:
+            slot = self._slots[chars[0].id]
+            index = numpy.fromiter(self._slots.values(), dtype=int)
+            return float(self._matrix[slot, index].sum()) / (len(index) - 1)
+
+        num = len(chars)
+        return float(self.matrix(chars).sum()) / (num * (num - 1))
+
+    def of(self, char_id):
+        """Get all the relations of the given character.
+
+        Args:
+            char_id (str): The character id.
+
+        Returns:
+            dict: Relation values, indexed by other characters ids.
+        """
+        if char_id not in self._slots:
+            return {}
+
+        slot = self._slots[char_id]
+        return {
+            id_: self._matrix[slot, other]
+            for id_, other in self._slots.items()
+            if id_ != char_id
+        }
+
+    def remove(self, char_id):
+        """Remove all the relations of the given character.
+
+        Args:
+            char_id (str): The character id.
+        """
+        slot = self._slots.pop(char_id, None)
+        if slot is not None:
+            self._free.append(slot)
+
+    def scale(self, factor):
+        """Multiply all the relations by the given factor.
+
+        Args:
+            factor (float): The factor.
+        """
+        self._matrix *= factor
+
+    def total(self):
+        """Get the mean of all the relations.
+
+        Returns:
+            float: The mean relation value.
+        """
+        index = numpy.fromiter(self._slots.values(), dtype=int)
+        return float(self._matrix[numpy.ix_(index, index)].sum()) / 2 / len(self)
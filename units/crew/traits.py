@@ -0,0 +1,124 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Characters traits API.
+
+Character traits are kept as a bit mask, in which every bit is a
+trait. The traits values are stable and don't depend on the game
+language, so they can be saved. Labels are taken only to show them.
+"""
+import enum
+
+import languages
+
+
+class Trait(enum.IntFlag):
+    """Characters traits.
+
+    Positive and negative traits are going in pairs,
+    in the same order as in the languages catalogs.
+    """
+
+    FAST_HANDS = 1 << 0
+    SNAIL = 1 << 1
+    CAT_EYES = 1 << 2
+    FEAR_OF_DARK = 1 << 3
+    MASOCHISM = 1 << 4
+    HEMOPHOBIA = 1 << 5
+    IMMUNITY = 1 << 6
+    WEAK_IMMUNITY = 1 << 7
+    LIBERAL = 1 << 8
+    LONER = 1 << 9
+    BLOODTHIRSTY = 1 << 10
+    NERVOUSNESS = 1 << 11
+    DEEP_BREATH = 1 << 12
+    MOTION_SICKNESS = 1 << 13
+    MECHANIC = 1 << 14
+    PHARMACOPHOBIA = 1 << 15
+
+
+NO_TRAITS = Trait(0)
+# (positive, negative) traits pairs
+PAIRS = tuple(
+    (Trait(1 << num), Trait(1 << (num + 1))) for num in range(0, len(Trait), 2)
+)
+POSITIVE = Trait(sum(pair[0] for pair in PAIRS))
+NEGATIVE = Trait(sum(pair[1] for pair in PAIRS))
+
+
+def count(traits):
+    """Count the given traits.
+
+    Args:
+        traits (Trait): Traits mask.
+
+    Returns:
+        int: Number of the traits.
+    """
+    return bin(traits).count("1")
+
+
+def split(traits):
+    """Split the given traits mask into single traits.
+
+    Args:
+        traits (Trait): Traits mask.
+
+    Returns:
+        list: Single traits in the stable order.
+    """
+    return [trait for trait in Trait if trait in traits]
+
+
+def label(trait):
+    """Get the label of the given trait in the current language.
+
+    Args:
+        trait (Trait): Single trait.
+
+    Returns:
+        str: The trait label.
+    """
+    num = trait.bit_length() - 1
+    return base.labels.TRAITS[num // 2][num % 2]  # noqa: F821
+
+
+def labels(traits):
+    """Get labels of the given traits in the current language.
+
+    Args:
+        traits (Trait): Traits mask.
+
+    Returns:
+        list: The traits labels.
+    """
+    return [label(trait) for trait in split(traits)]
+
+
+def load(desc):
+    """Load traits from the given save description.
+
+    Older saves keep traits as lists of localized
+    labels, which are converted into a traits mask.
+
+    Args:
+        desc (int | list): Traits description.
+
+    Returns:
+        Trait: Traits mask.
+    """
+    if isinstance(desc, int):
+        return Trait(desc)
+
+    by_label = {}
+    for lang in languages.LANGUAGES:
+        for pair_num, pair in enumerate(languages.load(lang).TRAITS):
+            for num, trait_label in enumerate(pair):
+                by_label[trait_label] = PAIRS[pair_num][num]
+
+    traits = NO_TRAITS
+    for trait_label in desc:
+        traits |= by_label[trait_label]
+
+    return traits
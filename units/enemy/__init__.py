@@ -4,13 +4,12 @@ License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
 
 Enemy systems.
 """
-import random
+import math
 
-from direct.actor.Actor import Actor
 from panda3d.core import CollisionHandlerEvent
 
 from gui.teaching import EnemyDesc
-from utils import address, chance
+from utils import chance
 from world.objects import (
     BARRIER_THRESHOLD,
     ROCKET_THRESHOLD,
@@ -25,8 +24,17 @@ from .enemy_unit import (
     MotoShooter,
     StunBombThrower,
 )
+from .formation import Formation
+from .pool import MAX_FREE, ActorsPool
 from .transport import TransportManager
 
+# enemy score increase after every attack
+SCORE_STEP = 1.5
+# classes, which can have only a limited number of units in a wave
+LIMITED_CLASSES = (BrakeThrower, StunBombThrower, DodgeShooter, Kamikaze)
+# max number of the units of a limited class in a wave
+LIMITED_NUM = 2
+
 # enemy classes description
 CLASSES = {
     "classes": (
@@ -99,24 +107,46 @@ class Enemy:
         self._unit_id = 0
         self.is_cooldown = False
         self._is_first_attack = True
-        self._front_y_positions = []
-        self._side_y_positions = []
-
-        for gain in range(1, 14):
-            self._side_y_positions.append(round(0.15 + gain * 0.075, 2))
-            self._side_y_positions.append(round(-0.15 - gain * 0.075, 2))
-
-        for gain in range(1, 7):
-            self._front_y_positions.append(round(0.1 + gain * 0.05, 2))
-            self._front_y_positions.append(round(-0.1 - gain * 0.05, 2))
+        self._formation = Formation()
 
         self._transport_mgr = TransportManager()
 
+        self.actors = ActorsPool()
+        self.actors.prewarm(self._actors_to_prewarm())
+
         # set enemy collisions handler
         self.handler = CollisionHandlerEvent()
         self.handler.addInPattern("into-%in")
         self.handler.addOutPattern("out-%in")
 
+    def _actors_to_prewarm(self):
+        """Count the actors to pre-build for the next attack.
+
+        The score can also grow between attacks, so the
+        wave of the next score step is considered.
+
+        Returns:
+            dict: Number of actors by model names.
+        """
+        score = self.score + SCORE_STEP
+        available = [
+            class_data
+            for class_data in CLASSES["classes"]
+            if class_data["threshold"] <= score
+        ]
+        # a wave is filled with units until its score reaches the enemy score
+        max_units = math.ceil(score / min(class_["score"] for class_ in available))
+
+        counts = {}
+        for class_data in available:
+            num = max_units
+            if class_data["class"] in LIMITED_CLASSES:
+                num = min(num, LIMITED_NUM)
+
+            counts[class_data["model"]] = counts.get(class_data["model"], 0) + num
+
+        return {model: min(num, MAX_FREE) for model, num in counts.items()}
+
     def _clear_enemies(self, task):
         """Delete all enemy units to release memory."""
         for enemy in self.active_units.values():
@@ -138,13 +168,12 @@ class Enemy:
             class_data (dict): Enemy class description.
             id_ (int): Unit id.
         """
-        y_poss = (
-            self._side_y_positions
-            if class_data["part"] == "side"
-            else self._front_y_positions
-        )
         enemy = class_data["class"](
-            Actor(address(class_data["model"])), id_, y_poss, self.handler, class_data
+            self.actors.take(class_data["model"]),
+            id_,
+            self._formation,
+            self.handler,
+            class_data,
         )
         self._transport_mgr.load_transport(enemy)
 
@@ -161,6 +190,10 @@ class Enemy:
         for enemy in self.active_units.values():
             enemy.capture_train()
 
+    def clear(self):
+        """Stop the enemy units movement."""
+        self._formation.clear()
+
     def going_to_attack(self, day_part, lights_on):
         """Checks if enemy is going to attack.
 
@@ -237,31 +270,13 @@ class Enemy:
 
         delay = 0
         wave_score = 0
-        brakers = 0
-        throwers = 0
-        cars = 0
-        kamikazes = 0
+        limited = {}
         while wave_score < self.score:
-            unit_class = random.choice(available)
-
-            if unit_class["class"] == BrakeThrower:
-                brakers += 1
-                if brakers == 2:
-                    available.remove(unit_class)
-
-            if unit_class["class"] == StunBombThrower:
-                throwers += 1
-                if throwers == 2:
-                    available.remove(unit_class)
-
-            if unit_class["class"] == DodgeShooter:
-                cars += 1
-                if cars == 2:
-                    available.remove(unit_class)
+            unit_class = base.rng.choice(available)  # noqa: F821
 
-            if unit_class["class"] == Kamikaze:
-                kamikazes += 1
-                if kamikazes == 2:
+            if unit_class["class"] in LIMITED_CLASSES:
+                limited[unit_class["class"]] = limited.get(unit_class["class"], 0) + 1
+                if limited[unit_class["class"]] == LIMITED_NUM:
                     available.remove(unit_class)
 
             self._unit_id += 1
@@ -276,11 +291,12 @@ class Enemy:
 
     def stop_attack(self):
         """Make all the unit smoothly stop following the Train."""
-        self.score += 1.5
+        self.score += SCORE_STEP
         for enemy in self.active_units.values():
             enemy.stop()
 
         taskMgr.doMethodLater(12, self._clear_enemies, "clear_enemies")  # noqa: F821
+        self.actors.prewarm(self._actors_to_prewarm())
 
         for class_ in CLASSES["classes"] + NOT_TRANSPORT_CLASSES:
             if class_["threshold"] == self.score:
@@ -5,11 +5,8 @@ License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
 Base enemy unit API.
 """
 import abc
-import random
 
-from direct.interval.IntervalGlobal import LerpPosInterval
-
-from utils import chance, take_random
+from utils import chance
 from units.unit import Unit
 
 
@@ -21,20 +18,27 @@ class EnemyUnit(Unit):
         class_ (str): Enemy class name.
         class_data (dict): Enemy class description.
         model (actor.Actor): Enemy character model.
-        y_positions (list): Free positions along Y.
+        formation (units.enemy.formation.Formation): Enemy units formation.
         enemy_handler (CollisionHandlerEvent): Enemy collisions handler.
     """
 
-    def __init__(self, id_, class_, class_data, model, y_positions, enemy_handler):
+    def __init__(self, id_, class_, class_data, model, formation, enemy_handler):
         Unit.__init__(self, "enemy_" + str(id_), class_, class_data)
 
         self.transport_snd = None
-        self._move_int = None
         self._rb_node = None
         self._tooltip = "Skinhead - " + self.class_
 
-        self._y_positions = y_positions
-        self._y_pos = take_random(self._y_positions)
+        self._formation = formation
+        self._lane = formation.take_lane(self.class_data["part"])
+        if self._lane is None:
+            # all the lanes are taken, ride along
+            # one of them without occupying it
+            self._y_pos = formation.lane_y(
+                formation.random_lane(self.class_data["part"])
+            )
+        else:
+            self._y_pos = formation.lane_y(self._lane)
 
         self._x_range = (
             (-0.3, 0.38) if self.class_data["part"] == "side" else (0.6, 1.3)
@@ -48,12 +52,13 @@ class EnemyUnit(Unit):
         self.model.reparentTo(self.node)
 
         # organize movement and aiming tasks
-        time_to_overtake = random.randint(33, 50)
+        time_to_overtake = base.rng.randint(33, 50)  # noqa: F821
 
-        self._move(time_to_overtake, (self._y_pos, random.uniform(*self._x_range), 0))
-        taskMgr.doMethodLater(  # noqa: F821
-            time_to_overtake + 2, self._float_move, self.id + "_float_move"
+        self._move(
+            time_to_overtake,
+            (self._y_pos, base.rng.uniform(*self._x_range), 0),  # noqa: F821
         )
+        self._do_later(time_to_overtake + 2, self._float_move, "_float_move")
 
     @abc.abstractmethod
     def _explode(self):
@@ -84,7 +89,7 @@ class EnemyUnit(Unit):
         Returns:
             float: Delay between shots in seconds.
         """
-        return 1.7 + random.uniform(0.1, 0.9)
+        return 1.7 + base.rng.uniform(0.1, 0.9)  # noqa: F821
 
     @property
     def tooltip(self):
@@ -109,7 +114,7 @@ class EnemyUnit(Unit):
 
         self.model.setColorScale(1, 1, 1, 1)
         self._stop_tasks("_float_move")
-        self._move_int.pause()
+        self._formation.stop(self.id)
 
         self.model.play("die")
         if self.id in base.world.enemy.active_units:  # noqa: F821
@@ -118,41 +123,41 @@ class EnemyUnit(Unit):
                 self.current_part.enemies.remove(self)
 
         self._explode()
-        self.transport_snd.stop()
-        self._y_positions.append(self._y_pos)
+        base.voices_mgr.stop(self.transport_snd)  # noqa: F821
+        self._release_lane()
 
         base.add_head(self.class_data["class"].__name__)  # noqa: F821
         return True
 
     def _float_move(self, task):
         """Make enemy floatly move along the Train."""
-        if chance(80):
-            shift = random.choice((-0.05, 0.05))
-            if self._y_pos + shift in self._y_positions:
-                self._y_positions.append(self._y_pos)
-                self._y_pos = self._y_pos + shift
-                self._y_positions.remove(self._y_pos)
+        if self._lane is not None and chance(80):
+            self._lane = self._formation.shift_lane(
+                self._lane, base.rng.choice((-1, 1))  # noqa: F821
+            )
+            self._y_pos = self._formation.lane_y(self._lane)
 
         self._move(
-            random.randint(3, 6), (self._y_pos, random.uniform(*self._x_range), 0)
+            base.rng.randint(3, 6),  # noqa: F821
+            (self._y_pos, base.rng.uniform(*self._x_range), 0),  # noqa: F821
         )
-        task.delayTime = random.randint(7, 9)
+        task.delayTime = base.rng.randint(7, 9)  # noqa: F821
         return task.again
 
     def _move(self, period, new_pos):
-        """Run a new movement interval with the given parameters.
+        """Start a new smooth movement with the given parameters.
 
         Args:
-            period (tuple): Interval duration bounds.
+            period (float): Movement duration in seconds.
             new_pos (tuple): New enemy position.
         """
-        if self._move_int is not None:
-            self._move_int.pause()
+        self._formation.move(self.id, self.node, period, new_pos)
 
-        self._move_int = LerpPosInterval(
-            self.node, period, new_pos, blendType="easeInOut"
-        )
-        self._move_int.start()
+    def _release_lane(self):
+        """Release the lane currently taken by this unit."""
+        if self._lane is not None:
+            self._formation.release_lane(self._lane)
+            self._lane = None
 
     def capture_train(self):
         """The Train got critical damage - stop near it."""
@@ -160,12 +165,15 @@ class EnemyUnit(Unit):
 
     def clear(self, task=None):
         """Clear all the graphical, physical and sound data of this unit."""
-        base.sound_mgr.detach_sound(self.transport_snd)  # noqa: F821
-        if getattr(self, "_cry_snd", None):
-            base.sound_mgr.detach_sound(self._cry_snd)  # noqa: F821
+        base.voices_mgr.release(self.model)  # noqa: F821
 
-        self._move_int.finish()
-        self.model.cleanup()
+        if not self.is_dead:
+            base.common_ctrl.remove_collider(self._col_node)  # noqa: F821
+
+        self._formation.remove(self.id)
+        base.world.enemy.actors.release(  # noqa: F821
+            self.class_data["model"], self.model
+        )
         self.node.removeNode()
 
         if self._rb_node is not None:
@@ -188,9 +196,9 @@ class EnemyUnit(Unit):
     def stop(self):
         """Smoothly stop this unit following the Train."""
         self._stop_tasks("_float_move")
-        self._move(random.randint(9, 11), (self._io_dist, -7, 0))
-        self._y_positions.append(self._y_pos)
+        self._move(base.rng.randint(9, 11), (self._io_dist, -7, 0))  # noqa: F821
+        self._release_lane()
 
     def stop_ride(self):
         """Stop riding actions."""
-        self.transport_snd.stop()
+        base.voices_mgr.stop(self.transport_snd)  # noqa: F821
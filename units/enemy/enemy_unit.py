@@ -4,8 +4,6 @@ License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
 
 Enemy units API.
 """
-import random
-
 from direct.directutil import Mopath
 from direct.interval.IntervalGlobal import (
     Func,
@@ -14,7 +12,6 @@ from direct.interval.IntervalGlobal import (
     LerpScaleInterval,
     Parallel,
     Sequence,
-    SoundInterval,
     Wait,
 )
 from direct.interval.MopathInterval import MopathInterval
@@ -40,45 +37,44 @@ class EnemyMotorcyclist(EnemyUnit):
         class_ (str): Enemy class name.
         class_data (dict): Enemy class description.
         model (actor.Actor): Enemy character model.
-        y_positions (list): Free positions along Y.
+        formation (units.enemy.formation.Formation): Enemy units formation.
         enemy_handler (CollisionHandlerEvent): Enemy collisions handler.
     """
 
-    def __init__(self, id_, class_, class_data, model, y_positions, enemy_handler):
+    def __init__(self, id_, class_, class_data, model, formation, enemy_handler):
         EnemyUnit.__init__(
-            self, id_, class_, class_data, model, y_positions, enemy_handler
+            self, id_, class_, class_data, model, formation, enemy_handler
         )
         if chance(50):
-            taskMgr.doMethodLater(  # noqa: F821
-                random.randint(26, 28), self._play_idle_anim, self.id + "_idle"
+            self._do_later(
+                base.rng.randint(26, 28), self._play_idle_anim, "_idle"  # noqa: F821
             )
-            self._cry_snd = base.sound_mgr.loadSfx(  # noqa: F821
-                "sounds/combat/enemy_cry{num}.ogg".format(num=random.randint(1, 3))
+            self._cry_snd = base.voices_mgr.load(  # noqa: F821
+                "sounds/combat/enemy_cry{num}.ogg".format(
+                    num=base.rng.randint(1, 3)  # noqa: F821
+                ),
+                self.model,
             )
             self._cry_snd.setVolume(0.4)
-            base.sound_mgr.attachSoundToObject(self._cry_snd, self.model)  # noqa: F821
         else:
             self._cry_snd = None
 
         taskMgr.doMethodLater(  # noqa: F821
-            random.randint(27, 29),
+            base.rng.randint(27, 29),  # noqa: F821
             base.world.play_fight_music,  # noqa: F821
             "play_music",
         )
         self._col_node = self._init_col_node(
             SHOT_RANGE_MASK, MOUSE_MASK, CollisionSphere(0, 0, 0.05, 0.05)
         )
-        base.common_ctrl.traverser.addCollider(  # noqa: F821
-            self._col_node, enemy_handler
-        )
-        self._explosion = base.effects_mgr.explosion(self)  # noqa: F821
+        base.common_ctrl.add_collider(self._col_node, enemy_handler)  # noqa: F821
 
     def _explode(self):
         """Play explosion sequence of effects and sounds.
 
         Also includes explosion physics.
         """
-        self._explosion.play()
+        base.effects_mgr.play_explosion(self)  # noqa: F821
 
         self._rb_node = BulletRigidBodyNode(self.id + "_physics")
         self._rb_node.setMass(80)
@@ -96,26 +92,28 @@ class EnemyMotorcyclist(EnemyUnit):
         x = 0
         y = 0
         if angle == 0:
-            y = random.randint(6500, 8500)
+            y = base.rng.randint(6500, 8500)  # noqa: F821
         elif angle == 90:
-            x = -random.randint(6500, 8500)
+            x = -base.rng.randint(6500, 8500)  # noqa: F821
         elif angle == -90:
-            x = random.randint(6500, 8500)
+            x = base.rng.randint(6500, 8500)  # noqa: F821
 
-        self._rb_node.applyForce(Vec3(x, y, random.randint(1500, 2500)), Point3(0))
+        self._rb_node.applyForce(
+            Vec3(x, y, base.rng.randint(1500, 2500)), Point3(0)  # noqa: F821
+        )
         self._rb_node.applyTorque(
             Vec3(
-                random.randint(-35, 35),
-                random.randint(-35, 35),
-                random.randint(-35, 35),
+                base.rng.randint(-35, 35),  # noqa: F821
+                base.rng.randint(-35, 35),  # noqa: F821
+                base.rng.randint(-35, 35),  # noqa: F821
             )
         )
 
     def _play_idle_anim(self, task):
         """Play enemy unit idle animation."""
-        self.model.play(random.choice(("idle1", "idle2")))
+        self.model.play(base.rng.choice(("idle1", "idle2")))  # noqa: F821
         if self._cry_snd is not None:
-            self._cry_snd.play()
+            base.voices_mgr.play(self._cry_snd)  # noqa: F821
 
         return task.done
 
@@ -128,14 +126,14 @@ class MotoShooter(EnemyMotorcyclist, Shooter):
     Args:
         model (actor.Actor): Enemy unit model.
         id_ (int): Enemy unit id.
-        y_positions (list): Free positions along Y.
+        formation (units.enemy.formation.Formation): Enemy units formation.
         enemy_handler (CollisionHandlerEvent): Enemy collisions handler.
         class_data (dict): Enemy class description.
     """
 
-    def __init__(self, model, id_, y_positions, enemy_handler, class_data):
+    def __init__(self, model, id_, formation, enemy_handler, class_data):
         EnemyMotorcyclist.__init__(
-            self, id_, "Moto Shooter", class_data, model, y_positions, enemy_handler
+            self, id_, "Moto Shooter", class_data, model, formation, enemy_handler
         )
         Shooter.__init__(self)
 
@@ -153,7 +151,7 @@ class MotoShooter(EnemyMotorcyclist, Shooter):
         Returns:
             float: One-time damage made by this unit.
         """
-        return random.uniform(*self.damage_range)
+        return base.rng.uniform(*self.damage_range)  # noqa: F821
 
     def _aim(self, back):
         """Aim to the Train when got close enough.
@@ -184,20 +182,16 @@ class MotoShooter(EnemyMotorcyclist, Shooter):
 
                 # (re-)start shooting
                 self._stop_tasks("_shoot")
-                taskMgr.doMethodLater(  # noqa: F821
-                    0.5, self._shoot, self.id + "_shoot"
-                )
+                self._do_later(0.5, self._shoot, "_shoot")
         else:
             targets = self.current_part.chars + [base.train]  # noqa: F821
 
             if self._target not in targets or chance(5):
-                self._target = random.choice(targets)
+                self._target = base.rng.choice(targets)  # noqa: F821
 
                 # (re-)start shooting
                 self._stop_tasks("_shoot")
-                taskMgr.doMethodLater(  # noqa: F821
-                    0.5, self._shoot, self.id + "_shoot"
-                )
+                self._do_later(0.5, self._shoot, "_shoot")
 
         task.delayTime = 0.5
         return task.again
@@ -233,7 +227,6 @@ class MotoShooter(EnemyMotorcyclist, Shooter):
     def clear(self, task=None):
         """Clear all the graphical data of this unit."""
         EnemyUnit.clear(self, task)
-        base.sound_mgr.detach_sound(self.shot_snd)  # noqa: F821
 
         if task is not None:
             return task.done
@@ -247,9 +240,7 @@ class MotoShooter(EnemyMotorcyclist, Shooter):
         self.current_part = part
         self._aim(False)
 
-        taskMgr.doMethodLater(  # noqa: F821
-            1.5, self._choose_target, self.id + "_choose_target"
-        )
+        self._do_later(1.5, self._choose_target, "_choose_target")
 
     def leave_the_part(self, _):
         """Stop fighting in the current part."""
@@ -273,14 +264,14 @@ class BrakeThrower(EnemyMotorcyclist):
     Args:
         model (actor.Actor): Enemy character model.
         id_ (int): Enemy unit id.
-        y_positions (list): Free positions along Y.
+        formation (units.enemy.formation.Formation): Enemy units formation.
         enemy_handler (CollisionHandlerEvent): Enemy collisions handler.
         class_data (dict): This unit class description.
     """
 
-    def __init__(self, model, id_, y_positions, enemy_handler, class_data):
+    def __init__(self, model, id_, formation, enemy_handler, class_data):
         EnemyMotorcyclist.__init__(
-            self, id_, "Braker", class_data, model, y_positions, enemy_handler
+            self, id_, "Braker", class_data, model, formation, enemy_handler
         )
         self.is_jumping = False
         self._train_captured = False
@@ -308,11 +299,12 @@ class BrakeThrower(EnemyMotorcyclist):
         )
         self._r_mopath.fFaceForward = True
 
-        self._jump_snd = base.sound_mgr.loadSfx("sounds/moto_jump.ogg")  # noqa: F821
-        base.sound_mgr.attachSoundToObject(self._jump_snd, self.model)  # noqa: F821
-
-        self._fall_snd = base.sound_mgr.loadSfx("sounds/moto_fall.ogg")  # noqa: F821
-        base.sound_mgr.attachSoundToObject(self._fall_snd, self.model)  # noqa: F821
+        self._jump_snd = base.voices_mgr.load(  # noqa: F821
+            "sounds/moto_jump.ogg", self.model
+        )
+        self._fall_snd = base.voices_mgr.load(  # noqa: F821
+            "sounds/moto_fall.ogg", self.model
+        )
 
     def _die(self):
         """Make this enemy unit die.
@@ -370,26 +362,28 @@ class BrakeThrower(EnemyMotorcyclist):
         if self._y_pos < 0:
             y_target = -y_target
 
-        if y_target not in self._y_positions:
+        lane = self._formation.take_lane(self.class_data["part"], y_target)
+        if lane is None:
             return task.again
 
-        self._y_positions.remove(y_target)
-
         self.is_jumping = True
         self._stop_tasks("_float_move")
-        self._move_int.pause()
+        self._formation.stop(self.id)
 
-        taskMgr.doMethodLater(  # noqa: F821
-            0.15, self._jump_snd.play, self.id + "_jump_sound", extraArgs=[]
+        self._do_later(
+            0.15,
+            base.voices_mgr.play,  # noqa: F821
+            "_jump_sound",
+            args=[self._jump_snd],
         )
-        taskMgr.doMethodLater(  # noqa: F821
-            1.5, self._fall_snd.play, self.id + "_fall_sound", extraArgs=[]
+        self._do_later(
+            1.5,
+            base.voices_mgr.play,  # noqa: F821
+            "_fall_sound",
+            args=[self._fall_snd],
         )
-        taskMgr.doMethodLater(  # noqa: F821
-            1,
-            self._drop_brake,
-            self.id + "_drop_brake",
-            extraArgs=[take_random(self._brakes)],
+        self._do_later(
+            1, self._drop_brake, "_drop_brake", args=[take_random(self._brakes)]
         )
         self._jump_int = Sequence(
             MopathInterval(
@@ -403,8 +397,9 @@ class BrakeThrower(EnemyMotorcyclist):
         )
         self._jump_int.start()
 
-        self._y_positions.append(self._y_pos)
-        self._y_pos = y_target
+        self._release_lane()
+        self._lane = lane
+        self._y_pos = self._formation.lane_y(lane)
 
     def _finish_jump(self):
         """Finish the jump sequence and return into the normal mode."""
@@ -418,9 +413,7 @@ class BrakeThrower(EnemyMotorcyclist):
         self.node.wrtReparentTo(base.train.model)  # noqa: F821
 
         if not self._train_captured:
-            taskMgr.doMethodLater(  # noqa: F821
-                2, self._float_move, self.id + "_float_move"
-            )
+            self._do_later(2, self._float_move, "_float_move")
 
     def capture_train(self):
         """The Train got critical damage - stop near it."""
@@ -439,9 +432,7 @@ class BrakeThrower(EnemyMotorcyclist):
         if not part.name.endswith("_front") or self._train_captured:
             return
 
-        taskMgr.doMethodLater(  # noqa: F821
-            15, self._jump_and_brake, self.id + "_jump_and_brake"
-        )
+        self._do_later(15, self._jump_and_brake, "_jump_and_brake")
 
     def stop(self):
         """Smoothly stop this unit following the Train."""
@@ -456,9 +447,6 @@ class BrakeThrower(EnemyMotorcyclist):
     def clear(self, task=None):
         """Clear all the graphical and sound data of this unit."""
         EnemyUnit.clear(self, task)
-        base.sound_mgr.detach_sound(self._jump_snd)  # noqa: F821
-        base.sound_mgr.detach_sound(self._fall_snd)  # noqa: F821
-
         if task is not None:
             return task.done
 
@@ -474,14 +462,14 @@ class StunBombThrower(EnemyMotorcyclist):
     Args:
         model (actor.Actor): Enemy character model.
         id_ (int): Enemy unit id.
-        y_positions (list): Free positions along Y.
+        formation (units.enemy.formation.Formation): Enemy units formation.
         enemy_handler (CollisionHandlerEvent): Enemy collisions handler.
         class_data (dict): This unit class description.
     """
 
-    def __init__(self, model, id_, y_positions, enemy_handler, class_data):
+    def __init__(self, model, id_, formation, enemy_handler, class_data):
         EnemyMotorcyclist.__init__(
-            self, id_, "Bomb Thrower", class_data, model, y_positions, enemy_handler
+            self, id_, "Bomb Thrower", class_data, model, formation, enemy_handler
         )
         self._throw_anim = "throw_" + ("right" if self._y_pos < 0 else "left")
 
@@ -518,7 +506,7 @@ class StunBombThrower(EnemyMotorcyclist):
             part (train.part.TrainPart): Train part this enemy entered.
         """
         self.current_part = part
-        taskMgr.doMethodLater(5, self._throw, self.id + "_throw")  # noqa: F821
+        self._do_later(5, self._throw, "_throw")
 
     def _throw(self, task):
         """Throw a bomb towards the Train."""
@@ -532,16 +520,14 @@ class StunBombThrower(EnemyMotorcyclist):
             coef = 0.35
 
         x_coor = 0.09 if self._y_pos > 0 else -0.09
-        y_coor = random.uniform(-0.5 + coef, 0 + coef)
+        y_coor = base.rng.uniform(-0.5 + coef, 0 + coef)  # noqa: F821
 
-        taskMgr.doMethodLater(  # noqa: F821
-            2.1, self._move_bomb_to, self.id + "_move_bomb", extraArgs=[x_coor, y_coor]
-        )
-        taskMgr.doMethodLater(  # noqa: F821
+        self._do_later(2.1, self._move_bomb_to, "_move_bomb", args=[x_coor, y_coor])
+        self._do_later(
             2.6,
             base.train.explode_bomb,  # noqa: F821
-            self.id + "_train_explode_bomb",
-            extraArgs=[x_coor, y_coor],
+            "_train_explode_bomb",
+            args=[x_coor, y_coor],
         )
         task.delayTime = 10
         return task.again
@@ -556,9 +542,7 @@ class StunBombThrower(EnemyMotorcyclist):
         self._bomb.wrtReparentTo(base.train.model)  # noqa: F821
         self._bomb.show()
         LerpPosInterval(self._bomb, 0.4, (x_coor, y_coor, self._bomb.getZ())).start()
-        taskMgr.doMethodLater(  # noqa: F821
-            0.6, self._return_bomb, self.id + "_return_bomb"
-        )
+        self._do_later(0.6, self._return_bomb, "_return_bomb")
 
     def _return_bomb(self, task):
         """Return the bomb model back to this unit."""
@@ -590,19 +574,19 @@ class DodgeShooter(EnemyUnit):
     Args:
         model (actor.Actor): Enemy character model.
         id_ (int): Enemy unit id.
-        y_positions (list): Free positions along Y.
+        formation (units.enemy.formation.Formation): Enemy units formation.
         enemy_handler (CollisionHandlerEvent): Enemy collisions handler.
         class_data (dict): This unit class description.
     """
 
-    def __init__(self, model, id_, y_positions, enemy_handler, class_data):
+    def __init__(self, model, id_, formation, enemy_handler, class_data):
         EnemyUnit.__init__(
             self,
             id_,
             "Gun Dodge",
             class_data,
             model,
-            y_positions,
+            formation,
             enemy_handler,
         )
 
@@ -611,12 +595,8 @@ class DodgeShooter(EnemyUnit):
             MOUSE_MASK,
             CollisionBox(Point3(-0.04, -0.12, -0.02), Point3(0.04, 0.11, 0.06)),
         )
-        base.common_ctrl.traverser.addCollider(  # noqa: F821
-            self._col_node, enemy_handler
-        )
+        base.common_ctrl.add_collider(self._col_node, enemy_handler)  # noqa: F821
         self._shoot_seq = self._set_shoot_anim()
-        self._explosion = base.effects_mgr.explosion_big(self)  # noqa: F821
-        self._smoke = base.effects_mgr.burn_smoke(self)  # noqa: F821
 
         self._piece1 = loader.loadModel(address("car_piece1"))  # noqa: F821
         self._piece1.reparentTo(self.model)
@@ -637,10 +617,9 @@ class DodgeShooter(EnemyUnit):
             direct.interval.MetaInterval.Sequence:
                 Shooting animation and sounds sequence.
         """
-        shot_snd = base.sound_mgr.loadSfx(  # noqa: F821
-            "sounds/combat/machine_gun_shot1.ogg"
+        shot_snd = base.voices_mgr.load(  # noqa: F821
+            "sounds/combat/machine_gun_shot1.ogg", self.model, "shot"
         )
-        base.sound_mgr.attachSoundToObject(shot_snd, self.model)  # noqa: F821
 
         fire = loader.loadModel(address("gun_fire2"))  # noqa: F821
         fire.reparentTo(self.model)
@@ -657,7 +636,11 @@ class DodgeShooter(EnemyUnit):
                 LerpScaleInterval(fire, 0.07, (1, 0.0001, 1)),
                 Wait(0.12),
             ),
-            SoundInterval(shot_snd, duration=0.25),
+            Sequence(
+                Func(base.voices_mgr.play, shot_snd),  # noqa: F821
+                Wait(0.25),
+                Func(base.voices_mgr.stop, shot_snd),  # noqa: F821
+            ),
         )
         return Sequence(*(shoot_par,) * 20)
 
@@ -677,9 +660,7 @@ class DodgeShooter(EnemyUnit):
 
         self.model.play("turn_right" if self._y_pos < 0 else "turn_left")
 
-        taskMgr.doMethodLater(  # noqa: F821
-            2, self._shoot_at_train, self.id + "_shoot_at_train"
-        )
+        self._do_later(2, self._shoot_at_train, "_shoot_at_train")
 
     def leave_the_part(self, _):
         """Stop fighting in the current part."""
@@ -689,16 +670,14 @@ class DodgeShooter(EnemyUnit):
     def _shoot_at_train(self, task):
         """Start shooting volley, including logic, animations, sounds."""
         self._shoot_seq.start()
-        taskMgr.doMethodLater(  # noqa: F821
-            0.5, self._do_damage_to_train, self.id + "_do_damage_to_train"
-        )
-        taskMgr.doMethodLater(  # noqa: F821
+        self._do_later(0.5, self._do_damage_to_train, "_do_damage_to_train")
+        self._do_later(
             6,
-            taskMgr.remove,  # noqa: F821
-            self.id + "_stop_doing_damage",
-            extraArgs=[self.id + "_do_damage_to_train"],
+            self._stop_tasks,
+            "_stop_doing_damage",
+            args=["_do_damage_to_train"],
         )
-        task.delayTime = random.randint(15, 18)
+        task.delayTime = base.rng.randint(15, 18)  # noqa: F821
         return task.again
 
     def _do_damage_to_train(self, task):
@@ -717,8 +696,8 @@ class DodgeShooter(EnemyUnit):
 
         Also includes explosion physics.
         """
-        self._explosion.play()
-        self._smoke.play()
+        base.effects_mgr.play_big_explosion(self)  # noqa: F821
+        base.effects_mgr.play_burn_smoke(self)  # noqa: F821
 
         self._rb_node = BulletRigidBodyNode(self.id + "_physics")
         self._rb_node.setMass(100)
@@ -736,20 +715,20 @@ class DodgeShooter(EnemyUnit):
         x = 0
         y = 0
         if angle == 0:
-            y = random.randint(6500, 8500)
+            y = base.rng.randint(6500, 8500)  # noqa: F821
         elif angle == 90:
-            x = -random.randint(6500, 8500)
+            x = -base.rng.randint(6500, 8500)  # noqa: F821
         elif angle == -90:
-            x = random.randint(6500, 8500)
+            x = base.rng.randint(6500, 8500)  # noqa: F821
 
         self._rb_node.applyForce(
-            Vec3(x, y, random.randint(1500, 2500)), Point3(0, -0.1, 0)
+            Vec3(x, y, base.rng.randint(1500, 2500)), Point3(0, -0.1, 0)  # noqa: F821
         )
         self._rb_node.applyTorque(
             Vec3(
-                random.randint(-15, 15),
-                random.randint(-15, 15),
-                random.randint(-15, 15),
+                base.rng.randint(-15, 15),  # noqa: F821
+                base.rng.randint(-15, 15),  # noqa: F821
+                base.rng.randint(-15, 15),  # noqa: F821
             )
         )
 
@@ -789,17 +768,17 @@ class DodgeShooter(EnemyUnit):
 
         rb_node.applyForce(
             Vec3(
-                random.randint(15, 30),
-                random.randint(15, 30),
-                random.randint(15, 30),
+                base.rng.randint(15, 30),  # noqa: F821
+                base.rng.randint(15, 30),  # noqa: F821
+                base.rng.randint(15, 30),  # noqa: F821
             ),
             Point3(0, -0.1, 0),
         )
         rb_node.applyTorque(
             Vec3(
-                random.randint(-torque, torque),
-                random.randint(-torque, torque),
-                random.randint(-torque, torque),
+                base.rng.randint(-torque, torque),  # noqa: F821
+                base.rng.randint(-torque, torque),  # noqa: F821
+                base.rng.randint(-torque, torque),  # noqa: F821
             )
         )
 
@@ -827,14 +806,14 @@ class Kamikaze(EnemyMotorcyclist):
     Args:
         model (actor.Actor): Enemy character model.
         id_ (int): Enemy unit id.
-        y_positions (list): Free positions along Y.
+        formation (units.enemy.formation.Formation): Enemy units formation.
         enemy_handler (CollisionHandlerEvent): Enemy collisions handler.
         class_data (dict): This unit class description.
     """
 
-    def __init__(self, model, id_, y_positions, enemy_handler, class_data):
+    def __init__(self, model, id_, formation, enemy_handler, class_data):
         EnemyMotorcyclist.__init__(
-            self, id_, "Kamikaze", class_data, model, y_positions, enemy_handler
+            self, id_, "Kamikaze", class_data, model, formation, enemy_handler
         )
 
         self._train_captured = False
@@ -850,11 +829,12 @@ class Kamikaze(EnemyMotorcyclist):
         )
         self._jump_path.fFaceForward = True
 
-        self._jump_snd = base.sound_mgr.loadSfx("sounds/moto_jump.ogg")  # noqa: F821
-        base.sound_mgr.attachSoundToObject(self._jump_snd, self.model)  # noqa: F821
-
-        self._wick_snd = base.sound_mgr.loadSfx("sounds/combat/wick.ogg")  # noqa: F821
-        base.sound_mgr.attachSoundToObject(self._wick_snd, self.model)  # noqa: F821
+        self._jump_snd = base.voices_mgr.load(  # noqa: F821
+            "sounds/moto_jump.ogg", self.model
+        )
+        self._wick_snd = base.voices_mgr.load(  # noqa: F821
+            "sounds/combat/wick.ogg", self.model
+        )
 
         self._wick = ParticleEffect()
 
@@ -870,7 +850,7 @@ class Kamikaze(EnemyMotorcyclist):
         self._wick.loadConfig("effects/kamikaze_wick.ptf")
         self._wick.start(self.model, render)  # noqa: F821
 
-        self._wick_snd.play()
+        base.voices_mgr.play(self._wick_snd)  # noqa: F821
 
     def _explode(self, kamikaze=False):
         """Explode the kamikaze.
@@ -889,12 +869,7 @@ class Kamikaze(EnemyMotorcyclist):
         EnemyMotorcyclist._explode(self)
 
         self._fire_ring.start(self.model, render)  # noqa: F821
-        taskMgr.doMethodLater(  # noqa: F821
-            0.95,
-            self._fire_ring.softStop,
-            self.id + "_cleanup_ring_of_fire",
-            extraArgs=[],
-        )
+        self._do_later(0.95, self._fire_ring.softStop, "_cleanup_ring_of_fire", args=[])
 
         col_node = CollisionNode("kamikaze_explosion")
         col_node.setFromCollideMask(NO_MASK)
@@ -905,10 +880,8 @@ class Kamikaze(EnemyMotorcyclist):
 
         self._explosion_col_np = self.model.attachNewNode(col_node)
 
-        taskMgr.doMethodLater(  # noqa: F821
-            0.05,
-            self._clear_explosion_collisions,
-            self.id + "_clear_explosion_collisions",
+        self._do_later(
+            0.05, self._clear_explosion_collisions, "_clear_explosion_collisions"
         )
 
     def _clear_explosion_collisions(self, task):
@@ -940,7 +913,7 @@ class Kamikaze(EnemyMotorcyclist):
 
         self.is_jumping = True
         self._stop_tasks("_float_move")
-        self._move_int.pause()
+        self._formation.stop(self.id)
 
         Sequence(
             LerpPosInterval(
@@ -953,7 +926,7 @@ class Kamikaze(EnemyMotorcyclist):
                 (-0.45 if self._y_pos < 0 else 0.45, -0.8, 0),
                 blendType="easeInOut",
             ),
-            Func(self._jump_snd.play),
+            Func(base.voices_mgr.play, self._jump_snd),  # noqa: F821
             MopathInterval(
                 self._jump_path, self.model, duration=0.8, name=self.id + "_jump"
             ),
@@ -961,10 +934,6 @@ class Kamikaze(EnemyMotorcyclist):
         ).start()
         return task.done
 
-    def _release_pos(self):
-        """Release the position currently taken by the unit."""
-        self._y_positions.append(self._y_pos)
-
     def capture_train(self):
         """The Train got critical damage - stop near it."""
         self._train_captured = True
@@ -982,9 +951,7 @@ class Kamikaze(EnemyMotorcyclist):
             return
 
         self.current_part = part
-        taskMgr.doMethodLater(  # noqa: F821
-            10, self._jump_and_explode, self.id + "_jump_and_explode"
-        )
+        self._do_later(10, self._jump_and_explode, "_jump_and_explode")
 
     def leave_the_part(self, part):
         """Stop fighting on the current part.
@@ -992,7 +959,7 @@ class Kamikaze(EnemyMotorcyclist):
         Args:
             part (train.part.TrainPart): Train part this enemy entered.
         """
-        self._release_pos()
+        self._release_lane()
         self.current_part = None
 
     def _die(self, kamikaze=False):
@@ -1009,7 +976,7 @@ class Kamikaze(EnemyMotorcyclist):
 
         self.model.setColorScale(1, 1, 1, 1)
         self._stop_tasks("_float_move", "_jump_and_explode")
-        self._move_int.pause()
+        self._formation.stop(self.id)
 
         if self.id in base.world.enemy.active_units:  # noqa: F821
             base.world.enemy.active_units.pop(self.id)  # noqa: F821
@@ -1017,8 +984,8 @@ class Kamikaze(EnemyMotorcyclist):
                 self.current_part.enemies.remove(self)
 
         self._explode(kamikaze=kamikaze)
-        self.transport_snd.stop()
-        self._y_positions.append(self._y_pos)
+        base.voices_mgr.stop(self.transport_snd)  # noqa: F821
+        self._release_lane()
 
         if not kamikaze:
             base.add_head(self.class_data["class"].__name__)  # noqa: F821
@@ -1035,7 +1002,4 @@ class Kamikaze(EnemyMotorcyclist):
         self._wick.cleanup()
         self._fire_ring.cleanup()
 
-        base.sound_mgr.detach_sound(self._jump_snd)  # noqa: F821
-        base.sound_mgr.detach_sound(self._wick_snd)  # noqa: F821
-
         EnemyUnit.clear(self, task)
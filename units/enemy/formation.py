@@ -0,0 +1,221 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Enemy formation API.
+
+Enemy units ride along the Train in lanes. All the lanes and the
+units movements are kept in arrays, and a single task moves all the
+units once per frame, so the movement cost doesn't depend on the
+number of the enemy units.
+"""
+import numpy
+
+# the first lane Y-coordinate, the step between lanes
+# and the number of lanes on each side of the Train
+LANES = {"side": (0.15, 0.075, 13), "front": (0.1, 0.05, 6)}
+# number of the movement slots to allocate at once
+SLOTS_STEP = 16
+
+
+class Formation:
+    """Controller of the enemy units lanes and movements.
+
+    Lanes of the same part and the same side of the Train
+    go in a row, from the closest to the Train to the farthest.
+    """
+
+    def __init__(self):
+        lanes = []
+        groups = []
+        for part, (first, step, num) in LANES.items():
+            for sign in (1, -1):
+                for gain in range(1, num + 1):
+                    lanes.append(round(sign * (first + gain * step), 2))
+                    groups.append((part, sign))
+
+        self._lanes = numpy.array(lanes)
+        self._groups = groups
+        self._parts = numpy.array([part for part, _ in groups])
+        # free lanes bitmap
+        self._free = numpy.ones(len(lanes), dtype=bool)
+
+        self._slots = {}
+        self._free_slots = list(range(SLOTS_STEP - 1, -1, -1))
+        self._nodes = [None] * SLOTS_STEP
+        self._from = numpy.zeros((SLOTS_STEP, 3))
+        self._to = numpy.zeros((SLOTS_STEP, 3))
+        self._starts = numpy.zeros(SLOTS_STEP)
+        self._periods = numpy.ones(SLOTS_STEP)
+        self._moving = numpy.zeros(SLOTS_STEP, dtype=bool)
+
+        self._task = taskMgr.add(self._move_units, "move_enemy_units")  # noqa: F821
+
+    def _grow(self):
+        """Allocate more movement slots."""
+        size = len(self._nodes)
+        self._free_slots = list(range(size + SLOTS_STEP - 1, size - 1, -1))
+
+        self._nodes += [None] * SLOTS_STEP
+        self._from = numpy.concatenate((self._from, numpy.zeros((SLOTS_STEP, 3))))
+        self._to = numpy.concatenate((self._to, numpy.zeros((SLOTS_STEP, 3))))
+        self._starts = numpy.concatenate((self._starts, numpy.zeros(SLOTS_STEP)))
+        self._periods = numpy.concatenate((self._periods, numpy.ones(SLOTS_STEP)))
+        self._moving = numpy.concatenate(
+            (self._moving, numpy.zeros(SLOTS_STEP, dtype=bool))
+        )
+
+    def _move_units(self, task):
+        """Move all the moving units one frame further."""
+        moving = numpy.flatnonzero(self._moving)
+        if not moving.size:
+            return task.cont
+
+        progress = numpy.clip(
+            (globalClock.getFrameTime() - self._starts[moving])  # noqa: F821
+            / self._periods[moving],
+            0,
+            1,
+        )
+        self._moving[moving[progress == 1]] = False
+
+        # ease in and out
+        progress = progress * progress * (3 - 2 * progress)
+        positions = (
+            self._from[moving]
+            + (self._to[moving] - self._from[moving]) * progress[:, None]
+        )
+        for slot, pos in zip(moving.tolist(), positions.tolist()):
+            self._nodes[slot].setPos(*pos)
+
+        return task.cont
+
+    def clear(self):
+        """Stop the units movement task of this formation."""
+        taskMgr.remove(self._task)  # noqa: F821
+
+    def lane_y(self, lane):
+        """Get Y-coordinate of the given lane.
+
+        Args:
+            lane (int): The lane index.
+
+        Returns:
+            float: The lane Y-coordinate.
+        """
+        return float(self._lanes[lane])
+
+    def move(self, unit_id, node, period, pos):
+        """Smoothly move the given unit node to the given position.
+
+        The previous movement of the unit is replaced.
+
+        Args:
+            unit_id (str): The unit id.
+            node (panda3d.core.NodePath): The unit node.
+            period (float): Movement duration in seconds.
+            pos (tuple): The new node position.
+        """
+        slot = self._slots.get(unit_id)
+        if slot is None:
+            if not self._free_slots:
+                self._grow()
+
+            slot = self._free_slots.pop()
+            self._slots[unit_id] = slot
+
+        self._nodes[slot] = node
+        self._from[slot] = tuple(node.getPos())
+        self._to[slot] = pos
+        self._starts[slot] = globalClock.getFrameTime()  # noqa: F821
+        self._periods[slot] = period
+        self._moving[slot] = True
+
+    def random_lane(self, part):
+        """Choose a random lane of the given Train part, free or not.
+
+        Args:
+            part (str): The Train part: "side" or "front".
+
+        Returns:
+            int: The lane index.
+        """
+        return int(
+            base.rng.choice(numpy.flatnonzero(self._parts == part))  # noqa: F821
+        )
+
+    def release_lane(self, lane):
+        """Mark the given lane free.
+
+        Args:
+            lane (int): The lane index.
+        """
+        self._free[lane] = True
+
+    def remove(self, unit_id):
+        """Stop the given unit movements and free its slot.
+
+        Args:
+            unit_id (str): The unit id.
+        """
+        slot = self._slots.pop(unit_id, None)
+        if slot is not None:
+            self._moving[slot] = False
+            self._nodes[slot] = None
+            self._free_slots.append(slot)
+
+    def shift_lane(self, lane, shift):
+        """Move from the given lane to the neighbor one, if it's free.
+
+        Args:
+            lane (int): The current lane index.
+            shift (int): 1 to move farther from the Train, -1 to move closer.
+
+        Returns:
+            int: The new lane index. The current one, if couldn't move.
+        """
+        new_lane = lane + shift
+        if (
+            0 <= new_lane < len(self._lanes)
+            and self._groups[new_lane] == self._groups[lane]
+            and self._free[new_lane]
+        ):
+            self._free[lane] = True
+            self._free[new_lane] = False
+            return new_lane
+
+        return lane
+
+    def stop(self, unit_id):
+        """Stop the given unit movement, leaving it where it is.
+
+        Args:
+            unit_id (str): The unit id.
+        """
+        slot = self._slots.get(unit_id)
+        if slot is not None:
+            self._moving[slot] = False
+
+    def take_lane(self, part, y=None):
+        """Take a free lane of the given Train part.
+
+        Args:
+            part (str): The Train part: "side" or "front".
+            y (float):
+                Optional. The lane Y-coordinate. If not
+                given, a random free lane is taken.
+
+        Returns:
+            int: The lane index. None, if there is no free lane.
+        """
+        free = self._free & (self._parts == part)
+        if y is not None:
+            free &= numpy.isclose(self._lanes, y)
+
+        free = numpy.flatnonzero(free)
+        if not free.size:
+            return None
+
+        lane = int(base.rng.choice(free))  # noqa: F821
+        self._free[lane] = False
+        return lane
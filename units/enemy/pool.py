@@ -0,0 +1,106 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Enemy units models pool API.
+"""
+from direct.actor.Actor import Actor
+
+from utils import address
+
+# max number of free actors to keep for a single model
+MAX_FREE = 8
+
+
+class ActorsPool:
+    """Pool of enemy units' actors.
+
+    Building an Actor means parsing its model and animations,
+    which makes frame spikes while an enemy wave is loading.
+    The pool pre-builds actors in background, one per frame,
+    and reuses actors of the cleared units in the next waves.
+    """
+
+    def __init__(self):
+        self._free = {}
+        self._to_build = []
+
+    def _build(self, name):
+        """Build a new actor.
+
+        Args:
+            name (str): Model name.
+
+        Returns:
+            direct.actor.Actor.Actor: New actor.
+        """
+        actor = Actor(address(name))
+        # remember the actor own children to
+        # detach all the others on release
+        actor.setPythonTag("own_children", actor.getNumChildren())
+        return actor
+
+    def _build_next(self, task):
+        """Pre-build the next planned actor."""
+        if not self._to_build:
+            return task.done
+
+        name = self._to_build.pop()
+        self._free.setdefault(name, []).append(self._build(name))
+        return task.cont
+
+    def prewarm(self, counts):
+        """Plan actors pre-building.
+
+        Args:
+            counts (dict): Number of free actors to have by model names.
+        """
+        for name, count in counts.items():
+            missing = count - len(self._free.get(name, [])) - self._to_build.count(name)
+            self._to_build += [name] * max(0, missing)
+
+        if not taskMgr.hasTaskNamed("prewarm_enemy_actors"):  # noqa: F821
+            taskMgr.add(self._build_next, "prewarm_enemy_actors")  # noqa: F821
+
+    def take(self, name):
+        """Take a free actor of the given model.
+
+        Args:
+            name (str): Model name.
+
+        Returns:
+            direct.actor.Actor.Actor: Actor ready to use.
+        """
+        free = self._free.get(name)
+        if free:
+            return free.pop()
+
+        return self._build(name)
+
+    def release(self, name, actor):
+        """Reset the given actor and return it into the pool.
+
+        All the nodes attached to the actor by its unit are
+        detached, while its own geometry and animations are kept.
+
+        Args:
+            name (str): Model name.
+            actor (direct.actor.Actor.Actor): Actor to release.
+        """
+        free = self._free.setdefault(name, [])
+        if len(free) >= MAX_FREE:
+            actor.cleanup()
+            actor.removeNode()
+            return
+
+        actor.stop()
+        actor.detachNode()
+
+        for child in list(actor.getChildren())[actor.getPythonTag("own_children") :]:
+            child.detachNode()
+
+        actor.show()
+        actor.clearColorScale()
+        actor.setPosHprScale(0, 0, 0, 0, 0, 0, 1, 1, 1)
+
+        free.append(actor)
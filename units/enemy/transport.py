@@ -4,7 +4,6 @@ License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
 
 Transport control API.
 """
-import random
 from direct.actor.Actor import Actor
 from utils import address
 
@@ -36,16 +35,12 @@ class TransportManager:
                 Unit to put on transport.
             type_ (str): The transport type: car or motorcycle.
         """
-        unit.transport_snd = base.sound_mgr.loadSfx(  # noqa: F821
-            "sounds/{type}_moves1.ogg".format(type=type_)
+        unit.transport_snd = base.voices_mgr.load(  # noqa: F821
+            "sounds/{type}_moves1.ogg".format(type=type_), unit.transport, "engine"
         )
-        unit.transport_snd.setLoop(True)
-        unit.transport_snd.setPlayRate(random.uniform(0.7, 1))
+        unit.transport_snd.setPlayRate(base.rng.uniform(0.7, 1))  # noqa: F821
         unit.transport_snd.setVolume(0.5)
-        unit.transport_snd.play()
-        base.sound_mgr.attachSoundToObject(  # noqa: F821
-            unit.transport_snd, unit.transport
-        )
+        base.voices_mgr.play_loop(unit.transport_snd)  # noqa: F821
 
     def load_transport(self, unit):
         """Load transport for the given unit.
@@ -62,11 +57,12 @@ class TransportManager:
         if not self._models[transport_model].getCurrentAnim():
             self._models[transport_model].loop("ride")
 
-        taskMgr.doMethodLater(  # noqa: F821
+        base.units_timers.do_later(  # noqa: F821
             4,
             self._load_snd,
-            "load_transport_sound_" + unit.id,
-            extraArgs=[unit, "moto" if transport_model.startswith("moto") else "car"],
+            unit.id,
+            "_load_transport_sound",
+            args=[unit, "moto" if transport_model.startswith("moto") else "car"],
         )
 
     def stop(self):
@@ -0,0 +1,157 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Units delayed actions scheduler API.
+
+All the units actions are kept in a single hashed timer wheel, which
+is ticked by a single task once per frame. Every action is identified
+by its unit id and the action name, so scheduling and cancelling an
+action doesn't depend on the number of the units in the game.
+"""
+from direct.task import Task
+
+# the wheel resolution in seconds
+TICK = 0.02
+# number of the wheel slots, longer delays take several wheel turns
+SLOTS = 1024
+
+
+class Timer:
+    """A delayed unit action.
+
+    Looks like a Panda3D task for the action function,
+    so that the task-style functions can be scheduled as is.
+
+    Args:
+        key (tuple): Unit id and action name.
+        func (callable): Function to call.
+        args (list): Function arguments. If None, the timer itself is passed.
+        delay (float): Delay before calling the function.
+    """
+
+    __slots__ = ("key", "func", "args", "delayTime", "tick")
+
+    done = Task.done
+    again = Task.again
+
+    def __init__(self, key, func, args, delay):
+        self.key = key
+        self.func = func
+        self.args = args
+        self.delayTime = delay
+        self.tick = None
+
+
+class TimerWheel:
+    """Scheduler of the units delayed actions.
+
+    An action scheduled for the same unit with the
+    same name replaces the previously scheduled one.
+
+    Args:
+        profiler (profiler.TasksProfiler):
+            Optional. Profiler to measure every action on its own.
+    """
+
+    def __init__(self, profiler=None):
+        self._slots = [{} for _ in range(SLOTS)]
+        self._timers = {}
+        self._profiler = profiler
+        self._tick = int(globalClock.getFrameTime() / TICK)  # noqa: F821
+
+        taskMgr.add(self._turn, "units_timer_wheel")  # noqa: F821
+
+    def _insert(self, timer):
+        """Put the given timer into the wheel slot of its due tick.
+
+        Args:
+            timer (Timer): Timer to insert.
+        """
+        timer.tick = max(
+            int((globalClock.getFrameTime() + timer.delayTime) / TICK)  # noqa: F821
+            + 1,
+            self._tick + 1,
+        )
+        self._slots[timer.tick % SLOTS][timer.key] = timer
+
+    def _run(self, timer):
+        """Call the given timer function and reschedule it, if needed.
+
+        Args:
+            timer (Timer): Due timer.
+        """
+        if timer.args is None:
+            result = timer.func(timer)
+        else:
+            result = timer.func(*timer.args)
+            if result is not Task.again:
+                result = Task.done
+
+        # the action could've rescheduled or cancelled itself
+        if self._timers.get(timer.key) is not timer:
+            return
+
+        if result is Task.again:
+            self._insert(timer)
+        else:
+            self._timers.pop(timer.key)
+
+    def _turn(self, task):
+        """Run all the due actions."""
+        now = int(globalClock.getFrameTime() / TICK)  # noqa: F821
+        # after a long frame every slot is checked only once
+        start = max(self._tick + 1, now - SLOTS + 1)
+        self._tick = now
+
+        for tick in range(start, now + 1):
+            slot = self._slots[tick % SLOTS]
+            if not slot:
+                continue
+
+            due = [timer for timer in slot.values() if timer.tick <= now]
+            for timer in due:
+                slot.pop(timer.key)
+
+            for timer in due:
+                # the action could've been cancelled or replaced
+                # by another action, called earlier in this tick
+                if self._timers.get(timer.key) is timer:
+                    self._run(timer)
+
+        return task.cont
+
+    def cancel(self, unit_id, *actions):
+        """Cancel the given actions of the given unit.
+
+        Args:
+            unit_id (str): The unit id.
+            actions (tuple): Names of the actions to cancel.
+        """
+        for action in actions:
+            timer = self._timers.pop((unit_id, action), None)
+            if timer is not None:
+                self._slots[timer.tick % SLOTS].pop(timer.key, None)
+
+    def do_later(self, delay, func, unit_id, action, args=None):
+        """Call the given function after the given delay.
+
+        If the function is called without arguments, it gets the
+        timer as a task, and can reschedule itself by returning
+        timer.again, probably with a changed timer.delayTime.
+
+        Args:
+            delay (float): Delay in seconds.
+            func (callable): Function to call.
+            unit_id (str): Id of the unit, which does the action.
+            action (str): The action name.
+            args (list): Optional. The function arguments.
+        """
+        self.cancel(unit_id, action)
+
+        if self._profiler is not None:
+            func = self._profiler.timed(func, unit_id + "_" + action.lstrip("_"))
+
+        timer = Timer((unit_id, action), func, args, delay)
+        self._timers[timer.key] = timer
+        self._insert(timer)
@@ -7,10 +7,11 @@ Base API for shooting units.
 import abc
 
 from direct.interval.IntervalGlobal import (
+    Func,
     LerpScaleInterval,
     Parallel,
     Sequence,
-    SoundInterval,
+    Wait,
 )
 
 from .enemy.base_enemy_unit import EnemyUnit
@@ -88,7 +89,11 @@ class Shooter(metaclass=abc.ABCMeta):
                 LerpScaleInterval(fire, 0.12, (1, 1, 1)),
                 LerpScaleInterval(fire, 0.12, (1, 0.0001, 1)),
             ),
-            SoundInterval(self.shot_snd, duration=0.3),
+            Sequence(
+                Func(base.voices_mgr.play, self.shot_snd),  # noqa: F821
+                Wait(0.3),
+                Func(base.voices_mgr.stop, self.shot_snd),  # noqa: F821
+            ),
         )
         return Sequence(*(shoot_seq,) * shots)
 
@@ -101,8 +106,6 @@ class Shooter(metaclass=abc.ABCMeta):
         Returns:
             panda3d.core.AudioSound: Shooting sound.
         """
-        shot_snd = base.sound_mgr.loadSfx(  # noqa: F821
-            "sounds/combat/{name}.ogg".format(name=name)
+        return base.voices_mgr.load(  # noqa: F821
+            "sounds/combat/{name}.ogg".format(name=name), self.model, "shot"
         )
-        base.sound_mgr.attachSoundToObject(shot_snd, self.model)  # noqa: F821
-        return shot_snd
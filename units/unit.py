@@ -81,12 +81,10 @@ class Unit(metaclass=abc.ABCMeta):
 
         self.is_dead = True
 
-        base.common_ctrl.traverser.removeCollider(self._col_node)  # noqa: F821
+        base.common_ctrl.remove_collider(self._col_node)  # noqa: F821
         self._col_node.removeNode()
 
-        taskMgr.doMethodLater(  # noqa: F821
-            self.clear_delay, self.clear, self.id + "_clear"
-        )
+        self._do_later(self.clear_delay, self.clear, "_clear")
         return True
 
     def _init_col_node(self, from_mask, into_mask, solid):
@@ -106,14 +104,24 @@ class Unit(metaclass=abc.ABCMeta):
         col_node.addSolid(solid)
         return self.model.attachNewNode(col_node)
 
+    def _do_later(self, delay, func, action, args=None):
+        """Do the given action of this unit after the given delay.
+
+        Args:
+            delay (float): Delay in seconds.
+            func (callable): Function to call.
+            action (str): The action name.
+            args (list): Optional. The function arguments.
+        """
+        base.units_timers.do_later(delay, func, self.id, action, args)  # noqa: F821
+
     def _stop_tasks(self, *names):
         """Stop this unit related tasks.
 
         Args:
             names (tuple): Tasks' names to stop.
         """
-        for name in names:
-            taskMgr.remove(self.id + name)  # noqa: F821
+        base.units_timers.cancel(self.id, *names)  # noqa: F821
 
     def get_damage(self, damage):
         """Getting damage.
@@ -4,9 +4,6 @@ License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
 
 Small common utils for the game logic.
 """
-import random
-import os.path
-
 from const import MOD_DIR
 
 
@@ -22,18 +19,23 @@ def address(name):
     return MOD_DIR + name + ".bam"
 
 
-def chance(percent):
+def chance(percent, rng=None):
     """Return True with percent possibility.
 
     Args:
         percent (int): Possibility percent.
+        rng (random.Random):
+            Optional. Random generator to use. The game one by default.
 
     Returns:
         bool:
             Random boolean value with the given
             possibility of True.
     """
-    return random.randint(1, 100) <= percent
+    if rng is None:
+        rng = base.rng  # noqa: F821
+
+    return rng.randint(1, 100) <= percent
 
 
 def clear_wids(wids):
@@ -64,27 +66,6 @@ def drown_snd(snd, task):
     return task.again
 
 
-def save_exists(num):
-    """Indicates if a saved game exists in the given slot.
-
-    Args:
-        num (int): The save slot number.
-
-    Returns:
-        bool: True if a valid game save exists, False otherwise.
-    """
-    return all(
-        (
-            os.path.exists("saves/save{}.dat".format(num)),
-            os.path.exists("saves/save{}.bak".format(num)),
-            os.path.exists("saves/save{}.dir".format(num)),
-            os.path.exists("saves/world{}.dat".format(num)),
-            os.path.exists("saves/world{}.bak".format(num)),
-            os.path.exists("saves/world{}.dir".format(num)),
-        )
-    )
-
-
 def take_random(list_):
     """Take a random element from the given list.
 
@@ -96,4 +77,4 @@ def take_random(list_):
     Returns:
         Any: The chosen element.
     """
-    return list_.pop(random.randint(0, len(list_) - 1))
+    return list_.pop(base.rng.randint(0, len(list_) - 1))  # noqa: F821
@@ -6,9 +6,8 @@ The Game world systems.
 """
 import copy
 import glob
-import random
-import shelve
 
+import numpy
 from direct.directutil import Mopath
 from direct.particles.ParticleEffect import ParticleEffect
 from panda3d.bullet import BulletPlaneShape, BulletRigidBodyNode, BulletWorld
@@ -25,13 +24,17 @@ from gui import CityGUI, RailsScheme
 from units.enemy import Enemy
 from utils import address, chance, drown_snd
 
-from .block import Block
+from .block import Block, BlockRecord
 from .location import LOCATION_CONF
 from .objects import SCPTrain
 from .outing import OutingsManager
 from .railway_generator import RailwayGenerator
 from .scenario import Scenario  # noqa: F401
 from .sun import Sun
+from .topology import RailwayTopology
+from . import vertices
+from .vertices import SurfaceVertices
+from .warmup import FIRST_BLOCKS, AssetsWarmup
 
 STATIONS = [
     "surface_with_station1",
@@ -63,7 +66,7 @@ class World:
         self._noon_ambient_snd = None
         self._night_ambient_snd = None
         self._scp_music = None
-        self._map = []  # all the world blocks
+        self._map = []  # records of all the world blocks
         self._stations = []
         self._branches = []
         self._block_coor = 0
@@ -87,12 +90,16 @@ class World:
         self._cur_music = None
         self._cur_idle_music = None
 
-        self._surf_vertices = self._cache_warmup()
+        self._env_templates = {}
+        self._warmup = AssetsWarmup()
+        self._warmed_blocks = {}
+        self._surf_vertices = self._load_surf_vertices()
         self._paths = self._load_motion_paths()
         self._inversions = self._prepare_inversions()
 
         self.sun = Sun(day_part_desc)
         self.city_gui = CityGUI()
+        self.topology = RailwayTopology(self._map)
         self.rails_scheme = RailsScheme(self._map)
         self.meet_scp = False
         self.scp_train = None
@@ -171,16 +178,13 @@ class World:
         Returns:
             bool: True if the Train is near a city.
         """
-        factor = -1 if self._loaded_blocks[-2].id < self._loaded_blocks[-1].id else 1
-        try:
-            return (
-                self._is_in_city
-                or self._map[self._block_num + 1 * factor].is_city
-                or self._map[self._block_num + 2 * factor].is_city
-                or self._map[self._block_num + 3 * factor].is_city
-            )
-        except IndexError:
-            return False
+        current_block, next_block = self._loaded_blocks[-2:]
+        if self._is_in_city or current_block.is_city:
+            return True
+
+        # a city is one of the two blocks behind the current one
+        distance, _ = self.topology.ahead(next_block.id, current_block.id, "city")
+        return distance <= 2
 
     @property
     def is_near_fork(self):
@@ -215,6 +219,32 @@ class World:
         """
         return self._last_angle
 
+    @property
+    def map_description(self):
+        """The world map description to save.
+
+        Branches blocks are described with their ids.
+
+        Returns:
+            dict: The main line blocks descriptions and the branches.
+        """
+        branches = []
+        for branch in self._branches:
+            blocks = branch["blocks"]
+            branches.append(
+                dict(
+                    branch,
+                    blocks=[blocks[0]]
+                    + [block.id for block in blocks[1:-1]]
+                    + [blocks[-1]],
+                )
+            )
+
+        return {
+            "main_line": [block.description() for block in self._map],
+            "branches": branches,
+        }
+
     @property
     def stations_pool(self):
         """Station blocks pool.
@@ -234,53 +264,38 @@ class World:
         """The block number, where the edge of the Stench is."""
         return self._stench_step
 
-    def _cache_warmup(self):
-        """Load all the game resources once to cache them.
+    def _load_surf_vertices(self):
+        """Load vertices indexes of all the surface models.
 
-        When a resource is loaded for the first time, the game can twitch
-        a little. This can be avoided by loading models before the game
-        actually started and caching them.
+        Vertices indexes are precomputed and cached on the disk,
+        only new or changed surface models are loaded and read.
 
         Returns:
-            dict: Index of vertices of every surface model.
+            dict: Vertices index of every surface model.
         """
-        for path in glob.glob("just_tex/*.png"):
-            loader.loadTexture(path)  # noqa: F821
+        cached_vertices = vertices.load_cache()
+        actual_vertices = {}
+        changed = False
 
         all_surf_vertices = {}
-        for path in glob.glob(MOD_DIR + "*.bam"):
-            dont_load = False
+        for path in glob.glob(MOD_DIR + "*surface*.bam"):
             path = path.replace("\\", "/")
-            for name in (
-                "locomotive",
-                "train_part_arrow",
-                "soldier",
-                "raider",
-                "anarchist",
-                "character_pointer",
-                "city_hangar",
-                "sun_path",
-                "relation_ball",
-                "tree",
-            ):
-                if name in path:
-                    dont_load = True
-                    break
-
-            if dont_load:
-                continue
-
-            mod = loader.loadModel(path)  # noqa: F821
-            # remember surface model's vertices coordinates,
-            # later they will be used to positionate
-            # environment models
-            if "surface" in path:
-                all_surf_vertices[path.replace("\\", "/")] = self._read_vertices(
-                    mod, path
+
+            key = vertices.cache_key(path)
+            if key not in cached_vertices:
+                # remember surface model's vertices coordinates,
+                # later they will be used to positionate
+                # environment models
+                cached_vertices[key] = self._read_vertices(
+                    loader.loadModel(path), path  # noqa: F821
                 )
+                changed = True
+
+            actual_vertices[key] = all_surf_vertices[path] = cached_vertices[key]
 
-        for path in glob.glob("sounds/*.ogg"):
-            base.sound_mgr.loadSfx(path)  # noqa: F821
+        # drop indexes of the removed or changed models
+        if changed or actual_vertices.keys() != cached_vertices.keys():
+            vertices.save_cache(actual_vertices)
 
         return all_surf_vertices
 
@@ -330,10 +345,12 @@ class World:
     def drop_outing_ability(self):
         """Drop the current block outing ability."""
         self._loaded_blocks[-2].outing_available = None
+        self.topology.invalidate()
 
     def drop_place_of_interest(self):
         """Drop the processed place of interest."""
         self._loaded_blocks[-2].is_station = False
+        self.topology.invalidate()
 
     def make_stench_step(self, task=None):
         """Move the Stench frontier one block further.
@@ -367,15 +384,15 @@ class World:
         return task.cont
 
     def _read_vertices(self, mod, path):
-        """Read the model vertices and return their positions.
+        """Read the model vertices and index their positions.
 
         Args:
             mod (panda3d.core.NodePath): Model to read vertices from.
             path (str): Model filename.
 
         Returns:
-            dict:
-                Dict with two lists of points: "wide" - most
+            world.vertices.SurfaceVertices:
+                Index with two squares of points: "wide" - most
                 part of the block, and "narrow" - smaller
                 part of the block with big paddings on
                 every side.
@@ -384,39 +401,42 @@ class World:
             mod.findAllMatches("**/+GeomNode")[0].node().getGeom(0).getVertexData(),
             "vertex",
         )
-        surf_vertices = {"wide": [], "narrow": []}
-
+        points = []
         while not v_reader.isAtEnd():
-            pos = v_reader.getData3()
-            if pos.is_nan():
-                continue
-
-            if (
-                # don't remember coordinates of vertices
-                # on which rails will be set
-                abs(pos.getX()) < 3.99
-                and abs(pos.getY()) < 3.99
-                and not ("turn" in path and abs(pos.getZ()) < 0.0001)
-                and not ("fork" in path and abs(pos.getZ()) < 0.02)
-                and not ("surface4" in path and pos.getZ() > 0.08)
-                and not ("surface5" in path and (pos.getZ() > 0.03 or pos.getZ() < 0))
-                # don't remember vertices of station and city models
-                and not ("station" in path and abs(pos.getY()) < 2.1)
-                and not (
-                    "surface8" in path
-                    and pos.getX() > -1.5
-                    and pos.getX() < 0.25
-                    and pos.getY() > -3.5
-                    and pos.getY() < -1.75
-                )
-                and not ("city" in path and abs(pos.getY()) < 2.1)
-            ):
-                surf_vertices["wide"].append(pos)
-
-                if abs(pos.getX()) < 3 and abs(pos.getY()) < 3:
-                    surf_vertices["narrow"].append(pos)
-
-        return surf_vertices
+            points.append(tuple(v_reader.getData3()))
+
+        points = numpy.array(points, dtype=numpy.float32).reshape(-1, 3)
+        x, y, z = points[:, 0], points[:, 1], points[:, 2]
+
+        # don't remember coordinates of vertices
+        # on which rails will be set
+        keep = ~numpy.isnan(points).any(axis=1)
+        keep &= (numpy.abs(x) < 3.99) & (numpy.abs(y) < 3.99)
+
+        if "turn" in path:
+            keep &= numpy.abs(z) >= 0.0001
+        if "fork" in path:
+            keep &= numpy.abs(z) >= 0.02
+        if "surface4" in path:
+            keep &= z <= 0.08
+        if "surface5" in path:
+            keep &= (z <= 0.03) & (z >= 0)
+        # don't remember vertices of station and city models
+        if "station" in path or "city" in path:
+            keep &= numpy.abs(y) >= 2.1
+        if "surface8" in path:
+            keep &= ~((x > -1.5) & (x < 0.25) & (y > -3.5) & (y < -1.75))
+
+        wide = points[keep]
+        return SurfaceVertices(
+            wide,
+            {
+                "wide": numpy.arange(len(wide)),
+                "narrow": numpy.flatnonzero(
+                    (numpy.abs(wide[:, 0]) < 3) & (numpy.abs(wide[:, 1]) < 3)
+                ),
+            },
+        )
 
     def _load_motion_paths(self):
         """Load all motion path models into single index.
@@ -455,24 +475,22 @@ class World:
         """
         if self._et_blocks > 8:
             if not self._et_rusty_blocks and chance(3):
-                self._et_rusty_blocks = random.randint(4, 8)
+                self._et_rusty_blocks = base.rng.randint(4, 8)  # noqa: F821
 
             if not self._et_stench_blocks and chance(2) and not self.scp_train:
-                self._et_stench_blocks = random.randint(4, 7)
+                self._et_stench_blocks = base.rng.randint(4, 7)  # noqa: F821
 
-        block = Block(
+        record = BlockRecord(
             name="direct",
             z_coor=0,
             z_dir=0,
             id_=-1,
             directions={},
-            path=self._paths["direct"],
-            cam_path=self._paths["cam_" + "direct"],
-            surf_vertices=self._surf_vertices,
             enemy_territory=True,
             is_rusty=self._et_rusty_blocks > 0,
             is_stenchy=self._et_stench_blocks > 0,
-        ).prepare()
+        )
+        block = self._build_block(record).prepare()
 
         self._loaded_blocks.append(block)
 
@@ -482,9 +500,37 @@ class World:
         if self._et_stench_blocks:
             self._et_stench_blocks -= 1
 
-        self._map.insert(self._block_num, block)
+        self._map.insert(self._block_num, record)
+        return block
+
+    def _build_block(self, record):
+        """Build a block object to load the given block.
+
+        Args:
+            record (world.block.BlockRecord): The block record.
+
+        Returns:
+            world.block.Block: Block object, ready for preparation.
+        """
+        block = self._warmed_blocks.pop(record, None)
+        if block is None:
+            block = Block(record, self._paths, self._surf_vertices)
+
         return block
 
+    def _warm_up(self, records):
+        """Start the assets warmup for the given blocks.
+
+        Blocks built for the warmup are kept to be prepared
+        later, so their layouts are not generated twice.
+
+        Args:
+            records (list): Records of the first blocks to prepare.
+        """
+        blocks = [self._build_block(record) for record in records]
+        self._warmup.start(blocks)
+        self._warmed_blocks = {block.record: block for block in blocks}
+
     def _track_amb_snd(self, task):
         """Check if current ambient sound should be changed."""
         if self.sun.day_part in ("evening", "night"):
@@ -547,6 +593,23 @@ class World:
         """
         self.outings_mgr.start_outing(type_)
 
+    def env_template(self, name):
+        """Get the shared template of the given environment model.
+
+        Templates are loaded once and then
+        instanced into the world blocks.
+
+        Args:
+            name (str): Environment model name.
+
+        Returns:
+            panda3d.core.NodePath: Environment model template.
+        """
+        if name not in self._env_templates:
+            self._env_templates[name] = loader.loadModel(address(name))  # noqa: F821
+
+        return self._env_templates[name]
+
     def generate_location(self, size, chosen_crew):
         """Generate game location.
 
@@ -570,11 +633,11 @@ class World:
         for num, rails_block in enumerate(rails_gen.generate_main_line(size)):
 
             if not rusty_blocks and chance(2):
-                rusty_blocks = random.randint(4, 8)
+                rusty_blocks = base.rng.randint(4, 8)  # noqa: F821
 
             if num > 100:
                 if not stench_blocks and chance(2):
-                    stench_blocks = random.randint(5, 9)
+                    stench_blocks = base.rng.randint(5, 9)  # noqa: F821
 
             is_city = False
             is_station = False
@@ -606,15 +669,12 @@ class World:
                 self._block_coor_step += 1
 
             self._map.append(
-                Block(
+                BlockRecord(
                     name=rails_block,
                     id_=num,
                     z_coor=self._block_coor,
                     z_dir=self._block_coor_step,
                     directions={num - 1: num + 1, num + 1: num - 1} if num > 0 else {},
-                    path=self._paths[rails_block],
-                    cam_path=self._paths["cam_" + rails_block],
-                    surf_vertices=self._surf_vertices,
                     is_station=is_station,
                     is_city=is_city,
                     is_rusty=is_rusty,
@@ -628,7 +688,7 @@ class World:
         # generating railway branches
         self._branches = rails_gen.generate_branches(self._map)
         for branch in self._branches:
-            br_start_block = Block(
+            br_start_block = BlockRecord(
                 name=branch["blocks"][0],
                 id_=branch["start"],
                 branch=branch["side"],
@@ -639,9 +699,6 @@ class World:
                     len(self._map): (branch["start"] + 1, branch["start"] - 1),
                     branch["start"] + 1: (branch["start"] - 1, len(self._map)),
                 },
-                path=self._paths[branch["blocks"][0]],
-                cam_path=self._paths["cam_" + branch["blocks"][0]],
-                surf_vertices=self._surf_vertices,
                 is_station=False,
                 is_city=False,
                 is_rusty=is_rusty,
@@ -655,11 +712,11 @@ class World:
             index = 1
             for rails_block in branch["blocks"][1:-1]:
                 if not rusty_blocks and chance(2):
-                    rusty_blocks = random.randint(4, 8)
+                    rusty_blocks = base.rng.randint(4, 8)  # noqa: F821
 
                 if num > 100:
                     if not stench_blocks and chance(2):
-                        stench_blocks = random.randint(6, 10)
+                        stench_blocks = base.rng.randint(6, 10)  # noqa: F821
 
                 is_station = False
 
@@ -688,7 +745,7 @@ class World:
 
                 num += 1
                 self._map.append(
-                    Block(
+                    BlockRecord(
                         name=rails_block,
                         id_=num,
                         branch=branch["side"],
@@ -703,9 +760,6 @@ class World:
                             len(self._map) - 1: len(self._map) + 1,
                             len(self._map) + 1: len(self._map) - 1,
                         },
-                        path=self._paths[rails_block],
-                        cam_path=self._paths["cam_" + rails_block],
-                        surf_vertices=self._surf_vertices,
                         is_station=is_station,
                         is_city=False,
                         is_rusty=is_rusty,
@@ -715,7 +769,7 @@ class World:
                         else self.outings_mgr.plan_outing(),
                     )
                 )
-                # replace the block name with the block object
+                # replace the block name with the block record
                 branch["blocks"][index] = self._map[-1]
                 index += 1
                 is_first = False
@@ -725,7 +779,7 @@ class World:
                 len(self._map) - 2: branch["end"],
             }
 
-            br_end_block = Block(
+            br_end_block = BlockRecord(
                 name=branch["blocks"][-1],
                 branch=branch["side"],
                 id_=branch["end"],
@@ -736,9 +790,6 @@ class World:
                     len(self._map) - 1: (branch["end"] + 1, branch["end"] - 1),
                     branch["end"] + 1: (branch["end"] - 1, len(self._map) - 1),
                 },
-                path=self._paths[branch["blocks"][-1]],
-                cam_path=self._paths["cam_" + branch["blocks"][-1]],
-                surf_vertices=self._surf_vertices,
                 is_station=False,
                 is_city=False,
                 is_rusty=is_rusty,
@@ -748,8 +799,13 @@ class World:
 
             self._map[branch["end"]] = br_end_block
 
+        self.topology.build()
         self._set_sounds()
+        if self.enemy is not None:
+            self.enemy.clear()
+
         self.enemy = Enemy()
+        self._warm_up(self._map[:FIRST_BLOCKS])
 
     def invert(self, block):
         """Invert the given block.
@@ -761,27 +817,13 @@ class World:
         if block.name in self._inversions:
             block.name, block.path, block.cam_path = self._inversions[block.name]
 
-    def save_map(self, num):
-        """Save the world map into a file.
-
-        Args:
-            num (int): The number of save slot.
-        """
-        map_to_save = []
-
-        for block in self._map:
-            map_to_save.append(block.description())
-
-        world_save = shelve.open("saves/world{}".format(str(num)), "n")
-        world_save["main_line"] = map_to_save
-        world_save["branches"] = self.branches
-        world_save.close()
-
-    def load_location(self, num, enemy_score, disease_threshold, stench_step, meet_scp):
+    def load_location(
+        self, world_map, enemy_score, disease_threshold, stench_step, meet_scp
+    ):
         """Load the given location from the last save.
 
         Args:
-            num (int): The save slot number.
+            world_map (dict): The saved world map description.
             enemy_score (int): Enemy score.
             disease_threshold (int): Disease activity score.
             stench_step (int):
@@ -794,18 +836,14 @@ class World:
 
         self.outings_mgr = OutingsManager()
 
-        world_save = shelve.open("saves/world{}".format(str(num)))
-        for desc in world_save["main_line"]:
-            block = Block(
+        for desc in world_map["main_line"]:
+            record = BlockRecord(
                 name=desc["name"],
                 id_=desc["id"],
                 directions=desc["directions"],
                 branch=desc["branch"],
                 z_coor=None,
                 z_dir=None,
-                path=self._paths[desc["name"]],
-                cam_path=self._paths["cam_" + desc["name"]],
-                surf_vertices=self._surf_vertices,
                 is_station=desc["station_side"] is not None,
                 is_city=desc["is_city"],
                 is_rusty=desc["is_rusty"],
@@ -813,13 +851,21 @@ class World:
                 outing_available=desc["outing_available"],
                 desc=desc,
             )
-            self._map.append(block)
+            self._map.append(record)
 
         self._set_sounds()
+        if self.enemy is not None:
+            self.enemy.clear()
+
         self.enemy = Enemy()
         self.enemy.score = enemy_score
 
-        self._branches = world_save["branches"]
+        blocks = {record.id: record for record in self._map}
+        self._branches = world_map["branches"]
+        for branch in self._branches:
+            branch["blocks"][1:-1] = [blocks[id_] for id_ in branch["blocks"][1:-1]]
+
+        self.topology.build()
 
     def load_blocks(self, cur_blocks, angle):
         """Load blocks around player to continue the saved game.
@@ -828,7 +874,9 @@ class World:
             cur_block (int): The current block number.
             angle (int): The current - 2 block angle.
         """
-        block = self._map[cur_blocks[0]].prepare()
+        self._warm_up([self._map[id_] for id_ in cur_blocks])
+
+        block = self._build_block(self._map[cur_blocks[0]]).prepare()
         block.rails_mod.reparentTo(render)  # noqa: F821
         block.rails_mod.setH(angle)
         self._loaded_blocks.append(block)
@@ -875,16 +923,14 @@ class World:
             self.outings_mgr.hide_outing()
             return
 
-        directions = self._loaded_blocks[-1].directions
-        if not directions:
-            return
-
-        new_block = directions[current_block.id]
-        if isinstance(new_block, tuple):
+        if not self._loaded_blocks[-1].directions:
             return
 
-        if self._map[new_block].outing_available:
-            self.outings_mgr.show_upcoming(self._map[new_block].outing_available)
+        distance, outing_block = self.topology.ahead(
+            current_block.id, self._loaded_blocks[-1].id, "outing"
+        )
+        if distance == 1:
+            self.outings_mgr.show_upcoming(outing_block.outing_available)
 
         elif self._map[self._loaded_blocks[-1].id].outing_available:
             self.outings_mgr.show_upcoming_closer()
@@ -956,21 +1002,16 @@ class World:
         if current_block.enemy_territory:
             return
 
-        directions = self._loaded_blocks[-1].directions
-        if not directions:
+        if not self._loaded_blocks[-1].directions:
             return
 
-        new_block = directions[current_block.id]
-
-        if isinstance(new_block, tuple):
-            return
-
-        if self._map[new_block].name in ("l_fork", "r_fork", "exit_from_fork"):
+        distance, fork = self.topology.ahead(
+            current_block.id, self._loaded_blocks[-1].id, "fork"
+        )
+        if distance == 1:
             self._near_fork = True
             base.train.show_turning_ability(  # noqa: F821
-                self._map[new_block],
-                current_block.branch,
-                new_block < current_block.id,
+                fork, current_block.branch, fork.id < current_block.id
             )
             return
 
@@ -1171,13 +1212,13 @@ class World:
 
                 cur_id = current_block.id if current_block.id != -1 else self._cur_block
 
-                block = self._map[next_block].prepare(
+                block = self._build_block(self._map[next_block]).prepare(
                     invert=cur_id > self._map[next_block].id,
                     from_branch=current_block.branch,
                 )
                 self._block_num = block.id
             else:
-                block = self._map[self._block_num].prepare()
+                block = self._build_block(self._map[self._block_num]).prepare()
 
             self._loaded_blocks.append(block)
 
@@ -1237,10 +1278,14 @@ class World:
             block.rails_mod.reparentTo(render)  # noqa: F821
 
         if not from_city:
-            self._track_cities()
+            # there is no player to leave cities and stations
+            # in headless mode, so the Train passes them by
+            if not base.headless:  # noqa: F821
+                self._track_cities()
             self._track_outings()
             self._track_forks()
-            self._track_places_of_interest()
+            if not base.headless:  # noqa: F821
+                self._track_places_of_interest()
 
         return block
 
@@ -1275,7 +1320,7 @@ class World:
 
             # don't keep enemy territory in the world
             if block_to_clear.id == -1:
-                self._map.remove(block_to_clear)
+                self._map.remove(block_to_clear.record)
                 self._block_num -= 1
 
     def start_ambient_sound(self):
@@ -1285,7 +1330,7 @@ class World:
     def play_fight_music(self, task):
         """Start to play fighting music."""
         if self._cur_music is None:
-            self._cur_music = random.choice(self._fight_music)
+            self._cur_music = base.rng.choice(self._fight_music)  # noqa: F821
             self._cur_music.setVolume(0.2)
             self._cur_music.play()
 
@@ -1304,12 +1349,14 @@ class World:
             self._cur_music = None
 
             taskMgr.doMethodLater(  # noqa: F821
-                random.randint(45, 55), self._play_idle_music, "play_idle_music"
+                base.rng.randint(45, 55),  # noqa: F821
+                self._play_idle_music,
+                "play_idle_music",
             )
 
     def _play_idle_music(self, task):
         """Play IDLE game music."""
-        self._cur_idle_music = random.choice(self._idle_music)
+        self._cur_idle_music = base.rng.choice(self._idle_music)  # noqa: F821
         self._cur_idle_music.play()
         return task.done
 
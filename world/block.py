@@ -4,11 +4,9 @@ License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
 
 World blocks API.
 """
-import copy
 import random
 
 from direct.interval.IntervalGlobal import LerpPosHprScaleInterval
-from direct.particles.ParticleEffect import ParticleEffect
 from panda3d.core import TextureStage, Texture, TransparencyAttrib
 
 from utils import address, chance, take_random
@@ -47,25 +45,41 @@ FLOWER_RANGES = {
 }
 
 
-class Block:
-    """Single world block.
+def _record_property(name, doc):
+    """Build a Block property, which is stored in the block record.
 
-    Consists of railway model, path for the locomotive to move along,
-    environment models and two terrain blocks.
+    Args:
+        name (str): Record attribute name.
+        doc (str): Property docstring.
+
+    Returns:
+        property: Property to read and write the record attribute.
+    """
+    return property(
+        lambda self: getattr(self.record, name),
+        lambda self, value: setattr(self.record, name, value),
+        doc=doc,
+    )
 
-    On creation it chooses terrains models and arranges environment
-    models, but only coordinates and model names are generated.
-    All of that content will be loaded on Block.prepare() call.
+
+class BlockRecord:
+    """Compact record of a single world block.
+
+    The world map keeps a record for every block, while heavy
+    Block objects, with their models and motion paths, are
+    built only for the currently loaded blocks.
+
+    On creation it chooses terrains models and a layout seed. The
+    environment models arrangement is derived from the seed on every
+    Block.prepare() call, so the record keeps only several values,
+    while the block layout is the same every time it's loaded.
 
     Args:
-        path (Mopath.Mopath): Motion path.
-        cam_path (Mopath.Mopath): Motion path for camera.
         name (str): Block path name.
         z_coor (int): Coordinate of the block.
         z_dir (int): Direction of the block along Z-axis.
         id_ (int): The block id.
         direction (dict): Possible movement directions on this block.
-        surf_vertices (dict): Vertices index of every surface model.
         branch (str): Branch direction indicator: "l" or "r".
         enemy_territory (bool): This block is an enemy territory.
         is_station (bool): Station must be set on this block.
@@ -76,16 +90,37 @@ class Block:
         desc (dict): Block description.
     """
 
+    __slots__ = (
+        "name",
+        "id",
+        "z_coor",
+        "z_dir",
+        "directions",
+        "branch",
+        "enemy_territory",
+        "is_station",
+        "is_city",
+        "is_rusty",
+        "is_stenchy",
+        "outing_available",
+        "station_side",
+        "l_surface",
+        "r_surface",
+        "l_angle",
+        "r_angle",
+        "seed",
+        "et_layout",
+        "add_surface",
+        "block",
+    )
+
     def __init__(
         self,
-        path,
-        cam_path,
         name,
         z_coor,
         z_dir,
         id_,
         directions,
-        surf_vertices,
         branch=None,
         enemy_territory=False,
         is_station=False,
@@ -95,39 +130,31 @@ class Block:
         outing_available=None,
         desc=None,
     ):
-
-        self._surfs = []
-        self._phys_objs = []
-        self._add_surface = False
-        self._old_values = None
-        self._fireflies = None
-        self._bonfire = None
-
-        self.rails_mod = None
         self.name = name
-        self.path = path
-        self.cam_path = cam_path
-        self.enemy_territory = enemy_territory
-        self.outing_available = outing_available
-        self.is_city = is_city
-        self.is_rusty = is_rusty
-        self.is_stenchy = is_stenchy
         self.id = id_
         self.z_coor = z_coor
         self.z_dir = z_dir
         self.directions = directions
         self.branch = branch
+        self.enemy_territory = enemy_territory
         self.is_station = is_station
-        self.scp_rails = None
+        self.is_city = is_city
+        self.is_rusty = is_rusty
+        self.is_stenchy = is_stenchy
+        self.outing_available = outing_available
+        # additional surfaces must be loaded on the block preparation
+        self.add_surface = False
+        # the Block object, while this block is loaded
+        self.block = None
 
         if desc:  # loading block
-            self._station_side = desc["station_side"]
-            self._l_surface = desc["l_surface"]
-            self._r_surface = desc["r_surface"]
-            self._l_angle = desc["l_angle"]
-            self._r_angle = desc["r_angle"]
-            self._env_mods = desc["env_mods"]
-            self._railways_model = desc["railways_model"]
+            self.station_side = desc["station_side"]
+            self.l_surface = desc["l_surface"]
+            self.r_surface = desc["r_surface"]
+            self.l_angle = desc["l_angle"]
+            self.r_angle = desc["r_angle"]
+            self.seed = desc["seed"]
+            self.et_layout = desc["et_layout"]
             self.id = desc["id"]
             self.branch = desc["branch"]
             self.directions = desc["directions"]
@@ -135,22 +162,144 @@ class Block:
             return
 
         # generating block
-        self._station_side = random.choice(("l", "r")) if is_station else None
+        self.station_side = (
+            base.rng.choice(("l", "r")) if is_station else None  # noqa: F821
+        )
+
+        self.l_surface, self.l_angle = self._gen_surface("l")
+        self.r_surface, self.r_angle = self._gen_surface("r")
+
+        self.seed = base.rng.getrandbits(32)  # noqa: F821
+        self.et_layout = enemy_territory
 
-        self._l_surface, self._l_angle = self._gen_surface("l")
-        self._r_surface, self._r_angle = self._gen_surface("r")
+    def _gen_surface(self, side):
+        """Generate a terrain block.
 
-        self._env_mods = {
-            "l": self._gen_env_mods(copy.deepcopy(surf_vertices[self._l_surface])),
-            "r": self._gen_env_mods(copy.deepcopy(surf_vertices[self._r_surface])),
+        Randomly choose one of the terrain blocks proper for this
+        rails block. Randomly rotate it. Use special terrain blocks
+        for enemy territory.
+
+        Args:
+            side (str):
+                Side of the terrain block, relatively to the railway.
+
+        Returns:
+            str, int: Terrain model name, angle.
+        """
+        if self.enemy_territory:
+            return address("surface_en1"), base.rng.choice(ANGLES)  # noqa: F821
+
+        if self.is_city:
+            return address("surface_with_" + side + "_city"), 180 if side == "r" else 0
+
+        if side == self.station_side:
+            surface = address(take_random(base.world.stations_pool))  # noqa: F821
+            return surface, (180 if side == "r" else 0)
+
+        surface = address(base.rng.choice(SURFACES[self.name]))  # noqa: F821
+        if self.name == "direct":
+            return surface, base.rng.choice(ANGLES)  # noqa: F821
+
+        return surface, 0
+
+    def description(self):
+        """Build block description.
+
+        Used to save the game world.
+
+        Returns:
+            dict: Block description.
+        """
+        desc = {
+            "name": self.name,
+            "id": self.id,
+            "branch": self.branch,
+            "directions": self.directions,
+            "outing_available": self.outing_available,
+            "is_city": self.is_city,
+            "is_rusty": self.is_rusty,
+            "is_stenchy": self.is_stenchy,
+            "station_side": self.station_side,
+            "l_surface": self.l_surface,
+            "r_surface": self.r_surface,
+            "l_angle": self.l_angle,
+            "r_angle": self.r_angle,
+            "seed": self.seed,
+            "et_layout": self.et_layout,
+            "is_station": self.is_station,
         }
-        self._railways_model = self._gen_railways_model()
+        return desc
 
-    def _gen_env_mods(self, vertices):
+    def load_additional_surface(self):
+        """Load the additional surface models for this block.
+
+        If the block isn't loaded yet, the surfaces
+        will be loaded on the block preparation.
+        """
+        if self.block is None:
+            self.add_surface = True
+        else:
+            self.block.load_additional_surface()
+
+
+class Block:
+    """Single world block.
+
+    Consists of railway model, path for the locomotive to move along,
+    environment models and two terrain blocks. Built from the block
+    record only to load the block, and dropped after clearing.
+
+    Args:
+        record (BlockRecord): The block record.
+        paths (dict): Motion paths index.
+        surf_vertices (dict): Vertices index of every surface model.
+    """
+
+    id = _record_property("id", "The block id.")
+    branch = _record_property("branch", "Branch direction indicator.")
+    directions = _record_property("directions", "Possible movement directions.")
+    enemy_territory = _record_property(
+        "enemy_territory", "This block is an enemy territory."
+    )
+    is_station = _record_property("is_station", "Station is set on this block.")
+    is_city = _record_property("is_city", "This is a city block.")
+    is_rusty = _record_property("is_rusty", "Rails on this block are deteriorated.")
+    is_stenchy = _record_property(
+        "is_stenchy", "This block is covered with the Stench clouds."
+    )
+    outing_available = _record_property(
+        "outing_available", "An outing type available on this block."
+    )
+
+    def __init__(self, record, paths, surf_vertices):
+        self._surfs = []
+        self._phys_objs = []
+        self._fireflies = None
+        self._bonfires = []
+        self._layout = None
+        self._surf_vertices = surf_vertices
+
+        self.record = record
+        self.rails_mod = None
+        self.name = record.name
+        self.path = paths[record.name]
+        self.cam_path = paths["cam_" + record.name]
+        self.scp_rails = None
+
+        self._l_surface = record.l_surface
+        self._r_surface = record.r_surface
+        self._l_angle = record.l_angle
+        self._r_angle = record.r_angle
+        self._seed = record.seed
+        self._et_layout = record.et_layout
+
+    def _gen_env_mods(self, rng, vertices):
         """Randomly select and arrange environment models.
 
         Args:
-            vertices (list): Vertices of the terrain model.
+            rng (random.Random): The block layout random generator.
+            vertices (world.vertices.VertexSampler):
+                Sampler of the terrain model vertices.
 
         Returns:
             list:
@@ -158,47 +307,50 @@ class Block:
                 model name, and the second is its position.
         """
         models = []
-        et_suf = "et_" if self.enemy_territory else ""
+        et_suf = "et_" if self._et_layout else ""
 
         for models_conf in LOCATION_CONF[et_suf + "with_quantity"]:
-            for _ in range(random.randint(*models_conf["quantity"])):
+            for _ in range(rng.randint(*models_conf["quantity"])):
                 models.append(
                     (
-                        random.choice(models_conf["models"]),
-                        take_random(vertices[models_conf["square"]]),
+                        rng.choice(models_conf["models"]),
+                        vertices.take(models_conf["square"]),
                     )
                 )
         for models_conf in LOCATION_CONF[et_suf + "with_chance"]:
-            if chance(models_conf["chance"]):
+            if chance(models_conf["chance"], rng):
                 models.append(
                     (
-                        random.choice(models_conf["models"]),
-                        take_random(vertices[models_conf["square"]]),
+                        rng.choice(models_conf["models"]),
+                        vertices.take(models_conf["square"]),
                     )
                 )
         return models
 
-    def _gen_railways_model(self):
+    def _gen_railways_model(self, rng):
         """Select railways model and generate its coordinates.
 
+        Args:
+            rng (random.Random): The block layout random generator.
+
         Returns:
             list: Railways model name, x and y coords, angle.
         """
         if (
-            self.name != "direct"
-            or chance(83)
-            or self.enemy_territory
-            or self.is_station
+            self.record.name != "direct"
+            or chance(83, rng)
+            or self._et_layout
+            or self.record.station_side is not None
         ):
             return
 
-        model = random.choice(
+        model = rng.choice(
             (
                 "arch1",
                 "sign1",
                 "sign2",
                 "sign3",
-                "light_post{}".format(random.randint(1, 2)),
+                "light_post{}".format(rng.randint(1, 2)),
                 "lamp_post1",
                 "transparant1",
             )
@@ -206,44 +358,70 @@ class Block:
         if model in ("arch1", "transparant1"):
             coor = 0
         else:
-            coor = random.choice((0.15, -0.15))
+            coor = rng.choice((0.15, -0.15))
 
         if model == "lamp_post1" and coor > 0:
             angle = 180
         else:
             angle = 0
 
-        return (address(model), (coor, random.randint(0, 8)), angle)
-
-    def _gen_surface(self, side):
-        """Generate a terrain block.
+        return (address(model), (coor, rng.randint(0, 8)), angle)
 
-        Randomly choose one of the terrain blocks proper for this
-        rails block. Randomly rotate it. Use special terrain blocks
-        for enemy territory.
+    def _gen_flowers(self, rng, angle, side):
+        """Generate texture flowers positions.
 
         Args:
-            side (str):
-                Side of the terrain block, relatively to the railway.
+            rng (random.Random): The block layout random generator.
+            angle (int): Surface model angle.
+            side (str): Surface model side.
 
         Returns:
-            str, int: Terrain model name, angle.
+            list: Flower texture numbers and their U and V positions.
         """
-        if self.enemy_territory:
-            return address("surface_en1"), random.choice(ANGLES)
+        flowers = []
+        for _ in range(rng.randint(0, 3)):
+            flowers.append(
+                (
+                    rng.randint(1, 5),
+                    rng.randint(*FLOWER_RANGES[(angle, side)]["u"]),
+                    rng.randint(*FLOWER_RANGES[(angle, side)]["v"]),
+                )
+            )
+        return flowers
 
-        if self.is_city:
-            return address("surface_with_" + side + "_city"), 180 if side == "r" else 0
+    def _gen_layout(self):
+        """Derive this block layout from its seed.
 
-        if side == self._station_side:
-            surface = address(take_random(base.world.stations_pool))  # noqa: F821
-            return surface, (180 if side == "r" else 0)
+        Returns:
+            dict:
+                Environment and railways models,
+                flowers and mist positions.
+        """
+        rng = random.Random(self._seed)
 
-        surface = address(random.choice(SURFACES[self.name]))
-        if self.name == "direct":
-            return surface, random.choice(ANGLES)
+        env_mods = {}
+        for side, surface in (("l", self._l_surface), ("r", self._r_surface)):
+            env_mods[side] = self._gen_env_mods(
+                rng, self._surf_vertices[surface].sampler(rng)
+            )
 
-        return surface, 0
+        layout = {
+            "env_mods": env_mods,
+            "railways_model": self._gen_railways_model(rng),
+            "flowers": {
+                "l": self._gen_flowers(rng, self._l_angle, "l"),
+                "r": self._gen_flowers(rng, self._r_angle, "r"),
+            },
+            "mist": rng.randint(-3, 3) if chance(6, rng) else None,
+        }
+        # environment models headings are generated last,
+        # so that all the other layout parts stay the same
+        for side in ("l", "r"):
+            env_mods[side] = [
+                env_mod + (rng.randint(1, 359),) for env_mod in env_mods[side]
+            ]
+
+        return layout
 
     def _load_surface_block(self, name, x_pos, y_pos, angle, side=None, invert=False):
         """Load terrain model and set it to the given coords.
@@ -275,33 +453,48 @@ class Block:
         if not side:
             return
 
-        # load environment models asynchronous
+        # environment models are grouped by model name, every
+        # group is loaded asynchronous into a single static batch
+        batches = {}
+        for env_mod in self._layout["env_mods"][side]:
+            if env_mod[0] == "fireplace1":
+                taskMgr.doMethodLater(  # noqa: F821
+                    0,
+                    self._load_env_model,
+                    "load_env_model",
+                    extraArgs=[surf_mod, env_mod],
+                )
+                continue
+
+            batches.setdefault(env_mod[0], []).append(env_mod[1:])
+
         delay = 0
-        for env_mod in self._env_mods[side]:
+        for name, placements in batches.items():
             taskMgr.doMethodLater(  # noqa: F821
                 delay,
-                self._load_env_model,
-                "load_env_model",
-                extraArgs=[surf_mod, env_mod],
+                self._load_env_batch,
+                "load_env_batch",
+                extraArgs=[surf_mod, name, placements],
             )
-            delay += 0.0275
+            delay += 0.1
 
         # load railways model
-        if self._railways_model:
-            railways_mod = loader.loadModel(self._railways_model[0])  # noqa: F821
+        railways_model = self._layout["railways_model"]
+        if railways_model:
+            railways_mod = loader.loadModel(railways_model[0])  # noqa: F821
             railways_mod.reparentTo(self.rails_mod)
 
-            railways_mod.setX(self._railways_model[1][0])
-            railways_mod.setY(self._railways_model[1][1])
-            railways_mod.setH(self._railways_model[2])
+            railways_mod.setX(railways_model[1][0])
+            railways_mod.setY(railways_model[1][1])
+            railways_mod.setH(railways_model[2])
 
         if not base.world.sun.is_dark:  # noqa: F821
-            # generate texture flowers
+            # set texture flowers
             taskMgr.doMethodLater(  # noqa: F821
                 2.5,
-                self._gen_flowers,
-                "generate_flowers",
-                extraArgs=[surf_mod, angle, side],
+                self._set_flowers,
+                "set_flowers",
+                extraArgs=[surf_mod, self._layout["flowers"][side]],
             )
 
         if invert:
@@ -322,56 +515,77 @@ class Block:
         r_surf.setPos(l_pos)
         r_surf.setH(r_surf, 180)
 
+    def _load_env_batch(self, surf_mod, name, placements):
+        """Helper to load a batch of environment models asynchronous.
+
+        Every model of the batch is an instance of the shared
+        template. When arranged, the batch is flattened into
+        a single static node to reduce the number of draw calls.
+
+        Args:
+            surf_mod (panda3d.core.NodePath): Surface model.
+            name (str): Environment model name.
+            placements (list): Positions and headings of the models.
+        """
+        batch = surf_mod.attachNewNode("env_batch_" + name)
+        template = base.world.env_template(name)  # noqa: F821
+
+        for pos, heading in placements:
+            mod = batch.attachNewNode(name)
+            mod.setPos(pos)
+            mod.setH(heading)
+            template.instanceTo(mod)
+
+        if "grass" in name:
+            batch.setTransparency(TransparencyAttrib.M_binary)
+            batch.setShaderOff()
+
+        if "snow_pile" == name:
+            base.world.sun.ignore_shadows(batch)  # noqa: F821
+
+        batch.flattenStrong()
+
     def _load_env_model(self, surf_mod, env_mod):
         """Helper to load a model asynchronous.
 
+        Used for the environment models, which
+        can't be batched, like ones with particles.
+
         Args:
             surf_mod (panda3d.core.NodePath): Surface model.
-            env_mod (str): Name of the model to load and its position.
+            env_mod (tuple): Name of the model to load, its position and heading.
         """
         mod = loader.loadModel(address(env_mod[0]))  # noqa: F821
-        if "grass" in env_mod[0]:
-            mod.setTransparency(TransparencyAttrib.M_binary)
-            mod.setShaderOff()
 
         if "fireplace1" == env_mod[0]:
-            self._bonfire = ParticleEffect()
-            self._bonfire.loadConfig("effects/bonfire.ptf")
-            self._bonfire.reparentTo(mod)
-            self._bonfire.start(mod, render)  # noqa: F821
-
-        if "snow_pile" == env_mod[0]:
-            base.world.sun.ignore_shadows(mod)  # noqa: F821
+            bonfire = base.effects_mgr.particles.acquire("bonfire")  # noqa: F821
+            bonfire.reparentTo(mod)
+            bonfire.start(mod, render)  # noqa: F821
+            self._bonfires.append(bonfire)
 
         mod.reparentTo(surf_mod)
         mod.setPos(env_mod[1])
-        mod.setH(random.randint(1, 359))
+        mod.setH(env_mod[2])
 
-    def _gen_flowers(self, surf_mod, angle, side):
-        """Generate texture flowers.
+    def _set_flowers(self, surf_mod, flowers):
+        """Set texture flowers.
 
         Args:
             surf_mod (panda3d.core.NodePath): Surface model.
-            angle (int): Surface model angle.
-            side (str): Surface model side.
+            flowers (list): Flower texture numbers and positions.
         """
-        for i in range(random.randint(0, 3)):
+        for i, (num, u_pos, v_pos) in enumerate(flowers):
             ts = TextureStage("ts_flower{}".format(str(i)))
             ts.setMode(TextureStage.MDecal)
 
             tex = loader.loadTexture(  # noqa: F821
-                "just_tex/flower{}.png".format(str(random.randint(1, 5)))
+                "just_tex/flower{}.png".format(str(num))
             )
             tex.setWrapU(Texture.WMClamp)
             tex.setWrapV(Texture.WMClamp)
 
             surf_mod.setTexture(ts, tex)
-            surf_mod.setTexPos(
-                ts,
-                random.randint(*FLOWER_RANGES[(angle, side)]["u"]),
-                random.randint(*FLOWER_RANGES[(angle, side)]["v"]),
-                0,
-            )
+            surf_mod.setTexPos(ts, u_pos, v_pos, 0)
             surf_mod.setTexScale(ts, 20, 20)
 
     def prepare(self, invert=False, from_branch=False):
@@ -387,7 +601,6 @@ class Block:
             Block: Returns self object.
         """
         if self.name in ("l_fork", "r_fork") and from_branch:
-            self._old_values = (self.name, self.path, self.cam_path)
             self.name, self.path, self.cam_path = (
                 "exit_from_fork",
                 (
@@ -411,9 +624,11 @@ class Block:
             )
 
         if invert:
-            self._old_values = (self.name, self.path, self.cam_path)
             base.world.invert(self)  # noqa: F821
 
+        self.record.block = self
+        if self._layout is None:
+            self._layout = self._gen_layout()
         self.rails_mod = loader.loadModel(  # noqa: F821
             address(self.name + "_rails" + ("_rusty" if self.is_rusty else ""))
         )
@@ -450,9 +665,9 @@ class Block:
             self._load_surface_block(self._l_surface, 4, 12, self._r_angle)
             self._load_surface_block(self._l_surface, -4, 12, self._r_angle)
 
-        if self._add_surface:
+        if self.record.add_surface:
             self.load_additional_surface()
-            self._add_surface = False
+            self.record.add_surface = False
 
         if self.id == 0:
             surf_mod = loader.loadModel(address("surface1"))  # noqa: F821
@@ -467,28 +682,31 @@ class Block:
             rails_mod.reparentTo(self.rails_mod)
             rails_mod.setPos(0, -8, 0)
 
-        if chance(6):
+        if self._layout["mist"] is not None:
             mist = loader.loadModel(address("mist"))  # noqa: F821
             mist.reparentTo(self.rails_mod)
-            mist.setPos(random.randint(-3, 3), 0, 0.07)
+            mist.setPos(self._layout["mist"], 0, 0.07)
             mist.setBin("transparent", 30)
             LerpPosHprScaleInterval(mist, 70, (0, -5, 0), 0, (1.3, 1.1, 1.3)).start()
 
         if base.world.sun.day_part == "night" and chance(70):  # noqa: F821
-            self._fireflies = ParticleEffect()
-            self._fireflies.loadConfig("effects/fireflies.ptf")
+            self._fireflies = base.effects_mgr.particles.acquire(  # noqa: F821
+                "fireflies"
+            )
 
             if chance(50):
-                self._fireflies.setPos(random.uniform(-0.15, -1), 0, 0.2)
+                self._fireflies.setPos(
+                    base.rng.uniform(-0.15, -1), 0, 0.2  # noqa: F821
+                )
             else:
-                self._fireflies.setPos(random.uniform(0.15, 1), 0, 0.2)
+                self._fireflies.setPos(base.rng.uniform(0.15, 1), 0, 0.2)  # noqa: F821
 
             self._fireflies.start(self.rails_mod, render)  # noqa: F821
 
         if chance(10):
             light_rays = loader.loadModel(address("light_rays"))  # noqa: F821
             light_rays.reparentTo(self.rails_mod)
-            light_rays.setPos(random.uniform(-1, 1), 0, 0.2)
+            light_rays.setPos(base.rng.uniform(-1, 1), 0, 0.2)  # noqa: F821
             light_rays.setBillboardPointWorld()
             light_rays.setDepthWrite(False)
 
@@ -496,12 +714,6 @@ class Block:
 
     def load_additional_surface(self):
         """Load the additional surface models for this block."""
-        # the rails model isn't prepared yet - delay the additional
-        # surfaces loading until the rails model loading
-        if self.rails_mod is None:
-            self._add_surface = True
-            return
-
         if self.name == "l_fork" or (
             self.name == "exit_from_fork" and self.branch == "r"
         ):
@@ -536,39 +748,40 @@ class Block:
         ):
             Rocket()
 
-    def description(self):
-        """Build block description.
+    def manifest(self):
+        """Build the list of assets, needed to prepare this block.
 
-        Used to save the game world.
+        The generated layout is kept to be used on the block preparation.
 
         Returns:
-            dict: Block description.
+            list: Assets kinds and paths.
         """
-        desc = {
-            "name": self.name,
-            "id": self.id,
-            "branch": self.branch,
-            "directions": self.directions,
-            "outing_available": self.outing_available,
-            "is_city": self.is_city,
-            "is_rusty": self.is_rusty,
-            "is_stenchy": self.is_stenchy,
-            "station_side": self._station_side,
-            "l_surface": self._l_surface,
-            "r_surface": self._r_surface,
-            "l_angle": self._l_angle,
-            "r_angle": self._r_angle,
-            "env_mods": self._env_mods,
-            "railways_model": self._railways_model,
-            "is_station": self.is_station,
+        models = {
+            address(self.name + "_rails" + ("_rusty" if self.is_rusty else "")),
+            address("mist"),
+            address("light_rays"),
+            self._l_surface,
+            self._r_surface,
         }
-        return desc
+        if self._layout is None:
+            self._layout = self._gen_layout()
+
+        for side in ("l", "r"):
+            for env_mod in self._layout["env_mods"][side]:
+                models.add(address(env_mod[0]))
+
+        if self._layout["railways_model"]:
+            models.add(self._layout["railways_model"][0])
+
+        manifest = [("model", path) for path in sorted(models)]
+        for num in range(1, 6):
+            manifest.append(("texture", "just_tex/flower{}.png".format(num)))
+
+        return manifest
 
     def clear(self):
-        """Clear this block and revert its inversion."""
-        if self._old_values:
-            self.name, self.path, self.cam_path = self._old_values
-            self._old_values = None
+        """Clear this block and release its record."""
+        self.record.block = None
 
         for obj in self._phys_objs:
             obj.clear()
@@ -576,11 +789,15 @@ class Block:
         self._surfs.clear()
         self.rails_mod.removeNode()
         self.rails_mod = None
+        self._layout = None
 
         if self._fireflies is not None:
-            self._fireflies.disable()
+            base.effects_mgr.particles.release(  # noqa: F821
+                "fireflies", self._fireflies
+            )
             self._fireflies = None
 
-        if self._bonfire is not None:
-            self._bonfire.disable()
-            self._bonfire = None
+        for bonfire in self._bonfires:
+            base.effects_mgr.particles.release("bonfire", bonfire)  # noqa: F821
+
+        self._bonfires.clear()
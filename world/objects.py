@@ -4,8 +4,6 @@ License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
 
 Active world objects API.
 """
-import random
-
 from direct.actor.Actor import Actor
 from direct.directutil import Mopath
 from direct.interval.IntervalGlobal import (
@@ -50,8 +48,8 @@ class Barrier:
     """
 
     def __init__(self, block):
-        id_ = "barrier_" + str(random.randint(1, 10000))
-        y_coor = random.randint(8, 16)
+        id_ = "barrier_" + str(base.rng.randint(1, 10000))  # noqa: F821
+        y_coor = base.rng.randint(8, 16)  # noqa: F821
         self._rb_nodes = []
 
         self._prepare_physics(
@@ -82,7 +80,7 @@ class Barrier:
 
         phys_np = block.rails_mod.attachNewNode(rb_node)
         phys_np.setPos(x_coor, y_coor, 0.07)
-        phys_np.setH(random.randint(-20, 20))
+        phys_np.setH(base.rng.randint(-20, 20))  # noqa: F821
         loader.loadModel(address("barrier1")).reparentTo(phys_np)  # noqa: F821
 
         base.world.phys_mgr.attachRigidBody(rb_node)  # noqa: F821
@@ -104,7 +102,9 @@ class Rocket:
     """
 
     def __init__(self):
-        x_coor, side = random.choice(((0.553, "left"), (-0.553, "right"), (0, "top")))
+        x_coor, side = base.rng.choice(  # noqa: F821
+            ((0.553, "left"), (-0.553, "right"), (0, "top"))
+        )
 
         self._model = Actor(address("rocket1"))
         self._model.reparentTo(base.train.model)  # noqa: F821
@@ -172,7 +172,7 @@ class SCPTrain:
 
     def __init__(self):
         self._positions = [-0.25, -0.07, 0.06, 0.22]
-        self._side = random.choice((0.7, -0.7))
+        self._side = base.rng.choice((0.7, -0.7))  # noqa: F821
         self._glow_step = 0.05
         self._glow_strength = 0.2
         self._move_int = None
@@ -249,8 +249,8 @@ class SCPTrain:
             y_offset = -0.1
             for sun in self.suns:
                 sun.model.setPos(
-                    random.uniform(0.4, 0.6) * factor,
-                    y_offset + random.uniform(-0.1, 0.1),
+                    base.rng.uniform(0.4, 0.6) * factor,  # noqa: F821
+                    y_offset + base.rng.uniform(-0.1, 0.1),  # noqa: F821
                     0.4,
                 )
                 y_offset += 0.1
@@ -259,7 +259,7 @@ class SCPTrain:
             for sun in self.suns:
                 sun.model.setPos(
                     sun.model.getX() + 0.65 * factor,
-                    y_offset + random.uniform(-0.1, 0.1),
+                    y_offset + base.rng.uniform(-0.1, 0.1),  # noqa: F821
                     0.38,
                 )
                 y_offset += 0.15
@@ -268,7 +268,7 @@ class SCPTrain:
             for sun in self.suns:
                 sun.model.setPos(
                     sun.model.getX() + 0.9 * factor,
-                    y_offset + random.uniform(-0.1, 0.1),
+                    y_offset + base.rng.uniform(-0.1, 0.1),  # noqa: F821
                     0.01,
                 )
                 y_offset += 0.22
@@ -311,9 +311,9 @@ class SCPTrain:
         col_node.setFromCollideMask(MOUSE_MASK)
         col_node.addSolid(CollisionSphere(0, 0, 0, 0.17))
 
-        base.common_ctrl.traverser.addCollider(  # noqa: F821
-            self._scorch_parts.attachNewNode(col_node),
-            base.common_ctrl.handler,  # noqa: F821
+        self._ray_col_np = self._scorch_parts.attachNewNode(col_node)
+        base.common_ctrl.add_collider(  # noqa: F821
+            self._ray_col_np, base.common_ctrl.handler  # noqa: F821
         )
 
         sizzle_snd = base.sound_mgr.loadSfx("sounds/sizzle.ogg")  # noqa: F821
@@ -330,15 +330,17 @@ class SCPTrain:
         name = event.getIntoNodePath().getName()
         if name.startswith("character_"):
             char = base.team.chars[name]  # noqa: F821
-            taskMgr.doMethodLater(  # noqa: F821
-                0.3, char.get_scorch_damage, char.id + "_scorch_damage"
+            base.units_timers.do_later(  # noqa: F821
+                0.3, char.get_scorch_damage, char.id, "_scorch_damage"
             )
 
     def _stop_scorch(self, event):
         """Stop scorching process."""
         name = event.getIntoNodePath().getName()
         if name.startswith("character_"):
-            taskMgr.remove(base.team.chars[name].id + "_scorch_damage")  # noqa: F821
+            base.units_timers.cancel(  # noqa: F821
+                base.team.chars[name].id, "_scorch_damage"  # noqa: F821
+            )
 
     def _ray_charge(self, task):
         """Do a light ray attack.
@@ -352,8 +354,8 @@ class SCPTrain:
             self._ray_start_snd.play()
             self._sizzle_snd.play()
 
-            x_pos = random.uniform(-0.13, 0.13)
-            y_pos = random.uniform(-0.17, 0.27)
+            x_pos = base.rng.uniform(-0.13, 0.13)  # noqa: F821
+            y_pos = base.rng.uniform(-0.17, 0.27)  # noqa: F821
             self._ray_np.setPos(x_pos, y_pos, 0.7)
 
             self._volume_ray.show()
@@ -380,7 +382,9 @@ class SCPTrain:
             self._ray_step = 0.9
             self._ray_strength = 70
             taskMgr.doMethodLater(  # noqa: F821
-                random.randint(7, 10), self._ray_charge, "scp_ray_charge"
+                base.rng.randint(7, 10),  # noqa: F821
+                self._ray_charge,
+                "scp_ray_charge",
             )
             return task.done
 
@@ -408,7 +412,7 @@ class SCPTrain:
                     self._inst_app_snd,
                 ],
             )
-            delay += random.uniform(0.4, 0.8)
+            delay += base.rng.uniform(0.4, 0.8)  # noqa: F821
             num_insts += 1
             if num_insts == 4:
                 break
@@ -417,8 +421,11 @@ class SCPTrain:
 
     def _float_move(self, task):
         """Make enemy floatly move along the Train."""
-        self._move(random.randint(2, 4), (self._side, random.uniform(-0.2, 0.2), 0))
-        task.delayTime = random.randint(4, 5)
+        self._move(
+            base.rng.randint(2, 4),  # noqa: F821
+            (self._side, base.rng.uniform(-0.2, 0.2), 0),  # noqa: F821
+        )
+        task.delayTime = base.rng.randint(4, 5)  # noqa: F821
         return task.again
 
     def _move(self, period, new_pos):
@@ -500,6 +507,7 @@ class SCPTrain:
         self.model.removeNode()
         self._ray_np.removeNode()
         self._scorch_parts.disable()
+        base.common_ctrl.remove_collider(self._ray_col_np)  # noqa: F821
 
         self._move_snd.stop()
         base.sound_mgr.detach_sound(self._sizzle_snd)  # noqa: F821
@@ -576,22 +584,19 @@ class SCPInstance(Shooter):
             "effects/instance_appear_{}.ptf".format(self._scp_train.side)
         )
         self._particles.start(self.model, render)  # noqa: F821
-        taskMgr.doMethodLater(  # noqa: F821
-            1.7, self._particles.softStop, self.id + "_stop_appearing", extraArgs=[]
-        )
+        self._do_later(1.7, self._particles.softStop, "_stop_appearing", args=[])
 
         self._target = None
         self.node = self.model.attachNewNode("np_" + self.id)
         self.shot_snd = self._set_shoot_snd(class_data["shot_snd"])
-        self._die_snd = base.sound_mgr.loadSfx("sounds/instance_die.ogg")  # noqa: F821
-        base.sound_mgr.attachSoundToObject(self._die_snd, self.model)  # noqa: F821
+        self._die_snd = base.voices_mgr.load(  # noqa: F821
+            "sounds/instance_die.ogg", self.model
+        )
 
         self._col_node = self._init_col_node(
             SHOT_RANGE_MASK, MOUSE_MASK, CollisionSphere(0, 0, 0.05, 0.05)
         )
-        base.common_ctrl.traverser.addCollider(  # noqa: F821
-            self._col_node, enemy_handler
-        )
+        base.common_ctrl.add_collider(self._col_node, enemy_handler)  # noqa: F821
 
         if class_ == "soldier":
             z = 0.064 if sex == "male" else 0.062
@@ -619,19 +624,17 @@ class SCPInstance(Shooter):
 
         self.current_part.enemies.append(self)
 
-        taskMgr.doMethodLater(  # noqa: F821
-            1.5, self._choose_target, self.id + "_choose_target"
-        )
+        self._do_later(1.5, self._choose_target, "_choose_target")
 
     @property
     def damage(self):
         """Damage amount for one shot."""
-        return random.choice((1, 2))
+        return base.rng.choice((1, 2))  # noqa: F821
 
     @property
     def shooting_speed(self):
         """Pause between shots."""
-        return 1.7 + random.uniform(0.1, 0.9)
+        return 1.7 + base.rng.uniform(0.1, 0.9)  # noqa: F821
 
     def _choose_target(self, task):
         """Choose a target to shoot."""
@@ -641,20 +644,16 @@ class SCPInstance(Shooter):
 
                 # (re-)start shooting
                 self._stop_tasks("_shoot")
-                taskMgr.doMethodLater(  # noqa: F821
-                    0.5, self._shoot, self.id + "_shoot"
-                )
+                self._do_later(0.5, self._shoot, "_shoot")
         else:
             targets = self.current_part.chars + [base.train]  # noqa: F821
 
             if self._target not in targets or chance(5):
-                self._target = random.choice(targets)
+                self._target = base.rng.choice(targets)  # noqa: F821
 
                 # (re-)start shooting
                 self._stop_tasks("_shoot")
-                taskMgr.doMethodLater(  # noqa: F821
-                    0.5, self._shoot, self.id + "_shoot"
-                )
+                self._do_later(0.5, self._shoot, "_shoot")
 
         task.delayTime = 0.5
         return task.again
@@ -668,25 +667,21 @@ class SCPInstance(Shooter):
         if not Shooter._die(self):
             return False
 
-        self._die_snd.play()
+        base.voices_mgr.play(self._die_snd)  # noqa: F821
 
         self._particles.softStart()
-        taskMgr.doMethodLater(  # noqa: F821
-            1.7, self._particles.disable, self.id + "_stop_appearing", extraArgs=[]
-        )
+        self._do_later(1.7, self._particles.disable, "_stop_appearing", args=[])
 
         self.is_dead = True
-        base.common_ctrl.traverser.removeCollider(self._col_node)  # noqa: F821
+        base.common_ctrl.remove_collider(self._col_node)  # noqa: F821
         self._col_node.removeNode()
 
-        taskMgr.doMethodLater(  # noqa: F821
-            self.clear_delay, self.clear, self.id + "_clear"
-        )
+        self._do_later(self.clear_delay, self.clear, "_clear")
 
         LerpAnimInterval(self.model, 0.1, "stand_and_aim", "die").start()
         self.model.play("die")
 
-        taskMgr.doMethodLater(3, self._hide, self.id + "_hide")  # noqa: F821
+        self._do_later(3, self._hide, "_hide")
 
     def _hide(self, task):
         """Hide the main model."""
@@ -714,14 +709,24 @@ class SCPInstance(Shooter):
         """Chance of the instance shot missed."""
         return chance(20)
 
+    def _do_later(self, delay, func, action, args=None):
+        """Do the given action of this instance after the given delay.
+
+        Args:
+            delay (float): Delay in seconds.
+            func (callable): Function to call.
+            action (str): The action name.
+            args (list): Optional. The function arguments.
+        """
+        base.units_timers.do_later(delay, func, self.id, action, args)  # noqa: F821
+
     def _stop_tasks(self, *names):
         """Stop this instance related tasks.
 
         Args:
             names (tuple): Tasks' names to stop.
         """
-        for name in names:
-            taskMgr.remove(self.id + name)  # noqa: F821
+        base.units_timers.cancel(self.id, *names)  # noqa: F821
 
     def enter_the_part(self, _):
         """Enter the train part."""
@@ -760,10 +765,9 @@ class SCPInstance(Shooter):
         Release models and sounds memory, release the part
         cell and delete the instance from the instances list.
         """
+        base.voices_mgr.release(self.model)  # noqa: F821
         self.model.cleanup()
         self.model.removeNode()
-        base.sound_mgr.detach_sound(self.shot_snd)  # noqa: F821
-        base.sound_mgr.detach_sound(self._die_snd)  # noqa: F821
 
         self.current_part.enemies.remove(self)
         base.world.enemy.active_units.pop(self.id)  # noqa: F821
@@ -806,7 +810,7 @@ class VioletSun:
         self._col_node = self._init_col_node(
             SHOT_RANGE_MASK, MOUSE_MASK, CollisionSphere(0, 0, 0, 0.02)
         )
-        base.common_ctrl.traverser.addCollider(  # noqa: F821
+        base.common_ctrl.add_collider(  # noqa: F821
             self._col_node, base.world.enemy.handler  # noqa: F821
         )
 
@@ -853,23 +857,23 @@ class VioletSun:
                 correct side of the Adjutant.
         """
         self._snd.play()
-        length = random.randint(17, 27)
+        length = base.rng.randint(17, 27)  # noqa: F821
         self._app_seq = Sequence(
             Parallel(
                 LerpHprInterval(
                     self.model,
                     length,
                     (
-                        random.randint(0, 360),
-                        random.randint(0, 360),
-                        random.randint(0, 360),
+                        base.rng.randint(0, 360),  # noqa: F821
+                        base.rng.randint(0, 360),  # noqa: F821
+                        base.rng.randint(0, 360),  # noqa: F821
                     ),
                     blendType="easeInOut",
                 ),
                 LerpPosInterval(
                     self.model,
                     length,
-                    (0.1 * factor, random.uniform(-0.05, 0.15), 0.01),
+                    (0.1 * factor, base.rng.uniform(-0.05, 0.15), 0.01),  # noqa: F821
                 ),
             ),
             Func(self._explode),
@@ -915,7 +919,7 @@ class VioletSun:
         if self._app_seq is not None:
             self._app_seq.pause()
 
-        base.common_ctrl.traverser.removeCollider(self._col_node)  # noqa: F821
+        base.common_ctrl.remove_collider(self._col_node)  # noqa: F821
         self._col_node.removeNode()
         self._scp_train.suns.remove(self)
 
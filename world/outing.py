@@ -5,7 +5,6 @@ License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
 API to manage outings.
 """
 import copy
-import random
 
 from gui import OutingsGUI
 
@@ -23,7 +22,7 @@ class OutingsManager:
     """
 
     def __init__(self, prefered_type=None):
-        self._threshold = random.randint(25, 33)
+        self._threshold = base.rng.randint(25, 33)  # noqa: F821
         self._outings = {
             "Enemy Camp": copy.deepcopy(ENEMY_CAMP),
             "Looting": copy.deepcopy(LOOTING),
@@ -80,12 +79,12 @@ class OutingsManager:
         self._threshold -= 1
 
         if self._threshold <= 0:
-            self._threshold = random.randint(16, 23)
+            self._threshold = base.rng.randint(16, 23)  # noqa: F821
 
             if self._prefered and chance(11):
                 return self._prefered
 
-            return random.choice(("Meet", "Enemy Camp", "Looting"))
+            return base.rng.choice(("Meet", "Enemy Camp", "Looting"))  # noqa: F821
 
     def show_can_start(self):
         """Show that outing can be started."""
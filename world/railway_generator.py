@@ -4,7 +4,6 @@ License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
 
 Railways network generator.
 """
-import random
 from utils import chance
 
 
@@ -58,9 +57,9 @@ class Bound:
         Returns:
             (float, str): New step value, turn model name.
         """
-        step = random.uniform(*self._s_range)
+        step = base.rng.uniform(*self._s_range)  # noqa: F821
         if self.value == 0:
-            step *= random.choice((1, -1))
+            step *= base.rng.choice((1, -1))  # noqa: F821
 
         prev_value = prev_bound.value if prev_bound else 0
 
@@ -82,7 +81,9 @@ class RailwayGenerator:
     def __init__(self):
         self._prev_bound = None
         self._prev = 0
-        self._step = random.uniform(0.025, 0.05) * random.choice((1, -1))
+        self._step = base.rng.uniform(0.025, 0.05) * base.rng.choice(  # noqa: F821
+            (1, -1)
+        )
         self._current = self._step
         self._station_threshold = 68
         self._city_threshold = 180
@@ -134,7 +135,7 @@ class RailwayGenerator:
             self._city_threshold = 170
             return "city"
 
-        return random.choice(("rs", "ls")) if chance(10) else "direct"
+        return base.rng.choice(("rs", "ls")) if chance(10) else "direct"  # noqa: F821
 
     def _choose_branch_block(self):
         """Generate a world block for a branch.
@@ -147,7 +148,7 @@ class RailwayGenerator:
             self._station_threshold = 76
             return "station"
 
-        return random.choice(("rs", "ls")) if chance(10) else "direct"
+        return base.rng.choice(("rs", "ls")) if chance(10) else "direct"  # noqa: F821
 
     def generate_main_line(self, size):
         """Generate the main railway line according to sin-like function.
@@ -248,14 +249,16 @@ class RailwayGenerator:
                     start = self.find_straight(
                         world_map,
                         branches,
-                        cursor + random.randint(*range_),
+                        cursor + base.rng.randint(*range_),  # noqa: F821
                     )
                 except IndexError:
                     break
 
                 try:
                     end = self.find_straight(
-                        world_map, branches, start + random.randint(49, 56)
+                        world_map,
+                        branches,
+                        start + base.rng.randint(49, 56),  # noqa: F821
                     )
                 except IndexError:
                     break
@@ -269,7 +272,7 @@ class RailwayGenerator:
 
             branch_blocks.append(branch["side"] + "_fork")
 
-            z_shift = random.randint(11, 14)
+            z_shift = base.rng.randint(11, 14)  # noqa: F821
 
             # generate the part of the branch from
             # the fork start to the first turn
@@ -4,8 +4,6 @@ License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
 
 The main game scenario.
 """
-import random
-
 from direct.gui.DirectGui import (
     DGG,
     DirectButton,
@@ -228,7 +226,7 @@ class Scenario:
         """
         if to_one:
             self.do_character_effect(
-                random.choice(list(base.team.chars.values())), effect  # noqa: F821
+                base.rng.choice(list(base.team.chars.values())), effect  # noqa: F821
             )
             return
 
@@ -0,0 +1,149 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Railway topology index API.
+
+The railway is a directed graph, in which every edge is a move from
+a block to its neighbor. For every move the nearest cities, forks,
+stations and outings ahead are precomputed, so looking ahead along
+the Train way is a dictionary lookup, which doesn't depend on the
+railway length.
+"""
+FORKS = ("l_fork", "r_fork", "exit_from_fork")
+
+# block features, which can be looked for on the railway
+FEATURES = {
+    "city": lambda record: record.is_city,
+    "fork": lambda record: record.name in FORKS,
+    "outing": lambda record: bool(record.outing_available),
+    "station": lambda record: record.is_station,
+}
+NOT_FOUND = (float("inf"), None)
+NOTHING_AHEAD = dict.fromkeys(FEATURES, NOT_FOUND)
+
+
+class RailwayTopology:
+    """Railway topology index.
+
+    On a fork the Train can go different ways, so the
+    blocks behind a fork are not considered ahead of the
+    Train, features are looked for up to the nearest fork.
+
+    Stations and outings can be dropped while playing, so
+    the index must be invalidated on such changes. It's
+    rebuilt on the next query then.
+
+    Args:
+        world_map (list): All the world blocks records.
+    """
+
+    def __init__(self, world_map):
+        self._map = world_map
+        self._ahead = {}
+        self._points = {}
+        self._is_actual = False
+        self._revision = 0
+
+    @property
+    def revision(self):
+        """The index revision, which changes with every map change.
+
+        Returns:
+            int: Number of the index builds.
+        """
+        if not self._is_actual:
+            self.build()
+
+        return self._revision
+
+    def _follow(self, move, records):
+        """Index the given move and all the moves following it.
+
+        Args:
+            move (tuple): Ids of the block to move from and the block to move to.
+            records (dict): The world blocks records, indexed by ids.
+        """
+        chain = []
+        while move not in self._ahead:
+            self._ahead[move] = None  # protects from walking in circles
+            chain.append(move)
+
+            next_id = records[move[1]].directions.get(move[0])
+            if isinstance(next_id, tuple) or next_id not in records:
+                # the next block is a fork or the railway end
+                self._ahead[chain.pop()] = NOTHING_AHEAD
+                break
+
+            move = (move[1], next_id)
+
+        for move in reversed(chain):
+            next_move = (move[1], records[move[1]].directions[move[0]])
+            following = self._ahead[next_move] or NOTHING_AHEAD
+
+            record = records[next_move[1]]
+            self._ahead[move] = {
+                kind: (1, record)
+                if has_feature(record)
+                else (following[kind][0] + 1, following[kind][1])
+                for kind, has_feature in FEATURES.items()
+            }
+
+    def ahead(self, from_id, to_id, kind):
+        """Find the nearest block with the given feature ahead.
+
+        Args:
+            from_id (int): Id of the block the Train is moving from.
+            to_id (int): Id of the block the Train is moving to.
+            kind (str): Feature name from FEATURES.
+
+        Returns:
+            tuple:
+                Number of blocks after the `to_id` block up to the found
+                block, and the found block record. (inf, None), if there
+                are no such blocks ahead, or the move is unknown.
+        """
+        if not self._is_actual:
+            self.build()
+
+        return self._ahead.get((from_id, to_id), NOTHING_AHEAD)[kind]
+
+    def build(self):
+        """Build the index of the current world map.
+
+        Enemy territory blocks are temporary and not indexed.
+        """
+        records = {record.id: record for record in self._map if record.id != -1}
+
+        self._ahead = {}
+        for record in records.values():
+            for from_id in record.directions:
+                if from_id in records:
+                    self._follow((from_id, record.id), records)
+
+        self._points = {
+            kind: [
+                record for _, record in sorted(records.items()) if has_feature(record)
+            ]
+            for kind, has_feature in FEATURES.items()
+        }
+        self._is_actual = True
+        self._revision += 1
+
+    def invalidate(self):
+        """Mark the index outdated after a block feature change."""
+        self._is_actual = False
+
+    def points(self, kind):
+        """Get all the blocks with the given feature.
+
+        Args:
+            kind (str): Feature name from FEATURES.
+
+        Returns:
+            list: Blocks records, sorted by their ids.
+        """
+        if not self._is_actual:
+            self.build()
+
+        return self._points[kind]
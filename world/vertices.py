@@ -0,0 +1,174 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Surface models vertices index API.
+"""
+import os
+import random
+
+import numpy
+
+# bump the version on every change of the
+# vertices filtering rules in World._read_vertices()
+CACHE_VERSION = 1
+CACHE_FILE = "cache/surf_vertices.npz"
+
+
+class SurfaceVertices:
+    """Compact read-only index of a surface model vertices.
+
+    Positions are kept in a single float32 array, while every
+    square of the surface is an array of indexes into it. The
+    index is built once and shared by all the world blocks.
+
+    Args:
+        points (numpy.ndarray): Vertices positions, shape (N, 3).
+        squares (dict): Squares names and indexes of their vertices.
+    """
+
+    def __init__(self, points, squares):
+        self.points = numpy.ascontiguousarray(points, dtype=numpy.float32)
+        self.points.setflags(write=False)
+
+        self.squares = {}
+        for name, indexes in squares.items():
+            indexes = numpy.ascontiguousarray(indexes, dtype=numpy.int32)
+            indexes.setflags(write=False)
+            self.squares[name] = indexes
+
+    def sampler(self, rng=random):
+        """Start a new sampling of this index vertices.
+
+        Args:
+            rng (random.Random): Optional. Random generator to use.
+
+        Returns:
+            VertexSampler: Sampler without replacement.
+        """
+        return VertexSampler(self, rng)
+
+
+class VertexSampler:
+    """Takes random surface vertices without replacement.
+
+    Every square is sampled through a lazy Fisher-Yates
+    permutation of its indexes: only the swapped positions
+    are remembered, so the sampling costs proportionally
+    to the number of taken vertices, not to the surface size.
+
+    Args:
+        vertices (SurfaceVertices): Index to sample from.
+        rng (random.Random): Optional. Random generator to use.
+    """
+
+    def __init__(self, vertices, rng=random):
+        self._vertices = vertices
+        self._rng = rng
+        self._swaps = {name: {} for name in vertices.squares}
+        self._taken = dict.fromkeys(vertices.squares, 0)
+
+    def take(self, square):
+        """Take a random vertex of the given square.
+
+        The vertex will not be returned again by this sampler.
+
+        Args:
+            square (str): Square name: "wide" or "narrow".
+
+        Returns:
+            tuple: Vertex position coordinates.
+        """
+        indexes = self._vertices.squares[square]
+        swaps = self._swaps[square]
+        taken = self._taken[square]
+
+        if taken >= len(indexes):
+            raise IndexError("All the {} square vertices are taken.".format(square))
+
+        pick = self._rng.randint(taken, len(indexes) - 1)
+        chosen = swaps.get(pick, pick)
+        swaps[pick] = swaps.pop(taken, taken)
+        self._taken[square] = taken + 1
+
+        return tuple(self._vertices.points[indexes[chosen]].tolist())
+
+
+def cache_key(path):
+    """Build a cache key of the given surface model.
+
+    The key depends on the model file modification time and
+    size, and on the version of the vertices filtering rules.
+
+    Args:
+        path (str): Model filename.
+
+    Returns:
+        str: Cache key.
+    """
+    stat = os.stat(path)
+    return "{}_{}_{}_v{}".format(
+        os.path.basename(path).replace(".", "_"),
+        stat.st_mtime_ns,
+        stat.st_size,
+        CACHE_VERSION,
+    )
+
+
+def load_cache(cache_file=CACHE_FILE):
+    """Load the precomputed vertices indexes from the disk.
+
+    Args:
+        cache_file (str): Cache file name.
+
+    Returns:
+        dict: Vertices indexes by their cache keys.
+    """
+    if not os.path.exists(cache_file):
+        return {}
+
+    index = {}
+    try:
+        with numpy.load(cache_file) as cache:
+            if int(cache["version"]) != CACHE_VERSION:
+                return {}
+
+            for key in map(str, cache["keys"]):
+                index[key] = SurfaceVertices(
+                    cache[key + ".points"],
+                    {
+                        "wide": cache[key + ".wide"],
+                        "narrow": cache[key + ".narrow"],
+                    },
+                )
+    except (OSError, KeyError, ValueError):
+        # broken cache file will be overwritten
+        return {}
+
+    return index
+
+
+def save_cache(index, cache_file=CACHE_FILE):
+    """Write the vertices indexes to the disk.
+
+    The file is written under a temporary name and then
+    renamed, so a broken write will not corrupt the cache.
+
+    Args:
+        index (dict): Vertices indexes by their cache keys.
+        cache_file (str): Cache file name.
+    """
+    arrays = {
+        "version": numpy.array(CACHE_VERSION),
+        "keys": numpy.array(sorted(index), dtype=str),
+    }
+    for key, vertices in index.items():
+        arrays[key + ".points"] = vertices.points
+        arrays[key + ".wide"] = vertices.squares["wide"]
+        arrays[key + ".narrow"] = vertices.squares["narrow"]
+
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    with open(cache_file + ".tmp", "wb") as file_:
+        numpy.savez(file_, **arrays)
+
+    os.replace(cache_file + ".tmp", cache_file)
@@ -0,0 +1,168 @@
+"""
+Copyright (C) 2021 Ilya "Faer" Gurov (ilya.faer@mail.ru)
+License: https://github.com/IlyaFaer/ForwardOnlyGame/blob/master/LICENSE.md
+
+Game assets warmup API.
+"""
+import collections
+import glob
+
+from const import MOD_DIR
+from .location import LOCATION_CONF
+
+# number of the world blocks, which assets
+# must be loaded before the game start
+FIRST_BLOCKS = 4
+# seconds of a frame, which can be spent on the warmup
+FRAME_BUDGET = 0.004
+# models, which are loaded by the game systems on start,
+# or which must not be cached at all
+NOT_WARMED_MODELS = (
+    "locomotive",
+    "train_part_arrow",
+    "soldier",
+    "raider",
+    "anarchist",
+    "character_pointer",
+    "city_hangar",
+    "sun_path",
+    "relation_ball",
+    "tree",
+)
+
+
+class AssetsWarmup:
+    """Prioritized game assets warmup.
+
+    When a resource is loaded for the first time, the game can twitch
+    a little. This can be avoided by loading resources before they are
+    actually used and caching them. Assets needed by the first world
+    blocks are loaded at once, all the others are put into a manifest
+    queue and streamed in the background with a per-frame time budget.
+    """
+
+    def __init__(self):
+        self._queue = collections.deque()
+        self._loaded = set()
+        self._models_in_flight = 0
+        self._started = False
+
+    @property
+    def is_done(self):
+        """Indicates if all the assets are warmed up.
+
+        Returns:
+            bool: True if the warmup queue is empty.
+        """
+        return not (self._queue or self._models_in_flight)
+
+    def _build_manifest(self):
+        """Build the full warmup manifest.
+
+        Environment models are queued first, as they are
+        loaded most often while the world blocks streaming.
+
+        Returns:
+            list: Assets kinds and paths in the order of loading.
+        """
+        models = []
+        for conf in LOCATION_CONF["with_quantity"] + LOCATION_CONF["with_chance"]:
+            for model in conf["models"]:
+                models.append(MOD_DIR + model + ".bam")
+
+        for path in sorted(glob.glob(MOD_DIR + "*.bam")):
+            models.append(path.replace("\\", "/"))
+
+        manifest = []
+        for path in models:
+            if not any(name in path for name in NOT_WARMED_MODELS):
+                manifest.append(("model", path))
+
+        for path in sorted(glob.glob("just_tex/*.png")):
+            manifest.append(("texture", path.replace("\\", "/")))
+
+        for path in sorted(glob.glob("sounds/*.ogg")):
+            manifest.append(("sound", path.replace("\\", "/")))
+
+        return manifest
+
+    def _load(self, kind, path):
+        """Load the given asset synchronously.
+
+        Args:
+            kind (str): Asset kind: "model", "texture" or "sound".
+            path (str): Asset file path.
+        """
+        self._loaded.add(path)
+
+        if kind == "model":
+            loader.loadModel(path)  # noqa: F821
+        elif kind == "texture":
+            loader.loadTexture(path)  # noqa: F821
+        else:
+            base.voices_mgr.preload(path)  # noqa: F821
+
+    def _model_loaded(self, _):
+        """Callback for an asynchronously loaded model."""
+        self._models_in_flight -= 1
+
+    def _stream(self, task):
+        """Load queued assets while the frame time budget allows.
+
+        Models are loaded by the threaded loader, not
+        more than two at a time, the lighter assets are
+        loaded on the main thread.
+        """
+        clock = globalClock  # noqa: F821
+        start = clock.getRealTime()
+
+        while self._queue and clock.getRealTime() - start < FRAME_BUDGET:
+            kind, path = self._queue[0]
+            if path in self._loaded:
+                self._queue.popleft()
+                continue
+
+            if kind == "model":
+                if self._models_in_flight >= 2:
+                    break
+
+                self._models_in_flight += 1
+                self._loaded.add(path)
+                loader.loadModel(path, callback=self._model_loaded)  # noqa: F821
+            else:
+                self._load(kind, path)
+
+            self._queue.popleft()
+
+        if self.is_done:
+            return task.done
+
+        return task.cont
+
+    def start(self, blocks):
+        """Start the warmup.
+
+        Load assets of the given blocks immediately
+        and stream all the others in the background. The
+        background streaming is started only once.
+
+        In headless mode nothing is streamed, as the threaded
+        loading and the real time budget would make the game
+        depend on the machine speed. Assets are loaded on demand.
+
+        Args:
+            blocks (list): The first world blocks to prepare.
+        """
+        for block in blocks[:FIRST_BLOCKS]:
+            for kind, path in block.manifest():
+                if path not in self._loaded:
+                    self._load(kind, path)
+
+        if base.headless or self._started:  # noqa: F821
+            return
+
+        self._started = True
+        self._queue.extend(
+            asset for asset in self._build_manifest() if asset[1] not in self._loaded
+        )
+        taskMgr.add(self._stream, "assets_warmup")  # noqa: F821